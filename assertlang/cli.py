@@ -28,6 +28,7 @@ import os
 import shutil
 import sys
 from pathlib import Path
+from typing import Optional
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -346,6 +347,13 @@ For more help: asl help <command>
         default='standard',
         help='Output format for Python (standard=code, pydantic=models, typeddict=state schemas, default: standard)'
     )
+    build_parser.add_argument(
+        '--contracts',
+        type=str,
+        choices=['none', 'pre', 'full'],
+        default='full',
+        help='Contract code to generate (none=no checks, pre=preconditions only, full=all checks, default: full)'
+    )
     build_parser.add_argument(
         '--output', '-o',
         type=str,
@@ -356,12 +364,17 @@ For more help: asl help <command>
         action='store_true',
         help='Verbose output'
     )
+    build_parser.add_argument(
+        '--no-ir-cache',
+        action='store_true',
+        help='Always re-parse instead of using the on-disk IR cache'
+    )
 
     # Compile command (NEW - Compile to MCP JSON)
     compile_parser = subparsers.add_parser(
         'compile',
-        help='Compile PW file to MCP JSON',
-        description='Compile PW source to MCP JSON intermediate representation.'
+        help='Compile PW file to MCP JSON or binary IR',
+        description='Compile PW source to MCP JSON or compact binary intermediate representation.'
     )
     compile_parser.add_argument(
         'file',
@@ -371,13 +384,25 @@ For more help: asl help <command>
     compile_parser.add_argument(
         '--output', '-o',
         type=str,
-        help='Output JSON file (default: <input>.al.json)'
+        help='Output file (default: <input>.al.json, or <input>.alir with --format binary)'
+    )
+    compile_parser.add_argument(
+        '--format', '-f',
+        type=str,
+        choices=['json', 'binary'],
+        default='json',
+        help='Output format (json=MCP JSON tree, binary=compact binary IR, default: json)'
     )
     compile_parser.add_argument(
         '--verbose', '-v',
         action='store_true',
         help='Verbose output'
     )
+    compile_parser.add_argument(
+        '--no-ir-cache',
+        action='store_true',
+        help='Always re-parse instead of using the on-disk IR cache'
+    )
 
     # Run command (NEW - Execute PW file)
     run_parser = subparsers.add_parser(
@@ -395,6 +420,21 @@ For more help: asl help <command>
         action='store_true',
         help='Verbose output'
     )
+    run_parser.add_argument(
+        '--no-ir-cache',
+        action='store_true',
+        help='Always re-parse instead of using the on-disk IR cache'
+    )
+    run_parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Interpret with the AL runtime and write a profile (<file>.folded, <file>.profile.json)'
+    )
+    run_parser.add_argument(
+        '--profile-output',
+        type=str,
+        help='Path prefix for the profile files (default: the input path without .al)'
+    )
 
     # Install-VSCode command (NEW - Install VS Code extension)
     install_vscode_parser = subparsers.add_parser(
@@ -1101,6 +1141,13 @@ def cmd_config(args) -> int:
     return 0
 
 
+def _use_ir_cache(args) -> Optional[bool]:
+    """Return the parse_al use_cache setting for a build/compile/run command."""
+    if getattr(args, 'no_ir_cache', False):
+        return False
+    return None
+
+
 def cmd_build(args) -> int:
     """Execute build command - compile PW to target language."""
     # Add pw-syntax-mcp-server to path
@@ -1153,11 +1200,11 @@ def cmd_build(args) -> int:
         # Parse PW → IR with timing
         if has_ux_utils:
             with timed_step("Parsing PW code", verbose=verbose, quiet=quiet):
-                ir = parse_al(pw_code)
+                ir = parse_al(pw_code, use_cache=_use_ir_cache(args))
         else:
             if verbose:
                 print(info("Parsing PW code..."))
-            ir = parse_al(pw_code)
+            ir = parse_al(pw_code, use_cache=_use_ir_cache(args))
 
         if verbose and not quiet:
             print(success(f"Parsed: {len(ir.functions)} functions, {len(ir.classes)} classes"))
@@ -1180,6 +1227,10 @@ def cmd_build(args) -> int:
         elif lang in ('cs', 'csharp'):
             lang = 'csharp'
 
+        # Contract clauses to emit; the Go, Rust, TypeScript and C# generators
+        # emit no contract code at any level
+        contracts = getattr(args, 'contracts', 'full')
+
         # MCP → Target language with timing
         if has_ux_utils:
             with timed_step(f"Generating {lang} code", verbose=verbose, quiet=quiet):
@@ -1193,7 +1244,7 @@ def cmd_build(args) -> int:
                         code = generate_typeddict(ir)
                     else:
                         # Standard Python code generation
-                        code = generate_python(ir)
+                        code = generate_python(ir, contracts=contracts)
                 elif lang == 'go':
                     generator = GoGeneratorV2()
                     code = generator.generate(ir)
@@ -1201,7 +1252,7 @@ def cmd_build(args) -> int:
                     generator = RustGeneratorV2()
                     code = generator.generate(ir)
                 elif lang == 'javascript':
-                    code = generate_javascript(ir)
+                    code = generate_javascript(ir, contracts=contracts)
                 elif lang == 'typescript':
                     code = pw_to_typescript(mcp_tree)
                 elif lang == 'csharp':
@@ -1223,7 +1274,7 @@ def cmd_build(args) -> int:
                     code = generate_typeddict(ir)
                 else:
                     # Standard Python code generation
-                    code = generate_python(ir)
+                    code = generate_python(ir, contracts=contracts)
             elif lang == 'go':
                 generator = GoGeneratorV2()
                 code = generator.generate(ir)
@@ -1231,7 +1282,7 @@ def cmd_build(args) -> int:
                 generator = RustGeneratorV2()
                 code = generator.generate(ir)
             elif lang == 'javascript':
-                code = generate_javascript(ir)
+                code = generate_javascript(ir, contracts=contracts)
             elif lang == 'typescript':
                 code = pw_to_typescript(mcp_tree)
             elif lang == 'csharp':
@@ -1274,11 +1325,12 @@ def cmd_build(args) -> int:
 
 
 def cmd_compile(args) -> int:
-    """Execute compile command - compile PW to MCP JSON."""
+    """Execute compile command - compile PW to MCP JSON or binary IR."""
     # Add pw-syntax-mcp-server to path
     sys.path.insert(0, str(Path(__file__).parent.parent / 'pw-syntax-mcp-server'))
 
     from dsl.al_parser import parse_al
+    from dsl import ir_binary
     from translators.ir_converter import ir_to_mcp
     import json
 
@@ -1298,7 +1350,24 @@ def cmd_compile(args) -> int:
         if args.verbose:
             print(info("Parsing PW code..."))
 
-        ir = parse_al(pw_code)
+        ir = parse_al(pw_code, use_cache=_use_ir_cache(args))
+
+        if getattr(args, 'format', 'json') == 'binary':
+            # IR → binary IR
+            if args.verbose:
+                print(info("Serializing binary IR..."))
+
+            if not args.output:
+                args.output = str(input_path.with_suffix(ir_binary.BINARY_SUFFIX))
+
+            output_path = Path(args.output)
+            size = ir_binary.dump(ir, output_path)
+
+            if args.verbose:
+                print(info(f"Written: {output_path} ({size} bytes)"))
+
+            print(success(f"Compiled {input_path} → {output_path}"))
+            return 0
 
         # IR → MCP
         if args.verbose:
@@ -1355,7 +1424,10 @@ def cmd_run(args) -> int:
         if args.verbose:
             print(info("Parsing PW code..."))
 
-        ir = parse_al(pw_code)
+        ir = parse_al(pw_code, use_cache=_use_ir_cache(args))
+
+        if args.profile:
+            return _run_profiled(ir, input_path, args)
 
         # IR → MCP → Python
         if args.verbose:
@@ -1381,6 +1453,31 @@ def cmd_run(args) -> int:
         return 1
 
 
+def _run_profiled(ir, input_path: Path, args) -> int:
+    """Interpret a parsed module (module variables, then main() if defined) under the profiler."""
+    from dsl.al_profiler import Profiler
+    from dsl.al_runtime import PWRuntime
+
+    profiler = Profiler()
+    runtime = PWRuntime(profiler=profiler)
+
+    if args.verbose:
+        print(info("Executing with profiler..."))
+        print("─" * 60)
+
+    runtime.execute_module(ir)
+    main = runtime.globals.get('main')
+    if main is not None:
+        runtime.execute_function(main, [])
+
+    prefix = args.profile_output or input_path.with_suffix('')
+    folded, summary = profiler.write(prefix)
+
+    print(profiler.format_table())
+    print(success(f"Profile written: {folded} (flamegraph), {summary} (summary)"))
+    return 0
+
+
 def cmd_install_vscode(args) -> int:
     """Execute install-vscode command - install VS Code extension."""
     import shutil
@@ -17,7 +17,7 @@ from dataclasses import dataclass
 from typing import List, Set, Dict, Any
 from pathlib import Path
 
-from dsl.al_parser import Lexer, Parser
+from dsl.al_parser import Parser, tokenize
 from dsl.ir import (
     IRModule, IRFunction, IRClass, IRContractClause,
     IRExpression, IROldExpr, IRBinaryOp, IRUnaryOp,
@@ -66,8 +66,7 @@ class ContractValidator:
 
         # Parse
         try:
-            lexer = Lexer(code)
-            tokens = lexer.tokenize()
+            tokens = tokenize(code)
             parser = Parser(tokens)
             module = parser.parse()
         except Exception as e:
@@ -5,16 +5,25 @@ from assertlang.runtime.contracts import (
     OldValue,
     ValidationMode,
     capture_old_values,
+    check_clause,
     check_invariant,
     check_postcondition,
     check_precondition,
+    configure_sampling,
+    get_sampling_stats,
     get_validation_mode,
+    register_clauses,
+    reset_sampling,
+    set_module_validation_mode,
     set_validation_mode,
     should_check_invariants,
     should_check_postconditions,
     should_check_preconditions,
+    validation_mode,
 )
 
+from assertlang.runtime.memo import MemoInfo, memoize
+
 from assertlang.runtime.stdlib import (
     Result,
     Ok,
@@ -31,14 +40,25 @@ __all__ = [
     "OldValue",
     "ValidationMode",
     "capture_old_values",
+    "check_clause",
     "check_invariant",
     "check_postcondition",
     "check_precondition",
+    "configure_sampling",
+    "get_sampling_stats",
     "get_validation_mode",
+    "register_clauses",
+    "reset_sampling",
+    "set_module_validation_mode",
     "set_validation_mode",
     "should_check_invariants",
     "should_check_postconditions",
     "should_check_preconditions",
+    "validation_mode",
+
+    # Memoization of @pure functions
+    "MemoInfo",
+    "memoize",
 
     # Standard library
     "Result",
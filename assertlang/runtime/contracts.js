@@ -132,6 +132,20 @@ function shouldCheckInvariants() {
     return validationMode === ValidationMode.FULL;
 }
 
+/**
+ * Materialize the context of a failed check. A context may be an object, or
+ * a function returning one that is only called when the check fails.
+ *
+ * @param {Object|Function|null} context - Variable context
+ * @returns {Object} Variable values for the error
+ */
+function violationContext(context) {
+    if (typeof context === 'function') {
+        return context();
+    }
+    return context || {};
+}
+
 /**
  * Check a precondition.
  *
@@ -139,7 +153,7 @@ function shouldCheckInvariants() {
  * @param {string} clauseName - Name of the clause
  * @param {string} expression - Expression string for error message
  * @param {string} functionName - Name of the function
- * @param {Object} context - Variable context
+ * @param {Object|Function} context - Variable context (see violationContext)
  * @param {string|null} className - Optional class name
  * @throws {ContractViolationError} If condition is false
  */
@@ -154,7 +168,7 @@ function checkPrecondition(condition, clauseName, expression, functionName, cont
             function: functionName,
             clause: clauseName,
             expression: expression,
-            context: context,
+            context: violationContext(context),
             className: className
         });
     }
@@ -167,7 +181,7 @@ function checkPrecondition(condition, clauseName, expression, functionName, cont
  * @param {string} clauseName - Name of the clause
  * @param {string} expression - Expression string for error message
  * @param {string} functionName - Name of the function
- * @param {Object} context - Variable context (including 'result')
+ * @param {Object|Function} context - Variable context, including 'result' (see violationContext)
  * @param {string|null} className - Optional class name
  * @throws {ContractViolationError} If condition is false
  */
@@ -182,7 +196,7 @@ function checkPostcondition(condition, clauseName, expression, functionName, con
             function: functionName,
             clause: clauseName,
             expression: expression,
-            context: context,
+            context: violationContext(context),
             className: className
         });
     }
@@ -195,7 +209,7 @@ function checkPostcondition(condition, clauseName, expression, functionName, con
  * @param {string} clauseName - Name of the clause
  * @param {string} expression - Expression string for error message
  * @param {string} className - Name of the class
- * @param {Object} context - Variable context (typically 'this')
+ * @param {Object|Function} context - Variable context, typically 'this' (see violationContext)
  * @throws {ContractViolationError} If condition is false
  */
 function checkInvariant(condition, clauseName, expression, className, context = {}) {
@@ -209,7 +223,7 @@ function checkInvariant(condition, clauseName, expression, className, context =
             function: '<invariant>',
             clause: clauseName,
             expression: expression,
-            context: context,
+            context: violationContext(context),
             className: className
         });
     }
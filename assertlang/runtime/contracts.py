@@ -14,8 +14,18 @@ Design Principles:
 4. Framework-agnostic - No dependencies on specific frameworks
 """
 
+import asyncio
+import functools
+import sys
+import threading
+import weakref
+from array import array
+from contextvars import ContextVar, Token
 from enum import Enum
-from typing import Any, Dict, Optional
+from types import FrameType
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, TypeVar, Union
+
+F = TypeVar("F", bound=Callable[..., Any])
 
 
 class ValidationMode(Enum):
@@ -24,18 +34,68 @@ class ValidationMode(Enum):
     DISABLED = "disabled"              # No contract checking (production)
     PRECONDITIONS_ONLY = "preconditions"  # Only check preconditions (production with validation)
     FULL = "full"                     # Check all contracts (development/testing)
+    SAMPLED = "sampled"               # Check each clause on 1-in-N calls (production assurance)
+
 
+class ModeFlags:
+    """What a validation mode checks. Generated code reads these per call."""
 
-# Global validation mode
-_VALIDATION_MODE = ValidationMode.FULL
+    # Plain slots: read faster than NamedTuple fields on the hot path
+    __slots__ = ("mode", "preconditions", "postconditions", "invariants", "sampling")
 
-# Global coverage tracking
-_CLAUSE_COVERAGE: Dict[str, int] = {}
+    def __init__(self, mode: ValidationMode, preconditions: bool, postconditions: bool, invariants: bool,
+                 sampling: bool):
+        self.mode = mode
+        self.preconditions = preconditions
+        self.postconditions = postconditions
+        self.invariants = invariants
+        self.sampling = sampling  # Ask sample_clause() before each check (SAMPLED)
+
+    def __repr__(self) -> str:
+        return f"ModeFlags({self.mode})"
+
+
+_MODE_FLAGS = {
+    ValidationMode.DISABLED: ModeFlags(ValidationMode.DISABLED, False, False, False, False),
+    ValidationMode.PRECONDITIONS_ONLY: ModeFlags(ValidationMode.PRECONDITIONS_ONLY, True, False, False, False),
+    ValidationMode.FULL: ModeFlags(ValidationMode.FULL, True, True, True, False),
+    ValidationMode.SAMPLED: ModeFlags(ValidationMode.SAMPLED, True, True, True, True),
+}
+
+# Process-wide default mode (set_validation_mode)
+_DEFAULT_FLAGS = _MODE_FLAGS[ValidationMode.FULL]
+
+# Mode of a `with validation_mode(...)` scope, per thread and asyncio task
+# (unset outside scopes). Generated functions resolve their mode once per
+# call with
+#     scoped_mode(_AL_MODE.flags)
+# so the disabled path is one context variable lookup.
+SCOPED_MODE: ContextVar[ModeFlags] = ContextVar("assertlang_validation_mode")
+# Tokens of the validation_mode blocks entered in this context, innermost last
+_SCOPE_TOKENS: ContextVar[Tuple[Token, ...]] = ContextVar("assertlang_validation_scopes", default=())
+# SCOPED_MODE.get, bound once: looking the method up on every call costs
+# about as much as the lookup itself
+scoped_mode = SCOPED_MODE.get
+
+
+# Variable values reported with a violation. Besides a dict, the check
+# functions accept a callable returning one, or a tuple naming locals of the
+# calling function (each a name, or a (key, local name) pair). Both are only
+# materialized when the check fails; generated code passes constant tuples,
+# so passing checks allocate nothing for their context.
+ViolationContext = Union[
+    Dict[str, Any],
+    Callable[[], Dict[str, Any]],
+    Tuple[Union[str, Tuple[str, str]], ...],
+]
 
 
 def set_validation_mode(mode: ValidationMode) -> None:
     """
-    Set global contract validation mode.
+    Set the process-wide contract validation mode.
+
+    Scopes (validation_mode) and module overrides (set_module_validation_mode)
+    take precedence over it.
 
     Args:
         mode: Validation mode to enable
@@ -49,29 +109,382 @@ def set_validation_mode(mode: ValidationMode) -> None:
 
         # Performance mode (no checks)
         set_validation_mode(ValidationMode.DISABLED)
+
+        # Production assurance (1-in-N calls, see configure_sampling)
+        set_validation_mode(ValidationMode.SAMPLED)
     """
-    global _VALIDATION_MODE
-    _VALIDATION_MODE = mode
+    global _DEFAULT_FLAGS
+    with _MODULE_MODES_LOCK:
+        _DEFAULT_FLAGS = _MODE_FLAGS[ValidationMode(mode)]
+        for module in _MODULE_MODES.values():
+            if module.override is None:
+                module.flags = _DEFAULT_FLAGS
 
 
 def get_validation_mode() -> ValidationMode:
-    """Get current validation mode."""
-    return _VALIDATION_MODE
+    """Get the validation mode in effect here (scoped, else process-wide)."""
+    return _current_flags().mode
+
+
+def _current_flags() -> ModeFlags:
+    return scoped_mode(_DEFAULT_FLAGS)
 
 
 def should_check_preconditions() -> bool:
     """Check if preconditions should be validated."""
-    return _VALIDATION_MODE in [ValidationMode.PRECONDITIONS_ONLY, ValidationMode.FULL]
+    return _current_flags().preconditions
 
 
 def should_check_postconditions() -> bool:
     """Check if postconditions should be validated."""
-    return _VALIDATION_MODE == ValidationMode.FULL
+    return _current_flags().postconditions
 
 
 def should_check_invariants() -> bool:
     """Check if invariants should be validated."""
-    return _VALIDATION_MODE == ValidationMode.FULL
+    return _current_flags().invariants
+
+
+# ============================================================================
+# Scoped and Per-Module Modes
+# ============================================================================
+
+
+class validation_mode:
+    """
+    Validation mode for a block or function, in this thread or asyncio task only.
+
+    Takes precedence over module overrides and the process-wide mode; tasks
+    and threads started inside the block (via contextvars.copy_context) keep
+    it.
+
+    Example:
+        with validation_mode(ValidationMode.FULL):
+            handle_canary_request(request)
+
+        @validation_mode(ValidationMode.DISABLED)
+        async def import_batch(rows): ...
+    """
+
+    def __init__(self, mode: ValidationMode):
+        self.flags = _MODE_FLAGS[ValidationMode(mode)]
+
+    def __enter__(self) -> "validation_mode":
+        # Tokens are kept per context, so one instance can be entered by
+        # several tasks or threads at once
+        token = SCOPED_MODE.set(self.flags)
+        _SCOPE_TOKENS.set(_SCOPE_TOKENS.get() + (token,))
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        tokens = _SCOPE_TOKENS.get()
+        _SCOPE_TOKENS.set(tokens[:-1])
+        SCOPED_MODE.reset(tokens[-1])
+
+    def __call__(self, func: F) -> F:
+        flags = self.flags
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def scoped_coroutine(*args: Any, **kwargs: Any) -> Any:
+                token = SCOPED_MODE.set(flags)
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    SCOPED_MODE.reset(token)
+
+            return scoped_coroutine  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def scoped(*args: Any, **kwargs: Any) -> Any:
+            token = SCOPED_MODE.set(flags)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                SCOPED_MODE.reset(token)
+
+        return scoped  # type: ignore[return-value]
+
+
+class ModuleMode:
+    """Validation mode of one generated module (see module_mode)."""
+
+    __slots__ = ("name", "override", "flags")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.override: Optional[ValidationMode] = None
+        self.flags = _DEFAULT_FLAGS  # Override if set, else the process-wide mode
+
+
+_MODULE_MODES: Dict[str, ModuleMode] = {}
+_MODULE_MODES_LOCK = threading.Lock()
+
+
+def module_mode(name: str) -> ModuleMode:
+    """
+    The mode handle of module `name`.
+
+    Generated modules fetch theirs once at import (`_AL_MODE`); its flags
+    follow set_validation_mode unless the module has an override.
+    """
+    with _MODULE_MODES_LOCK:
+        module = _MODULE_MODES.get(name)
+        if module is None:
+            module = _MODULE_MODES[name] = ModuleMode(name)
+        return module
+
+
+def set_module_validation_mode(name: str, mode: Optional[ValidationMode]) -> None:
+    """
+    Override the process-wide mode for one generated module.
+
+    Args:
+        name: Module name (its __name__)
+        mode: Mode for the module, or None to follow the process-wide mode
+
+    Example:
+        set_module_validation_mode("billing.ledger", ValidationMode.FULL)
+    """
+    module = module_mode(name)
+    with _MODULE_MODES_LOCK:
+        module.override = None if mode is None else ValidationMode(mode)
+        module.flags = _DEFAULT_FLAGS if mode is None else _MODE_FLAGS[module.override]
+
+
+# ============================================================================
+# Clause Registry
+# ============================================================================
+
+
+class ClauseInfo(NamedTuple):
+    """Static description of one contract clause."""
+
+    kind: str                   # "requires", "ensures" or "invariant"
+    function: Optional[str]     # Function name (None for invariants)
+    class_name: Optional[str]   # Class name (if method or invariant)
+    clause: str                 # Clause name (e.g., "name_not_empty")
+    expression: str             # Expression string (e.g., "len(name) >= 1")
+
+    @property
+    def key(self) -> str:
+        """Coverage key, e.g. "createUser.requires.name_not_empty"."""
+        return _clause_key(self.kind, self.function, self.class_name, self.clause)
+
+
+def _clause_key(kind: str, function: Optional[str], class_name: Optional[str], clause: str) -> str:
+    owner = f"{class_name}.{function}" if class_name and function else (function or class_name)
+    return f"{owner}.{kind}.{clause}"
+
+
+# Registered clauses, indexed by clause id, and the id of each clause key.
+# A key registered again (e.g. the same generated module loaded twice)
+# keeps its id, so its coverage adds up.
+_CLAUSES: List[ClauseInfo] = []
+_CLAUSE_IDS: Dict[str, int] = {}
+_REGISTRY_LOCK = threading.RLock()
+
+_VIOLATION_TYPES = {"requires": "precondition", "ensures": "postcondition", "invariant": "invariant"}
+
+
+def register_clauses(table: Iterable[Tuple[str, Optional[str], Optional[str], str, str]]) -> Tuple[int, ...]:
+    """
+    Register the contract clauses of a module.
+
+    Generated modules call this once at import with their clause table and
+    pass the returned ids to check_clause(), so checks never format names.
+
+    Args:
+        table: (kind, function, class_name, clause, expression) per clause
+
+    Returns:
+        The clause id of each entry, in order
+
+    Example:
+        _AL_CLAUSES = register_clauses((
+            ("requires", "createUser", None, "name_not_empty", "len(name) >= 1"),
+        ))
+    """
+    ids = []
+    with _REGISTRY_LOCK:
+        for entry in table:
+            info = ClauseInfo(*entry)
+            if info.kind not in _VIOLATION_TYPES:
+                raise ValueError(f"Unknown clause kind: {info.kind!r}")
+            key = info.key
+            clause_id = _CLAUSE_IDS.get(key)
+            if clause_id is None:
+                clause_id = _CLAUSE_IDS[key] = len(_CLAUSES)
+                _CLAUSES.append(info)
+                _SAMPLERS.append(_ClauseSampler(info.kind))
+            else:
+                _CLAUSES[clause_id] = info
+            ids.append(clause_id)
+    return tuple(ids)
+
+
+# Ids of clauses checked by name, keyed by the name tuple so a repeated
+# check hashes the caller's strings instead of formatting a key
+_NAMED_CLAUSE_IDS: Dict[Tuple[str, Optional[str], Optional[str], str], int] = {}
+
+
+def _clause_id(kind: str, function: Optional[str], class_name: Optional[str], clause: str, expression: str) -> int:
+    """Id of a clause checked by name (check_* calls without a clause_id)."""
+    try:
+        return _NAMED_CLAUSE_IDS[kind, function, class_name, clause]
+    except KeyError:
+        clause_id = register_clauses([(kind, function, class_name, clause, expression)])[0]
+        _NAMED_CLAUSE_IDS[kind, function, class_name, clause] = clause_id
+        return clause_id
+
+
+# ============================================================================
+# Sampled Checking
+# ============================================================================
+
+# SAMPLED mode settings (see configure_sampling)
+_SAMPLE_INTERVALS = {"requires": 100, "ensures": 100, "invariant": 100}
+_SAMPLE_WARMUP = 100
+_SAMPLE_BACKOFF_AFTER = 0
+_SAMPLE_MAX_INTERVAL = 10_000
+
+
+class _ClauseSampler:
+    """
+    Sampling state and counters of one contract clause.
+
+    The state is shared by all threads and updated without a lock, which
+    would cost as much as the skipped check it guards. Concurrent calls
+    can lose an update, so under threads the counters and the 1-in-N
+    spacing are approximate.
+    """
+
+    __slots__ = ("kind", "interval", "countdown", "calls", "checked", "clean")
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        self.interval = _SAMPLE_INTERVALS[kind]
+        self.countdown = self.interval
+        self.calls = 0
+        self.checked = 0
+        self.clean = 0  # Sampled checks since the last violation or back-off
+
+    def checked_call(self) -> bool:
+        """Count a sampled check and apply the back-off."""
+        self.checked += 1
+        # Counted as clean up front; _note_violation() undoes it
+        self.clean += 1
+        if _SAMPLE_BACKOFF_AFTER and self.clean >= _SAMPLE_BACKOFF_AFTER and self.interval < _SAMPLE_MAX_INTERVAL:
+            self.interval = min(self.interval * 2, _SAMPLE_MAX_INTERVAL)
+            self.clean = 0
+        return True
+
+
+# Sampler of each registered clause, indexed by clause id
+_SAMPLERS: List[_ClauseSampler] = []
+
+
+def configure_sampling(
+    preconditions: int = 100,
+    postconditions: int = 100,
+    invariants: int = 100,
+    warmup: int = 100,
+    backoff_after: int = 0,
+    max_interval: int = 10_000
+) -> None:
+    """
+    Configure ValidationMode.SAMPLED.
+
+    Each clause is checked on its first `warmup` calls, then on 1 in N calls,
+    with N set per clause type. With backoff_after, N doubles (up to
+    max_interval) each time a clause passes that many sampled checks in a
+    row; a violation resets it. Calls from several threads share the
+    counters without locking, so there the rate is approximate.
+
+    Args:
+        preconditions: N for @requires clauses
+        postconditions: N for @ensures clauses
+        invariants: N for @invariant clauses
+        warmup: Calls of each clause that are always checked
+        backoff_after: Clean sampled checks before N doubles (0 = never)
+        max_interval: Upper bound for N under back-off
+
+    Example:
+        configure_sampling(preconditions=10, postconditions=100, backoff_after=1000)
+        set_validation_mode(ValidationMode.SAMPLED)
+    """
+    global _SAMPLE_WARMUP, _SAMPLE_BACKOFF_AFTER, _SAMPLE_MAX_INTERVAL
+    intervals = {"requires": preconditions, "ensures": postconditions, "invariant": invariants}
+    if min(intervals.values()) < 1 or max_interval < 1:
+        raise ValueError("Sampling intervals must be at least 1")
+    if warmup < 0 or backoff_after < 0:
+        raise ValueError("warmup and backoff_after must not be negative")
+
+    _SAMPLE_INTERVALS.update(intervals)
+    _SAMPLE_WARMUP = warmup
+    _SAMPLE_BACKOFF_AFTER = backoff_after
+    _SAMPLE_MAX_INTERVAL = max_interval
+    for sampler in _SAMPLERS:
+        sampler.interval = sampler.countdown = _SAMPLE_INTERVALS[sampler.kind]
+        sampler.clean = 0
+
+
+def sample_clause(clause_id: int) -> bool:
+    """
+    Whether to check a clause on this call (SAMPLED mode).
+
+    Generated code asks before each check:
+        if not __mode.sampling or _al_contracts.sample_clause(_AL_CLAUSES[0]):
+    """
+    sampler = _SAMPLERS[clause_id]
+    sampler.calls += 1
+    if sampler.calls > _SAMPLE_WARMUP:
+        sampler.countdown -= 1
+        if sampler.countdown > 0:
+            return False
+        sampler.countdown = sampler.interval
+    return sampler.checked_call()
+
+
+def _note_violation(clause_id: int) -> None:
+    """A check of the clause failed: sample it at its base rate again."""
+    sampler = _SAMPLERS[clause_id]
+    sampler.interval = _SAMPLE_INTERVALS[sampler.kind]
+    sampler.countdown = min(sampler.countdown, sampler.interval)
+    sampler.clean = 0
+
+
+def get_sampling_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Get per-clause counters of SAMPLED mode.
+
+    Returns:
+        Dict mapping clause keys to their checked and skipped call counts
+        and current sampling interval. Under concurrent calls the counts
+        are approximate (see _ClauseSampler).
+
+    Example:
+        get_sampling_stats()
+        # {"createUser.requires.name_not_empty": {"checked": 110, "skipped": 890, "interval": 100}}
+    """
+    with _REGISTRY_LOCK:
+        samplers = list(zip(_CLAUSES, _SAMPLERS))
+    return {
+        info.key: {
+            "checked": sampler.checked,
+            # A lost update to calls must not show as negative skips
+            "skipped": max(sampler.calls - sampler.checked, 0),
+            "interval": sampler.interval,
+        }
+        for info, sampler in samplers
+        if sampler.calls
+    }
+
+
+def reset_sampling() -> None:
+    """Forget all sampling counters (the warm-up applies again)."""
+    with _REGISTRY_LOCK:
+        _SAMPLERS[:] = [_ClauseSampler(sampler.kind) for sampler in _SAMPLERS]
 
 
 class ContractViolationError(Exception):
@@ -207,13 +620,72 @@ def capture_old_values(old_expressions: Dict[str, Any]) -> Dict[str, OldValue]:
 # ============================================================================
 
 
+def _violation_context(context: Optional[ViolationContext], frame: FrameType) -> Optional[Dict[str, Any]]:
+    """Materialize the context of a failed check made from frame."""
+    if context is None or isinstance(context, dict):
+        return context
+    if callable(context):
+        return context()
+    local_vars = frame.f_locals
+    values = {}
+    for entry in context:
+        key, name = (entry, entry) if isinstance(entry, str) else entry
+        if name in local_vars:
+            values[key] = local_vars[name]
+    return values
+
+
+def check_clause(condition: bool, clause_id: int, context: Optional[ViolationContext] = None) -> None:
+    """
+    Check a registered contract clause.
+
+    Called by generated code, which tests the mode flag of the clause kind
+    first. Everything else about the clause (names, expression) comes
+    from its register_clauses() entry and is only read if the check fails.
+
+    Args:
+        condition: Result of evaluating the clause expression
+        clause_id: Id returned by register_clauses()
+        context: Variable values for error reporting (see ViolationContext)
+
+    Raises:
+        ContractViolationError: If condition is False
+
+    Example:
+        check_clause(len(name) >= 1, _AL_CLAUSES[0], context=("name",))
+    """
+    try:
+        _COVERAGE.counts[clause_id] += 1
+    except (AttributeError, IndexError):
+        _coverage_shard(clause_id)[clause_id] += 1
+
+    if not condition:
+        _raise_violation(clause_id, _violation_context(context, sys._getframe(1)))
+
+
+def _raise_violation(clause_id: int, context: Optional[Dict[str, Any]]) -> None:
+    info = _CLAUSES[clause_id]
+    _note_violation(clause_id)
+    violation_type = _VIOLATION_TYPES[info.kind]
+    raise ContractViolationError(
+        type=violation_type,
+        clause=info.clause,
+        expression=info.expression,
+        message=f"{violation_type.title()} '{info.clause}' violated",
+        function=info.function,
+        class_name=info.class_name,
+        context=context
+    )
+
+
 def check_precondition(
     condition: bool,
     clause_name: str,
     expression: str,
     function_name: str,
     class_name: Optional[str] = None,
-    context: Optional[Dict[str, Any]] = None
+    context: Optional[ViolationContext] = None,
+    clause_id: Optional[int] = None
 ) -> None:
     """
     Check a precondition assertion.
@@ -226,7 +698,9 @@ def check_precondition(
         expression: String representation of the expression
         function_name: Name of the function
         class_name: Name of the class (if method)
-        context: Variable values for error reporting
+        context: Variable values for error reporting (see ViolationContext)
+        clause_id: Id from register_clauses(), so repeated checks skip
+            the lookup by name
 
     Raises:
         ContractViolationError: If condition is False
@@ -244,11 +718,12 @@ def check_precondition(
         return
 
     # Track coverage
-    full_name = f"{class_name}.{function_name}" if class_name else function_name
-    key = f"{full_name}.requires.{clause_name}"
-    _CLAUSE_COVERAGE[key] = _CLAUSE_COVERAGE.get(key, 0) + 1
+    if clause_id is None:
+        clause_id = _clause_id("requires", function_name, class_name, clause_name, expression)
+    _count_coverage(clause_id)
 
     if not condition:
+        _note_violation(clause_id)
         raise ContractViolationError(
             type="precondition",
             clause=clause_name,
@@ -256,7 +731,7 @@ def check_precondition(
             message=f"Precondition '{clause_name}' violated",
             function=function_name,
             class_name=class_name,
-            context=context
+            context=_violation_context(context, sys._getframe(1))
         )
 
 
@@ -266,7 +741,8 @@ def check_postcondition(
     expression: str,
     function_name: str,
     class_name: Optional[str] = None,
-    context: Optional[Dict[str, Any]] = None
+    context: Optional[ViolationContext] = None,
+    clause_id: Optional[int] = None
 ) -> None:
     """
     Check a postcondition assertion.
@@ -279,7 +755,10 @@ def check_postcondition(
         expression: String representation of the expression
         function_name: Name of the function
         class_name: Name of the class (if method)
-        context: Variable values for error reporting (including 'result')
+        context: Variable values for error reporting, including 'result'
+            (see ViolationContext)
+        clause_id: Id from register_clauses(), so repeated checks skip
+            the lookup by name
 
     Raises:
         ContractViolationError: If condition is False
@@ -297,11 +776,12 @@ def check_postcondition(
         return
 
     # Track coverage
-    full_name = f"{class_name}.{function_name}" if class_name else function_name
-    key = f"{full_name}.ensures.{clause_name}"
-    _CLAUSE_COVERAGE[key] = _CLAUSE_COVERAGE.get(key, 0) + 1
+    if clause_id is None:
+        clause_id = _clause_id("ensures", function_name, class_name, clause_name, expression)
+    _count_coverage(clause_id)
 
     if not condition:
+        _note_violation(clause_id)
         raise ContractViolationError(
             type="postcondition",
             clause=clause_name,
@@ -309,7 +789,7 @@ def check_postcondition(
             message=f"Postcondition '{clause_name}' violated",
             function=function_name,
             class_name=class_name,
-            context=context
+            context=_violation_context(context, sys._getframe(1))
         )
 
 
@@ -318,7 +798,8 @@ def check_invariant(
     clause_name: str,
     expression: str,
     class_name: str,
-    context: Optional[Dict[str, Any]] = None
+    context: Optional[ViolationContext] = None,
+    clause_id: Optional[int] = None
 ) -> None:
     """
     Check a class invariant assertion.
@@ -330,7 +811,9 @@ def check_invariant(
         clause_name: Name of the clause (for error reporting)
         expression: String representation of the expression
         class_name: Name of the class
-        context: Variable values for error reporting
+        context: Variable values for error reporting (see ViolationContext)
+        clause_id: Id from register_clauses(), so repeated checks skip
+            the lookup by name
 
     Raises:
         ContractViolationError: If condition is False
@@ -348,17 +831,19 @@ def check_invariant(
         return
 
     # Track coverage
-    key = f"{class_name}.invariant.{clause_name}"
-    _CLAUSE_COVERAGE[key] = _CLAUSE_COVERAGE.get(key, 0) + 1
+    if clause_id is None:
+        clause_id = _clause_id("invariant", None, class_name, clause_name, expression)
+    _count_coverage(clause_id)
 
     if not condition:
+        _note_violation(clause_id)
         raise ContractViolationError(
             type="invariant",
             clause=clause_name,
             expression=expression,
             message=f"Invariant '{clause_name}' violated",
             class_name=class_name,
-            context=context
+            context=_violation_context(context, sys._getframe(1))
         )
 
 
@@ -367,21 +852,78 @@ def check_invariant(
 # ============================================================================
 
 
+# Coverage counters, indexed by clause id. Each thread counts into its own
+# preallocated array (a shard), so counting takes no lock and loses no
+# updates; get_coverage() adds up the shards. When a thread finishes, its
+# thread-local state is dropped, which folds its shard into
+# _COVERAGE_TOTALS and releases it.
+_COVERAGE = threading.local()
+_COVERAGE_SHARDS: List[array] = []
+_COVERAGE_TOTALS = array("Q")
+
+
+class _ShardOwner:
+    """Thread-local marker whose collection retires the thread's shard."""
+
+    __slots__ = ("__weakref__",)
+
+
+def _retire_shard(shard: array) -> None:
+    with _REGISTRY_LOCK:
+        if len(_COVERAGE_TOTALS) < len(shard):
+            _COVERAGE_TOTALS.frombytes(bytes(8 * (len(shard) - len(_COVERAGE_TOTALS))))
+        for clause_id, count in enumerate(shard):
+            if count:
+                _COVERAGE_TOTALS[clause_id] += count
+        _COVERAGE_SHARDS.remove(shard)
+
+
+def _coverage_shard(clause_id: int) -> array:
+    """The calling thread's shard, created or grown to cover clause_id."""
+    shard = getattr(_COVERAGE, "counts", None)
+    if shard is None:
+        shard = _COVERAGE.counts = array("Q")
+        with _REGISTRY_LOCK:
+            _COVERAGE_SHARDS.append(shard)
+        _COVERAGE.owner = _ShardOwner()
+        weakref.finalize(_COVERAGE.owner, _retire_shard, shard)
+    # Room for every clause registered so far, so growing stays rare
+    size = max(clause_id + 1, len(_CLAUSES))
+    if len(shard) < size:
+        shard.frombytes(bytes(8 * (size - len(shard))))
+    return shard
+
+
+def _count_coverage(clause_id: int) -> None:
+    try:
+        _COVERAGE.counts[clause_id] += 1
+    except (AttributeError, IndexError):
+        _coverage_shard(clause_id)[clause_id] += 1
+
+
 def get_coverage() -> Dict[str, int]:
     """
     Get contract clause coverage data.
 
     Returns:
-        Dict mapping clause keys to execution counts
+        Dict mapping clause keys to execution counts (clauses that were
+        checked at least once)
 
     Example:
         coverage = get_coverage()
         # {"createUser.requires.name_not_empty": 5, ...}
     """
-    return _CLAUSE_COVERAGE.copy()
+    with _REGISTRY_LOCK:
+        clauses = list(_CLAUSES)
+        totals = [0] * len(clauses)
+        for shard in [_COVERAGE_TOTALS, *_COVERAGE_SHARDS]:
+            for clause_id, count in enumerate(shard[:len(clauses)]):
+                totals[clause_id] += count
+    return {info.key: total for info, total in zip(clauses, totals) if total}
 
 
 def reset_coverage() -> None:
     """Reset contract coverage tracking."""
-    global _CLAUSE_COVERAGE
-    _CLAUSE_COVERAGE = {}
+    with _REGISTRY_LOCK:
+        for shard in [_COVERAGE_TOTALS, *_COVERAGE_SHARDS]:
+            shard[:] = array("Q", bytes(8 * len(shard)))
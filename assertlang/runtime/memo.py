@@ -0,0 +1,105 @@
+"""
+AssertLang Memoization Runtime
+
+Bounded result caches for functions declared @pure or @memoize(max=N).
+The parser has already checked these functions for purity (no I/O, no
+mutation of parameters), so generated code only needs the cache itself.
+
+Unlike functools.lru_cache, list and dict arguments are keyed by their
+contents, arguments that cannot be keyed bypass the cache instead of
+raising, and evictions are counted.
+
+Example:
+    @memoize(maxsize=256)
+    def shipping_cost(weight: float) -> float:
+        ...
+
+    shipping_cost.cache_info()
+    # MemoInfo(hits=10, misses=3, evictions=0, size=3, maxsize=256)
+"""
+
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, NamedTuple, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class MemoInfo(NamedTuple):
+    """Counters of one memoized function."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+def memo_key(value: Any) -> Any:
+    """
+    Hashable cache key for an argument. The type is part of the key, so 1,
+    1.0 and True stay distinct; lists, tuples and dicts are keyed by their
+    contents. Raises TypeError for unhashable values of other types.
+    """
+    cls = value.__class__
+    if cls is list or cls is tuple:
+        return (cls, tuple([memo_key(item) for item in value]))
+    if cls is dict:
+        return (cls, tuple([(memo_key(k), memo_key(v)) for k, v in value.items()]))
+    hash(value)
+    return (cls, value)
+
+
+def memoize(maxsize: int = 128) -> Callable[[F], F]:
+    """
+    Decorate a pure function with a bounded LRU cache of its results.
+
+    Args:
+        maxsize: Maximum number of cached results
+
+    The wrapper exposes cache_info() and cache_clear().
+    """
+    if maxsize < 1:
+        raise ValueError(f"maxsize must be a positive integer, got {maxsize}")
+
+    def decorator(func: F) -> F:
+        entries: OrderedDict = OrderedDict()
+        counters = {"hits": 0, "misses": 0, "evictions": 0}
+
+        @wraps(func)
+        def memoized(*args: Any, **kwargs: Any) -> Any:
+            try:
+                key = memo_key(args)
+                if kwargs:
+                    key = (key, memo_key(dict(sorted(kwargs.items()))))
+            except TypeError:
+                return func(*args, **kwargs)
+            try:
+                result = entries[key]
+            except KeyError:
+                pass
+            else:
+                entries.move_to_end(key)
+                counters["hits"] += 1
+                return result
+
+            counters["misses"] += 1
+            result = func(*args, **kwargs)
+            entries[key] = result
+            if len(entries) > maxsize:
+                entries.popitem(last=False)
+                counters["evictions"] += 1
+            return result
+
+        def cache_info() -> MemoInfo:
+            return MemoInfo(counters["hits"], counters["misses"], counters["evictions"], len(entries), maxsize)
+
+        def cache_clear() -> None:
+            entries.clear()
+            counters.update(hits=0, misses=0, evictions=0)
+
+        memoized.cache_info = cache_info
+        memoized.cache_clear = cache_clear
+        return memoized
+
+    return decorator
@@ -18,6 +18,8 @@ from dsl.ir import (
     IRNode,
     NodeType,
     SourceLocation,
+    IRVisitor,
+    dispatches,
 
     # Module-level nodes
     IRModule,
@@ -28,6 +30,7 @@ from dsl.ir import (
     IRTypeDefinition,
     IREnum,
     IREnumVariant,
+    intern_type,
 
     # Function/class nodes
     IRFunction,
@@ -67,6 +70,8 @@ __all__ = [
     "IRNode",
     "NodeType",
     "SourceLocation",
+    "IRVisitor",
+    "dispatches",
 
     # Module-level nodes
     "IRModule",
@@ -77,6 +82,7 @@ __all__ = [
     "IRTypeDefinition",
     "IREnum",
     "IREnumVariant",
+    "intern_type",
 
     # Function/class nodes
     "IRFunction",
@@ -0,0 +1,439 @@
+"""
+Asynchronous execution of AL functions on an asyncio event loop.
+
+PWRuntime.execute_function_async(func, args) runs func on the running loop:
+- Calling an `async function` starts it as an asyncio Task and evaluates to
+  that task; `await` waits for it. As with JavaScript promises, calls issued
+  before they are awaited run concurrently.
+- Python coroutine functions registered as globals are called the same way,
+  and `await` awaits their coroutines (or any other awaitable) natively.
+- With concurrent_awaits (the default), a run of consecutive
+  `let x = await f(...);` declarations whose calls do not read each other's
+  results is started together and awaited as one, so independent awaited
+  calls overlap as well. The calls still start in program order and the
+  results are assigned in program order; if one fails, those still pending
+  are cancelled. Only declarations are grouped: an awaited expression
+  statement such as `await db.write(x);` always completes before the next
+  statement starts.
+
+Only the statements and expressions of an async function that contain an
+`await` are evaluated here. Everything else, including every synchronous
+function, runs on the runtime's own engine and tiers. Async function bodies
+are walked with dict scopes like the tree engine, and are not pushed onto
+PWRuntime.call_stack, which concurrent tasks would interleave.
+
+Outside execute_function_async (and inside synchronous code such as lambdas)
+async functions run to completion when called and `await` passes values
+through (see dsl.al_runtime.await_value).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextvars import ContextVar
+from dataclasses import dataclass, field, fields
+from inspect import isawaitable
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, List, Optional, Set, Tuple
+
+from dsl.al_runtime import (
+    BreakSignal,
+    ContinueSignal,
+    PWRuntimeError,
+    ReturnValue,
+    compile_ir_pattern,
+    get_property,
+    is_truthy,
+)
+from dsl.ir import (
+    IRArray,
+    IRAssignment,
+    IRAwait,
+    IRBinaryOp,
+    IRCall,
+    IRExpression,
+    IRFor,
+    IRForCStyle,
+    IRFunction,
+    IRIdentifier,
+    IRIf,
+    IRIndex,
+    IRLambda,
+    IRMap,
+    IRNode,
+    IRPatternMatch,
+    IRPropertyAccess,
+    IRReturn,
+    IRStatement,
+    IRTernary,
+    IRUnaryOp,
+    IRVisitor,
+    IRWhile,
+    dispatches,
+)
+
+if TYPE_CHECKING:
+    from dsl.al_runtime import FunctionTier, PWRuntime
+
+# concurrent_awaits of the execute_function_async call in progress in this
+# context (tasks inherit it), or None during synchronous execution
+_ASYNC_MODE: ContextVar[Optional[bool]] = ContextVar("al_async_mode", default=None)
+
+_SIGNALS = (ReturnValue, BreakSignal, ContinueSignal)
+
+
+async def run_async(runtime: PWRuntime, func: Any, args: List[Any], concurrent_awaits: bool) -> Any:
+    """Implementation of PWRuntime.execute_function_async"""
+    token = _ASYNC_MODE.set(concurrent_awaits)
+    try:
+        return await settle(runtime.execute_function(func, args))
+    finally:
+        _ASYNC_MODE.reset(token)
+
+
+def start_coroutine(coroutine: Coroutine) -> Any:
+    """Schedule a coroutine returned by a Python global as a task, when running async"""
+    if _ASYNC_MODE.get() is None:
+        return coroutine
+    return asyncio.ensure_future(coroutine)
+
+
+async def settle(value: Any) -> Any:
+    """Await value if it is awaitable"""
+    if isawaitable(value):
+        return await value
+    return value
+
+
+# ============================================================================
+# Analysis
+# ============================================================================
+
+
+@dataclass
+class _Plan:
+    """What an async function needs evaluated asynchronously"""
+
+    # ids of the statements and expressions that contain an await (not
+    # counting lambda bodies, which run synchronously)
+    awaiting: Set[int] = field(default_factory=set)
+    # id of the first statement of a run of independent awaited declarations
+    # -> length of the run
+    runs: Dict[int, int] = field(default_factory=dict)
+
+
+def _find_awaits(node: Any, awaiting: Set[int]) -> bool:
+    if isinstance(node, list):
+        found = False
+        for item in node:
+            found = _find_awaits(item, awaiting) or found
+        return found
+    if isinstance(node, dict):
+        return _find_awaits(list(node.values()), awaiting)
+    if not isinstance(node, IRNode) or isinstance(node, IRLambda):
+        return False
+    found = isinstance(node, IRAwait)
+    for f in fields(node):
+        found = _find_awaits(getattr(node, f.name), awaiting) or found
+    if found:
+        awaiting.add(id(node))
+    return found
+
+
+def _reads(node: Any, names: Set[str]) -> bool:
+    """Collect the identifiers node reads; False if it binds names itself (`is` patterns)"""
+    if isinstance(node, list):
+        return all([_reads(item, names) for item in node])
+    if isinstance(node, dict):
+        return _reads(list(node.values()), names)
+    if not isinstance(node, IRNode):
+        return True
+    if isinstance(node, IRPatternMatch):
+        return False
+    if isinstance(node, IRIdentifier):
+        names.add(node.name)
+    return all([_reads(getattr(node, f.name), names) for f in fields(node)])
+
+
+def _awaited_call(stmt: IRStatement, awaiting: Set[int]) -> Optional[Tuple[str, Set[str]]]:
+    """(target, names read) if stmt is `let target = await call(...)` with no other await"""
+    if not (
+        isinstance(stmt, IRAssignment)
+        and stmt.is_declaration
+        and isinstance(stmt.target, str)
+        and isinstance(stmt.value, IRAwait)
+        and isinstance(stmt.value.expression, IRCall)
+        and id(stmt.value.expression) not in awaiting
+    ):
+        return None
+    names: Set[str] = set()
+    if not _reads(stmt.value.expression, names):
+        return None
+    return stmt.target, names
+
+
+def _find_runs(statements: List[IRStatement], plan: _Plan) -> None:
+    i = 0
+    while i < len(statements):
+        targets: Set[str] = set()
+        j = i
+        while j < len(statements):
+            awaited = _awaited_call(statements[j], plan.awaiting)
+            if awaited is None:
+                break
+            target, reads = awaited
+            if target in targets or reads & targets:
+                break
+            targets.add(target)
+            j += 1
+        if j - i > 1:
+            plan.runs[id(statements[i])] = j - i
+            i = j
+        else:
+            i += 1
+
+    for stmt in statements:
+        if id(stmt) not in plan.awaiting:
+            continue
+        if isinstance(stmt, IRIf):
+            _find_runs(stmt.then_body, plan)
+            _find_runs(stmt.else_body or [], plan)
+        elif isinstance(stmt, (IRFor, IRForCStyle, IRWhile)):
+            _find_runs(stmt.body, plan)
+
+
+# ============================================================================
+# Interpreter
+# ============================================================================
+
+
+class AsyncInterpreter(IRVisitor):
+    """
+    Runs the async functions of one PWRuntime as coroutines.
+
+    Statement handlers take (stmt, scope, plan) and return what the
+    tree-walker's would (a value or a control flow signal); expression
+    handlers take (expr, scope, plan). Both are only called for nodes in
+    plan.awaiting.
+    """
+
+    def __init__(self, runtime: PWRuntime):
+        self.runtime = runtime
+        # (id(IRFunction), concurrent_awaits) -> (IRFunction, plan)
+        self._plans: Dict[Tuple[int, bool], Tuple[IRFunction, _Plan]] = {}
+
+    def entry(self, tier: FunctionTier, entry: Callable[[List[Any]], Any]) -> Callable[[List[Any]], Any]:
+        """Wrap the synchronous entry point of an async function"""
+        func = tier.function
+        call = self.call
+
+        def async_entry(args: List[Any]) -> Any:
+            concurrent = _ASYNC_MODE.get()
+            if concurrent is None:
+                return entry(args)
+            tier.calls += 1
+            return asyncio.ensure_future(call(func, args, concurrent))
+
+        return async_entry
+
+    def plan(self, func: IRFunction, concurrent: bool) -> _Plan:
+        cached = self._plans.get((id(func), concurrent))
+        if cached is None or cached[0] is not func:
+            plan = _Plan()
+            _find_awaits(func.body, plan.awaiting)
+            if concurrent:
+                _find_runs(func.body, plan)
+            cached = self._plans[id(func), concurrent] = (func, plan)
+        return cached[1]
+
+    async def call(self, func: IRFunction, args: List[Any], concurrent: bool) -> Any:
+        """Run an async function's body and return its result"""
+        plan = self.plan(func, concurrent)
+        runtime = self.runtime
+
+        scope: Dict[str, Any] = {}
+        for i, param in enumerate(func.params):
+            if i < len(args):
+                scope[param.name] = args[i]
+            elif param.default_value:
+                scope[param.name] = runtime.evaluate_expression(param.default_value, scope)
+            else:
+                raise PWRuntimeError(f"Missing required argument: {param.name}", func.location)
+
+        result = await self.block(func.body, scope, plan)
+        if isinstance(result, ReturnValue):
+            result = result.value
+        # Like a JavaScript promise, returning a task resolves to its value
+        return await settle(result)
+
+    # ------------------------------------------------------------------
+    # Statements
+    # ------------------------------------------------------------------
+
+    async def statement(self, stmt: IRStatement, scope: Dict[str, Any], plan: _Plan) -> Any:
+        if id(stmt) not in plan.awaiting:
+            return self.runtime.execute_statement(stmt, scope)
+        return await self.dispatch("statement", stmt, scope, plan)
+
+    async def block(self, statements: List[IRStatement], scope: Dict[str, Any], plan: _Plan) -> Any:
+        result = None
+        i = 0
+        while i < len(statements):
+            stmt = statements[i]
+            run = plan.runs.get(id(stmt))
+            if run is not None:
+                result = await self._gather(statements[i:i + run], scope)
+                i += run
+                continue
+            result = await self.statement(stmt, scope, plan)
+            if isinstance(result, _SIGNALS):
+                return result
+            i += 1
+        return result
+
+    async def _gather(self, statements: List[IRAssignment], scope: Dict[str, Any]) -> Any:
+        """Start the calls of independent `let x = await call(...)` declarations, then await them all"""
+        runtime = self.runtime
+        started: List[Any] = []
+        try:
+            for stmt in statements:
+                value = runtime.evaluate_expression(stmt.value.expression, scope)
+                started.append(asyncio.ensure_future(value) if isawaitable(value) else value)
+            pending = [value for value in started if isinstance(value, asyncio.Future)]
+            if pending:
+                await asyncio.gather(*pending)
+        except BaseException:
+            for value in started:
+                if isinstance(value, asyncio.Future):
+                    value.cancel()
+            raise
+
+        value = None
+        for stmt, value in zip(statements, started):
+            if isinstance(value, asyncio.Future):
+                value = value.result()
+            runtime.assign(stmt, value, scope)
+        return value
+
+    @dispatches(IRReturn, table="statement")
+    async def _execute_return(self, stmt: IRReturn, scope: Dict[str, Any], plan: _Plan) -> Any:
+        return ReturnValue(await self.expression(stmt.value, scope, plan))
+
+    @dispatches(IRAssignment, table="statement")
+    async def _execute_assignment(self, stmt: IRAssignment, scope: Dict[str, Any], plan: _Plan) -> Any:
+        value = await self.expression(stmt.value, scope, plan)
+        self.runtime.assign(stmt, value, scope)
+        return value
+
+    @dispatches(IRIf, table="statement")
+    async def _execute_if(self, stmt: IRIf, scope: Dict[str, Any], plan: _Plan) -> Any:
+        if is_truthy(await self.expression(stmt.condition, scope, plan)):
+            return await self.block(stmt.then_body, scope, plan)
+        elif stmt.else_body:
+            return await self.block(stmt.else_body, scope, plan)
+
+    @dispatches(IRFor, table="statement")
+    async def _execute_for(self, stmt: IRFor, scope: Dict[str, Any], plan: _Plan) -> Any:
+        iterable = await self.expression(stmt.iterable, scope, plan)
+        loop_scope = dict(scope)
+        for item in iterable:
+            loop_scope[stmt.iterator] = item
+            result = await self.block(stmt.body, loop_scope, plan)
+            if isinstance(result, ReturnValue):
+                return result
+            if isinstance(result, BreakSignal):
+                break
+        scope.update(loop_scope)
+
+    @dispatches(IRForCStyle, table="statement")
+    async def _execute_for_c_style(self, stmt: IRForCStyle, scope: Dict[str, Any], plan: _Plan) -> Any:
+        await self.statement(stmt.init, scope, plan)
+        while is_truthy(await self.expression(stmt.condition, scope, plan)):
+            result = await self.block(stmt.body, scope, plan)
+            if isinstance(result, ReturnValue):
+                return result
+            if isinstance(result, BreakSignal):
+                break
+            await self.statement(stmt.increment, scope, plan)
+
+    @dispatches(IRWhile, table="statement")
+    async def _execute_while(self, stmt: IRWhile, scope: Dict[str, Any], plan: _Plan) -> Any:
+        while is_truthy(await self.expression(stmt.condition, scope, plan)):
+            result = await self.block(stmt.body, scope, plan)
+            if isinstance(result, ReturnValue):
+                return result
+            if isinstance(result, BreakSignal):
+                break
+
+    @dispatches(IRCall, IRAwait, table="statement")
+    async def _execute_expression_statement(self, stmt: IRExpression, scope: Dict[str, Any], plan: _Plan) -> Any:
+        return await self.expression(stmt, scope, plan)
+
+    @dispatches(object, table="statement")
+    async def _execute_other_statement(self, stmt: Any, scope: Dict[str, Any], plan: _Plan) -> Any:
+        # Awaits in statements the runtime cannot run asynchronously are synchronous
+        return self.runtime.execute_statement(stmt, scope)
+
+    # ------------------------------------------------------------------
+    # Expressions
+    # ------------------------------------------------------------------
+
+    async def expression(self, expr: IRExpression, scope: Dict[str, Any], plan: _Plan) -> Any:
+        if id(expr) not in plan.awaiting:
+            return self.runtime.evaluate_expression(expr, scope)
+        return await self.dispatch("expression", expr, scope, plan)
+
+    @dispatches(IRAwait, table="expression")
+    async def _evaluate_await(self, expr: IRAwait, scope: Dict[str, Any], plan: _Plan) -> Any:
+        return await settle(await self.expression(expr.expression, scope, plan))
+
+    @dispatches(IRBinaryOp, table="expression")
+    async def _evaluate_binary_op(self, expr: IRBinaryOp, scope: Dict[str, Any], plan: _Plan) -> Any:
+        left = await self.expression(expr.left, scope, plan)
+        right = await self.expression(expr.right, scope, plan)
+        return self.runtime._apply_binary_op(expr.op, left, right)
+
+    @dispatches(IRUnaryOp, table="expression")
+    async def _evaluate_unary_op(self, expr: IRUnaryOp, scope: Dict[str, Any], plan: _Plan) -> Any:
+        return self.runtime._apply_unary_op(expr.op, await self.expression(expr.operand, scope, plan))
+
+    @dispatches(IRCall, table="expression")
+    async def _evaluate_call(self, expr: IRCall, scope: Dict[str, Any], plan: _Plan) -> Any:
+        func = await self.expression(expr.function, scope, plan)
+        args = [await self.expression(arg, scope, plan) for arg in expr.args]
+        return self.runtime.execute_function(func, args)
+
+    @dispatches(IRArray, table="expression")
+    async def _evaluate_array(self, expr: IRArray, scope: Dict[str, Any], plan: _Plan) -> Any:
+        return [await self.expression(elem, scope, plan) for elem in expr.elements]
+
+    @dispatches(IRMap, table="expression")
+    async def _evaluate_map(self, expr: IRMap, scope: Dict[str, Any], plan: _Plan) -> Any:
+        return {key: await self.expression(val, scope, plan) for key, val in expr.entries.items()}
+
+    @dispatches(IRIndex, table="expression")
+    async def _evaluate_index(self, expr: IRIndex, scope: Dict[str, Any], plan: _Plan) -> Any:
+        obj = await self.expression(expr.object, scope, plan)
+        index = await self.expression(expr.index, scope, plan)
+        return obj[index]
+
+    @dispatches(IRPropertyAccess, table="expression")
+    async def _evaluate_property_access(self, expr: IRPropertyAccess, scope: Dict[str, Any], plan: _Plan) -> Any:
+        return get_property(await self.expression(expr.object, scope, plan), expr.property)
+
+    @dispatches(IRTernary, table="expression")
+    async def _evaluate_ternary(self, expr: IRTernary, scope: Dict[str, Any], plan: _Plan) -> Any:
+        if is_truthy(await self.expression(expr.condition, scope, plan)):
+            return await self.expression(expr.true_value, scope, plan)
+        return await self.expression(expr.false_value, scope, plan)
+
+    @dispatches(IRPatternMatch, table="expression")
+    async def _evaluate_pattern_match(self, expr: IRPatternMatch, scope: Dict[str, Any], plan: _Plan) -> bool:
+        bindings = compile_ir_pattern(expr).match(await self.expression(expr.value, scope, plan))
+        if bindings is None:
+            return False
+        scope.update(bindings)
+        return True
+
+    @dispatches(object, table="expression")
+    async def _evaluate_other(self, expr: Any, scope: Dict[str, Any], plan: _Plan) -> Any:
+        return self.runtime.evaluate_expression(expr, scope)
@@ -0,0 +1,702 @@
+"""
+Batch execution of AL functions over columns of arguments.
+
+PWRuntime.execute_function_batch(func, columns) evaluates func for every row
+of its argument columns. When NumPy is installed and func stays within the
+vectorizable subset, it runs once over whole arrays instead of once per row:
+- int, float and bool parameters, literals and module globals
+- arithmetic, comparison, logical and bitwise operators, unary operators
+  and ternaries
+- `let`/assignments to locals, `if`/`else` and `return` (every path must
+  return)
+
+Control flow is predicated: each statement runs under a mask of the rows
+that reach it, assignments merge into the rows they apply to and a `return`
+retires its rows. Contract clauses are evaluated the same way, as boolean
+masks of the rows that satisfy them.
+
+The vectorized path is exact or not taken. Functions outside the subset
+(calls, loops, strings, global writes, ...) run row by row through
+execute_function, and so does a batch whose values leave the range where
+NumPy matches the scalar runtime: a zero divisor in a live row (the scalar
+path raises the error) or integers beyond +-2**53, where int64 could overflow
+and int/float conversions stop being exact. An unexpected error on the
+vectorized path also falls back to the rows. BatchResult.reason says why a
+batch was not vectorized.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from dsl.al_runtime import is_truthy
+from dsl.ir import (
+    BinaryOperator,
+    IRAssignment,
+    IRBinaryOp,
+    IRContractClause,
+    IRExpression,
+    IRFunction,
+    IRIdentifier,
+    IRIf,
+    IRLiteral,
+    IRReturn,
+    IRStatement,
+    IRTernary,
+    IRUnaryOp,
+    IRVisitor,
+    UnaryOperator,
+    dispatches,
+)
+
+if TYPE_CHECKING:
+    from dsl.al_runtime import PWRuntime
+
+# Optional NumPy integration for vectorized batches
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+class VectorizationError(Exception):
+    """The function, or this batch, cannot be evaluated as array operations"""
+
+
+@dataclass
+class BatchResult:
+    """
+    Result of PWRuntime.execute_function_batch.
+
+    values holds one result per row: an ndarray when NumPy is installed, else
+    a list. vectorized says whether the batch ran as array operations and
+    reason why it did not. With contracts=True, requires and ensures map each
+    clause name to a boolean mask of the rows that satisfy it.
+    """
+
+    values: Any
+    vectorized: bool
+    reason: Optional[str] = None
+    requires: Dict[str, Any] = field(default_factory=dict)
+    ensures: Dict[str, Any] = field(default_factory=dict)
+
+
+# Integers stay within +-_INT_LIMIT on the vectorized path: int64 never
+# overflows and converting to float64 is exact
+_INT_LIMIT = 2**53
+
+# (frame, mask) -> array or scalar
+VectorExpression = Callable[[Dict[str, Any], Any], Any]
+# (frame, mask, state) -> None
+VectorStatement = Callable[[Dict[str, Any], Any, "_BatchState"], None]
+
+
+# ============================================================================
+# Array helpers
+# ============================================================================
+
+
+def _is_array(value: Any) -> bool:
+    return isinstance(value, np.ndarray)
+
+
+def _kind(value: Any) -> str:
+    """NumPy dtype kind of an array or scalar: 'b', 'i' or 'f'"""
+    if isinstance(value, (bool, np.bool_)):
+        return "b"
+    if isinstance(value, (int, np.integer)):
+        return "i"
+    if isinstance(value, (float, np.floating)):
+        return "f"
+    if _is_array(value):
+        return value.dtype.kind
+    raise VectorizationError(f"Value of type {type(value).__name__} is not a number")
+
+
+def _numeric(value: Any) -> Any:
+    """Bools take part in arithmetic as 0/1, like Python's"""
+    if _kind(value) == "b":
+        return value.astype(np.int64) if _is_array(value) else int(value)
+    return value
+
+
+def _bound(value: Any) -> int:
+    """Largest magnitude of an integer array or scalar"""
+    if _is_array(value):
+        if not value.size:
+            return 0
+        return max(-int(value.min()), int(value.max()))
+    return abs(int(value))
+
+
+def _check_bound(bound: int) -> None:
+    if bound > _INT_LIMIT:
+        raise VectorizationError("Integer values may exceed 2**53")
+
+
+def _scalar(value: Any) -> Any:
+    """0-d arrays (e.g. from np.where on two scalars) as Python scalars"""
+    if _is_array(value) and value.ndim == 0:
+        return value.item()
+    return value
+
+
+def _truth(value: Any) -> Any:
+    """AL truthiness of numbers and bools, as a bool array or bool"""
+    if _is_array(value) and value.ndim:
+        return value if value.dtype.kind == "b" else value != 0
+    if isinstance(value, (np.generic, np.ndarray)):
+        # Row-invariant NumPy scalars (np.greater(0, 1) is np.False_, not False)
+        return bool(value)
+    return is_truthy(value)
+
+
+def _live_zero(divisor: Any, mask: Any) -> bool:
+    if _is_array(divisor) and divisor.ndim:
+        return bool((divisor[mask] == 0).any())
+    return bool(divisor == 0) and bool(mask.any())
+
+
+def _arithmetic(
+    ufunc: Any, bound: Optional[Callable[[int, int], int]]
+) -> Callable[[Any, Any, Any], Any]:
+    """Operator on numbers; bound gives the result's integer magnitude from the operands'"""
+
+    def apply(left: Any, right: Any, mask: Any) -> Any:
+        left, right = _numeric(left), _numeric(right)
+        if bound is not None and _kind(left) == "i" and _kind(right) == "i":
+            _check_bound(bound(_bound(left), _bound(right)))
+        return ufunc(left, right)
+
+    return apply
+
+
+def _division(ufunc: Any) -> Callable[[Any, Any, Any], Any]:
+    """/, // and %: a zero divisor in a live row is left to the scalar runtime"""
+
+    def apply(left: Any, right: Any, mask: Any) -> Any:
+        left, right = _numeric(left), _numeric(right)
+        if _live_zero(right, mask):
+            raise VectorizationError("Division by zero")
+        if _is_array(right):
+            # Dead rows may still divide by zero; their values are discarded
+            right = np.where(right == 0, 1, right)
+        return ufunc(left, right)
+
+    return apply
+
+
+def _bitwise(ufunc: Any) -> Callable[[Any, Any, Any], Any]:
+    def apply(left: Any, right: Any, mask: Any) -> Any:
+        if _kind(left) == "f" or _kind(right) == "f":
+            raise VectorizationError("Bitwise operator on floats")
+        if _kind(left) != _kind(right):
+            left, right = _numeric(left), _numeric(right)
+        if _kind(left) == "i":
+            _check_bound(2 * max(_bound(left), _bound(right)))
+        return ufunc(left, right)
+
+    return apply
+
+
+def _compare(ufunc: Any) -> Callable[[Any, Any, Any], Any]:
+    return lambda left, right, mask: ufunc(left, right)
+
+
+def _negate(operand: Any) -> Any:
+    return -_numeric(operand)
+
+
+def _invert(operand: Any) -> Any:
+    if _kind(operand) == "f":
+        raise VectorizationError("Bitwise operator on floats")
+    operand = _numeric(operand)
+    _check_bound(_bound(operand) + 1)
+    return ~operand
+
+
+def _binary_operators() -> Dict[BinaryOperator, Callable[[Any, Any, Any], Any]]:
+    return {
+        BinaryOperator.ADD: _arithmetic(np.add, lambda a, b: a + b),
+        BinaryOperator.SUBTRACT: _arithmetic(np.subtract, lambda a, b: a + b),
+        BinaryOperator.MULTIPLY: _arithmetic(np.multiply, lambda a, b: a * b),
+        BinaryOperator.DIVIDE: _division(np.true_divide),
+        BinaryOperator.FLOOR_DIVIDE: _division(np.floor_divide),
+        BinaryOperator.MODULO: _division(np.remainder),
+        BinaryOperator.EQUAL: _compare(np.equal),
+        BinaryOperator.NOT_EQUAL: _compare(np.not_equal),
+        BinaryOperator.LESS_THAN: _compare(np.less),
+        BinaryOperator.LESS_EQUAL: _compare(np.less_equal),
+        BinaryOperator.GREATER_THAN: _compare(np.greater),
+        BinaryOperator.GREATER_EQUAL: _compare(np.greater_equal),
+        BinaryOperator.AND: lambda left, right, mask: np.logical_and(_truth(left), _truth(right)),
+        BinaryOperator.OR: lambda left, right, mask: np.logical_or(_truth(left), _truth(right)),
+        BinaryOperator.BIT_AND: _bitwise(np.bitwise_and),
+        BinaryOperator.BIT_OR: _bitwise(np.bitwise_or),
+        BinaryOperator.BIT_XOR: _bitwise(np.bitwise_xor),
+    }
+
+
+_UNARY_OPERATORS: Dict[UnaryOperator, Callable[[Any], Any]] = {
+    UnaryOperator.NOT: lambda operand: np.logical_not(_truth(operand)),
+    UnaryOperator.NEGATE: _negate,
+    UnaryOperator.POSITIVE: _numeric,
+    UnaryOperator.BIT_NOT: _invert,
+}
+
+
+def _as_column(column: Any) -> Any:
+    """Argument column as a 1-d bool, int64 or float64 array"""
+    array = np.asarray(column)
+    if array.ndim != 1:
+        raise VectorizationError(f"Column is not one-dimensional (shape {array.shape})")
+    kind = array.dtype.kind
+    if kind == "b":
+        return array
+    if kind in "iu":
+        _check_bound(_bound(array))
+        return array.astype(np.int64, copy=False)
+    if kind == "f":
+        # Rows are float64 (Python floats) on the scalar path too
+        return array.astype(np.float64, copy=False)
+    raise VectorizationError(f"Column of dtype {array.dtype} is not numeric")
+
+
+def _as_values(results: List[Any]) -> Any:
+    """Per-row results as an ndarray; anything but plain numbers makes it an object array"""
+    if all(isinstance(r, (bool, int, float)) for r in results):
+        try:
+            return np.array(results)
+        except OverflowError:
+            pass
+    values = np.empty(len(results), dtype=object)
+    for i, result in enumerate(results):
+        values[i] = result
+    return values
+
+
+# ============================================================================
+# Compilation
+# ============================================================================
+
+
+class _BatchState:
+    """Rows still running and the results of those that returned"""
+
+    __slots__ = ("active", "result")
+
+    def __init__(self, rows: int):
+        self.active = np.ones(rows, dtype=bool)
+        self.result: Any = None
+
+
+def _merge(mask: Any, value: Any, old: Any, rows: int) -> Any:
+    if old is None:
+        return np.array(np.broadcast_to(value, (rows,)))
+    return np.where(mask, value, old)
+
+
+def _assigned_names(statements: List[IRStatement]) -> Set[str]:
+    names: Set[str] = set()
+    for stmt in statements:
+        if isinstance(stmt, IRAssignment) and isinstance(stmt.target, str):
+            names.add(stmt.target)
+        elif isinstance(stmt, IRIf):
+            names |= _assigned_names(stmt.then_body) | _assigned_names(stmt.else_body or [])
+    return names
+
+
+def _returns(statements: List[IRStatement]) -> bool:
+    """Whether every path through statements ends in a return"""
+    for stmt in statements:
+        if isinstance(stmt, IRReturn):
+            return True
+        if (
+            isinstance(stmt, IRIf)
+            and stmt.else_body
+            and _returns(stmt.then_body)
+            and _returns(stmt.else_body)
+        ):
+            return True
+    return False
+
+
+class VectorCompiler(IRVisitor):
+    """
+    Compiles an IRFunction into array operations over its argument columns.
+
+    Statement handlers take the statement and return a VectorStatement;
+    expression handlers return a VectorExpression. Anything outside the
+    vectorizable subset raises VectorizationError.
+    """
+
+    def __init__(self, func: IRFunction):
+        self.func = func
+        self.params = [param.name for param in func.params]
+        self.binary_operators = _binary_operators()
+        # Names local to the code being compiled, and those certainly
+        # assigned at the current point
+        self.locals: Set[str] = set()
+        self.bound: Set[str] = set()
+
+    def compile(self) -> VectorStatement:
+        if not _returns(self.func.body):
+            raise VectorizationError("Not every path returns a value")
+        self.locals = set(self.params) | _assigned_names(self.func.body)
+        self.bound = set(self.params)
+        return self.block(self.func.body)
+
+    def compile_clause(self, clause: IRContractClause) -> VectorExpression:
+        """Compile a contract clause; `result` is bound in postconditions"""
+        names = set(self.params)
+        if clause.clause_type == "ensures":
+            names.add("result")
+        self.locals = set(names)
+        self.bound = set(names)
+        return self.expression(clause.expression)
+
+    # ------------------------------------------------------------------
+    # Statements
+    # ------------------------------------------------------------------
+
+    def statement(self, stmt: IRStatement) -> VectorStatement:
+        return self.dispatch("statement", stmt)
+
+    def block(self, statements: List[IRStatement]) -> VectorStatement:
+        compiled = tuple(self.statement(stmt) for stmt in statements)
+
+        def block(frame: Dict[str, Any], mask: Any, state: _BatchState) -> None:
+            for stmt in compiled:
+                live = mask & state.active
+                if not live.any():
+                    return
+                stmt(frame, live, state)
+
+        return block
+
+    @dispatches(IRReturn, table="statement")
+    def _compile_return(self, stmt: IRReturn) -> VectorStatement:
+        if stmt.value is None:
+            raise VectorizationError("Return without a value")
+        value = self.expression(stmt.value)
+
+        def return_(frame: Dict[str, Any], mask: Any, state: _BatchState) -> None:
+            state.result = _merge(mask, value(frame, mask), state.result, len(mask))
+            state.active = state.active & ~mask
+
+        return return_
+
+    @dispatches(IRAssignment, table="statement")
+    def _compile_assignment(self, stmt: IRAssignment) -> VectorStatement:
+        target = stmt.target
+        if not isinstance(target, str):
+            raise VectorizationError("Assignment to an index or property")
+        if not stmt.is_declaration and target not in self.bound:
+            # The scalar runtime would write a global of that name, if there is one
+            raise VectorizationError(f"Assignment to {target} may write a global")
+        value = self.expression(stmt.value)
+        self.bound.add(target)
+
+        def assign(frame: Dict[str, Any], mask: Any, state: _BatchState) -> None:
+            result = value(frame, mask)
+            old = frame.get(target)
+            frame[target] = result if old is None else np.where(mask, result, old)
+
+        return assign
+
+    @dispatches(IRIf, table="statement")
+    def _compile_if(self, stmt: IRIf) -> VectorStatement:
+        condition = self.expression(stmt.condition)
+        before = set(self.bound)
+        then_body = self.block(stmt.then_body)
+        after_then = self.bound
+        self.bound = set(before)
+        else_body = self.block(stmt.else_body) if stmt.else_body else None
+        self.bound = after_then & self.bound
+
+        def if_(frame: Dict[str, Any], mask: Any, state: _BatchState) -> None:
+            truth = _truth(condition(frame, mask))
+            then_mask = mask & truth
+            if then_mask.any():
+                then_body(frame, then_mask, state)
+            if else_body is not None:
+                else_mask = mask & ~then_mask
+                if else_mask.any():
+                    else_body(frame, else_mask, state)
+
+        return if_
+
+    @dispatches(object, table="statement")
+    def _compile_unsupported_statement(self, stmt: Any) -> VectorStatement:
+        raise VectorizationError(f"Unsupported statement type: {type(stmt).__name__}")
+
+    # ------------------------------------------------------------------
+    # Expressions
+    # ------------------------------------------------------------------
+
+    def expression(self, expr: IRExpression) -> VectorExpression:
+        return self.dispatch("expression", expr)
+
+    @dispatches(IRLiteral, table="expression")
+    def _compile_literal(self, expr: IRLiteral) -> VectorExpression:
+        value = expr.value
+        if not isinstance(value, (bool, int, float)):
+            raise VectorizationError(f"Literal of type {type(value).__name__}")
+        if isinstance(value, int) and not isinstance(value, bool):
+            _check_bound(abs(value))
+        return lambda frame, mask: value
+
+    @dispatches(IRIdentifier, table="expression")
+    def _compile_identifier(self, expr: IRIdentifier) -> VectorExpression:
+        name = expr.name
+        if name in self.bound:
+            return lambda frame, mask: frame[name]
+        if name in self.locals:
+            raise VectorizationError(f"{name} may be read before it is assigned")
+
+        def global_(frame: Dict[str, Any], mask: Any) -> Any:
+            globals_ = frame["<globals>"]
+            if name not in globals_:
+                raise VectorizationError(f"Undefined variable: {name}")
+            value = globals_[name]
+            if _kind(value) == "i":
+                _check_bound(_bound(value))
+            return value
+
+        return global_
+
+    @dispatches(IRBinaryOp, table="expression")
+    def _compile_binary_op(self, expr: IRBinaryOp) -> VectorExpression:
+        apply = self.binary_operators.get(expr.op)
+        if apply is None:
+            raise VectorizationError(f"Unsupported binary operator: {expr.op}")
+        left = self.expression(expr.left)
+        right = self.expression(expr.right)
+        return lambda frame, mask: apply(left(frame, mask), right(frame, mask), mask)
+
+    @dispatches(IRUnaryOp, table="expression")
+    def _compile_unary_op(self, expr: IRUnaryOp) -> VectorExpression:
+        apply = _UNARY_OPERATORS.get(expr.op)
+        if apply is None:
+            raise VectorizationError(f"Unsupported unary operator: {expr.op}")
+        operand = self.expression(expr.operand)
+        return lambda frame, mask: apply(operand(frame, mask))
+
+    @dispatches(IRTernary, table="expression")
+    def _compile_ternary(self, expr: IRTernary) -> VectorExpression:
+        condition = self.expression(expr.condition)
+        true_value = self.expression(expr.true_value)
+        false_value = self.expression(expr.false_value)
+
+        def ternary(frame: Dict[str, Any], mask: Any) -> Any:
+            truth = _truth(condition(frame, mask))
+            # Each branch only has to be valid in the rows that select it
+            return _scalar(np.where(
+                truth,
+                true_value(frame, mask & truth),
+                false_value(frame, mask & np.logical_not(truth)),
+            ))
+
+        return ternary
+
+    @dispatches(object, table="expression")
+    def _compile_unsupported_expression(self, expr: Any) -> VectorExpression:
+        raise VectorizationError(f"Unsupported expression type: {type(expr).__name__}")
+
+
+# ============================================================================
+# Execution
+# ============================================================================
+
+
+class _BatchProgram:
+    """A function compiled to array operations, plus its contract clauses"""
+
+    def __init__(self, func: IRFunction):
+        self.params = [param.name for param in func.params]
+        self.body: Union[VectorStatement, VectorizationError]
+        try:
+            self.body = VectorCompiler(func).compile()
+        except VectorizationError as e:
+            self.body = e
+        # Clauses are compiled separately; one that cannot be vectorized is
+        # evaluated row by row
+        self.clauses: Dict[int, Union[VectorExpression, VectorizationError]] = {}
+        for clause in func.requires + func.ensures:
+            try:
+                self.clauses[id(clause)] = VectorCompiler(func).compile_clause(clause)
+            except VectorizationError as e:
+                self.clauses[id(clause)] = e
+
+    def frame(self, globals_: Mapping[str, Any], columns: List[Any]) -> Dict[str, Any]:
+        frame = dict(zip(self.params, columns))
+        frame["<globals>"] = globals_
+        return frame
+
+    def run(self, globals_: Mapping[str, Any], columns: List[Any], rows: int) -> Any:
+        if isinstance(self.body, VectorizationError):
+            raise self.body
+        if not rows:
+            return np.empty(0)
+        state = _BatchState(rows)
+        with np.errstate(all="ignore"):
+            self.body(self.frame(globals_, columns), state.active.copy(), state)
+        return state.result
+
+
+# id(IRFunction) -> (IRFunction, _BatchProgram)
+_PROGRAM_CACHE: Dict[int, Tuple[IRFunction, _BatchProgram]] = {}
+_PROGRAM_CACHE_SIZE = 1024
+
+
+def batch_program(func: IRFunction) -> _BatchProgram:
+    """Compile func for batch execution, or return the cached program"""
+    cached = _PROGRAM_CACHE.get(id(func))
+    if cached is None or cached[0] is not func:
+        if len(_PROGRAM_CACHE) >= _PROGRAM_CACHE_SIZE:
+            del _PROGRAM_CACHE[next(iter(_PROGRAM_CACHE))]
+        cached = (func, _BatchProgram(func))
+        _PROGRAM_CACHE[id(func)] = cached
+    return cached[1]
+
+
+def _column_list(func: IRFunction, columns: Union[Mapping[str, Any], Sequence[Any]]) -> List[Any]:
+    """Columns in parameter order, from a sequence or a mapping by parameter name"""
+    if isinstance(columns, Mapping):
+        params = [param.name for param in func.params]
+        unknown = set(columns) - set(params)
+        if unknown:
+            raise ValueError(f"No parameter named {', '.join(sorted(unknown))} in {func.name}")
+        ordered = []
+        for name in params:
+            if name not in columns:
+                break
+            ordered.append(columns[name])
+        if len(ordered) != len(columns):
+            raise ValueError("Columns must cover a prefix of the parameters")
+        columns = ordered
+    columns = list(columns)
+    if not columns:
+        raise ValueError("execute_function_batch needs at least one column")
+    if len(columns) > len(func.params):
+        raise ValueError(
+            f"{func.name} takes {len(func.params)} arguments, got {len(columns)} columns"
+        )
+    lengths = {len(column) for column in columns}
+    if len(lengths) != 1:
+        raise ValueError(f"Columns have different lengths: {sorted(lengths)}")
+    return columns
+
+
+def _rows(columns: List[Any]) -> List[Tuple[Any, ...]]:
+    # ndarray elements are NumPy scalars; rows get Python values, as in scalar calls
+    lists = (column.tolist() if hasattr(column, "tolist") else column for column in columns)
+    return list(zip(*lists))
+
+
+def execute_batch(
+    runtime: PWRuntime,
+    func: IRFunction,
+    columns: Union[Mapping[str, Any], Sequence[Any]],
+    contracts: bool = False,
+) -> BatchResult:
+    """Evaluate func for every row of columns (see PWRuntime.execute_function_batch)"""
+    columns = _column_list(func, columns)
+    rows = len(columns[0])
+    program: Optional[_BatchProgram] = None
+    arrays: Optional[List[Any]] = None
+    values = None
+
+    if not NUMPY_AVAILABLE:
+        reason: Optional[str] = "NumPy is not installed"
+    elif len(columns) < len(func.params):
+        reason = "Parameters without a column use their defaults"
+    else:
+        program = batch_program(func)
+        try:
+            arrays = [_as_column(column) for column in columns]
+            values = program.run(runtime.globals, arrays, rows)
+            reason = None
+        except (VectorizationError, ArithmeticError, TypeError) as e:
+            reason = str(e)
+        except Exception as e:
+            # An unexpected NumPy error is not a result; the rows decide
+            reason = f"Vectorized evaluation failed: {type(e).__name__}: {e}"
+
+    vectorized = values is not None
+    row_values: Optional[List[Tuple[Any, ...]]] = None
+    if not vectorized:
+        row_values = _rows(columns)
+        results = [runtime.execute_function(func, list(row)) for row in row_values]
+        values = _as_values(results) if NUMPY_AVAILABLE else results
+
+    result = BatchResult(values=values, vectorized=vectorized, reason=reason)
+    if contracts:
+        for clause in func.requires + func.ensures:
+            masks = result.requires if clause.clause_type == "requires" else result.ensures
+            mask = None
+            compiled = None
+            if program is not None and arrays is not None:
+                compiled = program.clauses.get(id(clause))
+            if compiled is not None and not isinstance(compiled, VectorizationError):
+                try:
+                    mask = _clause_mask(program, compiled, runtime, arrays, values, rows)
+                except Exception:
+                    mask = None
+            if mask is None:
+                if row_values is None:
+                    row_values = _rows(columns)
+                mask = _clause_rows(runtime, func, clause, row_values, values)
+            masks[clause.name] = mask
+    return result
+
+
+def _clause_mask(
+    program: _BatchProgram,
+    compiled: VectorExpression,
+    runtime: PWRuntime,
+    arrays: List[Any],
+    values: Any,
+    rows: int,
+) -> Any:
+    frame = program.frame(runtime.globals, arrays)
+    if values.dtype == object:
+        raise VectorizationError("Results are not numeric")
+    frame["result"] = values
+    with np.errstate(all="ignore"):
+        truth = _truth(compiled(frame, np.ones(rows, dtype=bool)))
+    return np.array(np.broadcast_to(truth, (rows,)))
+
+
+def _clause_rows(
+    runtime: PWRuntime,
+    func: IRFunction,
+    clause: IRContractClause,
+    rows: List[Tuple[Any, ...]],
+    values: Any,
+) -> Any:
+    """Evaluate a clause row by row with the tree-walker"""
+    params = [param.name for param in func.params]
+    results = values.tolist() if NUMPY_AVAILABLE else values
+    holds = []
+    for row, result in zip(rows, results):
+        scope = dict(zip(params, row))
+        if clause.clause_type == "ensures":
+            scope["result"] = result
+        holds.append(is_truthy(runtime.evaluate_expression(clause.expression, scope)))
+    return np.array(holds, dtype=bool) if NUMPY_AVAILABLE else holds
@@ -0,0 +1,862 @@
+"""
+Closure-compiling execution engine for the PW runtime.
+
+PWRuntime's default engine re-walks the IR on every evaluation. This engine
+walks each IRFunction once and turns every node into a specialized Python
+closure: operators are resolved to their implementation at compile time,
+constants are folded into the closures that use them, and control flow is
+reported with sentinel signals instead of ReturnValue/BreakSignal objects.
+
+Instead of dict scopes, a resolution pass gives every local of a function
+(and of a lambda) a slot index, and each call runs in a list-backed frame:
+identifier lookups are indexed loads, `for` loops run in the function's own
+frame and lambdas get a small frame linked to their defining one rather than
+a copy of it. Only in a frame that defines lambdas, where the difference
+shows, does a `for` loop run in a copy of the frame like the tree-walker's
+loop scope.
+
+Compiled code has the same semantics as the tree-walker, including its
+quirks:
+- A function without a `return` yields the value of its last statement
+- A local that has not been assigned yet in this call resolves to the global
+  of that name, and assigning it writes that global
+- Unsupported nodes raise the same PWRuntimeError, but only when executed
+- A lambda created inside a `for` loop keeps seeing the loop's copy of the
+  frame after the loop ends
+
+Enable it per runtime:
+
+    runtime = PWRuntime(engine="closure")
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from dsl.al_runtime import (
+    BINARY_OPERATORS,
+    UNARY_OPERATORS,
+    PWRuntimeError,
+    await_value,
+    compile_ir_pattern,
+    get_property,
+    is_truthy,
+    pattern_captures,
+)
+from dsl.ir import (
+    BinaryOperator,
+    IRArray,
+    IRAssignment,
+    IRAwait,
+    IRBinaryOp,
+    IRBreak,
+    IRCall,
+    IRContinue,
+    IRExpression,
+    IRFor,
+    IRForCStyle,
+    IRFunction,
+    IRIdentifier,
+    IRIf,
+    IRIndex,
+    IRLambda,
+    IRLiteral,
+    IRMap,
+    IRNode,
+    IRPatternMatch,
+    IRPropertyAccess,
+    IRReturn,
+    IRStatement,
+    IRTernary,
+    IRUnaryOp,
+    IRVisitor,
+    IRWhile,
+    dispatches,
+)
+
+if TYPE_CHECKING:
+    from dsl.al_runtime import FunctionTier, PWRuntime
+
+Frame = List[Any]
+CompiledExpression = Callable[[Frame], Any]
+CompiledStatement = Callable[[Frame], Any]  # returns a control flow signal or None
+CompiledFunction = Callable[[List[Any]], Any]
+
+
+class _Signal:
+    """Control flow signal returned by compiled statements"""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"<{self.name}>"
+
+
+RETURN = _Signal("return")
+BREAK = _Signal("break")
+CONTINUE = _Signal("continue")
+
+
+class _Unbound:
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<unbound>"
+
+
+# Value of a local slot that has not been assigned in the current call
+UNBOUND = _Unbound()
+
+
+def _normal(frame: Frame) -> None:
+    return None
+
+
+def _slot_loader(
+    links: tuple, slot: int, certain: bool, fallback: CompiledExpression
+) -> CompiledExpression:
+    """Load a slot, following links out to a defining frame; unbound slots use fallback"""
+    if not links:
+        if certain:
+            return lambda frame: frame[slot]
+
+        def local(frame: Frame) -> Any:
+            value = frame[slot]
+            if value is UNBOUND:
+                return fallback(frame)
+            return value
+
+        return local
+
+    if len(links) == 1:
+        link = links[0]
+
+        def enclosing(frame: Frame) -> Any:
+            value = frame[link][slot]
+            if value is UNBOUND:
+                return fallback(frame)
+            return value
+
+        return enclosing
+
+    def outer(frame: Frame) -> Any:
+        target = frame
+        for link in links:
+            target = target[link]
+        value = target[slot]
+        if value is UNBOUND:
+            return fallback(frame)
+        return value
+
+    return outer
+
+
+# Operators whose Python semantics match BINARY_OPERATORS exactly, inlined into
+# the closure to skip a call: op -> (both operands compiled, constant right operand)
+_INLINE_BINARY = {
+    BinaryOperator.ADD: (
+        lambda left, right: lambda frame: left(frame) + right(frame),
+        lambda left, constant: lambda frame: left(frame) + constant,
+    ),
+    BinaryOperator.SUBTRACT: (
+        lambda left, right: lambda frame: left(frame) - right(frame),
+        lambda left, constant: lambda frame: left(frame) - constant,
+    ),
+    BinaryOperator.MULTIPLY: (
+        lambda left, right: lambda frame: left(frame) * right(frame),
+        lambda left, constant: lambda frame: left(frame) * constant,
+    ),
+    BinaryOperator.MODULO: (
+        lambda left, right: lambda frame: left(frame) % right(frame),
+        lambda left, constant: lambda frame: left(frame) % constant,
+    ),
+    BinaryOperator.LESS_THAN: (
+        lambda left, right: lambda frame: left(frame) < right(frame),
+        lambda left, constant: lambda frame: left(frame) < constant,
+    ),
+    BinaryOperator.LESS_EQUAL: (
+        lambda left, right: lambda frame: left(frame) <= right(frame),
+        lambda left, constant: lambda frame: left(frame) <= constant,
+    ),
+    BinaryOperator.GREATER_THAN: (
+        lambda left, right: lambda frame: left(frame) > right(frame),
+        lambda left, constant: lambda frame: left(frame) > constant,
+    ),
+    BinaryOperator.GREATER_EQUAL: (
+        lambda left, right: lambda frame: left(frame) >= right(frame),
+        lambda left, constant: lambda frame: left(frame) >= constant,
+    ),
+}
+
+
+def _assigned_names(statements: List[IRNode]) -> List[str]:
+    """Names a statement list (or expression) can bind, in order of first appearance"""
+    names: Dict[str, None] = {}
+
+    def collect(stmts: List[IRStatement]) -> None:
+        for stmt in stmts:
+            if isinstance(stmt, IRAssignment):
+                if isinstance(stmt.target, str):
+                    names[stmt.target] = None
+            elif isinstance(stmt, IRFor):
+                names[stmt.iterator] = None
+                collect(stmt.body)
+            elif isinstance(stmt, IRForCStyle):
+                collect([stmt.init, stmt.increment])
+                collect(stmt.body)
+            elif isinstance(stmt, IRWhile):
+                collect(stmt.body)
+            elif isinstance(stmt, IRIf):
+                collect(stmt.then_body)
+                collect(stmt.else_body or [])
+
+    collect(statements)
+    # `x is Some(val)` binds val
+    names.update(dict.fromkeys(pattern_captures(statements)))
+    return list(names)
+
+
+class FrameLayout:
+    """
+    Slot assignment for the frame of one function or lambda.
+
+    Layout: parameters, other locals, the result slot (value of `return` or
+    of the last statement) and, for lambdas, a link to the defining frame.
+    """
+
+    def __init__(
+        self, params: List[str], statements: List[IRNode], parent: Optional[FrameLayout] = None
+    ):
+        self.slots: Dict[str, int] = {}
+        for name in params + _assigned_names(statements):
+            self.slots.setdefault(name, len(self.slots))
+        self.arity = len(params)
+        self.params = set(params)
+        self.parent = parent
+        self.result = len(self.slots)
+        self.link = self.result + 1 if parent is not None else None
+        # Set when a lambda is defined inside this frame
+        self.has_lambdas = False
+
+    def padding(self) -> Frame:
+        """Slots after the parameters of a fresh frame, up to the result slot"""
+        return [UNBOUND] * (self.result - self.arity) + [None]
+
+
+class ClosureCompiler(IRVisitor):
+    """
+    Compiles IR functions of one PWRuntime into Python closures.
+
+    Statement handlers take (stmt, tail) and return a CompiledStatement.
+    `tail` is set for the last statement of a function body (and, through
+    `if`, of its branches); tail statements store their value in the result
+    slot so the function can return it when no explicit `return` runs.
+    """
+
+    def __init__(self, runtime: PWRuntime):
+        self.runtime = runtime
+        # Layout of the frame being compiled
+        self.layout: Optional[FrameLayout] = None
+        # Whether the parameters of self.layout are certainly bound: not while
+        # compiling defaults, and never in lambdas (they may be called short)
+        self.params_bound = False
+
+    # ------------------------------------------------------------------
+    # Functions
+    # ------------------------------------------------------------------
+
+    def compile_function(self, func: IRFunction, tier: FunctionTier) -> CompiledFunction:
+        """Compile func into a callable taking the argument list, counting calls in tier"""
+        name = func.name
+        location = func.location
+        params = [param.name for param in func.params]
+        default_values = [param.default_value for param in func.params if param.default_value]
+        layout = FrameLayout(params, default_values + func.body)
+        outer = (self.layout, self.params_bound)
+        self.layout, self.params_bound = layout, False
+        try:
+            defaults = [
+                self.expression(param.default_value) if param.default_value else None
+                for param in func.params
+            ]
+            self.params_bound = True
+            body = self.block(func.body, tail=True, stop_on=(RETURN,))
+        finally:
+            self.layout, self.params_bound = outer
+
+        arity = layout.arity
+        result = layout.result
+        padding = layout.padding()
+        runtime = self.runtime
+        call_stack = runtime.call_stack
+
+        def bind(args: List[Any]) -> Frame:
+            frame = [*args, *[UNBOUND] * (arity - len(args)), *padding]
+            for i in range(len(args), arity):
+                if defaults[i] is None:
+                    raise PWRuntimeError(f"Missing required argument: {params[i]}", location)
+                frame[i] = defaults[i](frame)
+            return frame
+
+        def function(args: List[Any]) -> Any:
+            tier.calls += 1
+            if tier.calls == runtime.tier_threshold:
+                native = runtime._promote(tier, function)
+                if native is not None:
+                    return native(args)
+            call_stack.append(name)
+            try:
+                if len(args) == arity:
+                    frame = [*args, *padding]
+                elif len(args) > arity:
+                    frame = [*args[:arity], *padding]
+                else:
+                    frame = bind(args)
+                body(frame)
+                return frame[result]
+            finally:
+                call_stack.pop()
+
+        return function
+
+    # ------------------------------------------------------------------
+    # Statements
+    # ------------------------------------------------------------------
+
+    def statement(self, stmt: IRStatement, tail: bool = False) -> CompiledStatement:
+        compiled = self.dispatch("statement", stmt, tail)
+        profiler = self.runtime.profiler
+        location = stmt.location
+        if profiler is None or location is None:
+            return compiled
+
+        line = location.line
+        count = profiler.line
+
+        def profiled(frame: Frame) -> Any:
+            count(line)
+            return compiled(frame)
+
+        return profiled
+
+    def block(
+        self,
+        statements: List[IRStatement],
+        tail: bool = False,
+        stop_on: tuple = (RETURN, BREAK, CONTINUE),
+    ) -> CompiledStatement:
+        """
+        Compile a statement list. Execution stops at the first signal in
+        stop_on; function bodies only stop on RETURN, like the tree-walker.
+        """
+        if not statements:
+            return _normal
+        compiled = [
+            self.statement(stmt, tail and i == len(statements) - 1)
+            for i, stmt in enumerate(statements)
+        ]
+        if len(compiled) == 1:
+            return compiled[0]
+        compiled = tuple(compiled)
+
+        if len(stop_on) == 1:
+            stop = stop_on[0]
+
+            def run_until(frame: Frame) -> Any:
+                for stmt in compiled:
+                    if stmt(frame) is stop:
+                        return stop
+                return None
+
+            return run_until
+
+        def run(frame: Frame) -> Any:
+            for stmt in compiled:
+                signal = stmt(frame)
+                if signal is not None:
+                    return signal
+            return None
+
+        return run
+
+    @dispatches(IRReturn, table="statement")
+    def _compile_return(self, stmt: IRReturn, tail: bool) -> CompiledStatement:
+        result = self.layout.result
+        if not stmt.value:
+
+            def return_none(frame: Frame) -> Any:
+                frame[result] = None
+                return RETURN
+
+            return return_none
+
+        value = self.expression(stmt.value)
+
+        def return_(frame: Frame) -> Any:
+            frame[result] = value(frame)
+            return RETURN
+
+        return return_
+
+    @dispatches(IRAssignment, table="statement")
+    def _compile_assignment(self, stmt: IRAssignment, tail: bool) -> CompiledStatement:
+        value = self.expression(stmt.value)
+        target = stmt.target
+
+        if isinstance(target, str):
+            slot = self.layout.slots[target]
+            if stmt.is_declaration or (self.params_bound and target in self.layout.params):
+
+                def assign(frame: Frame) -> Any:
+                    result = frame[slot] = value(frame)
+                    return result
+
+            else:
+                # Writes the global unless the name is bound in this frame (or,
+                # for lambdas, in a defining one)
+                globals_ = self.runtime.globals
+                bound = self._bound(target)
+
+                def assign(frame: Frame) -> Any:
+                    result = value(frame)
+                    if target not in globals_ or bound(frame):
+                        frame[slot] = result
+                    else:
+                        globals_[target] = result
+                    return result
+
+        elif isinstance(target, IRIndex):
+            obj = self.expression(target.object)
+            index = self.expression(target.index)
+
+            def assign(frame: Frame) -> Any:
+                result = value(frame)
+                obj(frame)[index(frame)] = result
+                return result
+
+        elif isinstance(target, IRPropertyAccess):
+            obj = self.expression(target.object)
+            prop = target.property
+
+            def assign(frame: Frame) -> Any:
+                result = value(frame)
+                setattr(obj(frame), prop, result)
+                return result
+
+        else:
+            message = f"Invalid assignment target: {type(target)}"
+
+            def assign(frame: Frame) -> Any:
+                value(frame)
+                raise PWRuntimeError(message)
+
+        if tail:
+            result_slot = self.layout.result
+
+            def assign_tail(frame: Frame) -> Any:
+                frame[result_slot] = assign(frame)
+
+            return assign_tail
+
+        def assign_statement(frame: Frame) -> Any:
+            assign(frame)
+
+        return assign_statement
+
+    @dispatches(IRIf, table="statement")
+    def _compile_if(self, stmt: IRIf, tail: bool) -> CompiledStatement:
+        condition = self.expression(stmt.condition)
+        then_body = self.block(stmt.then_body, tail)
+        else_body = self.block(stmt.else_body, tail) if stmt.else_body else _normal
+
+        def if_(frame: Frame) -> Any:
+            value = condition(frame)
+            if value is True or (value is not False and is_truthy(value)):
+                return then_body(frame)
+            return else_body(frame)
+
+        return if_
+
+    @dispatches(IRFor, table="statement")
+    def _compile_for(self, stmt: IRFor, tail: bool) -> CompiledStatement:
+        iterable = self.expression(stmt.iterable)
+        layout = self.layout
+        slot = layout.slots[stmt.iterator]
+        result = layout.result
+        body = self.block(stmt.body)
+
+        def for_in_copy(frame: Frame, items: Any) -> Any:
+            # The tree-walker runs the body in a copy of the scope and copies
+            # it back at the end: lambdas made in the loop keep the copy, and
+            # lambdas made before it see the loop's writes only afterwards
+            loop_frame = frame[:]
+            for item in items:
+                loop_frame[slot] = item
+                signal = body(loop_frame)
+                if signal is not None:
+                    if signal is BREAK:
+                        break
+                    if signal is RETURN:
+                        frame[result] = loop_frame[result]
+                        return RETURN
+            frame[:] = loop_frame
+            return None
+
+        def for_(frame: Frame) -> Any:
+            items = iterable(frame)
+            if layout.has_lambdas:
+                # Only lambdas can tell the copy from the frame itself
+                return for_in_copy(frame, items)
+            for item in items:
+                frame[slot] = item
+                signal = body(frame)
+                if signal is not None:
+                    if signal is BREAK:
+                        break
+                    if signal is RETURN:
+                        return RETURN
+            return None
+
+        return for_
+
+    @dispatches(IRForCStyle, table="statement")
+    def _compile_for_c_style(self, stmt: IRForCStyle, tail: bool) -> CompiledStatement:
+        init = self.statement(stmt.init)
+        condition = self.expression(stmt.condition)
+        increment = self.statement(stmt.increment)
+        body = self.block(stmt.body)
+
+        def for_c_style(frame: Frame) -> Any:
+            init(frame)
+            while True:
+                value = condition(frame)
+                if not (value is True or (value is not False and is_truthy(value))):
+                    break
+                signal = body(frame)
+                if signal is RETURN:
+                    return RETURN
+                if signal is BREAK:
+                    break
+                increment(frame)
+            return None
+
+        return for_c_style
+
+    @dispatches(IRWhile, table="statement")
+    def _compile_while(self, stmt: IRWhile, tail: bool) -> CompiledStatement:
+        condition = self.expression(stmt.condition)
+        body = self.block(stmt.body)
+
+        def while_(frame: Frame) -> Any:
+            while True:
+                value = condition(frame)
+                if not (value is True or (value is not False and is_truthy(value))):
+                    break
+                signal = body(frame)
+                if signal is RETURN:
+                    return RETURN
+                if signal is BREAK:
+                    break
+            return None
+
+        return while_
+
+    @dispatches(IRBreak, table="statement")
+    def _compile_break(self, stmt: IRBreak, tail: bool) -> CompiledStatement:
+        return lambda frame: BREAK
+
+    @dispatches(IRContinue, table="statement")
+    def _compile_continue(self, stmt: IRContinue, tail: bool) -> CompiledStatement:
+        return lambda frame: CONTINUE
+
+    @dispatches(IRCall, IRAwait, table="statement")
+    def _compile_expression_statement(self, stmt: IRExpression, tail: bool) -> CompiledStatement:
+        call = self.expression(stmt)
+
+        if tail:
+            result = self.layout.result
+
+            def call_tail(frame: Frame) -> Any:
+                frame[result] = call(frame)
+
+            return call_tail
+
+        def call_statement(frame: Frame) -> Any:
+            call(frame)
+
+        return call_statement
+
+    @dispatches(object, table="statement")
+    def _compile_unsupported_statement(self, stmt: Any, tail: bool) -> CompiledStatement:
+        message = f"Unsupported statement type: {type(stmt)}"
+
+        def unsupported(frame: Frame) -> Any:
+            raise PWRuntimeError(message)
+
+        return unsupported
+
+    # ------------------------------------------------------------------
+    # Expressions
+    # ------------------------------------------------------------------
+
+    def expression(self, expr: IRExpression) -> CompiledExpression:
+        return self.dispatch("expression", expr)
+
+    @dispatches(IRLiteral, table="expression")
+    def _compile_literal(self, expr: IRLiteral) -> CompiledExpression:
+        value = expr.value
+        return lambda frame: value
+
+    @dispatches(IRIdentifier, table="expression")
+    def _compile_identifier(self, expr: IRIdentifier) -> CompiledExpression:
+        name = expr.name
+        location = expr.location
+        globals_ = self.runtime.globals
+
+        def global_(frame: Frame) -> Any:
+            try:
+                return globals_[name]
+            except KeyError:
+                raise PWRuntimeError(f"Undefined variable: {name}", location) from None
+
+        # Innermost frame first; an unbound slot falls back to the next one out
+        load = global_
+        for links, slot, certain in reversed(self._resolve(name)):
+            load = _slot_loader(links, slot, certain, load)
+        return load
+
+    def _resolve(self, name: str) -> List[tuple]:
+        """(links to follow, slot, certainly bound) of each frame with a slot for name"""
+        found = []
+        links: List[int] = []
+        layout = self.layout
+        certain = self.params_bound
+        while layout is not None:
+            if name in layout.slots:
+                found.append((tuple(links), layout.slots[name], certain and name in layout.params))
+            if layout.link is not None:
+                links.append(layout.link)
+            layout = layout.parent
+            certain = False
+        return found
+
+    def _bound(self, name: str) -> Callable[[Frame], bool]:
+        """Predicate: does name have a value in this frame or a defining one"""
+        frames = self._resolve(name)
+        if len(frames) == 1:
+            slot = frames[0][1]
+            return lambda frame: frame[slot] is not UNBOUND
+
+        def bound(frame: Frame) -> bool:
+            for links, slot, _ in frames:
+                target = frame
+                for link in links:
+                    target = target[link]
+                if target[slot] is not UNBOUND:
+                    return True
+            return False
+
+        return bound
+
+    @dispatches(IRBinaryOp, table="expression")
+    def _compile_binary_op(self, expr: IRBinaryOp) -> CompiledExpression:
+        left = self.expression(expr.left)
+        right = self.expression(expr.right)
+        apply = BINARY_OPERATORS.get(expr.op)
+
+        if apply is None:
+            message = f"Unsupported binary operator: {expr.op}"
+
+            def unsupported(frame: Frame) -> Any:
+                left(frame)
+                right(frame)
+                raise PWRuntimeError(message)
+
+            return unsupported
+
+        inline = _INLINE_BINARY.get(expr.op)
+        if isinstance(expr.right, IRLiteral):
+            constant = expr.right.value
+            if inline is not None:
+                return inline[1](left, constant)
+            return lambda frame: apply(left(frame), constant)
+
+        if inline is not None:
+            return inline[0](left, right)
+        return lambda frame: apply(left(frame), right(frame))
+
+    @dispatches(IRUnaryOp, table="expression")
+    def _compile_unary_op(self, expr: IRUnaryOp) -> CompiledExpression:
+        operand = self.expression(expr.operand)
+        apply = UNARY_OPERATORS.get(expr.op)
+
+        if apply is None:
+            message = f"Unsupported unary operator: {expr.op}"
+
+            def unsupported(frame: Frame) -> Any:
+                operand(frame)
+                raise PWRuntimeError(message)
+
+            return unsupported
+
+        return lambda frame: apply(operand(frame))
+
+    @dispatches(IRCall, table="expression")
+    def _compile_call(self, expr: IRCall) -> CompiledExpression:
+        function = self.expression(expr.function)
+        args = tuple(self.expression(arg) for arg in expr.args)
+        execute_function = self.runtime.execute_function
+        tiers = self.runtime._tiers
+
+        def call(frame: Frame) -> Any:
+            func = function(frame)
+            argv = [arg(frame) for arg in args]
+            # Fast path: a PW function that has been called before
+            if func.__class__ is IRFunction:
+                tier = tiers.get(id(func))
+                if tier is not None and tier.function is func:
+                    return tier.entry(argv)
+            return execute_function(func, argv)
+
+        return call
+
+    @dispatches(IRAwait, table="expression")
+    def _compile_await(self, expr: IRAwait) -> CompiledExpression:
+        value = self.expression(expr.expression)
+        location = expr.location
+        return lambda frame: await_value(value(frame), location)
+
+    @dispatches(IRArray, table="expression")
+    def _compile_array(self, expr: IRArray) -> CompiledExpression:
+        elements = tuple(self.expression(elem) for elem in expr.elements)
+        return lambda frame: [elem(frame) for elem in elements]
+
+    @dispatches(IRMap, table="expression")
+    def _compile_map(self, expr: IRMap) -> CompiledExpression:
+        entries = tuple((key, self.expression(val)) for key, val in expr.entries.items())
+        return lambda frame: {key: val(frame) for key, val in entries}
+
+    @dispatches(IRIndex, table="expression")
+    def _compile_index(self, expr: IRIndex) -> CompiledExpression:
+        obj = self.expression(expr.object)
+        index = self.expression(expr.index)
+        return lambda frame: obj(frame)[index(frame)]
+
+    @dispatches(IRPropertyAccess, table="expression")
+    def _compile_property_access(self, expr: IRPropertyAccess) -> CompiledExpression:
+        obj = self.expression(expr.object)
+        prop = expr.property
+
+        def property_access(frame: Frame) -> Any:
+            return get_property(obj(frame), prop)
+
+        return property_access
+
+    @dispatches(IRTernary, table="expression")
+    def _compile_ternary(self, expr: IRTernary) -> CompiledExpression:
+        condition = self.expression(expr.condition)
+        true_value = self.expression(expr.true_value)
+        false_value = self.expression(expr.false_value)
+
+        def ternary(frame: Frame) -> Any:
+            value = condition(frame)
+            if value is True or (value is not False and is_truthy(value)):
+                return true_value(frame)
+            return false_value(frame)
+
+        return ternary
+
+    @dispatches(IRPatternMatch, table="expression")
+    def _compile_pattern_match(self, expr: IRPatternMatch) -> CompiledExpression:
+        value = self.expression(expr.value)
+        try:
+            match = compile_ir_pattern(expr).match
+        except PWRuntimeError as e:
+            error = e
+
+            def unsupported(frame: Frame) -> Any:
+                value(frame)
+                raise error
+
+            return unsupported
+
+        slots = self.layout.slots
+        captures = tuple(
+            (arg.name, slots[arg.name])
+            for arg in expr.pattern.args if arg.name != "_"
+        ) if isinstance(expr.pattern, IRCall) else ()
+
+        def pattern_match(frame: Frame) -> bool:
+            bindings = match(value(frame))
+            if bindings is None:
+                return False
+            for name, slot in captures:
+                if name in bindings:
+                    frame[slot] = bindings[name]
+            return True
+
+        return pattern_match
+
+    @dispatches(IRLambda, table="expression")
+    def _compile_lambda(self, expr: IRLambda) -> CompiledExpression:
+        params = [param.name for param in expr.params]
+        statements = expr.body if isinstance(expr.body, list) else [expr.body]
+        layout = FrameLayout(params, statements, parent=self.layout)
+        if self.layout is not None:
+            self.layout.has_lambdas = True
+        outer = (self.layout, self.params_bound)
+        self.layout, self.params_bound = layout, False
+        try:
+            if isinstance(expr.body, list):
+                block = self.block(expr.body, tail=True)
+                result = layout.result
+
+                def body(frame: Frame) -> Any:
+                    block(frame)
+                    return frame[result]
+
+            else:
+                body = self.expression(expr.body)
+        finally:
+            self.layout, self.params_bound = outer
+
+        arity = layout.arity
+        padding = layout.padding()
+
+        if layout.has_lambdas:
+            # Like the tree-walker, lambdas created during a call see the
+            # defining frame as it was when that call started
+            def lambda_(frame: Frame) -> Any:
+                def lambda_func(*args):
+                    link = frame[:]
+                    if len(args) >= arity:
+                        return body([*args[:arity], *padding, link])
+                    return body([*args, *[UNBOUND] * (arity - len(args)), *padding, link])
+
+                return lambda_func
+
+            return lambda_
+
+        def lambda_(frame: Frame) -> Any:
+            # Linked to the live defining frame; parameters that are not
+            # passed stay unbound and resolve through it
+            def lambda_func(*args):
+                if len(args) >= arity:
+                    return body([*args[:arity], *padding, frame])
+                return body([*args, *[UNBOUND] * (arity - len(args)), *padding, frame])
+
+            return lambda_func
+
+        return lambda_
+
+    @dispatches(object, table="expression")
+    def _compile_unsupported_expression(self, expr: Any) -> CompiledExpression:
+        message = f"Unsupported expression type: {type(expr)}"
+
+        def unsupported(frame: Frame) -> Any:
+            raise PWRuntimeError(message)
+
+        return unsupported
@@ -0,0 +1,659 @@
+"""
+Lowering of hot AL functions to Python bytecode.
+
+PWRuntime counts calls per IRFunction. Once a function reaches the runtime's
+tier_threshold, it is lowered here to a Python `ast.Module`, compiled with
+`compile()` and from then on runs as native Python code.
+
+The code object only depends on the IR, so it is cached per IRFunction and
+shared by every runtime (the stdlib functions are shared too). What differs
+per runtime (globals, call dispatch) is bound when the code object is executed
+into a fresh namespace.
+
+Lowering is exact or refused. Constructs whose tree-walker semantics Python
+cannot reproduce directly raise LoweringError, and the function stays in its
+current tier:
+- Unsupported statements/expressions (they fail at run time in every tier)
+- `continue` directly inside a C-style `for` (it must still run the increment)
+- Lambdas in functions with `for` loops (lambdas capture the loop's scope copy)
+- `break`/`continue` outside a loop
+- `is` patterns with captures inside lambdas
+
+AL locals become Python locals named `l_<name>`. The tree-walker resolves a
+name that was never assigned in the current call through the globals, so
+locals that may be unassigned at a read start out as _UNBOUND and are checked.
+"""
+
+from __future__ import annotations
+
+import ast
+from types import CodeType
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Set, Tuple, Union
+
+from dsl.al_runtime import (
+    BINARY_OPERATORS,
+    PWRuntimeError,
+    _divide,
+    await_value,
+    compile_ir_pattern,
+    get_property,
+    is_truthy,
+    pattern_captures,
+)
+from dsl.ir import (
+    BinaryOperator,
+    IRArray,
+    IRAssignment,
+    IRAwait,
+    IRBinaryOp,
+    IRBreak,
+    IRCall,
+    IRContinue,
+    IRExpression,
+    IRFor,
+    IRForCStyle,
+    IRFunction,
+    IRIdentifier,
+    IRIf,
+    IRIndex,
+    IRLambda,
+    IRLiteral,
+    IRMap,
+    IRPatternMatch,
+    IRPropertyAccess,
+    IRReturn,
+    IRStatement,
+    IRTernary,
+    IRUnaryOp,
+    IRVisitor,
+    IRWhile,
+    UnaryOperator,
+    dispatches,
+)
+
+if TYPE_CHECKING:
+    from dsl.al_runtime import FunctionTier, PWRuntime
+
+
+class LoweringError(Exception):
+    """The function uses a construct the Python tier cannot reproduce exactly"""
+
+
+class _Unbound:
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<unbound>"
+
+
+_UNBOUND = _Unbound()
+
+_BINARY_AST = {
+    BinaryOperator.ADD: ast.Add,
+    BinaryOperator.SUBTRACT: ast.Sub,
+    BinaryOperator.MULTIPLY: ast.Mult,
+    BinaryOperator.MODULO: ast.Mod,
+    BinaryOperator.POWER: ast.Pow,
+    BinaryOperator.FLOOR_DIVIDE: ast.FloorDiv,
+    BinaryOperator.BIT_AND: ast.BitAnd,
+    BinaryOperator.BIT_OR: ast.BitOr,
+    BinaryOperator.BIT_XOR: ast.BitXor,
+    BinaryOperator.LEFT_SHIFT: ast.LShift,
+    BinaryOperator.RIGHT_SHIFT: ast.RShift,
+}
+
+# EnumVariantInstance equality is its dataclass __eq__, so == matches values_equal
+_COMPARE_AST = {
+    BinaryOperator.EQUAL: ast.Eq,
+    BinaryOperator.NOT_EQUAL: ast.NotEq,
+    BinaryOperator.LESS_THAN: ast.Lt,
+    BinaryOperator.LESS_EQUAL: ast.LtE,
+    BinaryOperator.GREATER_THAN: ast.Gt,
+    BinaryOperator.GREATER_EQUAL: ast.GtE,
+    BinaryOperator.IN: ast.In,
+}
+
+# Operators applied through their BINARY_OPERATORS implementation
+_BINARY_HELPERS = {
+    BinaryOperator.DIVIDE: "_divide",
+    BinaryOperator.AND: "_and",
+    BinaryOperator.OR: "_or",
+}
+
+_UNARY_AST = {
+    UnaryOperator.NEGATE: ast.USub,
+    UnaryOperator.POSITIVE: ast.UAdd,
+    UnaryOperator.BIT_NOT: ast.Invert,
+}
+
+# Expressions that always produce a bool, so Python truthiness is exact
+_BOOLEAN_OPERATORS = set(_COMPARE_AST) | {BinaryOperator.AND, BinaryOperator.OR}
+
+_ENTRY = "_lowered"
+
+
+class LoweredFunction:
+    """Compiled code object of one lowered IRFunction, plus its constants"""
+
+    __slots__ = ("code", "constants", "source")
+
+    def __init__(self, code: CodeType, constants: Dict[str, Any], source: str):
+        self.code = code
+        self.constants = constants
+        self.source = source
+
+
+# id(IRFunction) -> (IRFunction, LoweredFunction or the LoweringError it raised)
+_CODE_CACHE: Dict[int, Tuple[IRFunction, Union[LoweredFunction, LoweringError]]] = {}
+_CODE_CACHE_SIZE = 4096
+
+
+def lower_function(func: IRFunction) -> LoweredFunction:
+    """Lower and compile func, or return the cached code object"""
+    cached = _CODE_CACHE.get(id(func))
+    if cached is None or cached[0] is not func:
+        try:
+            result: Union[LoweredFunction, LoweringError] = PythonLowering(func).compile()
+        except LoweringError as e:
+            result = e
+        if len(_CODE_CACHE) >= _CODE_CACHE_SIZE:
+            del _CODE_CACHE[next(iter(_CODE_CACHE))]
+        cached = (func, result)
+        _CODE_CACHE[id(func)] = cached
+
+    if isinstance(cached[1], LoweringError):
+        raise cached[1]
+    return cached[1]
+
+
+def native_entry(
+    func: IRFunction, runtime: PWRuntime, fallback: Callable[[List[Any]], Any], tier: FunctionTier
+) -> Callable[[List[Any]], Any]:
+    """
+    Bind func's lowered code to runtime and return an entry point taking the
+    argument list and counting calls in tier. Calls that omit arguments
+    (defaults, missing-argument errors) go to fallback, the function's
+    previous tier, which counts them itself.
+    """
+    lowered = lower_function(func)
+    globals_ = runtime.globals
+
+    def undefined(name: str, location: Any) -> Any:
+        raise PWRuntimeError(f"Undefined variable: {name}", location)
+
+    namespace = {
+        "__builtins__": {},
+        "_UNBOUND": _UNBOUND,
+        "_G": globals_,
+        "_undefined": undefined,
+        "_call": runtime.execute_function,
+        "_truthy": is_truthy,
+        "_prop": get_property,
+        "_divide": _divide,
+        "_await": await_value,
+        "_and": BINARY_OPERATORS[BinaryOperator.AND],
+        "_or": BINARY_OPERATORS[BinaryOperator.OR],
+    }
+    namespace.update(lowered.constants)
+    exec(lowered.code, namespace)
+    function = namespace[_ENTRY]
+
+    name = func.name
+    arity = len(func.params)
+    call_stack = runtime.call_stack
+
+    def entry(args: List[Any]) -> Any:
+        if len(args) != arity:
+            if len(args) < arity:
+                return fallback(args)
+            args = args[:arity]
+        tier.calls += 1
+        call_stack.append(name)
+        try:
+            return function(*args)
+        finally:
+            call_stack.pop()
+
+    return entry
+
+
+def _name(name: str, ctx: ast.expr_context = None) -> ast.Name:
+    return ast.Name(id=name, ctx=ctx or ast.Load())
+
+
+def _call(helper: str, *args: ast.expr) -> ast.Call:
+    return ast.Call(func=_name(helper), args=list(args), keywords=[])
+
+
+def _local(name: str) -> str:
+    if not name.isidentifier():
+        raise LoweringError(f"Identifier {name!r} is not a valid Python name")
+    return f"l_{name}"
+
+
+def _lambda_param(name: str, level: int) -> str:
+    if not name.isidentifier():
+        raise LoweringError(f"Identifier {name!r} is not a valid Python name")
+    return f"a{level}_{name}"
+
+
+class PythonLowering(IRVisitor):
+    """
+    Lowers one IRFunction to a Python function definition.
+
+    Statement handlers take (stmt, tail) and return a list of ast statements;
+    tail statements return their value, since the tree-walker returns the
+    value of a function's last statement when no `return` runs.
+    """
+
+    def __init__(self, func: IRFunction):
+        self.func = func
+        self.constants: Dict[str, Any] = {}
+        self.locals: Set[str] = set()
+        self.has_for = False
+        # Names certainly assigned at the current point of the function
+        self.bound: Set[str] = set()
+        # Enclosing loop kinds, innermost last
+        self.loops: List[type] = []
+        # Parameters of enclosing lambdas, innermost last
+        self.lambda_params: List[Set[str]] = []
+
+    def compile(self) -> LoweredFunction:
+        module = self.lower()
+        source = ast.unparse(module)
+        code = compile(module, f"<al:{self.func.name}>", "exec")
+        return LoweredFunction(code, self.constants, source)
+
+    def lower(self) -> ast.Module:
+        func = self.func
+        params = [param.name for param in func.params]
+        self._collect_locals(func.body)
+        self.locals.update(pattern_captures(func.body))
+        self.bound = set(params)
+
+        body: List[ast.stmt] = []
+        unbound = sorted(self.locals - self.bound)
+        if unbound:
+            body.append(ast.Assign(
+                targets=[_name(_local(name), ast.Store()) for name in unbound],
+                value=_name("_UNBOUND"),
+            ))
+        body.extend(self.block(func.body, tail=True))
+        body.append(ast.Return(value=ast.Constant(value=None)))
+
+        definition = ast.FunctionDef(
+            name=_ENTRY,
+            args=ast.arguments(
+                posonlyargs=[],
+                args=[ast.arg(arg=_local(name)) for name in params],
+                vararg=None,
+                kwonlyargs=[],
+                kw_defaults=[],
+                kwarg=None,
+                defaults=[],
+            ),
+            body=body,
+            decorator_list=[],
+            returns=None,
+        )
+        module = ast.Module(body=[definition], type_ignores=[])
+        return ast.fix_missing_locations(module)
+
+    def _collect_locals(self, statements: List[Any]) -> None:
+        for stmt in statements:
+            if isinstance(stmt, IRAssignment):
+                if isinstance(stmt.target, str):
+                    self.locals.add(stmt.target)
+            elif isinstance(stmt, IRFor):
+                self.has_for = True
+                self.locals.add(stmt.iterator)
+                self._collect_locals(stmt.body)
+            elif isinstance(stmt, IRForCStyle):
+                self._collect_locals([stmt.init, stmt.increment])
+                self._collect_locals(stmt.body)
+            elif isinstance(stmt, IRWhile):
+                self._collect_locals(stmt.body)
+            elif isinstance(stmt, IRIf):
+                self._collect_locals(stmt.then_body)
+                self._collect_locals(stmt.else_body or [])
+
+    def constant(self, value: Any) -> ast.expr:
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return ast.Constant(value=value)
+        name = f"_k{len(self.constants)}"
+        self.constants[name] = value
+        return _name(name)
+
+    # ------------------------------------------------------------------
+    # Statements
+    # ------------------------------------------------------------------
+
+    def statement(self, stmt: IRStatement, tail: bool = False) -> List[ast.stmt]:
+        return self.dispatch("statement", stmt, tail)
+
+    def block(self, statements: List[IRStatement], tail: bool = False) -> List[ast.stmt]:
+        lowered: List[ast.stmt] = []
+        for i, stmt in enumerate(statements):
+            lowered.extend(self.statement(stmt, tail and i == len(statements) - 1))
+        return lowered or [ast.Pass()]
+
+    def truth(self, expr: IRExpression) -> ast.expr:
+        """Lower a condition to an expression with AL truthiness"""
+        value = self.expression(expr)
+        if (
+            (isinstance(expr, IRBinaryOp) and expr.op in _BOOLEAN_OPERATORS)
+            or (isinstance(expr, IRUnaryOp) and expr.op == UnaryOperator.NOT)
+            or (isinstance(expr, IRLiteral) and isinstance(expr.value, bool))
+            or isinstance(expr, IRPatternMatch)
+        ):
+            return value
+        return _call("_truthy", value)
+
+    @dispatches(IRReturn, table="statement")
+    def _lower_return(self, stmt: IRReturn, tail: bool) -> List[ast.stmt]:
+        value = self.expression(stmt.value) if stmt.value else ast.Constant(value=None)
+        return [ast.Return(value=value)]
+
+    @dispatches(IRAssignment, table="statement")
+    def _lower_assignment(self, stmt: IRAssignment, tail: bool) -> List[ast.stmt]:
+        value = self.expression(stmt.value)
+        target = stmt.target
+        store = "_t" if tail else None
+        lowered: List[ast.stmt] = []
+        if store:
+            lowered.append(ast.Assign(targets=[_name(store, ast.Store())], value=value))
+            value = _name(store)
+
+        if isinstance(target, str):
+            local = _local(target)
+            if stmt.is_declaration or target in self.bound:
+                lowered.append(ast.Assign(targets=[_name(local, ast.Store())], value=value))
+                self.bound.add(target)
+            else:
+                # Assigns a global of that name unless the local has been assigned
+                if not store:
+                    store = "_t"
+                    lowered.append(ast.Assign(targets=[_name(store, ast.Store())], value=value))
+                    value = _name(store)
+                lowered.append(ast.If(
+                    test=ast.BoolOp(op=ast.Or(), values=[
+                        ast.Compare(left=_name(local), ops=[ast.IsNot()], comparators=[_name("_UNBOUND")]),
+                        ast.Compare(left=ast.Constant(value=target), ops=[ast.NotIn()], comparators=[_name("_G")]),
+                    ]),
+                    body=[ast.Assign(targets=[_name(local, ast.Store())], value=value)],
+                    orelse=[ast.Assign(
+                        targets=[ast.Subscript(value=_name("_G"), slice=ast.Constant(value=target), ctx=ast.Store())],
+                        value=value,
+                    )],
+                ))
+        elif isinstance(target, IRIndex):
+            lowered.append(ast.Assign(
+                targets=[ast.Subscript(
+                    value=self.expression(target.object),
+                    slice=self.expression(target.index),
+                    ctx=ast.Store(),
+                )],
+                value=value,
+            ))
+        elif isinstance(target, IRPropertyAccess) and target.property.isidentifier():
+            lowered.append(ast.Assign(
+                targets=[ast.Attribute(value=self.expression(target.object), attr=target.property, ctx=ast.Store())],
+                value=value,
+            ))
+        else:
+            raise LoweringError(f"Invalid assignment target: {type(target)}")
+
+        if tail:
+            lowered.append(ast.Return(value=_name("_t")))
+        return lowered
+
+    @dispatches(IRIf, table="statement")
+    def _lower_if(self, stmt: IRIf, tail: bool) -> List[ast.stmt]:
+        test = self.truth(stmt.condition)
+        before = set(self.bound)
+        if isinstance(stmt.condition, IRPatternMatch):
+            # The then branch only runs once the captures are bound
+            self.bound.update(pattern_captures(stmt.condition))
+        then_body = self.block(stmt.then_body, tail)
+        after_then = self.bound
+        self.bound = set(before)
+        else_body = self.block(stmt.else_body, tail) if stmt.else_body else []
+        self.bound = after_then & self.bound
+        return [ast.If(test=test, body=then_body, orelse=else_body)]
+
+    def _loop_body(self, kind: type, statements: List[IRStatement]) -> List[ast.stmt]:
+        # The body may run zero times: nothing it assigns is certain afterwards
+        before = set(self.bound)
+        self.loops.append(kind)
+        try:
+            return self.block(statements)
+        finally:
+            self.loops.pop()
+            self.bound = before
+
+    @dispatches(IRFor, table="statement")
+    def _lower_for(self, stmt: IRFor, tail: bool) -> List[ast.stmt]:
+        iterable = self.expression(stmt.iterable)
+        before = set(self.bound)
+        self.bound.add(stmt.iterator)
+        body = self._loop_body(IRFor, stmt.body)
+        self.bound = before
+        return [ast.For(
+            target=_name(_local(stmt.iterator), ast.Store()),
+            iter=iterable,
+            body=body,
+            orelse=[],
+        )]
+
+    @dispatches(IRForCStyle, table="statement")
+    def _lower_for_c_style(self, stmt: IRForCStyle, tail: bool) -> List[ast.stmt]:
+        lowered = self.statement(stmt.init)
+        test = self.truth(stmt.condition)
+        body = self._loop_body(IRForCStyle, stmt.body)
+        before = set(self.bound)
+        body.extend(self.statement(stmt.increment))
+        self.bound = before
+        lowered.append(ast.While(test=test, body=body, orelse=[]))
+        return lowered
+
+    @dispatches(IRWhile, table="statement")
+    def _lower_while(self, stmt: IRWhile, tail: bool) -> List[ast.stmt]:
+        test = self.truth(stmt.condition)
+        body = self._loop_body(IRWhile, stmt.body)
+        return [ast.While(test=test, body=body, orelse=[])]
+
+    @dispatches(IRBreak, table="statement")
+    def _lower_break(self, stmt: IRBreak, tail: bool) -> List[ast.stmt]:
+        if not self.loops:
+            raise LoweringError("break outside a loop")
+        return [ast.Break()]
+
+    @dispatches(IRContinue, table="statement")
+    def _lower_continue(self, stmt: IRContinue, tail: bool) -> List[ast.stmt]:
+        if not self.loops:
+            raise LoweringError("continue outside a loop")
+        if self.loops[-1] is IRForCStyle:
+            raise LoweringError("continue in a C-style for loop")
+        return [ast.Continue()]
+
+    @dispatches(IRCall, IRAwait, table="statement")
+    def _lower_expression_statement(self, stmt: IRExpression, tail: bool) -> List[ast.stmt]:
+        value = self.expression(stmt)
+        if tail:
+            return [ast.Return(value=value)]
+        return [ast.Expr(value=value)]
+
+    @dispatches(object, table="statement")
+    def _lower_unsupported_statement(self, stmt: Any, tail: bool) -> List[ast.stmt]:
+        raise LoweringError(f"Unsupported statement type: {type(stmt).__name__}")
+
+    # ------------------------------------------------------------------
+    # Expressions
+    # ------------------------------------------------------------------
+
+    def expression(self, expr: IRExpression) -> ast.expr:
+        return self.dispatch("expression", expr)
+
+    def _global(self, name: str, location: Any) -> ast.expr:
+        # _G[name] if name in _G else _undefined(name, location)
+        key = ast.Constant(value=name)
+        return ast.IfExp(
+            test=ast.Compare(left=key, ops=[ast.In()], comparators=[_name("_G")]),
+            body=ast.Subscript(value=_name("_G"), slice=key, ctx=ast.Load()),
+            orelse=_call("_undefined", key, self.constant(location)),
+        )
+
+    @dispatches(IRLiteral, table="expression")
+    def _lower_literal(self, expr: IRLiteral) -> ast.expr:
+        return self.constant(expr.value)
+
+    @dispatches(IRIdentifier, table="expression")
+    def _lower_identifier(self, expr: IRIdentifier) -> ast.expr:
+        return self._resolve(expr.name, len(self.lambda_params), expr.location)
+
+    def _resolve(self, name: str, depth: int, location: Any) -> ast.expr:
+        """Look name up from lambda nesting depth outwards, as the scope copies would"""
+        for level in range(depth - 1, -1, -1):
+            if name in self.lambda_params[level]:
+                # A lambda argument that was not passed leaves the enclosing value visible
+                param = _lambda_param(name, level)
+                return ast.IfExp(
+                    test=ast.Compare(left=_name(param), ops=[ast.IsNot()], comparators=[_name("_UNBOUND")]),
+                    body=_name(param),
+                    orelse=self._resolve(name, level, location),
+                )
+
+        if name in self.bound:
+            return _name(_local(name))
+        if name not in self.locals:
+            return self._global(name, location)
+        # A local that may not be assigned yet: the tree-walker falls back to globals
+        local = _local(name)
+        return ast.IfExp(
+            test=ast.Compare(left=_name(local), ops=[ast.IsNot()], comparators=[_name("_UNBOUND")]),
+            body=_name(local),
+            orelse=self._global(name, location),
+        )
+
+    @dispatches(IRBinaryOp, table="expression")
+    def _lower_binary_op(self, expr: IRBinaryOp) -> ast.expr:
+        op = expr.op
+        left = self.expression(expr.left)
+        right = self.expression(expr.right)
+        if op in _BINARY_AST:
+            return ast.BinOp(left=left, op=_BINARY_AST[op](), right=right)
+        if op in _COMPARE_AST:
+            return ast.Compare(left=left, ops=[_COMPARE_AST[op]()], comparators=[right])
+        if op in _BINARY_HELPERS:
+            return _call(_BINARY_HELPERS[op], left, right)
+        raise LoweringError(f"Unsupported binary operator: {op}")
+
+    @dispatches(IRUnaryOp, table="expression")
+    def _lower_unary_op(self, expr: IRUnaryOp) -> ast.expr:
+        if expr.op == UnaryOperator.NOT:
+            return ast.UnaryOp(op=ast.Not(), operand=self.truth(expr.operand))
+        if expr.op in _UNARY_AST:
+            return ast.UnaryOp(op=_UNARY_AST[expr.op](), operand=self.expression(expr.operand))
+        raise LoweringError(f"Unsupported unary operator: {expr.op}")
+
+    @dispatches(IRCall, table="expression")
+    def _lower_call(self, expr: IRCall) -> ast.expr:
+        function = self.expression(expr.function)
+        args = ast.List(elts=[self.expression(arg) for arg in expr.args], ctx=ast.Load())
+        return _call("_call", function, args)
+
+    @dispatches(IRAwait, table="expression")
+    def _lower_await(self, expr: IRAwait) -> ast.expr:
+        return _call("_await", self.expression(expr.expression), self.constant(expr.location))
+
+    @dispatches(IRArray, table="expression")
+    def _lower_array(self, expr: IRArray) -> ast.expr:
+        return ast.List(elts=[self.expression(elem) for elem in expr.elements], ctx=ast.Load())
+
+    @dispatches(IRMap, table="expression")
+    def _lower_map(self, expr: IRMap) -> ast.expr:
+        keys = [self.constant(key) for key in expr.entries]
+        values = [self.expression(val) for val in expr.entries.values()]
+        return ast.Dict(keys=keys, values=values)
+
+    @dispatches(IRIndex, table="expression")
+    def _lower_index(self, expr: IRIndex) -> ast.expr:
+        return ast.Subscript(
+            value=self.expression(expr.object),
+            slice=self.expression(expr.index),
+            ctx=ast.Load(),
+        )
+
+    @dispatches(IRPropertyAccess, table="expression")
+    def _lower_property_access(self, expr: IRPropertyAccess) -> ast.expr:
+        return _call("_prop", self.expression(expr.object), ast.Constant(value=expr.property))
+
+    @dispatches(IRTernary, table="expression")
+    def _lower_ternary(self, expr: IRTernary) -> ast.expr:
+        return ast.IfExp(
+            test=self.truth(expr.condition),
+            body=self.expression(expr.true_value),
+            orelse=self.expression(expr.false_value),
+        )
+
+    @dispatches(IRPatternMatch, table="expression")
+    def _lower_pattern_match(self, expr: IRPatternMatch) -> ast.expr:
+        try:
+            pattern = compile_ir_pattern(expr)
+        except PWRuntimeError as e:
+            raise LoweringError(e.message) from None
+        value = self.expression(expr.value)
+        match = ast.Call(func=self.constant(pattern.match), args=[value], keywords=[])
+        captures = [name for name in pattern.captures or () if name != "_"]
+        if not captures:
+            return ast.Compare(left=match, ops=[ast.IsNot()], comparators=[ast.Constant(value=None)])
+        if self.lambda_params:
+            raise LoweringError("pattern captures in a lambda")
+
+        # (_m := match(value)) is not None and (l_x := _m["x"], ...) and True
+        matched = ast.Compare(
+            left=ast.NamedExpr(target=_name("_m", ast.Store()), value=match),
+            ops=[ast.IsNot()],
+            comparators=[ast.Constant(value=None)],
+        )
+        binds = ast.Tuple(elts=[
+            ast.NamedExpr(
+                target=_name(_local(name), ast.Store()),
+                value=ast.Subscript(value=_name("_m"), slice=ast.Constant(value=name), ctx=ast.Load()),
+            )
+            for name in captures
+        ], ctx=ast.Load())
+        return ast.BoolOp(op=ast.And(), values=[matched, binds, ast.Constant(value=True)])
+
+    @dispatches(IRLambda, table="expression")
+    def _lower_lambda(self, expr: IRLambda) -> ast.expr:
+        if self.has_for:
+            raise LoweringError("lambda in a function with for loops")
+        if isinstance(expr.body, list):
+            raise LoweringError("lambda with a statement body")
+
+        params = [param.name for param in expr.params]
+        level = len(self.lambda_params)
+        self.lambda_params.append(set(params))
+        try:
+            body = self.expression(expr.body)
+        finally:
+            self.lambda_params.pop()
+
+        # lambda a0_x=_UNBOUND, *_extra: body
+        return ast.Lambda(
+            args=ast.arguments(
+                posonlyargs=[],
+                args=[ast.arg(arg=_lambda_param(name, level)) for name in params],
+                vararg=ast.arg(arg="_extra"),
+                kwonlyargs=[],
+                kw_defaults=[],
+                kwarg=None,
+                defaults=[_name("_UNBOUND") for _ in params],
+            ),
+            body=body,
+        )
+
+    @dispatches(object, table="expression")
+    def _lower_unsupported_expression(self, expr: Any) -> ast.expr:
+        raise LoweringError(f"Unsupported expression type: {type(expr).__name__}")
@@ -8,14 +8,14 @@ Architecture:
 2. Parser: Build IR tree from tokens
 3. Semantic Analyzer: Validate and enrich IR
 
-The parser is hand-written (recursive descent) for maximum control
-and clear error messages.
+The parser is hand-written (recursive descent, with an operator-precedence
+loop for binary expressions) for maximum control and clear error messages.
 """
 
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple, Union
 
@@ -23,6 +23,7 @@ from dsl.ir import (
     BinaryOperator,
     IRArray,
     IRAssignment,
+    IRAwait,
     IRBinaryOp,
     IRBreak,
     IRCall,
@@ -45,6 +46,7 @@ from dsl.ir import (
     IRLiteral,
     IRMap,
     IRModule,
+    IRNode,
     IROldExpr,
     IRParameter,
     IRPass,
@@ -64,6 +66,7 @@ from dsl.ir import (
     LiteralType,
     SourceLocation,
     UnaryOperator,
+    intern_type,
 )
 
 # Optional CharCNN integration for operation lookup
@@ -74,6 +77,9 @@ except ImportError:
     CHARCNN_AVAILABLE = False
     lookup_operation = None
 
+# Result cache bound for @pure and @memoize without max=N
+DEFAULT_MEMO_SIZE = 128
+
 
 # ============================================================================
 # Error Handling
@@ -632,6 +638,422 @@ class Lexer:
         return self.tokens
 
 
+# ============================================================================
+# Fast Lexer (table-driven)
+# ============================================================================
+
+# Keyword lookup: identifier text -> (token type, token value)
+_KEYWORD_TOKENS: Dict[str, Tuple[TokenType, Any]] = {
+    kw: (TokenType.KEYWORD, kw) for kw in KEYWORDS
+}
+_KEYWORD_TOKENS.update({
+    "true": (TokenType.BOOLEAN, True),
+    "false": (TokenType.BOOLEAN, False),
+    "null": (TokenType.NULL, None),
+    "and": (TokenType.AND, "and"),
+    "or": (TokenType.OR, "or"),
+    "not": (TokenType.NOT, "not"),
+    "is": (TokenType.IS, "is"),
+})
+
+_TWO_CHAR_TOKENS: Dict[str, TokenType] = {
+    "**": TokenType.POWER,
+    "==": TokenType.EQ, "!=": TokenType.NE,
+    "<=": TokenType.LE, ">=": TokenType.GE,
+    "<<": TokenType.LSHIFT, ">>": TokenType.RSHIFT,
+    "+=": TokenType.PLUS_ASSIGN, "-=": TokenType.MINUS_ASSIGN,
+    "*=": TokenType.STAR_ASSIGN, "/=": TokenType.SLASH_ASSIGN,
+    "->": TokenType.ARROW,
+    "&&": TokenType.LOGICAL_AND, "||": TokenType.LOGICAL_OR,
+}
+
+_SINGLE_CHAR_TOKENS: Dict[str, TokenType] = {
+    "+": TokenType.PLUS, "-": TokenType.MINUS,
+    "*": TokenType.STAR, "/": TokenType.SLASH,
+    "%": TokenType.PERCENT,
+    "=": TokenType.ASSIGN,
+    "!": TokenType.LOGICAL_NOT,
+    "<": TokenType.LT, ">": TokenType.GT,
+    "&": TokenType.BIT_AND, "|": TokenType.BIT_OR,
+    "^": TokenType.BIT_XOR, "~": TokenType.BIT_NOT,
+    "(": TokenType.LPAREN, ")": TokenType.RPAREN,
+    "[": TokenType.LBRACKET, "]": TokenType.RBRACKET,
+    "{": TokenType.LBRACE, "}": TokenType.RBRACE,
+    ":": TokenType.COLON, ",": TokenType.COMMA,
+    ".": TokenType.DOT, "?": TokenType.QUESTION,
+    ";": TokenType.SEMICOLON,
+    "@": TokenType.AT,
+}
+
+# Tokens after which `//` is floor division rather than a comment
+_EXPRESSION_END_TOKENS = frozenset({
+    TokenType.IDENTIFIER, TokenType.INTEGER, TokenType.FLOAT,
+    TokenType.RPAREN, TokenType.RBRACKET, TokenType.STRING,
+})
+
+# Tokens after which a newline continues the current line
+_CONTINUATION_TOKENS = frozenset({
+    TokenType.PLUS, TokenType.MINUS, TokenType.STAR, TokenType.SLASH,
+    TokenType.PERCENT, TokenType.POWER, TokenType.FLOOR_DIV,
+    TokenType.EQ, TokenType.NE,
+    TokenType.AND, TokenType.OR, TokenType.LOGICAL_AND, TokenType.LOGICAL_OR,
+    TokenType.BIT_AND, TokenType.BIT_OR, TokenType.BIT_XOR,
+    TokenType.LSHIFT, TokenType.RSHIFT,
+    TokenType.COMMA,
+})
+
+# First-character classes for ASCII; anything else goes through str predicates
+_CHAR_IDENT = 1
+_CHAR_NUMBER = 2
+_CHAR_STRING = 3
+_CHAR_OPERATOR = 4
+_CHAR_SLASH = 5
+_CHAR_HASH = 6
+_CHAR_NEWLINE = 7
+
+_CHAR_CLASSES: Dict[str, int] = {}
+for _c in "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_":
+    _CHAR_CLASSES[_c] = _CHAR_IDENT
+for _c in "0123456789":
+    _CHAR_CLASSES[_c] = _CHAR_NUMBER
+for _c in _SINGLE_CHAR_TOKENS:
+    _CHAR_CLASSES[_c] = _CHAR_OPERATOR
+_CHAR_CLASSES.update({"\"": _CHAR_STRING, "'": _CHAR_STRING, "/": _CHAR_SLASH,
+                      "#": _CHAR_HASH, "\n": _CHAR_NEWLINE})
+del _c
+
+_SPACES_RE = re.compile(r" *")
+_INLINE_WS_RE = re.compile(r"[ \t\r]*")
+_IDENT_RE = re.compile(r"\w+")
+_DECIMAL_RE = re.compile(r"[\d_]*(?:\.(?=\d)[\d_]*)?(?:[eE][+-]?\d*)?")
+_RADIX_RE = {
+    "x": (re.compile(r"[0-9a-fA-F_]*"), 16),
+    "b": (re.compile(r"[01_]*"), 2),
+    "o": (re.compile(r"[0-7_]*"), 8),
+}
+_STRING_BODY_RE = {
+    "\"": re.compile(r"[^\"\\]*"),
+    "'": re.compile(r"[^'\\]*"),
+}
+_STRING_ESCAPES = {"n": "\n", "t": "\t", "r": "\r"}
+
+
+class FastLexer:
+    """
+    Table-driven tokenizer for PW DSL 2.0 source code.
+
+    Produces the same token stream as ``Lexer`` but matches each identifier,
+    number, string, comment and operator with a single regex or table lookup,
+    and derives line/column from string offsets instead of per-character
+    counters. ``Lexer`` is kept as the reference implementation.
+
+    The only intended divergence: ``///`` at the start of a line and a lone
+    trailing ``/`` make the reference lexer loop forever; here they are
+    tokenized as a doc comment and a slash respectively.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens: List[Token] = []
+
+    def _error_at(self, msg: str, offset: int) -> ALParseError:
+        line = self.text.count("\n", 0, offset) + 1
+        column = offset - (self.text.rfind("\n", 0, offset) + 1) + 1
+        return ALParseError(msg, line, column)
+
+    def tokenize(self) -> List[Token]:
+        """Tokenize the entire input."""
+        text = self.text
+        n = len(text)
+        tokens = self.tokens
+        append = tokens.append
+
+        pos = 0
+        line = 1
+        line_pos = 0  # Offset of the first character of the current line
+        indent_stack = [0]
+        paren_depth = 0
+        line_start = True
+
+        while pos < n:
+            if line_start:
+                end = _SPACES_RE.match(text, pos).end()
+                indent = end - pos
+                pos = end
+                column = pos - line_pos + 1
+
+                if indent < indent_stack[-1]:
+                    while indent < indent_stack[-1]:
+                        indent_stack.pop()
+                        append(Token(TokenType.DEDENT, None, line, column))
+                    if indent != indent_stack[-1]:
+                        raise ALParseError("Inconsistent indentation", line, column)
+
+                # Blank lines and comment-only lines
+                c = text[pos] if pos < n else ""
+                if (c == "" or c == "\n" or c == "#" or
+                        (c == "/" and (text.startswith("/*", pos) or
+                                       (text.startswith("//", pos) and
+                                        not text.startswith("///", pos))))):
+                    if c == "#" or c == "/":
+                        start = pos
+                        pos = self._skip_comment(pos)
+                        newlines = text.count("\n", start, pos)
+                        if newlines:
+                            line += newlines
+                            line_pos = text.rfind("\n", start, pos) + 1
+                    if pos < n and text[pos] == "\n":
+                        pos += 1
+                        line += 1
+                        line_pos = pos
+                    continue
+
+                if indent > indent_stack[-1]:
+                    indent_stack.append(indent)
+                    append(Token(TokenType.INDENT, None, line, column))
+
+                line_start = False
+
+            c = text[pos]
+            if c in " \t\r":
+                pos = _INLINE_WS_RE.match(text, pos).end()
+                if pos >= n:
+                    break
+                c = text[pos]
+
+            kind = _CHAR_CLASSES.get(c)
+            if kind is None:
+                if c.isdigit():
+                    kind = _CHAR_NUMBER
+                elif c.isalpha():
+                    kind = _CHAR_IDENT
+
+            if kind == _CHAR_IDENT:
+                end = _IDENT_RE.match(text, pos).end()
+                ident = text[pos:end]
+                keyword = _KEYWORD_TOKENS.get(ident)
+                if keyword is None:
+                    append(Token(TokenType.IDENTIFIER, ident, line, pos - line_pos + 1))
+                else:
+                    append(Token(keyword[0], keyword[1], line, pos - line_pos + 1))
+                pos = end
+
+            elif kind == _CHAR_OPERATOR:
+                column = pos - line_pos + 1
+                two_char = text[pos:pos + 2]
+                token_type = _TWO_CHAR_TOKENS.get(two_char)
+                if token_type is not None:
+                    append(Token(token_type, two_char, line, column))
+                    pos += 2
+                    continue
+                if c in "([{":
+                    paren_depth += 1
+                elif c in ")]}":
+                    paren_depth -= 1
+                append(Token(_SINGLE_CHAR_TOKENS[c], c, line, column))
+                pos += 1
+
+            elif kind == _CHAR_NEWLINE:
+                if paren_depth <= 0 and not (tokens and tokens[-1].type in _CONTINUATION_TOKENS):
+                    append(Token(TokenType.NEWLINE, "\n", line, pos - line_pos + 1))
+                    line_start = True
+                pos += 1
+                line += 1
+                line_pos = pos
+
+            elif kind == _CHAR_NUMBER:
+                token, end = self._read_number(pos, line, pos - line_pos + 1)
+                append(token)
+                pos = end
+
+            elif kind == _CHAR_STRING:
+                start = pos
+                value, pos = self._read_string(pos)
+                append(Token(TokenType.STRING, value, line, start - line_pos + 1))
+                newlines = text.count("\n", start, pos)
+                if newlines:
+                    line += newlines
+                    line_pos = text.rfind("\n", start, pos) + 1
+
+            elif kind == _CHAR_SLASH:
+                column = pos - line_pos + 1
+                if text.startswith("///", pos):
+                    # Consecutive /// lines form one doc comment
+                    comment_lines = []
+                    while text.startswith("///", pos):
+                        pos += 3
+                        if pos < n and text[pos] == " ":
+                            pos += 1
+                        end = text.find("\n", pos)
+                        if end == -1:
+                            end = n
+                        comment_lines.append(text[pos:end])
+                        pos = end
+                        if pos < n:
+                            pos += 1
+                            line += 1
+                            line_pos = pos
+                        pos = _SPACES_RE.match(text, pos).end()
+                    append(Token(TokenType.DOC_COMMENT, "\n".join(comment_lines),
+                                 line, pos - line_pos + 1))
+                elif text.startswith("//", pos):
+                    last = tokens[-1] if tokens else None
+                    if (last is not None and last.type in _EXPRESSION_END_TOKENS and
+                            last.line == line):
+                        append(Token(TokenType.FLOOR_DIV, "//", line, column))
+                        pos += 2
+                    else:
+                        pos = self._skip_comment(pos)
+                elif text.startswith("/=", pos):
+                    append(Token(TokenType.SLASH_ASSIGN, "/=", line, column))
+                    pos += 2
+                elif text.startswith("/*", pos):
+                    start = pos
+                    pos = self._skip_comment(pos)
+                    newlines = text.count("\n", start, pos)
+                    if newlines:
+                        line += newlines
+                        line_pos = text.rfind("\n", start, pos) + 1
+                else:
+                    append(Token(TokenType.SLASH, "/", line, column))
+                    pos += 1
+
+            elif kind == _CHAR_HASH:
+                pos = self._skip_comment(pos)
+
+            else:
+                raise ALParseError(f"Unexpected character: {c!r}", line, pos - line_pos + 1)
+
+        column = pos - line_pos + 1
+
+        # Emit trailing dedents
+        while len(indent_stack) > 1:
+            indent_stack.pop()
+            append(Token(TokenType.DEDENT, None, line, column))
+
+        append(Token(TokenType.EOF, None, line, column))
+
+        return tokens
+
+    def _skip_comment(self, pos: int) -> int:
+        """Skip a #, // or /* */ comment starting at pos; return the new offset."""
+        text = self.text
+        if text.startswith("/*", pos):
+            end = text.find("*/", pos + 2)
+            return len(text) if end == -1 else end + 2
+        end = text.find("\n", pos)
+        return len(text) if end == -1 else end
+
+    def _read_number(self, pos: int, line: int, column: int) -> Tuple[Token, int]:
+        """Read numeric literal starting at pos; return the token and end offset."""
+        text = self.text
+
+        # Hex, binary, octal
+        if text[pos] == "0" and pos + 1 < len(text) and text[pos + 1] in "xXbBoO":
+            digits_re, base = _RADIX_RE[text[pos + 1].lower()]
+            end = digits_re.match(text, pos + 2).end()
+            num_str = text[pos:end].replace("_", "")
+            return Token(TokenType.INTEGER, int(num_str, base), line, column), end
+
+        end = _DECIMAL_RE.match(text, pos).end()
+        num_str = text[pos:end].replace("_", "")
+        if "." in num_str or "e" in num_str or "E" in num_str:
+            return Token(TokenType.FLOAT, float(num_str), line, column), end
+        return Token(TokenType.INTEGER, int(num_str), line, column), end
+
+    def _read_string(self, pos: int) -> Tuple[str, int]:
+        """Read string literal starting at pos; return the value and end offset."""
+        text = self.text
+        n = len(text)
+        quote = text[pos]
+        pos += 1
+
+        # Triple-quoted strings are raw up to the closing triple quote
+        if text.startswith(quote * 2, pos):
+            end = text.find(quote * 3, pos + 2)
+            if end == -1:
+                raise self._error_at("Unterminated string", n)
+            return text[pos + 2:end], end + 3
+
+        body_re = _STRING_BODY_RE[quote]
+        parts = []
+        while True:
+            end = body_re.match(text, pos).end()
+            parts.append(text[pos:end])
+            pos = end
+            if pos >= n:
+                raise self._error_at("Unterminated string", n)
+            if text[pos] == quote:
+                return "".join(parts), pos + 1
+            if pos + 1 >= n:
+                # Backslash at end of input
+                raise self._error_at("Unterminated string", n)
+            escape = text[pos + 1]
+            parts.append(_STRING_ESCAPES.get(escape, escape))
+            pos += 2
+
+
+# ============================================================================
+# Operator Precedence
+# ============================================================================
+
+# Binding powers for the expression engine (higher binds tighter).
+# Prefix `not` sits between `and` and the comparisons; arithmetic prefix
+# operators (- + ~ !) bind tighter than every binary operator.
+_BP_OR = 1
+_BP_AND = 2
+_BP_NOT = 3
+_BP_COMPARISON = 4
+_BP_BIT_OR = 5
+_BP_BIT_XOR = 6
+_BP_BIT_AND = 7
+_BP_SHIFT = 8
+_BP_ADDITIVE = 9
+_BP_MULTIPLICATIVE = 10
+
+# Infix token -> (binding power, operator). `is` and `in` are handled
+# separately because they are a token type and a keyword respectively.
+_INFIX_OPERATORS: Dict[TokenType, Tuple[int, BinaryOperator]] = {
+    TokenType.OR: (_BP_OR, BinaryOperator.OR),
+    TokenType.LOGICAL_OR: (_BP_OR, BinaryOperator.OR),
+    TokenType.AND: (_BP_AND, BinaryOperator.AND),
+    TokenType.LOGICAL_AND: (_BP_AND, BinaryOperator.AND),
+    TokenType.EQ: (_BP_COMPARISON, BinaryOperator.EQUAL),
+    TokenType.NE: (_BP_COMPARISON, BinaryOperator.NOT_EQUAL),
+    TokenType.LT: (_BP_COMPARISON, BinaryOperator.LESS_THAN),
+    TokenType.LE: (_BP_COMPARISON, BinaryOperator.LESS_EQUAL),
+    TokenType.GT: (_BP_COMPARISON, BinaryOperator.GREATER_THAN),
+    TokenType.GE: (_BP_COMPARISON, BinaryOperator.GREATER_EQUAL),
+    TokenType.BIT_OR: (_BP_BIT_OR, BinaryOperator.BIT_OR),
+    TokenType.BIT_XOR: (_BP_BIT_XOR, BinaryOperator.BIT_XOR),
+    TokenType.BIT_AND: (_BP_BIT_AND, BinaryOperator.BIT_AND),
+    TokenType.LSHIFT: (_BP_SHIFT, BinaryOperator.LEFT_SHIFT),
+    TokenType.RSHIFT: (_BP_SHIFT, BinaryOperator.RIGHT_SHIFT),
+    TokenType.PLUS: (_BP_ADDITIVE, BinaryOperator.ADD),
+    TokenType.MINUS: (_BP_ADDITIVE, BinaryOperator.SUBTRACT),
+    TokenType.STAR: (_BP_MULTIPLICATIVE, BinaryOperator.MULTIPLY),
+    TokenType.SLASH: (_BP_MULTIPLICATIVE, BinaryOperator.DIVIDE),
+    TokenType.PERCENT: (_BP_MULTIPLICATIVE, BinaryOperator.MODULO),
+    TokenType.POWER: (_BP_MULTIPLICATIVE, BinaryOperator.POWER),
+    TokenType.FLOOR_DIV: (_BP_MULTIPLICATIVE, BinaryOperator.FLOOR_DIVIDE),
+}
+
+_LITERAL_TOKENS: Dict[TokenType, LiteralType] = {
+    TokenType.INTEGER: LiteralType.INTEGER,
+    TokenType.FLOAT: LiteralType.FLOAT,
+    TokenType.STRING: LiteralType.STRING,
+    TokenType.BOOLEAN: LiteralType.BOOLEAN,
+    TokenType.NULL: LiteralType.NULL,
+}
+
+_PREFIX_OPERATORS: Dict[TokenType, UnaryOperator] = {
+    TokenType.MINUS: UnaryOperator.NEGATE,
+    TokenType.PLUS: UnaryOperator.POSITIVE,
+    TokenType.BIT_NOT: UnaryOperator.BIT_NOT,
+    TokenType.LOGICAL_NOT: UnaryOperator.NOT,  # C-style NOT operator
+}
+
+
 # ============================================================================
 # Parser (Syntax Analysis)
 # ============================================================================
@@ -1058,19 +1480,46 @@ class Parser:
 
         return effects
 
+    def parse_memoize_annotation(self) -> int:
+        """
+        Parse @pure or @memoize annotation, returning the result cache bound.
+
+        Syntax: @pure | @memoize | @memoize(max=N)
+        """
+        self.expect(TokenType.AT)  # consume '@'
+        keyword = self.expect(TokenType.IDENTIFIER).value
+        if keyword not in ("pure", "memoize"):
+            raise self.error(f"Expected 'pure' or 'memoize', got '{keyword}'")
+
+        max_size = DEFAULT_MEMO_SIZE
+        if keyword == "memoize" and self.match(TokenType.LPAREN):
+            self.advance()  # consume '('
+            option = self.expect(TokenType.IDENTIFIER).value
+            if option != "max":
+                raise self.error(f"Unknown @memoize option '{option}', expected 'max'")
+            self.expect(TokenType.ASSIGN)  # consume '='
+            if not self.match(TokenType.INTEGER) or self.current().value < 1:
+                raise self.error("@memoize max must be a positive integer")
+            max_size = self.advance().value
+            self.expect(TokenType.RPAREN)  # consume ')'
+
+        return max_size
+
     def parse_function(self) -> IRFunction:
         """
         Parse C-style function definition with optional generic parameters.
 
         Syntax: function name<T>(param1: type1, param2: type2) -> return_type throws Error { body }
         """
+        start = self.current()
         is_async = False
         if self.match(TokenType.KEYWORD) and self.current().value == "async":
             is_async = True
             self.advance()
 
         self.expect(TokenType.KEYWORD)  # "function"
-        name = self.expect(TokenType.IDENTIFIER).value
+        name_token = self.expect(TokenType.IDENTIFIER)
+        name = name_token.value
 
         # Parse generic parameters: <T> or <T, U>
         generic_params = []
@@ -1137,6 +1586,7 @@ class Parser:
         requires = []
         ensures = []
         effects = []
+        memoize = None
 
         # Parse body: { statements } (C-style) or : INDENT statements DEDENT (Python-style)
         if self.match(TokenType.LBRACE):
@@ -1155,6 +1605,8 @@ class Parser:
                         ensures.append(self.parse_contract_clause())
                     elif clause_type == "effects":
                         effects = self.parse_effects_annotation()
+                    elif clause_type in ("pure", "memoize"):
+                        memoize = self.parse_memoize_annotation()
                     else:
                         break  # Not a contract clause
                 else:
@@ -1195,6 +1647,8 @@ class Parser:
                         ensures.append(self.parse_contract_clause())
                     elif clause_type == "effects":
                         effects = self.parse_effects_annotation()
+                    elif clause_type in ("pure", "memoize"):
+                        memoize = self.parse_memoize_annotation()
                     else:
                         break  # Not a contract clause
                 else:
@@ -1206,7 +1660,7 @@ class Parser:
         else:
             raise self.error("Expected '{' or ':' to start function body")
 
-        return IRFunction(
+        func = IRFunction(
             name=name,
             generic_params=generic_params,
             params=params,
@@ -1217,7 +1671,18 @@ class Parser:
             requires=requires,
             ensures=ensures,
             effects=effects,
+            memoize=memoize,
         )
+        func.location = SourceLocation(line=start.line, column=start.column)
+        if memoize is not None:
+            violations = purity_violations(func)
+            if violations:
+                raise ALParseError(
+                    f"@pure function '{name}' is not pure: {'; '.join(violations)}",
+                    name_token.line,
+                    name_token.column,
+                )
+        return func
 
     def parse_class(self) -> IRClass:
         """
@@ -1357,12 +1822,14 @@ class Parser:
                         name="__init__",
                         params=params,
                         body=body,
-                        return_type=IRType(name="void")
+                        return_type=intern_type("void")
                     )
 
                 elif keyword == "function":
                     # Parse method (same as regular function)
                     method = self.parse_function()
+                    if method.memoize is not None:
+                        raise self.error(f"@pure is only supported on module-level functions, not method '{method.name}'")
 
                     # BUG FIX: Check if this is a constructor (__init__)
                     if method.name == "__init__":
@@ -1647,12 +2114,7 @@ class Parser:
             self.advance()
             is_optional = True
 
-        return IRType(
-            name=name,
-            generic_args=generic_args,
-            union_types=union_types,
-            is_optional=is_optional,
-        )
+        return intern_type(name, generic_args, is_optional, union_types)
 
     def parse_parameters(self) -> List[IRParameter]:
         """Parse function parameters."""
@@ -1719,7 +2181,14 @@ class Parser:
         return statements
 
     def parse_statement(self) -> IRStatement:
-        """Parse a single statement."""
+        """Parse a single statement, recording where it starts."""
+        token = self.current()
+        stmt = self._parse_statement()
+        if isinstance(stmt, IRNode) and stmt.location is None:
+            stmt.location = SourceLocation(line=token.line, column=token.column)
+        return stmt
+
+    def _parse_statement(self) -> IRStatement:
         if self.match(TokenType.KEYWORD):
             keyword = self.current().value
 
@@ -2166,16 +2635,16 @@ class Parser:
 
     def parse_ternary(self) -> IRExpression:
         """Parse ternary expression: x if cond else y"""
-        expr = self.parse_logical_or()
+        expr = self.parse_binary(_BP_OR)
 
         if self.match(TokenType.KEYWORD) and self.current().value == "if":
             # Save position in case this isn't a complete ternary expression
             saved_pos = self.pos
             self.advance()  # consume 'if'
-            condition = self.parse_logical_or()
+            condition = self.parse_binary(_BP_OR)
             if self.match(TokenType.KEYWORD) and self.current().value == "else":
                 self.advance()
-                false_value = self.parse_logical_or()
+                false_value = self.parse_binary(_BP_OR)
                 return IRTernary(
                     condition=condition,
                     true_value=expr,
@@ -2188,69 +2657,55 @@ class Parser:
 
         return expr
 
-    def parse_logical_or(self) -> IRExpression:
-        """Parse logical OR."""
-        left = self.parse_logical_and()
-
-        while self.match(TokenType.OR) or self.match(TokenType.LOGICAL_OR):
-            op = self.advance().value
-            right = self.parse_logical_and()
-            left = IRBinaryOp(op=BinaryOperator.OR, left=left, right=right)
-
-        return left
-
-    def parse_logical_and(self) -> IRExpression:
-        """Parse logical AND."""
-        left = self.parse_logical_not()
+    def parse_binary(self, min_bp: int) -> IRExpression:
+        """
+        Parse binary operators binding at least as tightly as min_bp.
 
-        while self.match(TokenType.AND) or self.match(TokenType.LOGICAL_AND):
-            op = self.advance().value
-            right = self.parse_logical_not()
-            left = IRBinaryOp(op=BinaryOperator.AND, left=left, right=right)
+        Operator-precedence (Pratt) loop driven by _INFIX_OPERATORS. All binary
+        operators are left-associative, so the right operand is parsed at
+        bp + 1. Prefix `not` is only valid in logical operand position and
+        takes a comparison as its operand.
 
-        return left
-
-    def parse_logical_not(self) -> IRExpression:
-        """Parse logical NOT."""
-        if self.match(TokenType.NOT):
+        `ceiling` mirrors the grammar's level structure: once an operator at
+        level L has been consumed, only operators at level <= L may follow.
+        This matters after `not x` and `x is Pattern`, which end at
+        comparison level and may only be continued by `and`/`or`.
+        """
+        tok = self.current()
+        if tok.type == TokenType.NOT and min_bp <= _BP_NOT:
             self.advance()
-            operand = self.parse_comparison()
-            return IRUnaryOp(op=UnaryOperator.NOT, operand=operand)
-
-        return self.parse_comparison()
-
-    def parse_comparison(self) -> IRExpression:
-        """Parse comparison operators, pattern matching, and membership tests."""
-        left = self.parse_bitwise_or()
+            operand = self.parse_binary(_BP_COMPARISON)
+            left = IRUnaryOp(op=UnaryOperator.NOT, operand=operand)
+            ceiling = _BP_AND
+        else:
+            left = self.parse_unary()
+            ceiling = _BP_MULTIPLICATIVE
 
-        while (self.match(TokenType.EQ, TokenType.NE, TokenType.LT, TokenType.LE, TokenType.GT, TokenType.GE, TokenType.IS) or
-               (self.match(TokenType.KEYWORD) and self.current().value == "in")):
-            tok = self.advance()
+        while True:
+            tok = self.current()
+            infix = _INFIX_OPERATORS.get(tok.type)
+            if infix is not None:
+                bp, op = infix
+            elif tok.type == TokenType.IS:
+                bp, op = _BP_COMPARISON, None
+            elif tok.type == TokenType.KEYWORD and tok.value == "in":
+                bp, op = _BP_COMPARISON, BinaryOperator.IN
+            else:
+                break
 
-            # Handle pattern matching ('is' operator)
-            if tok.type == TokenType.IS:
-                # Parse pattern (right side of 'is')
-                pattern = self.parse_pattern()
-                return IRPatternMatch(value=left, pattern=pattern)
+            if bp < min_bp or bp > ceiling:
+                break
+            self.advance()
 
-            # Handle membership test ('in' operator)
-            if tok.value == "in":
-                right = self.parse_bitwise_or()
-                left = IRBinaryOp(op=BinaryOperator.IN, left=left, right=right)
+            if op is None:
+                # Pattern matching ('is' operator) ends the comparison
+                left = IRPatternMatch(value=left, pattern=self.parse_pattern())
+                ceiling = _BP_AND
                 continue
 
-            # Handle regular comparison operators
-            op_map = {
-                "==": BinaryOperator.EQUAL,
-                "!=": BinaryOperator.NOT_EQUAL,
-                "<": BinaryOperator.LESS_THAN,
-                "<=": BinaryOperator.LESS_EQUAL,
-                ">": BinaryOperator.GREATER_THAN,
-                ">=": BinaryOperator.GREATER_EQUAL,
-            }
-            op = op_map[tok.value]
-            right = self.parse_bitwise_or()
+            right = self.parse_binary(bp + 1)
             left = IRBinaryOp(op=op, left=left, right=right)
+            ceiling = bp
 
         return left
 
@@ -2306,96 +2761,18 @@ class Parser:
 
         return pattern
 
-    def parse_bitwise_or(self) -> IRExpression:
-        """Parse bitwise OR."""
-        left = self.parse_bitwise_xor()
-
-        while self.match(TokenType.BIT_OR):
-            self.advance()
-            right = self.parse_bitwise_xor()
-            left = IRBinaryOp(op=BinaryOperator.BIT_OR, left=left, right=right)
-
-        return left
-
-    def parse_bitwise_xor(self) -> IRExpression:
-        """Parse bitwise XOR."""
-        left = self.parse_bitwise_and()
-
-        while self.match(TokenType.BIT_XOR):
-            self.advance()
-            right = self.parse_bitwise_and()
-            left = IRBinaryOp(op=BinaryOperator.BIT_XOR, left=left, right=right)
-
-        return left
-
-    def parse_bitwise_and(self) -> IRExpression:
-        """Parse bitwise AND."""
-        left = self.parse_shift()
-
-        while self.match(TokenType.BIT_AND):
-            self.advance()
-            right = self.parse_shift()
-            left = IRBinaryOp(op=BinaryOperator.BIT_AND, left=left, right=right)
-
-        return left
-
-    def parse_shift(self) -> IRExpression:
-        """Parse shift operators."""
-        left = self.parse_addition()
-
-        while self.match(TokenType.LSHIFT, TokenType.RSHIFT):
-            tok = self.advance()
-            op = BinaryOperator.LEFT_SHIFT if tok.type == TokenType.LSHIFT else BinaryOperator.RIGHT_SHIFT
-            right = self.parse_addition()
-            left = IRBinaryOp(op=op, left=left, right=right)
-
-        return left
-
-    def parse_addition(self) -> IRExpression:
-        """Parse addition and subtraction."""
-        left = self.parse_multiplication()
-
-        while self.match(TokenType.PLUS, TokenType.MINUS):
-            tok = self.advance()
-            op = BinaryOperator.ADD if tok.type == TokenType.PLUS else BinaryOperator.SUBTRACT
-            right = self.parse_multiplication()
-            left = IRBinaryOp(op=op, left=left, right=right)
-
-        return left
-
-    def parse_multiplication(self) -> IRExpression:
-        """Parse multiplication, division, modulo, floor division."""
-        left = self.parse_unary()
-
-        while self.match(TokenType.STAR, TokenType.SLASH, TokenType.PERCENT, TokenType.POWER, TokenType.FLOOR_DIV):
-            tok = self.advance()
-            op_map = {
-                "*": BinaryOperator.MULTIPLY,
-                "/": BinaryOperator.DIVIDE,
-                "%": BinaryOperator.MODULO,
-                "**": BinaryOperator.POWER,
-                "//": BinaryOperator.FLOOR_DIVIDE,
-            }
-            op = op_map[tok.value]
-            right = self.parse_unary()
-            left = IRBinaryOp(op=op, left=left, right=right)
-
-        return left
-
     def parse_unary(self) -> IRExpression:
-        """Parse unary operators."""
-        if self.match(TokenType.MINUS, TokenType.PLUS, TokenType.BIT_NOT, TokenType.LOGICAL_NOT):
-            tok = self.advance()
-            op_map = {
-                "-": UnaryOperator.NEGATE,
-                "+": UnaryOperator.POSITIVE,
-                "~": UnaryOperator.BIT_NOT,
-                "!": UnaryOperator.NOT,  # C-style NOT operator
-            }
-            op = op_map[tok.value]
+        """Parse unary operators, including `await`."""
+        op = _PREFIX_OPERATORS.get(self.current().type)
+        if op is not None:
+            self.advance()
             operand = self.parse_unary()
             return IRUnaryOp(op=op, operand=operand)
 
+        if self.match(TokenType.KEYWORD) and self.current().value == "await":
+            self.advance()
+            return IRAwait(expression=self.parse_unary())
+
         return self.parse_postfix()
 
     def parse_postfix(self) -> IRExpression:
@@ -2468,15 +2845,15 @@ class Parser:
                     self.advance()  # consume ':'
                     # Parse stop if present
                     if not self.match(TokenType.RBRACKET) and not self.match(TokenType.COLON):
-                        stop = self.parse_addition()  # Use parse_addition to avoid recursion
+                        stop = self.parse_binary(_BP_ADDITIVE)
                     # Check for step
                     if self.match(TokenType.COLON):
                         self.advance()
                         if not self.match(TokenType.RBRACKET):
-                            step = self.parse_addition()
+                            step = self.parse_binary(_BP_ADDITIVE)
                 else:
                     # Parse first expression (could be index or start of slice)
-                    first_expr = self.parse_addition()
+                    first_expr = self.parse_binary(_BP_ADDITIVE)
 
                     # Check if it's a slice (has ':')
                     if self.match(TokenType.COLON):
@@ -2485,12 +2862,12 @@ class Parser:
                         self.advance()  # consume ':'
                         # Parse stop if present
                         if not self.match(TokenType.RBRACKET) and not self.match(TokenType.COLON):
-                            stop = self.parse_addition()
+                            stop = self.parse_binary(_BP_ADDITIVE)
                         # Check for step
                         if self.match(TokenType.COLON):
                             self.advance()
                             if not self.match(TokenType.RBRACKET):
-                                step = self.parse_addition()
+                                step = self.parse_binary(_BP_ADDITIVE)
                     else:
                         # Simple indexing
                         self.expect(TokenType.RBRACKET)
@@ -2520,6 +2897,16 @@ class Parser:
 
     def parse_primary(self) -> IRExpression:
         """Parse primary expressions."""
+        # Fast path for the most common primaries: literals and plain identifiers
+        tok = self.current()
+        literal_type = _LITERAL_TOKENS.get(tok.type)
+        if literal_type is not None:
+            self.advance()
+            return IRLiteral(value=tok.value, literal_type=literal_type)
+        if tok.type == TokenType.IDENTIFIER and tok.value != "fn":
+            self.advance()
+            return IRIdentifier(name=tok.value)
+
         # Old keyword for postconditions: old expr
         if self.match(TokenType.KEYWORD) and self.current().value == "old":
             self.advance()  # consume 'old'
@@ -2558,7 +2945,7 @@ class Parser:
             # Parse parameters
             while not self.match(TokenType.RPAREN):
                 param_name = self.expect(TokenType.IDENTIFIER).value
-                params.append(IRParameter(name=param_name, param_type=IRType(name="any")))
+                params.append(IRParameter(name=param_name, param_type=intern_type("any")))
                 if self.match(TokenType.COMMA):
                     self.advance()
                 elif not self.match(TokenType.RPAREN):
@@ -2643,11 +3030,11 @@ class Parser:
             # Parse parameters
             if self.match(TokenType.IDENTIFIER):
                 param_name = self.advance().value
-                params.append(IRParameter(name=param_name, param_type=IRType(name="any")))
+                params.append(IRParameter(name=param_name, param_type=intern_type("any")))
                 while self.match(TokenType.COMMA):
                     self.advance()
                     param_name = self.expect(TokenType.IDENTIFIER).value
-                    params.append(IRParameter(name=param_name, param_type=IRType(name="any")))
+                    params.append(IRParameter(name=param_name, param_type=intern_type("any")))
 
             self.expect(TokenType.COLON)
             body = self.parse_expression()
@@ -2661,7 +3048,7 @@ class Parser:
             # Parse parameters
             while not self.match(TokenType.RPAREN):
                 param_name = self.expect(TokenType.IDENTIFIER).value
-                params.append(IRParameter(name=param_name, param_type=IRType(name="any")))
+                params.append(IRParameter(name=param_name, param_type=intern_type("any")))
                 if self.match(TokenType.COMMA):
                     self.advance()
                 elif not self.match(TokenType.RPAREN):
@@ -2672,17 +3059,91 @@ class Parser:
             body = self.parse_expression()
             return IRLambda(params=params, body=body)
 
-        # Await expression
-        if self.match(TokenType.KEYWORD) and self.current().value == "await":
-            self.advance()
-            expr = self.parse_expression()
-            # Note: IR doesn't have IRAwait yet, wrap in metadata
-            # For now, create a call-like structure
-            return expr
-
         raise self.error(f"Unexpected token in expression: {self.current().type.value}")
 
 
+# ============================================================================
+# Purity Checking
+# ============================================================================
+
+# Calls that perform I/O or read the environment
+IMPURE_FUNCTIONS = frozenset({"print", "input", "open", "read_file", "write_file", "fetch", "sleep"})
+IMPURE_MODULES = frozenset({
+    "io", "fs", "file", "http", "net", "console", "db", "database",
+    "os", "sys", "process", "env", "random", "time", "log", "logger",
+})
+
+# Methods that mutate their receiver in place
+MUTATING_METHODS = frozenset({
+    "append", "push", "pop", "insert", "remove", "clear", "extend", "update", "set", "sort", "reverse",
+})
+
+
+def _root_name(expr: Any) -> Optional[str]:
+    """Identifier at the base of a property/index chain such as a.b[0].c"""
+    while isinstance(expr, (IRPropertyAccess, IRIndex)):
+        expr = expr.object
+    return expr.name if isinstance(expr, IRIdentifier) else None
+
+
+def purity_violations(func: IRFunction) -> List[str]:
+    """
+    Reasons func cannot be treated as pure (an empty list if it can).
+
+    A pure function performs no I/O (calls to IMPURE_FUNCTIONS or into
+    IMPURE_MODULES), declares no @effects, does not mutate its parameters
+    (index/property assignment or MUTATING_METHODS calls on them) and does
+    not assign to names it never declares, which may be module globals.
+    """
+    violations: List[str] = []
+    if func.is_async:
+        violations.append("async functions cannot be memoized")
+    if func.effects:
+        violations.append(f"declares @effects [{', '.join(func.effects)}]")
+
+    params = {param.name for param in func.params}
+    local: set = set(params)
+    assigned: Dict[str, None] = {}
+
+    def visit(node: Any) -> None:
+        if isinstance(node, list):
+            for item in node:
+                visit(item)
+            return
+        if not isinstance(node, IRNode):
+            return
+        if isinstance(node, IRAssignment):
+            if isinstance(node.target, str):
+                if node.is_declaration:
+                    local.add(node.target)
+                else:
+                    assigned[node.target] = None
+            elif _root_name(node.target) in params:
+                violations.append(f"mutates parameter '{_root_name(node.target)}'")
+        elif isinstance(node, IRFor):
+            local.add(node.iterator)
+        elif isinstance(node, IRLambda):
+            local.update(param.name for param in node.params)
+        elif isinstance(node, IRCall):
+            callee = node.function
+            if isinstance(callee, IRIdentifier) and callee.name in IMPURE_FUNCTIONS:
+                violations.append(f"calls {callee.name}()")
+            elif isinstance(callee, IRPropertyAccess):
+                root = _root_name(callee)
+                if root in IMPURE_MODULES and root not in params:
+                    violations.append(f"calls {root}.{callee.property}()")
+                elif root in params and callee.property in MUTATING_METHODS:
+                    violations.append(f"mutates parameter '{root}' via {callee.property}()")
+        for f in fields(node):
+            visit(getattr(node, f.name))
+
+    visit(func.body)
+    for name in assigned:
+        if name not in local:
+            violations.append(f"assigns to '{name}' without declaring it (may be a global)")
+    return violations
+
+
 # ============================================================================
 # Public API
 # ============================================================================
@@ -2834,6 +3295,10 @@ class TypeChecker:
             else:
                 return "any"
 
+        elif isinstance(expr, IRAwait):
+            # An awaited call has the declared return type of the call
+            return self.infer_type(expr.expression)
+
         elif isinstance(expr, IRCall):
             # Extract function name
             func_name = None
@@ -2877,12 +3342,12 @@ class TypeChecker:
         """
         # Convert to IRType objects if needed
         if isinstance(actual, str):
-            actual_type = IRType(name=actual, is_optional=False)
+            actual_type = intern_type(actual)
         else:
             actual_type = actual
 
         if isinstance(expected, str):
-            expected_type = IRType(name=expected, is_optional=False)
+            expected_type = intern_type(expected)
         else:
             expected_type = expected
 
@@ -2907,12 +3372,43 @@ class TypeChecker:
         return False
 
 
-def parse_al(text: str) -> IRModule:
+# Lexer backends selectable in parse_al(). "reference" is the original
+# character-at-a-time Lexer, kept for differential testing.
+LEXER_BACKENDS = {
+    "fast": FastLexer,
+    "reference": Lexer,
+}
+
+
+def tokenize(text: str, lexer: str = "fast") -> List[Token]:
+    """
+    Tokenize PW DSL 2.0 text with the selected lexer backend.
+
+    Args:
+        text: PW DSL 2.0 source code
+        lexer: Backend name from LEXER_BACKENDS ("fast" or "reference")
+
+    Returns:
+        List of tokens ending with EOF
+    """
+    if lexer not in LEXER_BACKENDS:
+        raise ValueError(f"Unknown lexer backend: {lexer!r}")
+    return LEXER_BACKENDS[lexer](text).tokenize()
+
+
+def parse_al(text: str, lexer: str = "fast", use_cache: Optional[bool] = None) -> IRModule:
     """
     Parse PW DSL 2.0 text into IR.
 
+    Parsed modules are memoized in an on-disk cache keyed by the source hash
+    and parser version (see dsl.ir_cache), so unchanged files skip lexing,
+    parsing and type checking entirely.
+
     Args:
         text: PW DSL 2.0 source code
+        lexer: Lexer backend ("fast" or "reference")
+        use_cache: Consult the IR cache (default: ASSERTLANG_IR_CACHE setting).
+            Only the "fast" lexer path is cached.
 
     Returns:
         IRModule: Root IR node
@@ -2920,9 +3416,19 @@ def parse_al(text: str) -> IRModule:
     Raises:
         ALParseError: If parsing fails
     """
+    from dsl import ir_cache
+
+    if use_cache is None:
+        use_cache = ir_cache.ir_cache_enabled()
+    cache = ir_cache.get_ir_cache() if use_cache and lexer == "fast" else None
+
+    if cache is not None:
+        cached = cache.get(text)
+        if cached is not None:
+            return cached
+
     # Lexical analysis
-    lexer = Lexer(text)
-    tokens = lexer.tokenize()
+    tokens = tokenize(text, lexer)
 
     # Syntax analysis
     parser = Parser(tokens)
@@ -2932,4 +3438,7 @@ def parse_al(text: str) -> IRModule:
     type_checker = TypeChecker()
     type_checker.check_module(ir)
 
+    if cache is not None:
+        cache.put(text, ir)
+
     return ir
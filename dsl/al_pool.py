@@ -0,0 +1,427 @@
+"""
+Pre-warmed pool of worker processes that run AL functions.
+
+Building a PWRuntime, loading the stdlib and parsing a program on the request
+thread makes latency spiky, and the GIL keeps one process on one core.
+RuntimePool does that work up front: it imports the parser, runtime and
+compilers and builds the stdlib bindings in the parent, then forks N workers
+that inherit all of it. Jobs (source text or an IR cache key, a function
+name and its arguments) go to an idle worker over its pipe and the result
+comes back the same way.
+
+Each worker keeps a small LRU of loaded programs keyed by IR cache key, so
+repeated jobs for the same program skip parsing and module setup. AL
+functions cannot write module globals, so the only state a job leaves behind
+for the next is tiering progress and memoized results.
+
+- timeout: a job still running after this many seconds is abandoned and its
+  worker killed and replaced (PoolTimeoutError)
+- max_jobs_per_worker: a worker exits after this many jobs and a fresh one
+  is forked, bounding the memory a long-lived worker can accumulate
+- stats(): jobs, errors, timeouts, worker restarts, throughput and latency
+  percentiles
+
+Workers are forked, so the pool is POSIX only.
+
+Example:
+    >>> with RuntimePool(workers=4, timeout=2.0) as pool:
+    ...     pool.run("add", [1, 2], source=SOURCE)
+    ...     results = pool.map(Job("add", [i, i], source=SOURCE) for i in range(100))
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from multiprocessing.connection import Connection, wait
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+import dsl.al_closure  # noqa: F401 - imported before forking so workers inherit it
+import dsl.al_lowering  # noqa: F401
+from dsl.al_parser import parse_al
+from dsl.al_runtime import DEFAULT_TIER_THRESHOLD, PWRuntime, _stdlib_globals
+from dsl.ir import IRFunction
+from dsl.ir_cache import get_ir_cache
+
+# Loaded programs each worker keeps
+WORKER_PROGRAM_CACHE_SIZE = 32
+# Completed job latencies kept for percentiles
+LATENCY_WINDOW = 10000
+
+
+class PoolError(Exception):
+    """Raised for pool failures and for jobs that fail in a worker"""
+
+
+class PoolTimeoutError(PoolError):
+    """Raised for jobs that exceed their timeout"""
+
+
+@dataclass
+class Job:
+    """One function call to run in a worker"""
+
+    function: str
+    args: List[Any]
+    source: Optional[str] = None  # AL source text...
+    key: Optional[str] = None  # ...or the IR cache key of an already parsed program
+    timeout: Optional[float] = None  # Defaults to the pool timeout
+
+
+@dataclass
+class JobResult:
+    """Outcome of a Job; error is None on success"""
+
+    value: Any = None
+    error: Optional[str] = None
+    timed_out: bool = False
+    seconds: float = 0.0
+    worker: Optional[int] = None  # pid
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class _Worker:
+    __slots__ = ("process", "conn", "jobs")
+
+    def __init__(self, process: multiprocessing.Process, conn: Connection):
+        self.process = process
+        self.conn = conn
+        self.jobs = 0
+
+
+def _load_program(
+    key: str, source: Optional[str], engine: str, tier_threshold: Optional[int]
+) -> PWRuntime:
+    if source is not None:
+        module = parse_al(source)
+    else:
+        module = get_ir_cache().load(key)
+        if module is None:
+            raise PoolError(f"No cached IR for key {key}")
+    runtime = PWRuntime(engine=engine, tier_threshold=tier_threshold)
+    runtime.execute_module(module)
+    return runtime
+
+
+def _worker_main(
+    conn: Connection, max_jobs: Optional[int], engine: str, tier_threshold: Optional[int]
+) -> None:
+    """Worker loop: run jobs from conn until told to stop or max_jobs is reached"""
+    programs: OrderedDict = OrderedDict()  # IR cache key -> PWRuntime
+    handled = 0
+    while max_jobs is None or handled < max_jobs:
+        try:
+            job = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if job is None:
+            break
+        handled += 1
+        key, source, function, args = job
+        try:
+            runtime = programs.get(key)
+            if runtime is None:
+                runtime = programs[key] = _load_program(key, source, engine, tier_threshold)
+                if len(programs) > WORKER_PROGRAM_CACHE_SIZE:
+                    programs.popitem(last=False)
+            else:
+                programs.move_to_end(key)
+            func = runtime.globals.get(function)
+            if not isinstance(func, IRFunction):
+                raise PoolError(f"Program has no function {function!r}")
+            reply = (True, runtime.execute_function(func, list(args)))
+        except Exception as e:
+            reply = (False, f"{type(e).__name__}: {e}")
+        try:
+            conn.send(reply)
+        except Exception as e:
+            conn.send((False, f"Result cannot be sent back: {type(e).__name__}: {e}"))
+    conn.close()
+
+
+class RuntimePool:
+    """
+    Pool of forked PWRuntime workers.
+
+    Thread-safe: run() and map() may be called from several threads, each
+    job holding one worker until it completes. Use as a context manager or
+    call close() to stop the workers.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+        max_jobs_per_worker: Optional[int] = None,
+        engine: str = "closure",
+        tier_threshold: Optional[int] = DEFAULT_TIER_THRESHOLD,
+    ):
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError(f"workers must be a positive integer, got {workers}")
+        if max_jobs_per_worker is not None and max_jobs_per_worker < 1:
+            raise ValueError(
+                f"max_jobs_per_worker must be a positive integer or None, got {max_jobs_per_worker}"
+            )
+        if engine not in PWRuntime.ENGINES:
+            engines = ", ".join(PWRuntime.ENGINES)
+            raise ValueError(f"Unknown engine {engine!r}, expected one of: {engines}")
+        try:
+            self._context = multiprocessing.get_context("fork")
+        except ValueError:
+            raise PoolError("RuntimePool needs the 'fork' start method, which this platform lacks")
+
+        self.size = workers
+        self.timeout = timeout
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.engine = engine
+        self.tier_threshold = tier_threshold
+
+        self._lock = threading.Lock()
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._workers: List[_Worker] = []
+        self._closed = False
+        self._counters = {"jobs": 0, "errors": 0, "timeouts": 0, "recycled": 0, "restarted": 0}
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+        # Warm the parent so every worker starts with the stdlib built
+        _stdlib_globals()
+        for _ in range(workers):
+            self._idle.put(self._spawn())
+        self._started = time.perf_counter()
+
+    def __enter__(self) -> RuntimePool:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Jobs
+    # ------------------------------------------------------------------
+
+    def run(
+        self,
+        function: str,
+        args: List[Any],
+        source: Optional[str] = None,
+        key: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Run one job and return its value, raising PoolError if it fails"""
+        result = self.map([Job(function, args, source, key, timeout)])[0]
+        if result.timed_out:
+            raise PoolTimeoutError(result.error)
+        if result.error is not None:
+            raise PoolError(result.error)
+        return result.value
+
+    def map(self, jobs: Iterable[Job]) -> List[JobResult]:
+        """
+        Run jobs on all idle workers concurrently and return their results
+        in order. Failures are reported in the JobResult, not raised.
+        """
+        jobs = list(jobs)
+        results: List[Optional[JobResult]] = [None] * len(jobs)
+        pending = deque(enumerate(jobs))
+        running: Dict[Connection, Tuple[int, _Worker, float, Optional[float]]] = {}
+
+        try:
+            while pending or running:
+                while pending:
+                    # Block for a worker only when nothing is running here
+                    worker = self._acquire(block=not running)
+                    if worker is None:
+                        break
+                    index, job = pending.popleft()
+                    try:
+                        message = self._message(job)
+                    except PoolError as e:
+                        self._release(worker)
+                        results[index] = self._record(JobResult(error=str(e)))
+                        continue
+                    timeout = job.timeout if job.timeout is not None else self.timeout
+                    start = time.perf_counter()
+                    try:
+                        worker.conn.send(message)
+                    except Exception as e:
+                        if isinstance(e, OSError):
+                            # The pipe broke, possibly mid-message: the worker is unusable
+                            self._replace(worker)
+                        else:
+                            # Pickling fails before anything is written: the worker is fine
+                            self._release(worker)
+                        error = f"Job cannot be sent: {type(e).__name__}: {e}"
+                        results[index] = self._record(JobResult(error=error))
+                        continue
+                    worker.jobs += 1
+                    deadline = None if timeout is None else start + timeout
+                    running[worker.conn] = (index, worker, start, deadline)
+                if not running:
+                    continue
+
+                deadlines = [
+                    deadline for _, _, _, deadline in running.values() if deadline is not None
+                ]
+                wait_for = max(0.0, min(deadlines) - time.perf_counter()) if deadlines else None
+                for conn in wait(list(running), wait_for):
+                    index, worker, start, _ = running.pop(conn)
+                    try:
+                        ok, payload = conn.recv()
+                    except (EOFError, OSError):
+                        self._replace(worker)
+                        result = JobResult(error=f"Worker {worker.process.pid} exited")
+                    else:
+                        self._release(worker)
+                        result = JobResult(value=payload) if ok else JobResult(error=payload)
+                    result.seconds = time.perf_counter() - start
+                    result.worker = worker.process.pid
+                    results[index] = self._record(result)
+
+                now = time.perf_counter()
+                for conn, (index, worker, start, deadline) in list(running.items()):
+                    if deadline is not None and now >= deadline:
+                        del running[conn]
+                        self._replace(worker)
+                        error = f"Job timed out after {now - start:.3f}s"
+                        result = JobResult(error=error, timed_out=True)
+                        result.seconds = now - start
+                        result.worker = worker.process.pid
+                        results[index] = self._record(result)
+        finally:
+            # Leaving early (an exception or KeyboardInterrupt) abandons the jobs
+            # still running; their workers would otherwise never become idle again
+            for _, worker, _, _ in running.values():
+                self._replace(worker)
+
+        return results  # type: ignore[return-value]
+
+    def _message(self, job: Job) -> Tuple[str, Optional[str], str, List[Any]]:
+        if (job.source is None) == (job.key is None):
+            raise PoolError("A job needs exactly one of source or key")
+        key = job.key if job.source is None else get_ir_cache().key(job.source)
+        return (key, job.source, job.function, job.args)
+
+    def _record(self, result: JobResult) -> JobResult:
+        with self._lock:
+            self._counters["jobs"] += 1
+            if result.timed_out:
+                self._counters["timeouts"] += 1
+            elif result.error is not None:
+                self._counters["errors"] += 1
+            if not result.timed_out:
+                self._latencies.append(result.seconds)
+        return result
+
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self.max_jobs_per_worker, self.engine, self.tier_threshold),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        worker = _Worker(process, parent_conn)
+        with self._lock:
+            self._workers.append(worker)
+        return worker
+
+    def _acquire(self, block: bool) -> Optional[_Worker]:
+        if self._closed:
+            raise PoolError("RuntimePool is closed")
+        try:
+            return self._idle.get(block=block)
+        except queue.Empty:
+            return None
+
+    def _release(self, worker: _Worker) -> None:
+        if self.max_jobs_per_worker is not None and worker.jobs >= self.max_jobs_per_worker:
+            # The worker exits by itself after its last job
+            self._retire(worker)
+            with self._lock:
+                self._counters["recycled"] += 1
+            self._idle.put(self._spawn())
+        else:
+            self._idle.put(worker)
+
+    def _replace(self, worker: _Worker) -> None:
+        """Kill a worker that timed out or died and fork a new one"""
+        worker.process.kill()
+        self._retire(worker)
+        with self._lock:
+            self._counters["restarted"] += 1
+        self._idle.put(self._spawn())
+
+    def _retire(self, worker: _Worker) -> None:
+        worker.process.join(timeout=5)
+        if worker.process.is_alive():
+            worker.process.kill()
+            worker.process.join()
+        worker.conn.close()
+        with self._lock:
+            self._workers.remove(worker)
+
+    def close(self) -> None:
+        """Stop all workers; jobs still running are abandoned"""
+        if self._closed:
+            return
+        self._closed = True
+        with self._lock:
+            workers = list(self._workers)
+        for worker in workers:
+            try:
+                worker.conn.send(None)
+            except OSError:
+                pass
+        for worker in workers:
+            worker.process.join(timeout=1)
+            if worker.process.is_alive():
+                worker.process.kill()
+                worker.process.join()
+            worker.conn.close()
+        with self._lock:
+            self._workers.clear()
+
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Job counters, worker restarts (recycled after max_jobs_per_worker,
+        restarted after a timeout or crash), throughput since the pool
+        started and latency percentiles of recent completed jobs.
+        """
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._counters)
+            latencies = sorted(self._latencies)
+        stats["workers"] = self.size
+        elapsed = time.perf_counter() - self._started
+        stats["jobs_per_second"] = stats["jobs"] / elapsed if elapsed > 0 else 0.0
+        if latencies:
+            def percentile(p: float) -> float:
+                return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+            stats["latency_ms"] = {
+                "mean": sum(latencies) / len(latencies) * 1000,
+                "p50": percentile(0.50),
+                "p95": percentile(0.95),
+                "p99": percentile(0.99),
+                "max": latencies[-1] * 1000,
+            }
+        else:
+            stats["latency_ms"] = None
+        return stats
@@ -0,0 +1,167 @@
+"""
+Opt-in profiler for AL programs.
+
+Pass a Profiler to dsl.al_runtime.PWRuntime (or dsl.runtime.PWRuntime) and
+it records, per AL function, call counts and inclusive/exclusive wall time,
+and per source line the number of statements executed there (from the
+SourceLocation the parser attaches to each statement). Runtimes created
+without a profiler take none of these code paths.
+
+Output:
+- collapsed(): one "outer;inner;leaf <microseconds>" line per distinct call
+  stack with the exclusive time spent in it, the input format of
+  flamegraph.pl, inferno and speedscope
+- summary(): JSON-serializable functions and lines, hottest first
+
+Example:
+    >>> profiler = Profiler()
+    >>> runtime = PWRuntime(profiler=profiler)
+    >>> runtime.execute_module(module)
+    >>> runtime.execute_function(runtime.globals["main"], [])
+    >>> profiler.write("app")  # app.folded, app.profile.json
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from dsl.ir import IRFunction, SourceLocation
+
+# Name recorded for statements that run outside any function
+MODULE_FRAME = "<module>"
+
+
+@dataclass
+class FunctionProfile:
+    """Accumulated timings of one AL function"""
+
+    name: str
+    calls: int = 0
+    inclusive_ns: int = 0  # Recursive activations are counted once
+    exclusive_ns: int = 0
+    location: Optional[SourceLocation] = None
+
+
+class Profiler:
+    """
+    Records function timings and line counts reported by a runtime.
+
+    Runtimes call enter()/exit() around each AL function call (or use
+    wrap()) and line() before each statement.
+    """
+
+    def __init__(self, clock: Callable[[], int] = time.perf_counter_ns):
+        self.clock = clock
+        self.functions: Dict[str, FunctionProfile] = {}
+        self.lines: Dict[Tuple[str, int], int] = {}  # (function, line) -> statements executed
+        self.stacks: Dict[Tuple[str, ...], int] = {}  # call stack -> exclusive ns
+        self.total_ns = 0
+        self._stack: List[str] = []
+        self._frames: List[List[int]] = []  # [start ns, ns spent in callees]
+        self._depth: Dict[str, int] = {}
+
+    def enter(self, name: str, location: Optional[SourceLocation] = None) -> None:
+        profile = self.functions.get(name)
+        if profile is None:
+            profile = self.functions[name] = FunctionProfile(name, location=location)
+        profile.calls += 1
+        self._depth[name] = self._depth.get(name, 0) + 1
+        self._stack.append(name)
+        self._frames.append([self.clock(), 0])
+
+    def exit(self) -> None:
+        end = self.clock()
+        start, callees = self._frames.pop()
+        stack = tuple(self._stack)
+        name = self._stack.pop()
+        elapsed = end - start
+        exclusive = elapsed - callees
+
+        profile = self.functions[name]
+        profile.exclusive_ns += exclusive
+        depth = self._depth[name] = self._depth[name] - 1
+        if depth == 0:
+            profile.inclusive_ns += elapsed
+        self.stacks[stack] = self.stacks.get(stack, 0) + exclusive
+
+        if self._frames:
+            self._frames[-1][1] += elapsed
+        else:
+            self.total_ns += elapsed
+
+    def wrap(self, func: IRFunction, entry: Callable[[List[Any]], Any]) -> Callable[[List[Any]], Any]:
+        """Return an entry point (taking the argument list) that profiles calls to entry"""
+        name = func.name
+        location = func.location
+        enter = self.enter
+        exit = self.exit
+
+        def profiled(args: List[Any]) -> Any:
+            enter(name, location)
+            try:
+                return entry(args)
+            finally:
+                exit()
+
+        return profiled
+
+    def line(self, line: int) -> None:
+        key = (self._stack[-1] if self._stack else MODULE_FRAME, line)
+        self.lines[key] = self.lines.get(key, 0) + 1
+
+    # ------------------------------------------------------------------
+    # Reports
+    # ------------------------------------------------------------------
+
+    def collapsed(self) -> str:
+        """Collapsed stacks ("a;b;c <microseconds>") for flamegraph tools"""
+        lines = [
+            f"{';'.join(stack)} {ns // 1000}"
+            for stack, ns in sorted(self.stacks.items())
+            if ns >= 1000
+        ]
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def summary(self) -> Dict[str, Any]:
+        """Per-function and per-line statistics, hottest first"""
+        functions = sorted(self.functions.values(), key=lambda p: p.exclusive_ns, reverse=True)
+        lines = sorted(self.lines.items(), key=lambda item: item[1], reverse=True)
+        return {
+            "total_ms": self.total_ns / 1e6,
+            "functions": [
+                {
+                    "name": p.name,
+                    "calls": p.calls,
+                    "inclusive_ms": p.inclusive_ns / 1e6,
+                    "exclusive_ms": p.exclusive_ns / 1e6,
+                    "line": p.location.line if p.location else None,
+                }
+                for p in functions
+            ],
+            "lines": [
+                {"function": function, "line": line, "count": count}
+                for (function, line), count in lines
+            ],
+        }
+
+    def format_table(self, limit: int = 10) -> str:
+        """Plain-text table of the functions with the most exclusive time"""
+        rows = [f"{'function':<32} {'calls':>9} {'incl ms':>10} {'excl ms':>10}"]
+        for entry in self.summary()["functions"][:limit]:
+            rows.append(
+                f"{entry['name']:<32} {entry['calls']:>9} "
+                f"{entry['inclusive_ms']:>10.2f} {entry['exclusive_ms']:>10.2f}"
+            )
+        return "\n".join(rows)
+
+    def write(self, prefix: Union[str, Path]) -> Tuple[Path, Path]:
+        """Write <prefix>.folded and <prefix>.profile.json, returning both paths"""
+        folded = Path(f"{prefix}.folded")
+        summary = Path(f"{prefix}.profile.json")
+        folded.write_text(self.collapsed())
+        summary.write_text(json.dumps(self.summary(), indent=2))
+        return folded, summary
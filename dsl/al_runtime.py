@@ -5,7 +5,8 @@ This module implements the PW runtime that executes AssertLang IR directly
 without transpilation. This IS the runtime for the PW programming language.
 
 Architecture:
-- Tree-walking interpreter over IR nodes
+- Tree-walking interpreter over IR nodes, or closure-compiled functions
+  (PWRuntime(engine="closure"), see dsl.al_closure)
 - Direct execution without code generation
 - Support for generics via monomorphization
 - Pattern matching for enum variants
@@ -13,20 +14,30 @@ Architecture:
 
 Performance:
 - Fast enough for development (optimize later)
+- Stdlib compiled once into a frozen snapshot shared by all runtimes
+- Enum variant lookups and `is` patterns resolved once and cached on the IR
+- Hot functions lowered to Python bytecode after tier_threshold calls
+- Results of @pure functions cached in a bounded LRU per runtime
+- Async functions and `await` run on an asyncio event loop through
+  execute_function_async (see dsl.al_async)
 - Reasonable memory usage
 - Source location tracking for errors
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+import operator
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields
+from inspect import iscoroutine
+from types import CoroutineType, MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 
 from dsl.ir import (
     BinaryOperator,
     IRArray,
     IRAssignment,
+    IRAwait,
     IRBinaryOp,
     IRBreak,
     IRCall,
@@ -44,19 +55,29 @@ from dsl.ir import (
     IRLiteral,
     IRMap,
     IRModule,
+    IRNode,
     IRParameter,
+    IRPatternMatch,
     IRPropertyAccess,
     IRReturn,
     IRStatement,
     IRTernary,
     IRType,
     IRUnaryOp,
+    IRVisitor,
     IRWhile,
     LiteralType,
     SourceLocation,
     UnaryOperator,
+    dispatches,
+    slotted_dataclass,
 )
 from dsl.al_parser import parse_al
+from dsl.stdlib_snapshot import StdlibNotFoundError, get_stdlib_snapshot
+
+if TYPE_CHECKING:
+    from dsl.al_batch import BatchResult
+    from dsl.al_profiler import Profiler
 
 
 # ============================================================================
@@ -99,12 +120,36 @@ class ContinueSignal:
     pass
 
 
+# Calls after which a function is lowered to Python bytecode (see dsl.al_lowering)
+DEFAULT_TIER_THRESHOLD = 1000
+
+
+@dataclass
+class FunctionTier:
+    """
+    Execution tier of one IRFunction within a runtime.
+
+    tier is the runtime's engine ("tree" or "closure") until the function is
+    called tier_threshold times, then "python" once it has been lowered to a
+    Python code object. reason says why lowering was refused, if it was.
+    memo caches results when the function is @pure; its hits do not run the
+    function, so they are not counted in calls.
+    """
+
+    function: IRFunction = field(repr=False)
+    tier: str
+    calls: int = 0
+    reason: Optional[str] = None
+    entry: Optional[Callable[[List[Any]], Any]] = field(default=None, repr=False, compare=False)
+    memo: Optional[MemoCache] = field(default=None, repr=False, compare=False)
+
+
 # ============================================================================
 # Enum Variant Runtime Representation
 # ============================================================================
 
 
-@dataclass
+@slotted_dataclass
 class EnumVariantInstance:
     """
     Runtime instance of an enum variant.
@@ -126,6 +171,47 @@ class EnumVariantInstance:
         return self.variant_name
 
 
+class VariantConstructor:
+    """Callable that builds instances of one enum variant"""
+
+    __slots__ = ("variant_name",)
+
+    def __init__(self, variant_name: str):
+        self.variant_name = variant_name
+
+    def __call__(self, *args: Any) -> EnumVariantInstance:
+        return EnumVariantInstance(self.variant_name, list(args))
+
+    def __repr__(self) -> str:
+        return f"<variant constructor {self.variant_name}>"
+
+    def __reduce__(self) -> Any:
+        return (make_variant_constructor, (self.variant_name,))
+
+
+# variant name -> its constructor; constructors are stateless, so one per name
+_VARIANT_CONSTRUCTORS: Dict[str, VariantConstructor] = {}
+
+
+def make_variant_constructor(variant_name: str) -> VariantConstructor:
+    """Return the (shared) callable that builds instances of an enum variant"""
+    constructor = _VARIANT_CONSTRUCTORS.get(variant_name)
+    if constructor is None:
+        constructor = _VARIANT_CONSTRUCTORS[variant_name] = VariantConstructor(variant_name)
+    return constructor
+
+
+def variant_table(enum: IREnum) -> Mapping[str, VariantConstructor]:
+    """Variant name -> constructor for enum, built on first use and cached on the node"""
+    try:
+        return enum._variant_table
+    except AttributeError:
+        pass
+    table = {variant.name: make_variant_constructor(variant.name) for variant in enum.variants}
+    enum._variant_table = table
+    return table
+
+
 # ============================================================================
 # Pattern Matching
 # ============================================================================
@@ -139,6 +225,121 @@ class PatternMatch:
     bindings: Dict[str, Any]
 
 
+class VariantPattern:
+    """
+    A pattern compiled once into a matcher.
+
+    captures is None for a bare variant name ("None"), else the capture names
+    ("Some(val)" -> ("val",), "_" ignores a value).
+    """
+
+    __slots__ = ("variant_name", "captures")
+
+    def __init__(self, variant_name: str, captures: Optional[Tuple[str, ...]] = None):
+        self.variant_name = variant_name
+        self.captures = captures
+
+    def match(self, value: Any) -> Optional[Dict[str, Any]]:
+        """Bindings if value matches, None if it does not"""
+        if value.__class__ is not EnumVariantInstance or value.variant_name != self.variant_name:
+            return None
+        captures = self.captures
+        if captures is None:
+            return {}
+
+        values = value.values
+        if len(captures) == 1:
+            capture = captures[0]
+            if capture == "_":
+                return {}
+            # A single capture binds the value, or all of them as a tuple
+            if len(values) == 1:
+                return {capture: values[0]}
+            if not values:
+                return None
+            return {capture: tuple(values)}
+
+        if len(values) != len(captures):
+            return None
+        return {capture: v for capture, v in zip(captures, values) if capture != "_"}
+
+    def __repr__(self) -> str:
+        if self.captures is None:
+            return f"VariantPattern({self.variant_name})"
+        return f"VariantPattern({self.variant_name}({', '.join(self.captures)}))"
+
+
+# pattern string -> VariantPattern
+_PATTERN_CACHE: Dict[str, VariantPattern] = {}
+_PATTERN_CACHE_SIZE = 1024
+
+
+def compile_pattern(pattern: str) -> VariantPattern:
+    """Parse a pattern string ("Name" or "Name(binding)"), or return the cached matcher"""
+    compiled = _PATTERN_CACHE.get(pattern)
+    if compiled is None:
+        if "(" in pattern:
+            variant_name = pattern[: pattern.index("(")]
+            binding = pattern[pattern.index("(") + 1 : pattern.rindex(")")]
+            compiled = VariantPattern(variant_name, (binding,))
+        else:
+            compiled = VariantPattern(pattern)
+        if len(_PATTERN_CACHE) >= _PATTERN_CACHE_SIZE:
+            del _PATTERN_CACHE[next(iter(_PATTERN_CACHE))]
+        _PATTERN_CACHE[pattern] = compiled
+    return compiled
+
+
+def compile_ir_pattern(node: IRPatternMatch) -> VariantPattern:
+    """Matcher for an `is` expression, built on first use and cached on the node"""
+    try:
+        return node._compiled_pattern
+    except AttributeError:
+        pass
+
+    pattern = node.pattern
+    captures: Optional[Tuple[str, ...]] = None
+    if isinstance(pattern, IRCall):
+        if not all(isinstance(arg, IRIdentifier) for arg in pattern.args):
+            raise PWRuntimeError("Pattern captures must be identifiers", node.location)
+        captures = tuple(arg.name for arg in pattern.args)
+        pattern = pattern.function
+
+    # Qualified patterns (Option.Some) match on the variant name alone
+    if isinstance(pattern, IRIdentifier):
+        compiled = VariantPattern(pattern.name, captures)
+    elif isinstance(pattern, IRPropertyAccess):
+        compiled = VariantPattern(pattern.property, captures)
+    else:
+        raise PWRuntimeError(f"Unsupported pattern: {type(pattern)}", node.location)
+
+    node._compiled_pattern = compiled
+    return compiled
+
+
+def pattern_captures(node: Any) -> List[str]:
+    """
+    Names bound by the `is` patterns in node (an IR node or list of nodes),
+    not counting those inside lambdas, which bind in the lambda's own scope.
+    """
+    names: Dict[str, None] = {}
+
+    def visit(node: Any) -> None:
+        if isinstance(node, list):
+            for item in node:
+                visit(item)
+        elif isinstance(node, IRNode) and not isinstance(node, IRLambda):
+            if isinstance(node, IRPatternMatch) and isinstance(node.pattern, IRCall):
+                for arg in node.pattern.args:
+                    if isinstance(arg, IRIdentifier) and arg.name != "_":
+                        names[arg.name] = None
+            for f in fields(node):
+                visit(getattr(node, f.name))
+
+    visit(node)
+    return list(names)
+
+
 class PatternMatcher:
     """Pattern matching support for enum variants"""
 
@@ -154,39 +355,236 @@ class PatternMatcher:
             "Ok(x)" - Match Ok variant, bind value to 'x'
             "Err(e)" - Match Err variant, bind error to 'e'
 
+        Pattern strings are parsed once and cached (see compile_pattern).
+
         Returns:
             PatternMatch with matched=True and bindings if successful
             PatternMatch with matched=False if unsuccessful
         """
-        if not isinstance(value, EnumVariantInstance):
+        bindings = compile_pattern(pattern).match(value)
+        if bindings is None:
             return PatternMatch(matched=False, bindings={})
+        return PatternMatch(matched=True, bindings=bindings)
 
-        # Parse pattern: "Name" or "Name(binding)"
-        if "(" in pattern:
-            # Extract variant name and binding
-            variant_name = pattern[: pattern.index("(")]
-            binding_part = pattern[pattern.index("(") + 1 : pattern.rindex(")")]
 
-            if value.variant_name != variant_name:
-                return PatternMatch(matched=False, bindings={})
+def get_property(obj: Any, name: str) -> Any:
+    """Property access: enum variant constructors, attributes, then map keys"""
+    # Handle enum variant access (e.g., Option.Some)
+    if isinstance(obj, IREnum):
+        constructor = variant_table(obj).get(name)
+        if constructor is None:
+            raise PWRuntimeError(f"Enum {obj.name} has no variant {name}")
+        return constructor
+
+    # Regular property access
+    if hasattr(obj, name):
+        return getattr(obj, name)
+    elif isinstance(obj, dict):
+        return obj.get(name)
+    else:
+        raise PWRuntimeError(f"Object has no property: {name}")
+
+
+# ============================================================================
+# Operators
+# ============================================================================
+
+
+def is_truthy(value: Any) -> bool:
+    """Determine if a value is truthy (for conditionals)"""
+    if value is None:
+        return False
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return value != 0
+    if isinstance(value, str):
+        return len(value) > 0
+    if isinstance(value, (list, dict)):
+        return len(value) > 0
+    # EnumVariantInstance is always truthy
+    return True
+
+
+def values_equal(left: Any, right: Any) -> bool:
+    """Check equality (handles enum variants)"""
+    if isinstance(left, EnumVariantInstance) and isinstance(right, EnumVariantInstance):
+        return left.variant_name == right.variant_name and left.values == right.values
+    return left == right
+
+
+def _divide(left: Any, right: Any) -> Any:
+    if right == 0:
+        raise PWRuntimeError("Division by zero")
+    return left / right
+
+
+# Operator semantics shared by every execution engine. Both operands are
+# always evaluated before the operator is applied (AND/OR do not short-circuit).
+BINARY_OPERATORS: Mapping[BinaryOperator, Callable[[Any, Any], Any]] = MappingProxyType({
+    BinaryOperator.ADD: operator.add,
+    BinaryOperator.SUBTRACT: operator.sub,
+    BinaryOperator.MULTIPLY: operator.mul,
+    BinaryOperator.DIVIDE: _divide,
+    BinaryOperator.MODULO: operator.mod,
+    BinaryOperator.POWER: operator.pow,
+    BinaryOperator.FLOOR_DIVIDE: operator.floordiv,
+    BinaryOperator.EQUAL: values_equal,
+    BinaryOperator.NOT_EQUAL: lambda left, right: not values_equal(left, right),
+    BinaryOperator.LESS_THAN: operator.lt,
+    BinaryOperator.LESS_EQUAL: operator.le,
+    BinaryOperator.GREATER_THAN: operator.gt,
+    BinaryOperator.GREATER_EQUAL: operator.ge,
+    BinaryOperator.AND: lambda left, right: is_truthy(left) and is_truthy(right),
+    BinaryOperator.OR: lambda left, right: is_truthy(left) or is_truthy(right),
+    BinaryOperator.BIT_AND: operator.and_,
+    BinaryOperator.BIT_OR: operator.or_,
+    BinaryOperator.BIT_XOR: operator.xor,
+    BinaryOperator.LEFT_SHIFT: operator.lshift,
+    BinaryOperator.RIGHT_SHIFT: operator.rshift,
+    BinaryOperator.IN: lambda left, right: left in right,
+})
+
+UNARY_OPERATORS: Mapping[UnaryOperator, Callable[[Any], Any]] = MappingProxyType({
+    UnaryOperator.NOT: lambda operand: not is_truthy(operand),
+    UnaryOperator.NEGATE: operator.neg,
+    UnaryOperator.POSITIVE: operator.pos,
+    UnaryOperator.BIT_NOT: operator.invert,
+})
+
+
+def await_value(value: Any, location: Optional[SourceLocation] = None) -> Any:
+    """
+    `await` in synchronous execution. Async functions called outside
+    PWRuntime.execute_function_async have already run to completion, so plain
+    values pass through, as do tasks that have finished; anything still
+    pending cannot be waited for here.
+    """
+    if not hasattr(value, "__await__"):
+        return value
+    done = getattr(value, "done", None)
+    if done is not None and done():
+        return value.result()
+    if iscoroutine(value):
+        value.close()
+    raise PWRuntimeError(
+        "Cannot await a pending coroutine or task here: run async code with execute_function_async",
+        location,
+    )
+
+
+# ============================================================================
+# Memoization of @pure Functions
+# ============================================================================
+
+_SCALAR_TYPES = frozenset({int, float, str, bool, type(None)})
 
-            # Check if binding is wildcard
-            if binding_part == "_":
-                return PatternMatch(matched=True, bindings={})
 
-            # Bind value (only supports single value for now)
-            if len(value.values) == 1:
-                return PatternMatch(matched=True, bindings={binding_part: value.values[0]})
-            elif len(value.values) == 0:
-                return PatternMatch(matched=False, bindings={})
+def memo_key(value: Any) -> Any:
+    """
+    Hashable cache key for a runtime value. The type is part of the key, so
+    1, 1.0 and true stay distinct; lists and maps are keyed by their contents.
+    Raises TypeError for values that cannot be keyed (functions, objects).
+    """
+    cls = value.__class__
+    if cls in _SCALAR_TYPES:
+        return (cls, value)
+    if cls is list:
+        return (list, tuple([memo_key(item) for item in value]))
+    if cls is dict:
+        return (dict, tuple([(memo_key(k), memo_key(v)) for k, v in value.items()]))
+    if cls is EnumVariantInstance:
+        return (cls, value.variant_name, tuple([memo_key(item) for item in value.values]))
+    raise TypeError(f"Cannot memoize on a {cls.__name__} argument")
+
+
+class MemoCache:
+    """
+    Bounded LRU cache of one @pure function's results within a runtime.
+
+    Calls whose arguments cannot be keyed bypass the cache, and calls that
+    raise are not cached. Cached results are shared between hits, as with
+    functools.lru_cache.
+    """
+
+    __slots__ = ("max_size", "entries", "hits", "misses", "evictions")
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def wrap(self, entry: Callable[[List[Any]], Any]) -> Callable[[List[Any]], Any]:
+        """Return an entry point that consults the cache before calling entry"""
+        entries = self.entries
+        max_size = self.max_size
+
+        def memoized(args: List[Any]) -> Any:
+            try:
+                key = tuple([memo_key(arg) for arg in args])
+            except TypeError:
+                return entry(args)
+            try:
+                result = entries[key]
+            except KeyError:
+                pass
             else:
-                # Multiple values - bind as tuple
-                return PatternMatch(matched=True, bindings={binding_part: tuple(value.values)})
-        else:
-            # Simple pattern: just variant name
-            if value.variant_name != pattern:
-                return PatternMatch(matched=False, bindings={})
-            return PatternMatch(matched=True, bindings={})
+                entries.move_to_end(key)
+                self.hits += 1
+                return result
+
+            self.misses += 1
+            result = entry(args)
+            entries[key] = result
+            if len(entries) > max_size:
+                entries.popitem(last=False)
+                self.evictions += 1
+            return result
+
+        return memoized
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self.entries),
+            "max_size": self.max_size,
+        }
+
+
+# ============================================================================
+# Standard Library
+# ============================================================================
+
+_STDLIB_GLOBALS: Optional[Mapping[str, Any]] = None
+
+
+def _stdlib_globals() -> Mapping[str, Any]:
+    """
+    Return the stdlib global bindings, built once per process.
+
+    Enums, variant constructors (Some, None, Ok, Err) and functions
+    (option_some, result_ok, ...) come from the frozen stdlib snapshot and are
+    shared read-only across runtime instances.
+    """
+    global _STDLIB_GLOBALS
+    if _STDLIB_GLOBALS is None:
+        try:
+            snapshot = get_stdlib_snapshot()
+        except StdlibNotFoundError:
+            raise PWRuntimeError("stdlib not found")
+
+        bindings: Dict[str, Any] = {}
+        for enum in snapshot.enums:
+            bindings[enum.name] = enum
+            bindings.update(variant_table(enum))
+        for func in snapshot.functions:
+            bindings[func.name] = func
+        _STDLIB_GLOBALS = MappingProxyType(bindings)
+    return _STDLIB_GLOBALS
 
 
 # ============================================================================
@@ -194,57 +592,63 @@ class PatternMatcher:
 # ============================================================================
 
 
-class PWRuntime:
+class PWRuntime(IRVisitor):
     """
     AssertLang Runtime Interpreter
 
     Executes AssertLang IR directly without transpilation.
     This IS the runtime for the PW programming language.
+
+    Engines:
+        "tree" - walk the IR on every evaluation (default)
+        "closure" - compile each IRFunction once into nested Python closures
+                    (see dsl.al_closure) and run those instead
+
+    Either way, calls are counted per function and a function called
+    tier_threshold times is lowered to a Python code object (see
+    dsl.al_lowering). Pass tier_threshold=None to disable tiering.
+
+    With a profiler (see dsl.al_profiler), every function call and
+    statement is reported to it. Profiled runtimes never lower functions to
+    Python, whose code has no per-statement hooks.
+
+    execute_function_async runs async functions and `await` on the asyncio
+    event loop (see dsl.al_async); execute_function runs them to completion.
     """
 
-    def __init__(self):
+    ENGINES = ("tree", "closure")
+
+    def __init__(
+        self,
+        engine: str = "tree",
+        tier_threshold: Optional[int] = DEFAULT_TIER_THRESHOLD,
+        profiler: Optional[Profiler] = None,
+    ):
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}, expected one of: {', '.join(self.ENGINES)}")
+        if tier_threshold is not None and tier_threshold < 1:
+            raise ValueError(f"tier_threshold must be a positive call count or None, got {tier_threshold}")
         self.globals: Dict[str, Any] = {}  # Global scope
         self.call_stack: List[str] = []  # Call stack for debugging
         self.stdlib_loaded = False  # Track if stdlib is loaded
+        self.engine = engine
+        self.tier_threshold = tier_threshold if profiler is None else None
+        self.profiler = profiler
+        # id(IRFunction) -> FunctionTier; IR nodes are unhashable
+        self._tiers: Dict[int, FunctionTier] = {}
+        self._compiler = None
+        self._async = None
+        if profiler is not None:
+            # Shadow the method so unprofiled runtimes pay nothing per statement
+            self.execute_statement = self._execute_statement_profiled
 
     def load_stdlib(self) -> None:
         """Load standard library (Option, Result enums and functions)"""
         if self.stdlib_loaded:
             return
 
-        # Parse stdlib/core_simple.al (temporary until parser supports pattern matching)
-        stdlib_path = Path(__file__).parent.parent / "stdlib" / "core_simple.al"
-        if not stdlib_path.exists():
-            # Fallback to core.al if simple version doesn't exist
-            stdlib_path = Path(__file__).parent.parent / "stdlib" / "core.al"
-            if not stdlib_path.exists():
-                raise PWRuntimeError(f"stdlib not found")
-
-        with open(stdlib_path, "r") as f:
-            stdlib_source = f.read()
-
-        module = parse_al(stdlib_source)
-
-        # Register enums (Option, Result)
-        for enum in module.enums:
-            self.globals[enum.name] = enum
-
-            # Register variant constructors (Some, None, Ok, Err)
-            for variant in enum.variants:
-                # Create constructor function
-                def make_variant_constructor(variant_name: str):
-                    def constructor(*args):
-                        return EnumVariantInstance(variant_name, list(args))
-
-                    return constructor
-
-                # Register as global: Option.Some, Option.None, Result.Ok, Result.Err
-                self.globals[variant.name] = make_variant_constructor(variant.name)
-
-        # Register functions (option_some, option_map, result_ok, etc.)
-        for func in module.functions:
-            self.globals[func.name] = func
-
+        # The stdlib is compiled once per process and shared read-only
+        self.globals.update(_stdlib_globals())
         self.stdlib_loaded = True
 
     def execute_module(self, module: IRModule) -> Any:
@@ -255,15 +659,7 @@ class PWRuntime:
         # Register module enums
         for enum in module.enums:
             self.globals[enum.name] = enum
-            for variant in enum.variants:
-
-                def make_variant_constructor(variant_name: str):
-                    def constructor(*args):
-                        return EnumVariantInstance(variant_name, list(args))
-
-                    return constructor
-
-                self.globals[variant.name] = make_variant_constructor(variant.name)
+            self.globals.update(variant_table(enum))
 
         # Register module functions
         for func in module.functions:
@@ -280,11 +676,61 @@ class PWRuntime:
         """Execute a PW function with arguments"""
         # Handle Python built-in functions
         if callable(func) and not isinstance(func, IRFunction):
-            return func(*args)
+            result = func(*args)
+            if result.__class__ is CoroutineType:
+                # A Python coroutine function: a task under execute_function_async
+                from dsl.al_async import start_coroutine
+
+                return start_coroutine(result)
+            return result
 
         if not isinstance(func, IRFunction):
             raise PWRuntimeError(f"Cannot call non-function: {type(func)}")
 
+        tier = self._tiers.get(id(func))
+        if tier is None or tier.function is not func:
+            tier = self._install(func)
+        return tier.entry(args)
+
+    async def execute_function_async(
+        self, func: Union[IRFunction, callable], args: List[Any], concurrent_awaits: bool = True
+    ) -> Any:
+        """
+        Execute a PW function on the running asyncio event loop and return
+        its awaited result.
+
+        Calls to async functions (AL or Python coroutine functions) start
+        tasks that `await` waits for. With concurrent_awaits, consecutive
+        `let x = await f(...);` declarations that do not depend on each other
+        are awaited together (see dsl.al_async).
+        """
+        from dsl.al_async import run_async
+
+        return await run_async(self, func, args, concurrent_awaits)
+
+    def execute_function_batch(
+        self,
+        func: IRFunction,
+        columns: Union[Mapping[str, Any], Sequence[Any]],
+        contracts: bool = False,
+    ) -> BatchResult:
+        """
+        Execute func once per row of argument columns (NumPy arrays or lists),
+        given in parameter order or by parameter name.
+
+        With NumPy installed, functions over numbers and bools are evaluated
+        as array operations; others run row by row (see dsl.al_batch). With
+        contracts=True, the result also holds a boolean mask per contract
+        clause.
+        """
+        from dsl.al_batch import execute_batch
+
+        if not isinstance(func, IRFunction):
+            raise PWRuntimeError(f"Cannot batch-execute non-function: {type(func)}")
+        return execute_batch(self, func, columns, contracts)
+
+    def _interpret_function(self, func: IRFunction, args: List[Any]) -> Any:
+        """Run func by walking its IR"""
         # Push to call stack
         self.call_stack.append(func.name)
 
@@ -321,117 +767,228 @@ class PWRuntime:
             # Pop from call stack
             self.call_stack.pop()
 
+    def function_tier(self, func: IRFunction) -> FunctionTier:
+        """Return func's tier in this runtime, creating its entry point on first use"""
+        tier = self._tiers.get(id(func))
+        if tier is None or tier.function is not func:
+            tier = self._install(func)
+        return tier
+
+    def _install(self, func: IRFunction) -> FunctionTier:
+        """Create the call-counting entry point for func in the runtime's engine"""
+        tier = FunctionTier(func, self.engine)
+
+        if self.engine == "closure":
+            if self._compiler is None:
+                from dsl.al_closure import ClosureCompiler
+
+                self._compiler = ClosureCompiler(self)
+            tier.entry = self._compiler.compile_function(func, tier)
+        else:
+
+            def entry(args: List[Any]) -> Any:
+                tier.calls += 1
+                if tier.calls == self.tier_threshold:
+                    native = self._promote(tier, entry)
+                    if native is not None:
+                        return native(args)
+                return self._interpret_function(func, args)
+
+            tier.entry = entry
+
+        if func.memoize is not None:
+            tier.memo = MemoCache(func.memoize)
+            tier.entry = tier.memo.wrap(tier.entry)
+        if func.is_async:
+            tier.entry = self._async_entry(tier, tier.entry)
+        if self.profiler is not None:
+            tier.entry = self.profiler.wrap(func, tier.entry)
+
+        self._tiers[id(func)] = tier
+        return tier
+
+    def _promote(
+        self, tier: FunctionTier, fallback: Callable[[List[Any]], Any]
+    ) -> Optional[Callable[[List[Any]], Any]]:
+        """
+        Lower a hot function to Python and switch its entry point over.
+        fallback (the current entry point) keeps handling calls that omit
+        arguments.
+        """
+        from dsl.al_lowering import LoweringError, native_entry
+
+        if tier.tier == "python" or tier.reason is not None:
+            # Already decided; a call omitting arguments fell back from native code
+            return None
+        try:
+            native = native_entry(tier.function, self, fallback, tier)
+        except LoweringError as e:
+            tier.reason = str(e)
+            return None
+
+        tier.tier = "python"
+        tier.entry = native if tier.memo is None else tier.memo.wrap(native)
+        if tier.function.is_async:
+            tier.entry = self._async_entry(tier, tier.entry)
+        # The native entry point counts the call that triggered promotion again
+        tier.calls -= 1
+        return native
+
+    def _async_entry(
+        self, tier: FunctionTier, entry: Callable[[List[Any]], Any]
+    ) -> Callable[[List[Any]], Any]:
+        """Entry point of an async function: a task under execute_function_async, else entry"""
+        if self._async is None:
+            from dsl.al_async import AsyncInterpreter
+
+            self._async = AsyncInterpreter(self)
+        return self._async.entry(tier, entry)
+
+    def tier_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-function execution tier, call count and lowering refusal reason"""
+        return {
+            tier.function.name: {"tier": tier.tier, "calls": tier.calls, "reason": tier.reason}
+            for tier in self._tiers.values()
+        }
+
+    def memo_stats(self) -> Dict[str, Dict[str, int]]:
+        """Per-function result cache hits, misses, evictions and size for @pure functions"""
+        return {tier.function.name: tier.memo.stats() for tier in self._tiers.values() if tier.memo is not None}
+
     def execute_statement(self, stmt: IRStatement, scope: Dict[str, Any]) -> Any:
         """Execute a single statement"""
-        if isinstance(stmt, IRReturn):
-            if stmt.value:
-                value = self.evaluate_expression(stmt.value, scope)
-                return ReturnValue(value)
-            return ReturnValue(None)
-
-        elif isinstance(stmt, IRAssignment):
+        handler = self._dispatch_tables["statement"].get(stmt.__class__)
+        if handler is None:
+            handler = self.handler_for("statement", stmt.__class__)
+        return handler(self, stmt, scope)
+
+    def _execute_statement_profiled(self, stmt: IRStatement, scope: Dict[str, Any]) -> Any:
+        location = stmt.location
+        if location is not None:
+            self.profiler.line(location.line)
+        return PWRuntime.execute_statement(self, stmt, scope)
+
+    @dispatches(IRReturn, table="statement")
+    def _execute_return(self, stmt: IRReturn, scope: Dict[str, Any]) -> Any:
+        if stmt.value:
             value = self.evaluate_expression(stmt.value, scope)
-
-            # Handle different assignment targets
-            if isinstance(stmt.target, str):
-                # Simple assignment: x = value
-                if stmt.is_declaration or stmt.target in scope:
-                    scope[stmt.target] = value
-                elif stmt.target in self.globals:
-                    self.globals[stmt.target] = value
-                else:
-                    # New variable in current scope
-                    scope[stmt.target] = value
-            elif isinstance(stmt.target, IRIndex):
-                # Indexed assignment: arr[0] = value
-                obj = self.evaluate_expression(stmt.target.object, scope)
-                index = self.evaluate_expression(stmt.target.index, scope)
-                obj[index] = value
-            elif isinstance(stmt.target, IRPropertyAccess):
-                # Property assignment: obj.prop = value
-                obj = self.evaluate_expression(stmt.target.object, scope)
-                setattr(obj, stmt.target.property, value)
+            return ReturnValue(value)
+        return ReturnValue(None)
+
+    @dispatches(IRAssignment, table="statement")
+    def _execute_assignment(self, stmt: IRAssignment, scope: Dict[str, Any]) -> Any:
+        value = self.evaluate_expression(stmt.value, scope)
+        self.assign(stmt, value, scope)
+        return value
+
+    def assign(self, stmt: IRAssignment, value: Any, scope: Dict[str, Any]) -> None:
+        """Store the value of an assignment statement in its target"""
+        # Handle different assignment targets
+        if isinstance(stmt.target, str):
+            # Simple assignment: x = value
+            if stmt.is_declaration or stmt.target in scope:
+                scope[stmt.target] = value
+            elif stmt.target in self.globals:
+                self.globals[stmt.target] = value
             else:
-                raise PWRuntimeError(f"Invalid assignment target: {type(stmt.target)}")
-
-            return value
+                # New variable in current scope
+                scope[stmt.target] = value
+        elif isinstance(stmt.target, IRIndex):
+            # Indexed assignment: arr[0] = value
+            obj = self.evaluate_expression(stmt.target.object, scope)
+            index = self.evaluate_expression(stmt.target.index, scope)
+            obj[index] = value
+        elif isinstance(stmt.target, IRPropertyAccess):
+            # Property assignment: obj.prop = value
+            obj = self.evaluate_expression(stmt.target.object, scope)
+            setattr(obj, stmt.target.property, value)
+        else:
+            raise PWRuntimeError(f"Invalid assignment target: {type(stmt.target)}")
 
-        elif isinstance(stmt, IRIf):
-            condition = self.evaluate_expression(stmt.condition, scope)
+    @dispatches(IRIf, table="statement")
+    def _execute_if(self, stmt: IRIf, scope: Dict[str, Any]) -> Any:
+        condition = self.evaluate_expression(stmt.condition, scope)
 
-            if self._is_truthy(condition):
-                return self.execute_block(stmt.then_body, scope)
-            elif stmt.else_body:
-                return self.execute_block(stmt.else_body, scope)
+        if self._is_truthy(condition):
+            return self.execute_block(stmt.then_body, scope)
+        elif stmt.else_body:
+            return self.execute_block(stmt.else_body, scope)
 
-        elif isinstance(stmt, IRFor):
-            iterable = self.evaluate_expression(stmt.iterable, scope)
+    @dispatches(IRFor, table="statement")
+    def _execute_for(self, stmt: IRFor, scope: Dict[str, Any]) -> Any:
+        iterable = self.evaluate_expression(stmt.iterable, scope)
 
-            # Create new scope for loop variable
-            loop_scope = dict(scope)
+        # Create new scope for loop variable
+        loop_scope = dict(scope)
 
-            for item in iterable:
-                loop_scope[stmt.iterator] = item
+        for item in iterable:
+            loop_scope[stmt.iterator] = item
 
-                result = self.execute_block(stmt.body, loop_scope)
+            result = self.execute_block(stmt.body, loop_scope)
 
-                if isinstance(result, ReturnValue):
-                    return result
-                if isinstance(result, BreakSignal):
-                    break
-                if isinstance(result, ContinueSignal):
-                    continue
+            if isinstance(result, ReturnValue):
+                return result
+            if isinstance(result, BreakSignal):
+                break
+            if isinstance(result, ContinueSignal):
+                continue
 
-            # Copy loop scope changes back to parent scope
-            scope.update(loop_scope)
+        # Copy loop scope changes back to parent scope
+        scope.update(loop_scope)
 
-        elif isinstance(stmt, IRForCStyle):
-            # Initialize
-            self.execute_statement(stmt.init, scope)
+    @dispatches(IRForCStyle, table="statement")
+    def _execute_for_c_style(self, stmt: IRForCStyle, scope: Dict[str, Any]) -> Any:
+        # Initialize
+        self.execute_statement(stmt.init, scope)
 
-            # Loop
-            while True:
-                condition = self.evaluate_expression(stmt.condition, scope)
-                if not self._is_truthy(condition):
-                    break
+        # Loop
+        while True:
+            condition = self.evaluate_expression(stmt.condition, scope)
+            if not self._is_truthy(condition):
+                break
 
-                result = self.execute_block(stmt.body, scope)
+            result = self.execute_block(stmt.body, scope)
 
-                if isinstance(result, ReturnValue):
-                    return result
-                if isinstance(result, BreakSignal):
-                    break
-                if isinstance(result, ContinueSignal):
-                    pass  # Continue to increment
+            if isinstance(result, ReturnValue):
+                return result
+            if isinstance(result, BreakSignal):
+                break
+            if isinstance(result, ContinueSignal):
+                pass  # Continue to increment
 
-                # Increment
-                self.execute_statement(stmt.increment, scope)
+            # Increment
+            self.execute_statement(stmt.increment, scope)
 
-        elif isinstance(stmt, IRWhile):
-            while True:
-                condition = self.evaluate_expression(stmt.condition, scope)
-                if not self._is_truthy(condition):
-                    break
+    @dispatches(IRWhile, table="statement")
+    def _execute_while(self, stmt: IRWhile, scope: Dict[str, Any]) -> Any:
+        while True:
+            condition = self.evaluate_expression(stmt.condition, scope)
+            if not self._is_truthy(condition):
+                break
 
-                result = self.execute_block(stmt.body, scope)
+            result = self.execute_block(stmt.body, scope)
 
-                if isinstance(result, ReturnValue):
-                    return result
-                if isinstance(result, BreakSignal):
-                    break
+            if isinstance(result, ReturnValue):
+                return result
+            if isinstance(result, BreakSignal):
+                break
 
-        elif isinstance(stmt, IRBreak):
-            return BreakSignal()
+    @dispatches(IRBreak, table="statement")
+    def _execute_break(self, stmt: IRBreak, scope: Dict[str, Any]) -> Any:
+        return BreakSignal()
 
-        elif isinstance(stmt, IRContinue):
-            return ContinueSignal()
+    @dispatches(IRContinue, table="statement")
+    def _execute_continue(self, stmt: IRContinue, scope: Dict[str, Any]) -> Any:
+        return ContinueSignal()
 
-        elif isinstance(stmt, IRCall):
-            # Expression statement (function call without using result)
-            return self.evaluate_expression(stmt, scope)
+    @dispatches(IRCall, IRAwait, table="statement")
+    def _execute_expression_statement(self, stmt: IRExpression, scope: Dict[str, Any]) -> Any:
+        # Expression statement (function call without using result)
+        return self.evaluate_expression(stmt, scope)
 
-        else:
-            raise PWRuntimeError(f"Unsupported statement type: {type(stmt)}")
+    @dispatches(object, table="statement")
+    def _execute_unsupported(self, stmt: Any, scope: Dict[str, Any]) -> Any:
+        raise PWRuntimeError(f"Unsupported statement type: {type(stmt)}")
 
     def execute_block(self, statements: List[IRStatement], scope: Dict[str, Any]) -> Any:
         """Execute a block of statements"""
@@ -447,191 +1004,134 @@ class PWRuntime:
 
     def evaluate_expression(self, expr: IRExpression, scope: Dict[str, Any]) -> Any:
         """Evaluate an expression and return its value"""
-        if isinstance(expr, IRLiteral):
-            return expr.value
-
-        elif isinstance(expr, IRIdentifier):
-            # Look up variable
-            if expr.name in scope:
-                return scope[expr.name]
-            elif expr.name in self.globals:
-                return self.globals[expr.name]
-            else:
-                raise PWRuntimeError(f"Undefined variable: {expr.name}", expr.location)
-
-        elif isinstance(expr, IRBinaryOp):
-            left = self.evaluate_expression(expr.left, scope)
-            right = self.evaluate_expression(expr.right, scope)
-            return self._apply_binary_op(expr.op, left, right)
-
-        elif isinstance(expr, IRUnaryOp):
-            operand = self.evaluate_expression(expr.operand, scope)
-            return self._apply_unary_op(expr.op, operand)
-
-        elif isinstance(expr, IRCall):
-            func = self.evaluate_expression(expr.function, scope)
-            args = [self.evaluate_expression(arg, scope) for arg in expr.args]
-
-            # Handle IRFunction objects (from stdlib or user code)
-            if isinstance(func, IRFunction):
-                return self.execute_function(func, args)
-            # Handle Python callables (enum constructors, lambdas)
-            elif callable(func):
-                return self.execute_function(func, args)
-            else:
-                raise PWRuntimeError(f"Cannot call non-function: {type(func)}")
-
-        elif isinstance(expr, IRArray):
-            return [self.evaluate_expression(elem, scope) for elem in expr.elements]
-
-        elif isinstance(expr, IRMap):
-            return {key: self.evaluate_expression(val, scope) for key, val in expr.entries.items()}
-
-        elif isinstance(expr, IRIndex):
-            obj = self.evaluate_expression(expr.object, scope)
-            index = self.evaluate_expression(expr.index, scope)
-            return obj[index]
-
-        elif isinstance(expr, IRPropertyAccess):
-            obj = self.evaluate_expression(expr.object, scope)
-
-            # Handle enum variant access (e.g., Option.Some)
-            if isinstance(obj, IREnum):
-                # Look up variant by name
-                for variant in obj.variants:
-                    if variant.name == expr.property:
-                        # Return constructor
-                        def make_constructor(variant_name: str):
-                            def constructor(*args):
-                                return EnumVariantInstance(variant_name, list(args))
-
-                            return constructor
-
-                        return make_constructor(variant.name)
-                raise PWRuntimeError(f"Enum {obj.name} has no variant {expr.property}")
-
-            # Regular property access
-            if hasattr(obj, expr.property):
-                return getattr(obj, expr.property)
-            elif isinstance(obj, dict):
-                return obj.get(expr.property)
-            else:
-                raise PWRuntimeError(f"Object has no property: {expr.property}")
+        handler = self._dispatch_tables["expression"].get(expr.__class__)
+        if handler is None:
+            handler = self.handler_for("expression", expr.__class__)
+        return handler(self, expr, scope)
+
+    @dispatches(IRLiteral, table="expression")
+    def _evaluate_literal(self, expr: IRLiteral, scope: Dict[str, Any]) -> Any:
+        return expr.value
+
+    @dispatches(IRIdentifier, table="expression")
+    def _evaluate_identifier(self, expr: IRIdentifier, scope: Dict[str, Any]) -> Any:
+        # Look up variable
+        if expr.name in scope:
+            return scope[expr.name]
+        elif expr.name in self.globals:
+            return self.globals[expr.name]
+        else:
+            raise PWRuntimeError(f"Undefined variable: {expr.name}", expr.location)
+
+    @dispatches(IRBinaryOp, table="expression")
+    def _evaluate_binary_op(self, expr: IRBinaryOp, scope: Dict[str, Any]) -> Any:
+        left = self.evaluate_expression(expr.left, scope)
+        right = self.evaluate_expression(expr.right, scope)
+        return self._apply_binary_op(expr.op, left, right)
+
+    @dispatches(IRUnaryOp, table="expression")
+    def _evaluate_unary_op(self, expr: IRUnaryOp, scope: Dict[str, Any]) -> Any:
+        operand = self.evaluate_expression(expr.operand, scope)
+        return self._apply_unary_op(expr.op, operand)
+
+    @dispatches(IRCall, table="expression")
+    def _evaluate_call(self, expr: IRCall, scope: Dict[str, Any]) -> Any:
+        func = self.evaluate_expression(expr.function, scope)
+        args = [self.evaluate_expression(arg, scope) for arg in expr.args]
+
+        # Handle IRFunction objects (from stdlib or user code)
+        if isinstance(func, IRFunction):
+            return self.execute_function(func, args)
+        # Handle Python callables (enum constructors, lambdas)
+        elif callable(func):
+            return self.execute_function(func, args)
+        else:
+            raise PWRuntimeError(f"Cannot call non-function: {type(func)}")
+
+    @dispatches(IRAwait, table="expression")
+    def _evaluate_await(self, expr: IRAwait, scope: Dict[str, Any]) -> Any:
+        return await_value(self.evaluate_expression(expr.expression, scope), expr.location)
+
+    @dispatches(IRArray, table="expression")
+    def _evaluate_array(self, expr: IRArray, scope: Dict[str, Any]) -> Any:
+        return [self.evaluate_expression(elem, scope) for elem in expr.elements]
+
+    @dispatches(IRMap, table="expression")
+    def _evaluate_map(self, expr: IRMap, scope: Dict[str, Any]) -> Any:
+        return {key: self.evaluate_expression(val, scope) for key, val in expr.entries.items()}
+
+    @dispatches(IRIndex, table="expression")
+    def _evaluate_index(self, expr: IRIndex, scope: Dict[str, Any]) -> Any:
+        obj = self.evaluate_expression(expr.object, scope)
+        index = self.evaluate_expression(expr.index, scope)
+        return obj[index]
+
+    @dispatches(IRPropertyAccess, table="expression")
+    def _evaluate_property_access(self, expr: IRPropertyAccess, scope: Dict[str, Any]) -> Any:
+        obj = self.evaluate_expression(expr.object, scope)
+        return get_property(obj, expr.property)
+
+    @dispatches(IRPatternMatch, table="expression")
+    def _evaluate_pattern_match(self, expr: IRPatternMatch, scope: Dict[str, Any]) -> bool:
+        # `opt is Some(val)` binds val in the current scope when it matches
+        value = self.evaluate_expression(expr.value, scope)
+        bindings = compile_ir_pattern(expr).match(value)
+        if bindings is None:
+            return False
+        scope.update(bindings)
+        return True
 
-        elif isinstance(expr, IRTernary):
-            condition = self.evaluate_expression(expr.condition, scope)
-            if self._is_truthy(condition):
-                return self.evaluate_expression(expr.true_value, scope)
+    @dispatches(IRTernary, table="expression")
+    def _evaluate_ternary(self, expr: IRTernary, scope: Dict[str, Any]) -> Any:
+        condition = self.evaluate_expression(expr.condition, scope)
+        if self._is_truthy(condition):
+            return self.evaluate_expression(expr.true_value, scope)
+        else:
+            return self.evaluate_expression(expr.false_value, scope)
+
+    @dispatches(IRLambda, table="expression")
+    def _evaluate_lambda(self, expr: IRLambda, scope: Dict[str, Any]) -> Any:
+        # Return lambda as closure
+        def lambda_func(*args):
+            # Create new scope with parameters
+            lambda_scope = dict(scope)
+            for i, param in enumerate(expr.params):
+                if i < len(args):
+                    lambda_scope[param.name] = args[i]
+
+            # Execute body
+            if isinstance(expr.body, list):
+                return self.execute_block(expr.body, lambda_scope)
             else:
-                return self.evaluate_expression(expr.false_value, scope)
-
-        elif isinstance(expr, IRLambda):
-            # Return lambda as closure
-            def lambda_func(*args):
-                # Create new scope with parameters
-                lambda_scope = dict(scope)
-                for i, param in enumerate(expr.params):
-                    if i < len(args):
-                        lambda_scope[param.name] = args[i]
-
-                # Execute body
-                if isinstance(expr.body, list):
-                    return self.execute_block(expr.body, lambda_scope)
-                else:
-                    return self.evaluate_expression(expr.body, lambda_scope)
+                return self.evaluate_expression(expr.body, lambda_scope)
 
-            return lambda_func
+        return lambda_func
 
-        else:
-            raise PWRuntimeError(f"Unsupported expression type: {type(expr)}")
+    @dispatches(object, table="expression")
+    def _evaluate_unsupported(self, expr: Any, scope: Dict[str, Any]) -> Any:
+        raise PWRuntimeError(f"Unsupported expression type: {type(expr)}")
 
     def _apply_binary_op(self, op: BinaryOperator, left: Any, right: Any) -> Any:
         """Apply binary operator"""
-        if op == BinaryOperator.ADD:
-            return left + right
-        elif op == BinaryOperator.SUBTRACT:
-            return left - right
-        elif op == BinaryOperator.MULTIPLY:
-            return left * right
-        elif op == BinaryOperator.DIVIDE:
-            if right == 0:
-                raise PWRuntimeError("Division by zero")
-            return left / right
-        elif op == BinaryOperator.MODULO:
-            return left % right
-        elif op == BinaryOperator.POWER:
-            return left**right
-        elif op == BinaryOperator.FLOOR_DIVIDE:
-            return left // right
-
-        elif op == BinaryOperator.EQUAL:
-            return self._equals(left, right)
-        elif op == BinaryOperator.NOT_EQUAL:
-            return not self._equals(left, right)
-        elif op == BinaryOperator.LESS_THAN:
-            return left < right
-        elif op == BinaryOperator.LESS_EQUAL:
-            return left <= right
-        elif op == BinaryOperator.GREATER_THAN:
-            return left > right
-        elif op == BinaryOperator.GREATER_EQUAL:
-            return left >= right
-
-        elif op == BinaryOperator.AND:
-            return self._is_truthy(left) and self._is_truthy(right)
-        elif op == BinaryOperator.OR:
-            return self._is_truthy(left) or self._is_truthy(right)
-
-        elif op == BinaryOperator.BIT_AND:
-            return left & right
-        elif op == BinaryOperator.BIT_OR:
-            return left | right
-        elif op == BinaryOperator.BIT_XOR:
-            return left ^ right
-        elif op == BinaryOperator.LEFT_SHIFT:
-            return left << right
-        elif op == BinaryOperator.RIGHT_SHIFT:
-            return left >> right
-
-        elif op == BinaryOperator.IN:
-            return left in right
-
-        else:
+        apply = BINARY_OPERATORS.get(op)
+        if apply is None:
             raise PWRuntimeError(f"Unsupported binary operator: {op}")
+        return apply(left, right)
 
     def _apply_unary_op(self, op: UnaryOperator, operand: Any) -> Any:
         """Apply unary operator"""
-        if op == UnaryOperator.NOT:
-            return not self._is_truthy(operand)
-        elif op == UnaryOperator.NEGATE:
-            return -operand
-        elif op == UnaryOperator.POSITIVE:
-            return +operand
-        elif op == UnaryOperator.BIT_NOT:
-            return ~operand
-        else:
+        apply = UNARY_OPERATORS.get(op)
+        if apply is None:
             raise PWRuntimeError(f"Unsupported unary operator: {op}")
+        return apply(operand)
 
     def _is_truthy(self, value: Any) -> bool:
         """Determine if a value is truthy (for conditionals)"""
-        if value is None:
-            return False
-        if isinstance(value, bool):
-            return value
-        if isinstance(value, (int, float)):
-            return value != 0
-        if isinstance(value, str):
-            return len(value) > 0
-        if isinstance(value, (list, dict)):
-            return len(value) > 0
-        # EnumVariantInstance is always truthy
-        return True
+        return is_truthy(value)
 
     def _equals(self, left: Any, right: Any) -> bool:
         """Check equality (handles enum variants)"""
-        if isinstance(left, EnumVariantInstance) and isinstance(right, EnumVariantInstance):
-            return left.variant_name == right.variant_name and left.values == right.values
-        return left == right
+        return values_equal(left, right)
 
     def evaluate_pattern_is(
         self, value: Any, pattern: str, scope: Dict[str, Any]
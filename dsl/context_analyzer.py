@@ -38,6 +38,8 @@ from dsl.ir import (
     IRReturn,
     IRStatement,
     IRType,
+    IRVisitor,
+    dispatches,
 )
 from dsl.type_system import TypeInfo
 
@@ -109,7 +111,7 @@ class DataFlow:
 # ============================================================================
 
 
-class ContextAnalyzer:
+class ContextAnalyzer(IRVisitor):
     """
     Analyzes code context to enable cross-function type inference.
 
@@ -189,39 +191,37 @@ class ContextAnalyzer:
             stmt: Statement to analyze
             context: Function context to update
         """
-        # Assignment
-        if isinstance(stmt, IRAssignment):
-            target = stmt.target
-            context.local_variables.add(target)
-
-            # Track variable usage
-            if target not in context.variable_usage:
-                context.variable_usage[target] = VariableUsage(
-                    variable_name=target,
-                    function_name=context.name
-                )
-            context.variable_usage[target].assignment_count += 1
-
-            # Analyze right-hand side
+        self.dispatch("statement", stmt, context)
+
+    @dispatches(IRAssignment, table="statement")
+    def _analyze_assignment(self, stmt: IRAssignment, context: FunctionContext) -> None:
+        target = stmt.target
+        context.local_variables.add(target)
+
+        # Track variable usage
+        if target not in context.variable_usage:
+            context.variable_usage[target] = VariableUsage(
+                variable_name=target,
+                function_name=context.name
+            )
+        context.variable_usage[target].assignment_count += 1
+
+        # Analyze right-hand side
+        self._analyze_expression(stmt.value, context)
+
+    @dispatches(IRReturn, table="statement")
+    def _analyze_return(self, stmt: IRReturn, context: FunctionContext) -> None:
+        if stmt.value:
+            context.return_expressions.append(stmt.value)
             self._analyze_expression(stmt.value, context)
 
-        # Return statement
-        elif isinstance(stmt, IRReturn):
-            if stmt.value:
-                context.return_expressions.append(stmt.value)
-                self._analyze_expression(stmt.value, context)
-
-        # If statement
-        elif isinstance(stmt, IRIf):
-            self._analyze_expression(stmt.condition, context)
-            for s in stmt.then_body:
-                self._analyze_statement(s, context)
-            for s in stmt.else_body:
-                self._analyze_statement(s, context)
-
-        # Other statement types (for, while, try, etc.)
-        # Handle recursively based on type
-        # (simplified for this implementation)
+    @dispatches(IRIf, table="statement")
+    def _analyze_if(self, stmt: IRIf, context: FunctionContext) -> None:
+        self._analyze_expression(stmt.condition, context)
+        for s in stmt.then_body:
+            self._analyze_statement(s, context)
+        for s in stmt.else_body:
+            self._analyze_statement(s, context)
 
     def _analyze_expression(self, expr: IRExpression, context: FunctionContext) -> None:
         """
@@ -231,57 +231,63 @@ class ContextAnalyzer:
             expr: Expression to analyze
             context: Function context to update
         """
-        # Identifier (variable reference)
-        if isinstance(expr, IRIdentifier):
-            var_name = expr.name
+        self.dispatch("expression", expr, context)
+
+    @dispatches(IRIdentifier, table="expression")
+    def _analyze_identifier(self, expr: IRIdentifier, context: FunctionContext) -> None:
+        var_name = expr.name
+        if var_name not in context.variable_usage:
+            context.variable_usage[var_name] = VariableUsage(
+                variable_name=var_name,
+                function_name=context.name
+            )
+        context.variable_usage[var_name].read_count += 1
+
+    @dispatches(IRCall, table="expression")
+    def _analyze_call(self, expr: IRCall, context: FunctionContext) -> None:
+        callee = expr.function
+        if isinstance(callee, IRIdentifier):
+            call_site = CallSite(
+                caller_function=context.name,
+                callee_function=callee.name,
+                arguments=expr.args
+            )
+            context.calls_made.append(call_site)
+
+        # Analyze arguments
+        for arg in expr.args:
+            self._analyze_expression(arg, context)
+
+    @dispatches(IRPropertyAccess, table="expression")
+    def _analyze_property_access(self, expr: IRPropertyAccess, context: FunctionContext) -> None:
+        obj = expr.object
+        if isinstance(obj, IRIdentifier):
+            var_name = obj.name
             if var_name not in context.variable_usage:
                 context.variable_usage[var_name] = VariableUsage(
                     variable_name=var_name,
                     function_name=context.name
                 )
+            context.variable_usage[var_name].property_accesses.append(expr.property)
             context.variable_usage[var_name].read_count += 1
 
-        # Function call
-        elif isinstance(expr, IRCall):
-            callee = expr.function
-            if isinstance(callee, IRIdentifier):
-                call_site = CallSite(
-                    caller_function=context.name,
-                    callee_function=callee.name,
-                    arguments=expr.args
-                )
-                context.calls_made.append(call_site)
-
-            # Analyze arguments
-            for arg in expr.args:
-                self._analyze_expression(arg, context)
-
-        # Property access (e.g., user.name)
-        elif isinstance(expr, IRPropertyAccess):
-            obj = expr.object
-            if isinstance(obj, IRIdentifier):
-                var_name = obj.name
-                if var_name not in context.variable_usage:
-                    context.variable_usage[var_name] = VariableUsage(
-                        variable_name=var_name,
-                        function_name=context.name
-                    )
-                context.variable_usage[var_name].property_accesses.append(expr.property)
-                context.variable_usage[var_name].read_count += 1
-
-        # Binary operation
-        elif isinstance(expr, IRBinaryOp):
-            self._analyze_expression(expr.left, context)
-            self._analyze_expression(expr.right, context)
-
-            # Track operator usage on left operand
-            if isinstance(expr.left, IRIdentifier):
-                var_name = expr.left.name
-                if var_name in context.variable_usage:
-                    context.variable_usage[var_name].operators_used.add(expr.op.value)
-
-        # Other expression types handled recursively
-        # (simplified for this implementation)
+    @dispatches(IRBinaryOp, table="expression")
+    def _analyze_binary_op(self, expr: IRBinaryOp, context: FunctionContext) -> None:
+        self._analyze_expression(expr.left, context)
+        self._analyze_expression(expr.right, context)
+
+        # Track operator usage on left operand
+        if isinstance(expr.left, IRIdentifier):
+            var_name = expr.left.name
+            if var_name in context.variable_usage:
+                context.variable_usage[var_name].operators_used.add(expr.op.value)
+
+    @dispatches(object, table="statement")
+    @dispatches(object, table="expression")
+    def _analyze_other(self, node: Any, context: FunctionContext) -> None:
+        # Other statement/expression types (for, while, try, etc.) are not
+        # tracked yet (simplified for this implementation)
+        pass
 
     # ========================================================================
     # Call Graph Construction
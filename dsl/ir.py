@@ -23,9 +23,9 @@ The IR supports:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Union
 
 
 # ============================================================================
@@ -164,7 +164,55 @@ class LiteralType(Enum):
 # ============================================================================
 
 
-@dataclass
+def slotted_dataclass(cls: type) -> type:
+    """
+    Dataclass decorator that also gives the class __slots__.
+
+    Equivalent to @dataclass(slots=True), which is unavailable on Python 3.9.
+    Instances carry no per-instance __dict__, which roughly halves the memory
+    footprint of large IR trees.
+    """
+    cls = dataclass(cls)
+
+    inherited = set()
+    for base in cls.__mro__[1:]:
+        inherited.update(getattr(base, "__slots__", ()))
+
+    field_names = [f.name for f in fields(cls)]
+    # Extra (non-field) slots declared in the class body
+    extra_slots = tuple(cls.__dict__.get("__slots__", ()))
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = tuple(
+        name for name in field_names if name not in inherited
+    ) + extra_slots
+    for name in field_names + list(extra_slots):
+        # Class-level defaults would conflict with the slot descriptors;
+        # the generated __init__ keeps its own copy of them.
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    slotted = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted.__qualname__ = cls.__qualname__
+
+    # Re-point zero-argument super() cells from the original class
+    for value in cls_dict.values():
+        if isinstance(value, (classmethod, staticmethod)):
+            value = value.__func__
+        functions = (
+            (value.fget, value.fset, value.fdel) if isinstance(value, property) else (value,)
+        )
+        for func in functions:
+            for cell in getattr(func, "__closure__", None) or ():
+                try:
+                    if cell.cell_contents is cls:
+                        cell.cell_contents = slotted
+                except ValueError:
+                    pass
+    return slotted
+
+
+@slotted_dataclass
 class SourceLocation:
     """Source location information for IR nodes."""
 
@@ -182,6 +230,50 @@ class SourceLocation:
         return "unknown location"
 
 
+class _PendingMetadata(dict):
+    """
+    Empty metadata dict handed out for nodes that have no metadata yet.
+
+    The first write attaches it to its node, so nodes that never store a
+    location, comment or annotation never allocate a metadata dict.
+    """
+
+    __slots__ = ("_node",)
+
+    def __init__(self, node: IRNode):
+        super().__init__()
+        self._node = node
+
+    def _target(self) -> Dict[str, Any]:
+        node = self._node
+        if node is None:
+            return self
+        self._node = None
+        if node._metadata is None:
+            node._metadata = self
+            return self
+        return node._metadata
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        target = self._target()
+        dict.__setitem__(target, key, value)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        return dict.setdefault(self._target(), key, default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        dict.update(self._target(), *args, **kwargs)
+
+    def __ior__(self, other: Any) -> Dict[str, Any]:
+        target = self._target()
+        dict.update(target, other)
+        return target
+
+    def __reduce__(self) -> Any:
+        # Copies and pickles are plain dicts
+        return (dict, (dict(self),))
+
+
 class IRNode:
     """
     Base class for all IR nodes.
@@ -190,17 +282,35 @@ class IRNode:
     - type: The node type enum
     - metadata: Arbitrary metadata (source location, comments, etc.)
 
+    Nodes use __slots__ (see slotted_dataclass) and allocate their metadata
+    dict lazily, on first write.
+
     Note: This is not a dataclass itself to avoid field ordering issues in subclasses.
     """
 
+    __slots__ = ("type", "_metadata")
+
     def __init__(self, type: NodeType, metadata: Optional[Dict[str, Any]] = None):
         self.type = type
-        self.metadata = metadata if metadata is not None else {}
+        self._metadata = metadata
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Arbitrary metadata (allocated on first write)."""
+        metadata = self._metadata
+        if metadata is None:
+            return _PendingMetadata(self)
+        return metadata
+
+    @metadata.setter
+    def metadata(self, value: Optional[Dict[str, Any]]) -> None:
+        self._metadata = value
 
     @property
     def location(self) -> Optional[SourceLocation]:
         """Get source location from metadata."""
-        return self.metadata.get("location")
+        metadata = self._metadata
+        return metadata.get("location") if metadata else None
 
     @location.setter
     def location(self, value: SourceLocation) -> None:
@@ -210,7 +320,8 @@ class IRNode:
     @property
     def comment(self) -> Optional[str]:
         """Get comment from metadata."""
-        return self.metadata.get("comment")
+        metadata = self._metadata
+        return metadata.get("comment") if metadata else None
 
     @comment.setter
     def comment(self, value: str) -> None:
@@ -223,7 +334,7 @@ class IRNode:
 # ============================================================================
 
 
-@dataclass
+@slotted_dataclass
 class IRImport(IRNode):
     """
     Import statement.
@@ -242,7 +353,7 @@ class IRImport(IRNode):
         super().__init__(type=NodeType.IMPORT)
 
 
-@dataclass
+@slotted_dataclass
 class IRModule(IRNode):
     """
     Top-level module/file representation.
@@ -274,7 +385,22 @@ class IRModule(IRNode):
 # ============================================================================
 
 
-@dataclass
+class _FrozenList(list):
+    """List that rejects mutation (generic/union arguments of interned types)."""
+
+    __slots__ = ()
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("arguments of an interned IRType are immutable")
+
+    append = extend = insert = pop = remove = clear = sort = reverse = _immutable
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+
+    def __reduce__(self) -> Any:
+        return (list, (list(self),))
+
+
+@slotted_dataclass
 class IRType(IRNode):
     """
     Type reference.
@@ -285,19 +411,92 @@ class IRType(IRNode):
     - Custom: "User", "Payment"
     - Optional: "T?"
     - Union: "A|B|C"
+
+    Types created with intern_type() are hash-consed: structurally identical
+    types share one immutable instance, so equality and hashing are O(1) and
+    consumers can cache per-type results.
     """
 
+    __slots__ = ("_interned_hash", "_str")
+
     name: str  # Type name
     generic_args: List[IRType] = field(default_factory=list)  # Generic arguments
     is_optional: bool = False  # T?
     union_types: List[IRType] = field(default_factory=list)  # A|B|C
 
     def __post_init__(self) -> None:
+        self._interned_hash = None
+        self._str = None
         self.type = NodeType.TYPE
         super().__init__(type=NodeType.TYPE)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        try:
+            interned = self._interned_hash is not None
+        except AttributeError:
+            interned = False
+        if interned:
+            raise AttributeError(f"interned IRType '{self}' is immutable")
+        object.__setattr__(self, name, value)
+
+    @property
+    def is_interned(self) -> bool:
+        """True if this is the canonical (shared, immutable) instance."""
+        return self._interned_hash is not None
+
+    def structural_key(self) -> tuple:
+        """Hashable key identifying this type's structure."""
+        return (
+            self.name,
+            tuple(arg.structural_key() for arg in self.generic_args),
+            self.is_optional,
+            tuple(t.structural_key() for t in self.union_types),
+        )
+
+    def interned(self) -> IRType:
+        """Return the canonical interned instance equal to this type."""
+        if self._interned_hash is not None or self._metadata:
+            # Types carrying metadata stay private to their owner
+            return self
+        return intern_type(self.name, self.generic_args, self.is_optional, self.union_types)
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, IRType):
+            return NotImplemented
+        if (
+            self._interned_hash is not None
+            and other._interned_hash is not None
+            and self._interned_hash != other._interned_hash
+        ):
+            return False
+        return (
+            self.name == other.name
+            and self.is_optional == other.is_optional
+            and self.generic_args == other.generic_args
+            and self.union_types == other.union_types
+        )
+
+    def __hash__(self) -> int:
+        if self._interned_hash is not None:
+            return self._interned_hash
+        return hash(self.structural_key())
+
+    def __reduce_ex__(self, protocol: int) -> Any:
+        if self._interned_hash is not None:
+            # Copies and unpickled instances resolve to the canonical type
+            return (
+                intern_type,
+                (self.name, list(self.generic_args), self.is_optional, list(self.union_types)),
+            )
+        return object.__reduce_ex__(self, protocol)
+
     def __str__(self) -> str:
         """String representation of type."""
+        if self._str is not None:
+            return self._str
+
         result = self.name
 
         # Add generic arguments
@@ -307,8 +506,7 @@ class IRType(IRNode):
 
         # Add union types
         if self.union_types:
-            types = "|".join(str(t) for t in [self] + self.union_types)
-            result = types
+            result = "|".join([result] + [str(t) for t in self.union_types])
 
         # Add optional marker
         if self.is_optional:
@@ -317,7 +515,51 @@ class IRType(IRNode):
         return result
 
 
-@dataclass
+# Interning table: (name, interned args, is_optional, interned unions) -> IRType
+_TYPE_TABLE: Dict[tuple, IRType] = {}
+
+
+def intern_type(
+    name: str,
+    generic_args: Optional[List[IRType]] = None,
+    is_optional: bool = False,
+    union_types: Optional[List[IRType]] = None,
+) -> IRType:
+    """
+    Return the shared, immutable IRType with the given structure.
+
+    Arguments are interned recursively, so structurally identical types are
+    always the same object.
+
+    Example:
+        >>> intern_type("array", [intern_type("int")]) is intern_type("array", [IRType("int")])
+        True
+    """
+    args = tuple(arg.interned() for arg in generic_args) if generic_args else ()
+    unions = tuple(t.interned() for t in union_types) if union_types else ()
+    key = (name, args, is_optional, unions)
+
+    existing = _TYPE_TABLE.get(key)
+    if existing is not None:
+        return existing
+
+    candidate = IRType(
+        name=name,
+        generic_args=_FrozenList(args),
+        is_optional=is_optional,
+        union_types=_FrozenList(unions),
+    )
+    candidate._str = str(candidate)
+    candidate._interned_hash = hash(key)
+    return _TYPE_TABLE.setdefault(key, candidate)
+
+
+def interned_type_count() -> int:
+    """Return the number of distinct interned types."""
+    return len(_TYPE_TABLE)
+
+
+@slotted_dataclass
 class IRTypeDefinition(IRNode):
     """
     Type definition (struct/class-like type).
@@ -338,7 +580,7 @@ class IRTypeDefinition(IRNode):
         super().__init__(type=NodeType.TYPE_DEFINITION)
 
 
-@dataclass
+@slotted_dataclass
 class IREnumVariant(IRNode):
     """
     Enum variant.
@@ -357,7 +599,7 @@ class IREnumVariant(IRNode):
         super().__init__(type=NodeType.ENUM_VARIANT)
 
 
-@dataclass
+@slotted_dataclass
 class IREnum(IRNode):
     """
     Enumeration definition.
@@ -373,6 +615,10 @@ class IREnum(IRNode):
           - None
     """
 
+    # Runtime cache of variant name -> constructor (see dsl.al_runtime.variant_table);
+    # not a field, so it is ignored by equality and serialization
+    __slots__ = ("_variant_table",)
+
     name: str
     generic_params: List[str] = field(default_factory=list)  # Generic type parameters
     variants: List[IREnumVariant] = field(default_factory=list)
@@ -388,7 +634,7 @@ class IREnum(IRNode):
 # ============================================================================
 
 
-@dataclass
+@slotted_dataclass
 class IRParameter(IRNode):
     """
     Function parameter.
@@ -409,7 +655,7 @@ class IRParameter(IRNode):
         super().__init__(type=NodeType.PARAMETER)
 
 
-@dataclass
+@slotted_dataclass
 class IRFunction(IRNode):
     """
     Function definition.
@@ -437,6 +683,12 @@ class IRFunction(IRNode):
           @effects [database.write, event.emit("user.created")]
           // body
         }
+
+        # Memoized (checked for purity when parsed):
+        function shipping_cost(weight: float) -> float {
+          @memoize(max=256)
+          // body
+        }
     """
 
     name: str
@@ -456,13 +708,14 @@ class IRFunction(IRNode):
     ensures: List['IRContractClause'] = field(default_factory=list)  # Postconditions
     effects: List[str] = field(default_factory=list)  # Side effects
     operation_metadata: Dict[str, Any] = field(default_factory=dict)  # @operation metadata
+    memoize: Optional[int] = None  # @pure / @memoize(max=N) result cache bound
 
     def __post_init__(self) -> None:
         self.type = NodeType.FUNCTION
         super().__init__(type=NodeType.FUNCTION)
 
 
-@dataclass
+@slotted_dataclass
 class IRProperty(IRNode):
     """
     Class property.
@@ -483,7 +736,7 @@ class IRProperty(IRNode):
         super().__init__(type=NodeType.PROPERTY)
 
 
-@dataclass
+@slotted_dataclass
 class IRClass(IRNode):
     """
     Class definition.
@@ -534,7 +787,7 @@ class IRClass(IRNode):
 # ============================================================================
 
 
-@dataclass
+@slotted_dataclass
 class IRIf(IRNode):
     """
     If statement.
@@ -555,7 +808,7 @@ class IRIf(IRNode):
         super().__init__(type=NodeType.IF)
 
 
-@dataclass
+@slotted_dataclass
 class IRFor(IRNode):
     """
     For loop.
@@ -576,7 +829,7 @@ class IRFor(IRNode):
         super().__init__(type=NodeType.FOR)
 
 
-@dataclass
+@slotted_dataclass
 class IRForCStyle(IRNode):
     """
     C-style for loop.
@@ -597,7 +850,7 @@ class IRForCStyle(IRNode):
         super().__init__(type=NodeType.FOR_C_STYLE)
 
 
-@dataclass
+@slotted_dataclass
 class IRWhile(IRNode):
     """
     While loop.
@@ -615,7 +868,7 @@ class IRWhile(IRNode):
         super().__init__(type=NodeType.WHILE)
 
 
-@dataclass
+@slotted_dataclass
 class IRCase(IRNode):
     """
     Case clause in switch statement.
@@ -638,7 +891,7 @@ class IRCase(IRNode):
         super().__init__(type=NodeType.CASE)
 
 
-@dataclass
+@slotted_dataclass
 class IRSwitch(IRNode):
     """
     Switch/match statement.
@@ -671,7 +924,7 @@ class IRSwitch(IRNode):
         super().__init__(type=NodeType.SWITCH)
 
 
-@dataclass
+@slotted_dataclass
 class IRCatch(IRNode):
     """
     Catch block in try/catch.
@@ -690,7 +943,7 @@ class IRCatch(IRNode):
         super().__init__(type=NodeType.CATCH)
 
 
-@dataclass
+@slotted_dataclass
 class IRTry(IRNode):
     """
     Try/catch statement.
@@ -713,7 +966,7 @@ class IRTry(IRNode):
         super().__init__(type=NodeType.TRY)
 
 
-@dataclass
+@slotted_dataclass
 class IRAssignment(IRNode):
     """
     Variable assignment.
@@ -733,7 +986,7 @@ class IRAssignment(IRNode):
         super().__init__(type=NodeType.ASSIGNMENT)
 
 
-@dataclass
+@slotted_dataclass
 class IRReturn(IRNode):
     """
     Return statement.
@@ -749,7 +1002,7 @@ class IRReturn(IRNode):
         super().__init__(type=NodeType.RETURN)
 
 
-@dataclass
+@slotted_dataclass
 class IRThrow(IRNode):
     """
     Throw/raise statement.
@@ -765,7 +1018,7 @@ class IRThrow(IRNode):
         super().__init__(type=NodeType.THROW)
 
 
-@dataclass
+@slotted_dataclass
 class IRBreak(IRNode):
     """Break statement in loops."""
 
@@ -774,7 +1027,7 @@ class IRBreak(IRNode):
         super().__init__(type=NodeType.BREAK)
 
 
-@dataclass
+@slotted_dataclass
 class IRContinue(IRNode):
     """Continue statement in loops."""
 
@@ -783,7 +1036,7 @@ class IRContinue(IRNode):
         super().__init__(type=NodeType.CONTINUE)
 
 
-@dataclass
+@slotted_dataclass
 class IRPass(IRNode):
     """Pass/noop statement."""
 
@@ -797,7 +1050,7 @@ class IRPass(IRNode):
 # ============================================================================
 
 
-@dataclass
+@slotted_dataclass
 class IRCall(IRNode):
     """
     Function call.
@@ -818,7 +1071,7 @@ class IRCall(IRNode):
         super().__init__(type=NodeType.CALL)
 
 
-@dataclass
+@slotted_dataclass
 class IRBinaryOp(IRNode):
     """
     Binary operation.
@@ -838,7 +1091,7 @@ class IRBinaryOp(IRNode):
         super().__init__(type=NodeType.BINARY_OP)
 
 
-@dataclass
+@slotted_dataclass
 class IRUnaryOp(IRNode):
     """
     Unary operation.
@@ -856,7 +1109,7 @@ class IRUnaryOp(IRNode):
         super().__init__(type=NodeType.UNARY_OP)
 
 
-@dataclass
+@slotted_dataclass
 class IRLiteral(IRNode):
     """
     Literal value.
@@ -877,7 +1130,7 @@ class IRLiteral(IRNode):
         super().__init__(type=NodeType.LITERAL)
 
 
-@dataclass
+@slotted_dataclass
 class IRIdentifier(IRNode):
     """
     Variable/function identifier.
@@ -895,7 +1148,7 @@ class IRIdentifier(IRNode):
         super().__init__(type=NodeType.IDENTIFIER)
 
 
-@dataclass
+@slotted_dataclass
 class IRPropertyAccess(IRNode):
     """
     Property access.
@@ -913,7 +1166,7 @@ class IRPropertyAccess(IRNode):
         super().__init__(type=NodeType.PROPERTY_ACCESS)
 
 
-@dataclass
+@slotted_dataclass
 class IRIndex(IRNode):
     """
     Array/map indexing.
@@ -931,7 +1184,7 @@ class IRIndex(IRNode):
         super().__init__(type=NodeType.INDEX)
 
 
-@dataclass
+@slotted_dataclass
 class IRLambda(IRNode):
     """
     Lambda/anonymous function.
@@ -949,7 +1202,7 @@ class IRLambda(IRNode):
         super().__init__(type=NodeType.LAMBDA)
 
 
-@dataclass
+@slotted_dataclass
 class IRArray(IRNode):
     """
     Array literal.
@@ -966,7 +1219,7 @@ class IRArray(IRNode):
         super().__init__(type=NodeType.ARRAY)
 
 
-@dataclass
+@slotted_dataclass
 class IRMap(IRNode):
     """
     Map/object literal.
@@ -983,7 +1236,7 @@ class IRMap(IRNode):
         super().__init__(type=NodeType.MAP)
 
 
-@dataclass
+@slotted_dataclass
 class IRTernary(IRNode):
     """
     Ternary conditional expression.
@@ -1002,7 +1255,7 @@ class IRTernary(IRNode):
         super().__init__(type=NodeType.TERNARY)
 
 
-@dataclass
+@slotted_dataclass
 class IRComprehension(IRNode):
     """
     List/Dict/Set comprehension.
@@ -1024,7 +1277,7 @@ class IRComprehension(IRNode):
         super().__init__(type=NodeType.COMPREHENSION)
 
 
-@dataclass
+@slotted_dataclass
 class IRFString(IRNode):
     """
     F-string / template literal.
@@ -1041,7 +1294,7 @@ class IRFString(IRNode):
         super().__init__(type=NodeType.FSTRING)
 
 
-@dataclass
+@slotted_dataclass
 class IRWith(IRNode):
     """
     Context manager / using statement.
@@ -1066,7 +1319,7 @@ class IRWith(IRNode):
         super().__init__(type=NodeType.WITH)
 
 
-@dataclass
+@slotted_dataclass
 class IRDecorator(IRNode):
     """
     Decorator / attribute.
@@ -1090,7 +1343,7 @@ class IRDecorator(IRNode):
         super().__init__(type=NodeType.DECORATOR)
 
 
-@dataclass
+@slotted_dataclass
 class IRSlice(IRNode):
     """
     Slice notation.
@@ -1112,7 +1365,7 @@ class IRSlice(IRNode):
         super().__init__(type=NodeType.SLICE)
 
 
-@dataclass
+@slotted_dataclass
 class IRDestructure(IRNode):
     """
     Destructuring assignment.
@@ -1134,7 +1387,7 @@ class IRDestructure(IRNode):
         super().__init__(type=NodeType.DESTRUCTURE)
 
 
-@dataclass
+@slotted_dataclass
 class IRSpread(IRNode):
     """
     Spread operator.
@@ -1152,7 +1405,7 @@ class IRSpread(IRNode):
         super().__init__(type=NodeType.SPREAD)
 
 
-@dataclass
+@slotted_dataclass
 class IRDefer(IRNode):
     """
     Defer statement (Go).
@@ -1168,7 +1421,7 @@ class IRDefer(IRNode):
         super().__init__(type=NodeType.DEFER)
 
 
-@dataclass
+@slotted_dataclass
 class IRChannel(IRNode):
     """
     Channel operation (Go).
@@ -1187,7 +1440,7 @@ class IRChannel(IRNode):
         super().__init__(type=NodeType.CHANNEL)
 
 
-@dataclass
+@slotted_dataclass
 class IRSelect(IRNode):
     """
     Select statement (Go).
@@ -1212,7 +1465,7 @@ class IRSelect(IRNode):
         super().__init__(type=NodeType.SELECT)
 
 
-@dataclass
+@slotted_dataclass
 class IRGoroutine(IRNode):
     """
     Goroutine (Go async execution).
@@ -1228,7 +1481,7 @@ class IRGoroutine(IRNode):
         super().__init__(type=NodeType.GOROUTINE)
 
 
-@dataclass
+@slotted_dataclass
 class IRAwait(IRNode):
     """
     Await expression.
@@ -1245,7 +1498,7 @@ class IRAwait(IRNode):
         super().__init__(type=NodeType.AWAIT)
 
 
-@dataclass
+@slotted_dataclass
 class IRPatternMatch(IRNode):
     """
     Pattern matching expression using 'is' operator.
@@ -1257,6 +1510,9 @@ class IRPatternMatch(IRNode):
         res is Err(e)     // Matches Err variant and binds e
     """
 
+    # Runtime cache of the compiled matcher (see dsl.al_runtime.compile_ir_pattern)
+    __slots__ = ("_compiled_pattern",)
+
     value: IRExpression  # The value being matched (left side)
     pattern: IRExpression  # The pattern (right side) - usually IRCall or IRIdentifier
     # pattern can be:
@@ -1269,7 +1525,7 @@ class IRPatternMatch(IRNode):
         super().__init__(type=NodeType.PATTERN_MATCH)
 
 
-@dataclass
+@slotted_dataclass
 class IROldExpr(IRNode):
     """
     Old expression for referencing pre-state in postconditions.
@@ -1291,7 +1547,7 @@ class IROldExpr(IRNode):
 # ============================================================================
 
 
-@dataclass
+@slotted_dataclass
 class IRContractClause(IRNode):
     """
     Contract clause (precondition, postcondition, or invariant).
@@ -1311,7 +1567,7 @@ class IRContractClause(IRNode):
         super().__init__(type=NodeType.CONTRACT_CLAUSE)
 
 
-@dataclass
+@slotted_dataclass
 class IRContractAnnotation(IRNode):
     """
     Contract metadata annotation (@contract, @operation, @effects).
@@ -1378,3 +1634,110 @@ IRStatement = Union[
     IRChannel,
     IRCall,  # Expression statements
 ]
+
+
+# ============================================================================
+# Visitor / Dispatch
+# ============================================================================
+
+
+def dispatches(*node_classes: type, table: str = "visit") -> Callable[[Callable], Callable]:
+    """
+    Register the decorated IRVisitor method as the handler for node_classes.
+
+    Args:
+        node_classes: Classes handled by the method (subclasses match too;
+            register `object` for a catch-all fallback)
+        table: Dispatch table name, so one visitor can keep separate tables
+            (e.g. "statement" and "expression")
+    """
+
+    def decorator(method: Callable) -> Callable:
+        registrations = getattr(method, "_ir_dispatch", ())
+        method._ir_dispatch = registrations + tuple((table, cls) for cls in node_classes)
+        return method
+
+    return decorator
+
+
+class IRVisitor:
+    """
+    Base class for IR consumers that dispatch on node class.
+
+    Each subclass gets its own dispatch tables (node class -> function),
+    built once when the subclass is created. A class without a direct entry is
+    resolved through its MRO once and memoized, so dispatch is a single dict
+    lookup regardless of how many node kinds a consumer handles.
+
+    Handlers are looked up by method name when the table is built, so a
+    subclass can override a handler by redefining the method.
+
+    Example:
+        class Printer(IRVisitor):
+            @dispatches(IRLiteral)
+            def visit_literal(self, node):
+                return repr(node.value)
+
+            @dispatches(object)
+            def visit_other(self, node):
+                return "?"
+
+        Printer().visit(IRLiteral(value=1, literal_type=LiteralType.INTEGER))  # "1"
+    """
+
+    _dispatch_tables: ClassVar[Dict[str, Dict[type, Callable]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        registrations: Dict[str, Dict[type, str]] = {}
+        for klass in reversed(cls.__mro__):
+            for name, member in vars(klass).items():
+                for table, node_class in getattr(member, "_ir_dispatch", ()):
+                    registrations.setdefault(table, {})[node_class] = name
+        cls._dispatch_tables = {
+            table: {node_class: getattr(cls, name) for node_class, name in entries.items()}
+            for table, entries in registrations.items()
+        }
+
+    @classmethod
+    def dispatch_table(cls, table: str = "visit") -> Dict[type, Callable]:
+        """Return the (memoizing) dispatch table for hot-path lookups."""
+        handlers = cls._dispatch_tables.get(table)
+        if handlers is None:
+            handlers = cls._dispatch_tables.setdefault(table, {})
+        return handlers
+
+    @classmethod
+    def handler_for(cls, table: str, node_class: type) -> Callable:
+        """Resolve (and memoize) the handler for node_class in a table."""
+        handlers = cls.dispatch_table(table)
+        handler = handlers.get(node_class)
+        if handler is None:
+            for base in node_class.__mro__[1:]:
+                handler = handlers.get(base)
+                if handler is not None:
+                    break
+            else:
+                handler = cls._missing_handler(table)
+            handlers[node_class] = handler
+        return handler
+
+    @classmethod
+    def _missing_handler(cls, table: str) -> Callable:
+        def missing(self: IRVisitor, node: Any, *args: Any) -> Any:
+            raise TypeError(
+                f"{cls.__name__} has no '{table}' handler for {type(node).__name__}"
+            )
+
+        return missing
+
+    def dispatch(self, table: str, node: Any, *args: Any) -> Any:
+        """Call the handler registered for node's class in table."""
+        handler = self._dispatch_tables.get(table, {}).get(node.__class__)
+        if handler is None:
+            handler = self.handler_for(table, node.__class__)
+        return handler(self, node, *args)
+
+    def visit(self, node: Any, *args: Any) -> Any:
+        """Dispatch node through the default "visit" table."""
+        return self.dispatch("visit", node, *args)
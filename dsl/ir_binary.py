@@ -0,0 +1,637 @@
+"""
+Compact binary serialization for IR modules.
+
+`asl compile` historically wrote the MCP tree (`ir_to_mcp`) as indented JSON,
+which is many megabytes for large modules and slow to load back through
+`mcp_to_ir`. This module writes the IR directly in a versioned binary form.
+
+Layout (all integers are unsigned LEB128 varints unless noted):
+
+    header    MAGIC (4 bytes) | version (u8) | flags (u8)
+              strings_offset (u32 LE) | root_offset (u32 LE)
+    types     count | count * value          interned IRType table
+    root      value                          the IRModule
+    strings   count | count * (len | utf-8)  string table
+    kinds     count | count * (name | field_count | field_count * name)
+    enums     count | count * name
+
+Values are tagged with one byte. Strings are string-table indices, enum
+values are a one-byte enum index plus the member name, and node kinds are
+indices into the kind table (class name plus field names, so files survive
+fields being added to the IR). Children are a varint count followed by their
+values. IRFunction bodies are length-prefixed so a reader can skip them and
+decode each body on first access.
+
+Example:
+    >>> data = dumps(module)
+    >>> loads(data) == module
+    True
+    >>> module = load("app.alir")  # mmap-backed, function bodies decoded lazily
+"""
+
+from __future__ import annotations
+
+import importlib
+import mmap
+import struct
+from dataclasses import MISSING, fields
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from dsl.ir import IRFunction, IRModule, IRNode, IRType, SourceLocation, intern_type
+
+MAGIC = b"ALIR"
+FORMAT_VERSION = 1
+BINARY_SUFFIX = ".alir"
+
+_HEADER = struct.Struct("<4sBBII")
+_DOUBLE = struct.Struct("<d")
+
+# Value tags
+_NONE = 0
+_FALSE = 1
+_TRUE = 2
+_INT = 3  # zigzag varint
+_NEG_INT = 4  # reserved for ints wider than 64 bits (varint of -value)
+_FLOAT = 5
+_STR = 6
+_LIST = 7
+_DICT = 8
+_TUPLE = 9
+_ENUM = 10
+_NODE = 11
+_TYPE = 12  # interned IRType (type table index)
+_LOCATION = 13
+_BODY = 14  # length-prefixed list, decoded lazily
+
+
+class IRBinaryError(ValueError):
+    """Raised for malformed, truncated or incompatible binary IR."""
+
+
+# ============================================================================
+# Varints
+# ============================================================================
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(buf: Any, pos: int) -> Tuple[int, int]:
+    byte = buf[pos]
+    if byte < 0x80:
+        return byte, pos + 1
+    result = byte & 0x7F
+    shift = 7
+    while True:
+        pos += 1
+        byte = buf[pos]
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos + 1
+        shift += 7
+
+
+# ============================================================================
+# Encoder
+# ============================================================================
+
+
+class _Encoder:
+    """Single-use writer that accumulates the value stream and side tables."""
+
+    def __init__(self) -> None:
+        self.strings: Dict[str, int] = {}
+        self.kinds: Dict[type, Tuple[int, List[str]]] = {}
+        self.enums: Dict[type, int] = {}
+        self.types: Dict[int, int] = {}  # id(interned IRType) -> table index
+        self.type_table = bytearray()
+        self.type_count = 0
+
+    def string(self, value: str) -> int:
+        index = self.strings.get(value)
+        if index is None:
+            index = self.strings[value] = len(self.strings)
+        return index
+
+    def kind(self, cls: type) -> Tuple[int, List[str]]:
+        entry = self.kinds.get(cls)
+        if entry is None:
+            for name in (cls.__module__, cls.__qualname__):
+                self.string(name)
+            names = [f.name for f in fields(cls)]
+            for name in names:
+                self.string(name)
+            entry = self.kinds[cls] = (len(self.kinds), names)
+        return entry
+
+    def interned_type(self, ir_type: IRType) -> int:
+        index = self.types.get(id(ir_type))
+        if index is None:
+            # Arguments are written (and so decoded) before the type itself
+            out = bytearray()
+            _write_varint(out, self.string(ir_type.name))
+            self.value(out, list(ir_type.generic_args))
+            out.append(_TRUE if ir_type.is_optional else _FALSE)
+            self.value(out, list(ir_type.union_types))
+            self.type_table += out
+            index = self.types[id(ir_type)] = self.type_count
+            self.type_count += 1
+        return index
+
+    def value(self, out: bytearray, value: Any) -> None:
+        if value is None:
+            out.append(_NONE)
+        elif value is True:
+            out.append(_TRUE)
+        elif value is False:
+            out.append(_FALSE)
+        elif isinstance(value, IRNode):
+            if isinstance(value, IRType) and value.is_interned:
+                out.append(_TYPE)
+                _write_varint(out, self.interned_type(value))
+                return
+            cls = value.__class__
+            index, names = self.kind(cls)
+            out.append(_NODE)
+            _write_varint(out, index)
+            for name in names:
+                if name == "body" and cls is IRFunction:
+                    self.body(out, value.body)
+                else:
+                    self.value(out, getattr(value, name))
+            self.value(out, value._metadata or None)
+        elif isinstance(value, str):
+            out.append(_STR)
+            _write_varint(out, self.string(value))
+        elif isinstance(value, Enum):
+            cls = value.__class__
+            index = self.enums.get(cls)
+            if index is None:
+                if len(self.enums) == 0x80:
+                    raise IRBinaryError("Binary IR supports at most 128 enum classes")
+                self.string(cls.__module__)
+                self.string(cls.__qualname__)
+                index = self.enums[cls] = len(self.enums)
+            out.append(_ENUM)
+            out.append(index)
+            _write_varint(out, self.string(value.name))
+        elif isinstance(value, int):
+            if -(1 << 63) <= value < (1 << 63):
+                out.append(_INT)
+                _write_varint(out, (value << 1) ^ (value >> 63))
+            else:
+                out.append(_NEG_INT if value < 0 else _INT)
+                _write_varint(out, -value if value < 0 else value << 1)
+        elif isinstance(value, float):
+            out.append(_FLOAT)
+            out += _DOUBLE.pack(value)
+        elif isinstance(value, (list, tuple)):
+            out.append(_TUPLE if isinstance(value, tuple) else _LIST)
+            _write_varint(out, len(value))
+            for item in value:
+                self.value(out, item)
+        elif isinstance(value, dict):
+            out.append(_DICT)
+            _write_varint(out, len(value))
+            for key, item in value.items():
+                self.value(out, key)
+                self.value(out, item)
+        elif isinstance(value, SourceLocation):
+            out.append(_LOCATION)
+            for item in (value.file, value.line, value.column, value.end_line, value.end_column):
+                self.value(out, item)
+        else:
+            raise IRBinaryError(f"Cannot serialize {type(value).__name__} in binary IR")
+
+    def body(self, out: bytearray, statements: List[Any]) -> None:
+        payload = bytearray()
+        self.value(payload, list(statements))
+        out.append(_BODY)
+        _write_varint(out, len(payload))
+        out += payload
+
+    def finish(self, root: IRModule) -> bytes:
+        stream = bytearray()
+        self.value(stream, root)
+
+        types = bytearray()
+        _write_varint(types, self.type_count)
+        types += self.type_table
+
+        tables = bytearray()
+        _write_varint(tables, len(self.strings))
+        for text in self.strings:
+            data = text.encode("utf-8", "surrogatepass")
+            _write_varint(tables, len(data))
+            tables += data
+        _write_varint(tables, len(self.kinds))
+        for cls, (_, names) in self.kinds.items():
+            _write_varint(tables, self.strings[cls.__module__])
+            _write_varint(tables, self.strings[cls.__qualname__])
+            _write_varint(tables, len(names))
+            for name in names:
+                _write_varint(tables, self.strings[name])
+        _write_varint(tables, len(self.enums))
+        for cls in self.enums:
+            _write_varint(tables, self.strings[cls.__module__])
+            _write_varint(tables, self.strings[cls.__qualname__])
+
+        root_offset = _HEADER.size + len(types)
+        strings_offset = root_offset + len(stream)
+        header = _HEADER.pack(MAGIC, FORMAT_VERSION, 0, strings_offset, root_offset)
+        return b"".join((header, types, stream, tables))
+
+
+def dumps(module: IRModule) -> bytes:
+    """Serialize an IR module to binary IR."""
+    return _Encoder().finish(module)
+
+
+def dump(module: IRModule, path: Union[str, Path]) -> int:
+    """Write an IR module to `path` as binary IR. Returns the byte size."""
+    data = dumps(module)
+    Path(path).write_bytes(data)
+    return len(data)
+
+
+# ============================================================================
+# Decoder
+# ============================================================================
+
+
+def _resolve(module_name: str, qualname: str) -> Any:
+    # Only IR definitions may be named by a file, never arbitrary imports
+    if module_name != "dsl" and not module_name.startswith("dsl."):
+        raise IRBinaryError(f"Refusing to load {module_name}.{qualname} from binary IR")
+    try:
+        target: Any = importlib.import_module(module_name)
+        for part in qualname.split("."):
+            target = getattr(target, part)
+    except (ImportError, AttributeError):
+        raise IRBinaryError(f"Unknown IR class in binary IR: {module_name}.{qualname}")
+    return target
+
+
+class _LazyBody(list):
+    """
+    Function body that decodes its statements on first access.
+
+    Until then it holds only the reader and the offset of the encoded
+    statements. Copies and pickles are plain lists.
+    """
+
+    __slots__ = ("_reader", "_offset")
+
+    def __init__(self, reader: IRBinaryReader, offset: int):
+        super().__init__()
+        self._reader = reader
+        self._offset = offset
+
+    def _load(self) -> List[Any]:
+        reader = self._reader
+        if reader is not None:
+            self._reader = None
+            statements, _ = reader._decode(self._offset)
+            list.extend(self, statements)
+        return self
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._reader is None
+
+    def __reduce__(self) -> Any:
+        return (list, (list(self._load()),))
+
+
+def _forward(name: str) -> Callable:
+    method = getattr(list, name)
+
+    def forward(self: _LazyBody, *args: Any, **kwargs: Any) -> Any:
+        return method(self._load(), *args, **kwargs)
+
+    forward.__name__ = name
+    return forward
+
+
+for _name in (
+    "__iter__", "__len__", "__getitem__", "__setitem__", "__delitem__", "__contains__",
+    "__reversed__", "__eq__", "__ne__", "__lt__", "__le__", "__gt__", "__ge__", "__add__",
+    "__iadd__", "__mul__", "__imul__", "__repr__", "append", "extend", "insert", "pop",
+    "remove", "index", "count", "sort", "reverse", "clear", "copy",
+):
+    setattr(_LazyBody, _name, _forward(_name))
+_LazyBody.__hash__ = None  # type: ignore[assignment]
+
+
+class IRBinaryReader:
+    """
+    Reader over a binary IR buffer (bytes or a memory-mapped file).
+
+    Example:
+        >>> with IRBinaryReader.open("app.alir") as reader:
+        ...     module = reader.module(lazy=False)
+    """
+
+    def __init__(self, data: Any):
+        self._buf = data
+        self._mmap: Optional[mmap.mmap] = data if isinstance(data, mmap.mmap) else None
+        if len(data) < _HEADER.size:
+            raise IRBinaryError("Truncated binary IR header")
+        magic, version, _flags, strings_offset, root_offset = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise IRBinaryError("Not a binary IR file (bad magic)")
+        if version != FORMAT_VERSION:
+            raise IRBinaryError(
+                f"Unsupported binary IR version {version} (expected {FORMAT_VERSION})"
+            )
+        self.version = version
+        self._root_offset = root_offset
+        self._decoder: Optional[Callable[[int, bool], Tuple[Any, int]]] = None
+        try:
+            self._read_tables(strings_offset)
+            self._read_types()
+        except IndexError:
+            raise IRBinaryError("Truncated binary IR tables")
+
+    @classmethod
+    def open(cls, path: Union[str, Path], use_mmap: bool = True) -> IRBinaryReader:
+        """Open a binary IR file, memory-mapping it when possible."""
+        with open(path, "rb") as handle:
+            if use_mmap:
+                try:
+                    return cls(mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ))
+                except (ValueError, OSError):
+                    pass  # Empty files and special files cannot be mapped
+            return cls(handle.read())
+
+    def _read_tables(self, pos: int) -> None:
+        buf = self._buf
+        count, pos = _read_varint(buf, pos)
+        strings = []
+        for _ in range(count):
+            size, pos = _read_varint(buf, pos)
+            strings.append(bytes(buf[pos:pos + size]).decode("utf-8", "surrogatepass"))
+            pos += size
+        self._strings = strings
+
+        count, pos = _read_varint(buf, pos)
+        kinds = []
+        for _ in range(count):
+            module_index, pos = _read_varint(buf, pos)
+            name_index, pos = _read_varint(buf, pos)
+            field_count, pos = _read_varint(buf, pos)
+            names = []
+            for _ in range(field_count):
+                index, pos = _read_varint(buf, pos)
+                names.append(strings[index])
+            cls = _resolve(strings[module_index], strings[name_index])
+            if not (isinstance(cls, type) and issubclass(cls, IRNode)):
+                raise IRBinaryError(f"{cls!r} is not an IR node class")
+            kinds.append(self._kind_plan(cls, names))
+        self._kinds = kinds
+
+        count, pos = _read_varint(buf, pos)
+        if count > 0x7F:
+            raise IRBinaryError("Too many enum classes in binary IR")
+        enums = []
+        for _ in range(count):
+            module_index, pos = _read_varint(buf, pos)
+            name_index, pos = _read_varint(buf, pos)
+            cls = _resolve(strings[module_index], strings[name_index])
+            if not (isinstance(cls, type) and issubclass(cls, Enum)):
+                raise IRBinaryError(f"{cls!r} is not an enum")
+            enums.append(cls)
+        self._enums = enums
+
+    @staticmethod
+    def _kind_plan(
+        cls: type, names: List[str]
+    ) -> Tuple[type, List[str], Optional[Dict[str, Any]]]:
+        """
+        Field names as written, plus defaults for fields the file lacks.
+
+        The defaults are None when the file matches the class exactly, so
+        nodes can be built positionally.
+        """
+        known = {f.name: f for f in fields(cls)}
+        if names == list(known) and all(f.init for f in known.values()):
+            return cls, names, None
+        unknown = [name for name in names if name not in known]
+        if unknown:
+            raise IRBinaryError(f"Binary IR has unknown {cls.__name__} fields: {unknown}")
+        missing = {}
+        for name, f in known.items():
+            if name in names:
+                continue
+            if f.default is not MISSING:
+                missing[name] = f.default
+            elif f.default_factory is not MISSING:
+                missing[name] = f.default_factory
+            else:
+                raise IRBinaryError(f"Binary IR is missing required {cls.__name__}.{name}")
+        return cls, names, missing
+
+    def _read_types(self) -> None:
+        buf = self._buf
+        count, pos = _read_varint(buf, _HEADER.size)
+        self._types: List[IRType] = []
+        for _ in range(count):
+            name_index, pos = _read_varint(buf, pos)
+            generic_args, pos = self._decode(pos)
+            is_optional = buf[pos] == _TRUE
+            union_types, pos = self._decode(pos + 1)
+            self._types.append(
+                intern_type(self._strings[name_index], generic_args, is_optional, union_types)
+            )
+
+    def _decode(self, pos: int, lazy: bool = False) -> Tuple[Any, int]:
+        decode = self._decoder
+        if decode is None:
+            if self._buf is None:
+                raise IRBinaryError("Binary IR reader is closed")
+            decode = self._decoder = self._make_decoder()
+        return decode(pos, lazy)
+
+    def _make_decoder(self) -> Callable[[int, bool], Tuple[Any, int]]:
+        """Build the recursive value decoder with its tables bound as locals."""
+        buf = self._buf
+        strings = self._strings
+        kinds = self._kinds
+        enums = [dict(cls.__members__) for cls in self._enums]
+        types = self._types
+        reader = self
+        unpack_double = _DOUBLE.unpack_from
+
+        def varint(pos: int) -> Tuple[int, int]:
+            byte = buf[pos]
+            if byte < 0x80:
+                return byte, pos + 1
+            return _read_varint(buf, pos)
+
+        def decode(pos: int, lazy: bool) -> Tuple[Any, int]:
+            tag = buf[pos]
+            pos += 1
+
+            if tag == _NODE:
+                index, pos = varint(pos)
+                cls, names, missing = kinds[index]
+                values = []
+                append = values.append
+                for _ in names:
+                    # Inline the common leaf values; everything else recurses
+                    field_tag = buf[pos]
+                    if field_tag == _STR or field_tag == _TYPE:
+                        index = buf[pos + 1]
+                        if index < 0x80:
+                            append(strings[index] if field_tag == _STR else types[index])
+                            pos += 2
+                            continue
+                    elif field_tag == _NONE:
+                        append(None)
+                        pos += 1
+                        continue
+                    elif field_tag == _ENUM:
+                        index = buf[pos + 1]
+                        name_index = buf[pos + 2]
+                        if name_index < 0x80:
+                            append(enums[index][strings[name_index]])
+                            pos += 3
+                            continue
+                    elif field_tag == _BODY:
+                        size, start = varint(pos + 1)
+                        pos = start + size
+                        append(_LazyBody(reader, start) if lazy else decode(start, False)[0])
+                        continue
+                    value, pos = decode(pos, lazy)
+                    append(value)
+                if missing is None:
+                    node = cls(*values)
+                else:
+                    kwargs = dict(zip(names, values))
+                    for name, default in missing.items():
+                        kwargs[name] = default() if callable(default) else default
+                    node = cls(**kwargs)
+                if buf[pos] == _NONE:
+                    return node, pos + 1
+                node._metadata, pos = decode(pos, lazy)
+                return node, pos
+            if tag == _STR:
+                index, pos = varint(pos)
+                return strings[index], pos
+            if tag == _LIST:
+                count, pos = varint(pos)
+                items = []
+                append = items.append
+                for _ in range(count):
+                    item, pos = decode(pos, lazy)
+                    append(item)
+                return items, pos
+            if tag == _TYPE:
+                index, pos = varint(pos)
+                return types[index], pos
+            if tag == _NONE:
+                return None, pos
+            if tag == _ENUM:
+                index = buf[pos]  # enum classes in a file always fit one byte
+                pos += 1
+                name_index, pos = varint(pos)
+                return enums[index][strings[name_index]], pos
+            if tag == _TRUE:
+                return True, pos
+            if tag == _FALSE:
+                return False, pos
+            if tag == _INT:
+                raw, pos = varint(pos)
+                return (raw >> 1) ^ -(raw & 1), pos
+            if tag == _NEG_INT:
+                raw, pos = varint(pos)
+                return -raw, pos
+            if tag == _FLOAT:
+                return unpack_double(buf, pos)[0], pos + 8
+            if tag == _DICT:
+                count, pos = varint(pos)
+                result = {}
+                for _ in range(count):
+                    key, pos = decode(pos, lazy)
+                    result[key], pos = decode(pos, lazy)
+                return result, pos
+            if tag == _TUPLE:
+                count, pos = varint(pos)
+                values = []
+                for _ in range(count):
+                    item, pos = decode(pos, lazy)
+                    values.append(item)
+                return tuple(values), pos
+            if tag == _LOCATION:
+                values = []
+                for _ in range(5):
+                    item, pos = decode(pos, lazy)
+                    values.append(item)
+                return SourceLocation(*values), pos
+            if tag == _BODY:
+                size, start = varint(pos)
+                return decode(start, lazy)[0], start + size
+            raise IRBinaryError(f"Invalid value tag {tag} at offset {pos - 1}")
+
+        return decode
+
+    def module(self, lazy: bool = True) -> IRModule:
+        """
+        Decode the IR module.
+
+        Args:
+            lazy: Decode each function body on first access instead of up front.
+                The reader (and its memory map) stays alive until every lazy
+                body has been loaded.
+        """
+        try:
+            module, _ = self._decode(self._root_offset, lazy)
+        except IndexError:
+            raise IRBinaryError("Truncated binary IR")
+        if not isinstance(module, IRModule):
+            raise IRBinaryError(f"Binary IR root is {type(module).__name__}, not IRModule")
+        return module
+
+    def close(self) -> None:
+        """Release the buffer. Lazy bodies that were not loaded become unusable."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._buf = None
+        self._decoder = None
+
+    def __enter__(self) -> IRBinaryReader:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def loads(data: bytes, lazy: bool = False) -> IRModule:
+    """Deserialize binary IR produced by dumps()."""
+    return IRBinaryReader(data).module(lazy=lazy)
+
+
+def load(path: Union[str, Path], lazy: bool = True, use_mmap: bool = True) -> IRModule:
+    """
+    Load a binary IR file.
+
+    The file is memory-mapped and, with lazy=True, function bodies are decoded
+    on first access, so loading a large module only pays for what is used.
+    """
+    reader = IRBinaryReader.open(path, use_mmap=use_mmap)
+    module = reader.module(lazy=lazy)
+    if not lazy:
+        reader.close()
+    return module
+
+
+def is_binary_ir(data: bytes) -> bool:
+    """True if `data` starts with the binary IR magic."""
+    return data[:len(MAGIC)] == MAGIC
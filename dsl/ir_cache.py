@@ -0,0 +1,290 @@
+"""
+Content-addressed on-disk cache for parsed IR modules.
+
+Parsing and type checking a large .al file dominates the cost of `asl build`,
+`asl compile` and `asl run`. Most builds re-parse sources that have not
+changed, so `parse_al` consults this cache before doing any work.
+
+Design:
+- Key: sha256 of the source text combined with a parser fingerprint (hash of
+  the parser and IR sources plus the Python version). Editing the parser or
+  the IR definitions invalidates every entry automatically.
+- Value: the type-checked IRModule, pickled and zlib-compressed.
+- Eviction: least-recently-used by file mtime (touched on every hit), bounded
+  by a total size budget.
+- Failure model: best effort. Any I/O or decoding problem is treated as a
+  miss; the cache never turns a successful parse into an error.
+
+Configuration (environment):
+- ASSERTLANG_IR_CACHE=0                Disable the cache entirely
+- ASSERTLANG_IR_CACHE_DIR=<path>       Cache directory
+                                       (default: $XDG_CACHE_HOME/assertlang/ir)
+- ASSERTLANG_IR_CACHE_MAX_BYTES=<n>    Size budget (default: 64 MiB)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from dsl.ir import IRModule
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+CACHE_SUFFIX = ".ir"
+
+# Sources whose contents determine the shape of the cached IR.
+_FINGERPRINT_SOURCES = ("al_parser.py", "ir.py")
+
+_parser_fingerprint: Optional[str] = None
+_source_fingerprint: Optional[str] = None
+
+
+def _fingerprint(prefix: bytes) -> str:
+    digest = hashlib.sha256(prefix)
+    here = Path(__file__).parent
+    for name in _FINGERPRINT_SOURCES:
+        try:
+            digest.update((here / name).read_bytes())
+        except OSError:
+            digest.update(name.encode())
+    return digest.hexdigest()[:16]
+
+
+def parser_fingerprint() -> str:
+    """Return a short hash identifying the current parser and IR version."""
+    global _parser_fingerprint
+    if _parser_fingerprint is None:
+        version = f"py{sys.version_info[0]}.{sys.version_info[1]}"
+        _parser_fingerprint = _fingerprint(version.encode())
+    return _parser_fingerprint
+
+
+def ir_source_fingerprint() -> str:
+    """
+    Like parser_fingerprint(), but without the Python version.
+
+    For IR pickles that ship prebuilt (the stdlib snapshot in a pure-Python
+    wheel) and must stay valid on every supported interpreter.
+    """
+    global _source_fingerprint
+    if _source_fingerprint is None:
+        _source_fingerprint = _fingerprint(b"")
+    return _source_fingerprint
+
+
+def default_cache_dir() -> Path:
+    """Return the cache directory, honouring ASSERTLANG_IR_CACHE_DIR and XDG."""
+    override = os.environ.get("ASSERTLANG_IR_CACHE_DIR")
+    if override:
+        return Path(override)
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return base / "assertlang" / "ir"
+
+
+def _env_max_bytes() -> int:
+    value = os.environ.get("ASSERTLANG_IR_CACHE_MAX_BYTES")
+    if value:
+        try:
+            return max(0, int(value))
+        except ValueError:
+            pass
+    return DEFAULT_MAX_BYTES
+
+
+class IRCache:
+    """
+    Size-bounded LRU cache of parsed IR modules stored on disk.
+
+    Example:
+        >>> cache = IRCache(Path("/tmp/ir-cache"))
+        >>> module = cache.get(source)
+        >>> if module is None:
+        ...     module = parse(source)
+        ...     cache.put(source, module)
+    """
+
+    def __init__(self, directory: Optional[Path] = None, max_bytes: Optional[int] = None):
+        self.directory = Path(directory) if directory is not None else default_cache_dir()
+        self.max_bytes = _env_max_bytes() if max_bytes is None else max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, text: str) -> str:
+        """Return the cache key for a source text."""
+        digest = hashlib.sha256(parser_fingerprint().encode())
+        digest.update(b"\0")
+        digest.update(text.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{CACHE_SUFFIX}"
+
+    def get(self, text: str) -> Optional[IRModule]:
+        """Return the cached IR for `text`, or None on a miss."""
+        return self.load(self.key(text))
+
+    def load(self, key: str) -> Optional[IRModule]:
+        """Return the cached IR stored under `key` (see key()), or None on a miss."""
+        path = self._path(key)
+        try:
+            payload = path.read_bytes()
+            module = pickle.loads(zlib.decompress(payload))
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception:
+            # Corrupt or incompatible entry: drop it and re-parse
+            self.misses += 1
+            self._unlink(path)
+            return None
+
+        if not isinstance(module, IRModule):
+            self.misses += 1
+            self._unlink(path)
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return module
+
+    def put(self, text: str, module: IRModule) -> bool:
+        """Store the IR for `text`. Returns True if the entry was written."""
+        try:
+            payload = zlib.compress(pickle.dumps(module, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            return False
+        if len(payload) > self.max_bytes:
+            return False
+
+        path = self._path(self.key(text))
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    handle.write(payload)
+                os.replace(tmp_name, path)
+            except BaseException:
+                self._unlink(Path(tmp_name))
+                raise
+        except OSError:
+            return False
+
+        self._evict()
+        return True
+
+    def _evict(self) -> None:
+        """Remove least-recently-used entries until the size budget is met."""
+        entries = []
+        total = 0
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if not entry.name.endswith(CACHE_SUFFIX):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+        except OSError:
+            return
+
+        if total <= self.max_bytes:
+            return
+
+        entries.sort()
+        for _mtime, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if self._unlink(Path(path)):
+                total -= size
+                self.evictions += 1
+
+    def clear(self) -> int:
+        """Delete every cache entry. Returns the number of entries removed."""
+        removed = 0
+        if not self.directory.is_dir():
+            return 0
+        for path in self.directory.glob(f"*{CACHE_SUFFIX}"):
+            if self._unlink(path):
+                removed += 1
+        return removed
+
+    def size_bytes(self) -> int:
+        """Return the total size of all cache entries."""
+        if not self.directory.is_dir():
+            return 0
+        total = 0
+        for path in self.directory.glob(f"*{CACHE_SUFFIX}"):
+            try:
+                total += path.stat().st_size
+            except OSError:
+                pass
+        return total
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss/eviction counters for this cache instance."""
+        return {
+            "directory": str(self.directory),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "max_bytes": self.max_bytes,
+        }
+
+    @staticmethod
+    def _unlink(path: Path) -> bool:
+        try:
+            path.unlink()
+            return True
+        except OSError:
+            return False
+
+
+# ============================================================================
+# Process-wide cache used by parse_al
+# ============================================================================
+
+_default_cache: Optional[IRCache] = None
+_cache_enabled: Optional[bool] = None
+
+
+def ir_cache_enabled() -> bool:
+    """Return True if parse_al should consult the on-disk cache."""
+    if _cache_enabled is not None:
+        return _cache_enabled
+    setting = os.environ.get("ASSERTLANG_IR_CACHE", "1").strip().lower()
+    return setting not in ("0", "false", "no", "off")
+
+
+def set_ir_cache_enabled(enabled: Optional[bool]) -> None:
+    """Force the cache on or off for this process (None restores the env default)."""
+    global _cache_enabled
+    _cache_enabled = enabled
+
+
+def get_ir_cache() -> IRCache:
+    """Return the process-wide IR cache, creating it on first use."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = IRCache()
+    return _default_cache
+
+
+def set_ir_cache(cache: Optional[IRCache]) -> None:
+    """Replace the process-wide IR cache (None recreates it from the environment)."""
+    global _default_cache
+    _default_cache = cache
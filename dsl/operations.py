@@ -0,0 +1,168 @@
+"""
+Operation registry for dsl.runtime.PWRuntime.
+
+Method-style calls in PW code (`str.upper(s)`, `file.read(path)`) name an
+operation "namespace.method". Each operation is a Python callable registered
+here under that id and called with the evaluated arguments. The runtime
+resolves the operation of a call site once and then calls it directly.
+
+Plugins add (or replace) operations by registering them:
+
+    from dsl.operations import register_operation
+
+    @register_operation("text.slug")
+    def slug(value: str) -> str:
+        return value.lower().replace(" ", "-")
+
+Installed packages can instead declare an entry point in the
+"assertlang.operations" group naming a callable that takes
+register_operation. Entry points are loaded the first time an operation is
+not found.
+"""
+
+import json
+import math
+import warnings
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+PLUGIN_GROUP = "assertlang.operations"
+
+Operation = Callable[..., Any]
+
+# "namespace.method" -> callable
+OPERATIONS: Dict[str, Operation] = {}
+
+_plugins_loaded = False
+
+
+def register_operation(operation_id: str, func: Optional[Operation] = None) -> Any:
+    """
+    Register func as the operation "namespace.method". Without func, return
+    a decorator that registers the function it decorates.
+    """
+    namespace, _, method = operation_id.partition(".")
+    if not namespace or not method or "." in method:
+        raise ValueError(f"Operation id must be 'namespace.method', got {operation_id!r}")
+
+    def decorator(func: Operation) -> Operation:
+        OPERATIONS[operation_id] = func
+        return func
+
+    return decorator if func is None else decorator(func)
+
+
+def resolve_operation(operation_id: str) -> Operation:
+    """Return the callable registered for operation_id"""
+    operation = OPERATIONS.get(operation_id)
+    if operation is None:
+        load_operation_plugins()
+        operation = OPERATIONS.get(operation_id)
+        if operation is None:
+            raise NotImplementedError(f"Operation not implemented: {operation_id}")
+    return operation
+
+
+def load_operation_plugins() -> None:
+    """Load the operations of installed plugins (once per process)"""
+    global _plugins_loaded
+    if _plugins_loaded:
+        return
+    _plugins_loaded = True
+
+    from importlib.metadata import entry_points
+
+    found = entry_points()
+    group = found.select(group=PLUGIN_GROUP) if hasattr(found, "select") else found.get(PLUGIN_GROUP, ())
+    for entry_point in group:
+        try:
+            entry_point.load()(register_operation)
+        except Exception as e:
+            warnings.warn(f"Failed to load operation plugin {entry_point.name!r}: {e}")
+
+
+# ============================================================================
+# Built-in Operations
+# ============================================================================
+
+# String operations
+register_operation("str.split", lambda value, separator: value.split(separator))
+register_operation("str.upper", lambda value: value.upper())
+register_operation("str.lower", lambda value: value.lower())
+register_operation("str.strip", lambda value: value.strip())
+register_operation("str.replace", lambda value, old, new: value.replace(old, new))
+register_operation("str.join", lambda separator, items: separator.join(items))
+register_operation("str.contains", lambda value, part: part in value)
+register_operation("str.starts_with", lambda value, prefix: value.startswith(prefix))
+register_operation("str.ends_with", lambda value, suffix: value.endswith(suffix))
+
+
+# File operations
+@register_operation("file.read")
+def _file_read(path: str) -> str:
+    return Path(path).read_text()
+
+
+@register_operation("file.write")
+def _file_write(path: str, content: str) -> None:
+    Path(path).write_text(content)
+
+
+@register_operation("file.exists")
+def _file_exists(path: str) -> bool:
+    return Path(path).exists()
+
+
+@register_operation("file.delete")
+def _file_delete(path: str) -> None:
+    Path(path).unlink()
+
+
+# Array operations
+@register_operation("array.push")
+def _array_push(items: list, item: Any) -> None:
+    items.append(item)
+
+
+@register_operation("array.reverse")
+def _array_reverse(items: list) -> None:
+    items.reverse()
+
+
+@register_operation("array.sort")
+def _array_sort(items: list) -> None:
+    items.sort()
+
+
+register_operation("array.pop", lambda items: items.pop())
+register_operation("array.len", len)
+register_operation("array.contains", lambda items, item: item in items)
+
+# JSON operations
+register_operation("json.parse", json.loads)
+register_operation("json.stringify", lambda value: json.dumps(value))
+register_operation("json.stringify_pretty", lambda value: json.dumps(value, indent=2))
+
+# Math operations
+register_operation("math.abs", abs)
+register_operation("math.ceil", math.ceil)
+register_operation("math.floor", math.floor)
+register_operation("math.round", lambda value: round(value))
+register_operation("math.sqrt", math.sqrt)
+register_operation("math.pow", math.pow)
+register_operation("math.max", lambda *values: max(*values))
+register_operation("math.min", lambda *values: min(*values))
+
+
+# HTTP operations (simplified - would use requests in production)
+@register_operation("http.get")
+def _http_get(url: str) -> str:
+    import urllib.request
+
+    with urllib.request.urlopen(url) as response:
+        return response.read().decode("utf-8")
+
+
+@register_operation("http.get_json")
+def _http_get_json(url: str) -> Any:
+    return json.loads(_http_get(url))
@@ -4,44 +4,76 @@ Execute PW code directly using CharCNN + MCP pipeline
 """
 
 import sys
-import json
 import subprocess
 from pathlib import Path
-from typing import Any, Dict, Optional, List
+from typing import Any, Callable, Dict, Optional, List, Tuple
 from dataclasses import dataclass
 
 from dsl.al_parser import parse_al, ALParseError
+from dsl.al_profiler import Profiler
 from dsl.ir import *
-from ml.inference import OperationLookup
+from dsl.operations import resolve_operation
+
+CHARCNN_MODEL_PATH = 'ml/charcnn_large.pt'
 
 
 @dataclass
 class RuntimeContext:
     """Runtime execution context"""
     variables: Dict[str, Any]
+    globals: Dict[str, Any]
     functions: Dict[str, IRFunction]
+    frames: List[Dict[str, Any]]
     return_value: Optional[Any] = None
 
     def __init__(self):
-        self.variables = {}
+        # variables holds the locals of the running call; at module level
+        # it is the globals map itself
+        self.globals = {}
+        self.variables = self.globals
         self.functions = {}
+        # Locals of the suspended callers, innermost last
+        self.frames = []
         self.return_value = None
 
+    def push_frame(self, local_vars: Dict[str, Any]) -> None:
+        """Enter a call whose locals are local_vars"""
+        self.frames.append(self.variables)
+        self.variables = local_vars
+
+    def pop_frame(self) -> None:
+        """Return to the caller's locals"""
+        self.variables = self.frames.pop()
+
 
 class PWRuntime:
     """PW code execution engine"""
 
-    def __init__(self, use_charcnn: bool = True):
+    def __init__(self, use_charcnn: bool = True, profiler: Optional[Profiler] = None):
         self.context = RuntimeContext()
-        self.operation_lookup = None
-
-        if use_charcnn:
-            try:
-                self.operation_lookup = OperationLookup(model_path='ml/charcnn_large.pt')
-                print("✅ CharCNN loaded")
-            except Exception as e:
-                print(f"⚠️  CharCNN not available: {e}")
-                self.operation_lookup = None
+        self.use_charcnn = use_charcnn
+        self._operation_lookup = None
+        self._operation_lookup_loaded = False
+        # id(call node) -> (call node, resolved operation)
+        self._call_sites: Dict[int, Tuple[IRCall, Callable[..., Any]]] = {}
+        self.profiler = profiler
+        if profiler is not None:
+            # Shadow the method so unprofiled runtimes pay nothing per node
+            self.execute_node = self._execute_node_profiled
+
+    @property
+    def operation_lookup(self):
+        """CharCNN operation lookup, loaded on first use (None if unavailable)"""
+        if not self._operation_lookup_loaded:
+            self._operation_lookup_loaded = True
+            if self.use_charcnn:
+                try:
+                    from ml.inference import OperationLookup
+                    self._operation_lookup = OperationLookup(model_path=CHARCNN_MODEL_PATH)
+                    print("✅ CharCNN loaded")
+                except Exception as e:
+                    print(f"⚠️  CharCNN not available: {e}")
+        return self._operation_lookup
 
     def execute_file(self, file_path: str) -> Any:
         """Execute a PW file"""
@@ -80,15 +112,25 @@ class PWRuntime:
             print(f"Runtime error in {source_name}: {e}")
             raise
 
+    def _execute_node_profiled(self, node: IRNode) -> Any:
+        location = node.location
+        if location is not None:
+            self.profiler.line(location.line)
+        return PWRuntime.execute_node(self, node)
+
     def execute_node(self, node: IRNode) -> Any:
         """Execute an IR node"""
         if isinstance(node, IRLiteral):
             return node.value
 
         elif isinstance(node, IRIdentifier):
-            if node.name not in self.context.variables:
-                raise NameError(f"Variable not defined: {node.name}")
-            return self.context.variables[node.name]
+            context = self.context
+            name = node.name
+            if name in context.variables:
+                return context.variables[name]
+            if name in context.globals:
+                return context.globals[name]
+            raise NameError(f"Variable not defined: {name}")
 
         elif isinstance(node, IRArray):
             return [self.execute_node(item) for item in node.elements]
@@ -105,6 +147,10 @@ class PWRuntime:
         elif isinstance(node, IRCall):
             return self.execute_call(node)
 
+        elif isinstance(node, IRAwait):
+            # Calls run synchronously here, so the awaited value is the result
+            return self.execute_node(node.expression)
+
         elif isinstance(node, IRAssignment):
             value = self.execute_node(node.value)
             self.context.variables[node.target] = value
@@ -260,13 +306,18 @@ class PWRuntime:
             raise NotImplementedError(f"Call type not implemented: {type(node.function).__name__}")
 
     def execute_method_call(self, node: IRCall) -> Any:
-        """Execute method call using CharCNN + MCP"""
+        """Execute method call through the operation registry"""
+        # Evaluate arguments
+        args = [self.execute_node(arg) for arg in node.args]
+
+        cached = self._call_sites.get(id(node))
+        if cached is not None and cached[0] is node:
+            return cached[1](*args)
+
         if not isinstance(node.function, IRPropertyAccess):
             raise TypeError("Expected IRPropertyAccess for method call")
 
         member_access = node.function
-        namespace = None
-        method = None
 
         # Get namespace and method name
         if isinstance(member_access.object, IRIdentifier):
@@ -275,147 +326,45 @@ class PWRuntime:
         else:
             raise NotImplementedError("Complex property access not yet supported")
 
-        operation_id = f"{namespace}.{method}"
-
-        # Evaluate arguments
-        args = [self.execute_node(arg) for arg in node.args]
-
         # Note: CharCNN predictions are available in node.operation_id (from parser)
         # but we don't override the namespace.method from AST since that's authoritative
         # CharCNN is useful for ambiguous cases or LSP suggestions, not runtime execution
 
-        # Execute operation
-        return self.execute_operation(operation_id, args)
+        # Resolve once per call site; later calls go straight to the operation
+        operation = resolve_operation(f"{namespace}.{method}")
+        self._call_sites[id(node)] = (node, operation)
+        return operation(*args)
 
     def execute_operation(self, operation_id: str, args: List[Any]) -> Any:
-        """Execute operation (delegates to Python stdlib or MCP)"""
-        # For now, implement common operations directly
-        # In production, this would query MCP and execute generated code
-
-        namespace, method = operation_id.split('.')
-
-        # String operations
-        if namespace == 'str':
-            if method == 'split':
-                if len(args) != 2:
-                    raise TypeError(f"str.split() takes 2 arguments ({len(args)} given)")
-                return args[0].split(args[1])
-            elif method == 'upper':
-                return args[0].upper()
-            elif method == 'lower':
-                return args[0].lower()
-            elif method == 'strip':
-                return args[0].strip()
-            elif method == 'replace':
-                return args[0].replace(args[1], args[2])
-            elif method == 'join':
-                return args[0].join(args[1])
-            elif method == 'contains':
-                return args[1] in args[0]
-            elif method == 'starts_with':
-                return args[0].startswith(args[1])
-            elif method == 'ends_with':
-                return args[0].endswith(args[1])
-
-        # File operations
-        elif namespace == 'file':
-            if method == 'read':
-                return Path(args[0]).read_text()
-            elif method == 'write':
-                Path(args[0]).write_text(args[1])
-                return None
-            elif method == 'exists':
-                return Path(args[0]).exists()
-            elif method == 'delete':
-                Path(args[0]).unlink()
-                return None
-
-        # Array operations
-        elif namespace == 'array':
-            if method == 'push':
-                args[0].append(args[1])
-                return None
-            elif method == 'pop':
-                return args[0].pop()
-            elif method == 'len':
-                return len(args[0])
-            elif method == 'reverse':
-                args[0].reverse()
-                return None
-            elif method == 'sort':
-                args[0].sort()
-                return None
-            elif method == 'contains':
-                return args[1] in args[0]
-
-        # JSON operations
-        elif namespace == 'json':
-            if method == 'parse':
-                return json.loads(args[0])
-            elif method == 'stringify':
-                return json.dumps(args[0])
-            elif method == 'stringify_pretty':
-                return json.dumps(args[0], indent=2)
-
-        # Math operations
-        elif namespace == 'math':
-            import math
-            if method == 'abs':
-                return abs(args[0])
-            elif method == 'ceil':
-                return math.ceil(args[0])
-            elif method == 'floor':
-                return math.floor(args[0])
-            elif method == 'round':
-                return round(args[0])
-            elif method == 'sqrt':
-                return math.sqrt(args[0])
-            elif method == 'pow':
-                return math.pow(args[0], args[1])
-            elif method == 'max':
-                return max(*args)
-            elif method == 'min':
-                return min(*args)
-
-        # HTTP operations (simplified - would use requests in production)
-        elif namespace == 'http':
-            if method == 'get':
-                import urllib.request
-                with urllib.request.urlopen(args[0]) as response:
-                    return response.read().decode('utf-8')
-            elif method == 'get_json':
-                import urllib.request
-                with urllib.request.urlopen(args[0]) as response:
-                    return json.loads(response.read().decode('utf-8'))
-
-        raise NotImplementedError(f"Operation not implemented: {operation_id}")
+        """Execute a registered operation (see dsl.operations)"""
+        return resolve_operation(operation_id)(*args)
 
     def execute_function(self, func: IRFunction, args: List[IRExpression]) -> Any:
         """Execute user-defined function"""
         # Evaluate arguments
         arg_values = [self.execute_node(arg) for arg in args]
 
-        # Create new context for function
-        old_vars = self.context.variables.copy()
-        old_return = self.context.return_value
-
-        # Bind arguments
-        for param, value in zip(func.params, arg_values):
-            self.context.variables[param.name] = value
-
-        # Execute function body
-        self.context.return_value = None
-        for stmt in func.body:
-            self.execute_node(stmt)
-
-        # Get return value
-        result = self.context.return_value
-
-        # Restore context
-        self.context.variables = old_vars
-        self.context.return_value = old_return
-
-        return result
+        if self.profiler is not None:
+            self.profiler.enter(func.name, func.location)
+        context = self.context
+        old_return = context.return_value
+        # Fresh locals per call: the cost of a call does not depend on how
+        # many variables its callers hold
+        context.push_frame({param.name: value for param, value in zip(func.params, arg_values)})
+        try:
+            # Execute function body
+            context.return_value = None
+            for stmt in func.body:
+                self.execute_node(stmt)
+                if context.return_value is not None:
+                    break
+
+            return context.return_value
+        finally:
+            context.pop_frame()
+            context.return_value = old_return
+            if self.profiler is not None:
+                self.profiler.exit()
 
 
 def execute_pw_file(file_path: str) -> Any:
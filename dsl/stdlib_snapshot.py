@@ -0,0 +1,224 @@
+"""
+Frozen, precompiled snapshot of the PW standard library.
+
+Every PWRuntime needs the stdlib enums (Option, Result) and helper functions
+in its globals. Parsing stdlib/core_simple.al on every runtime construction
+dominates start-up cost when a service creates a fresh runtime per request,
+so the stdlib is compiled once into a snapshot file and loaded lazily, once
+per process. The resulting IR is shared read-only by every runtime.
+
+Snapshot file:
+- Location: next to the stdlib source (stdlib/core_simple.al.snapshot in a
+  source checkout, dsl/stdlib/core_simple.al.snapshot in an install)
+- Contents: pickled {"format", "key", "module"}, where key is the sha256 of
+  the stdlib source plus the parser and IR sources (ir_source_fingerprint in
+  dsl.ir_cache). The key and the pickle protocol do not depend on the Python
+  version, so a snapshot built into a wheel is valid on every interpreter.
+- Built by the package build (build_py in setup.py), which ships the stdlib
+  sources and their snapshot as package data, or by hand with
+  `python -m dsl.stdlib_snapshot`. A missing, stale or unreadable snapshot
+  is rebuilt from source on the first load, with a logged warning, and
+  written back if the stdlib directory is writable.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple
+
+from dsl.ir import IREnum, IRFunction, IRModule
+
+SNAPSHOT_FORMAT = 1
+SNAPSHOT_SUFFIX = ".snapshot"
+# The highest protocol every supported Python (3.9+) reads
+SNAPSHOT_PICKLE_PROTOCOL = 5
+
+logger = logging.getLogger(__name__)
+
+# Installs ship the stdlib as package data; a source checkout keeps it at the
+# repository root
+_PACKAGED_STDLIB_DIR = Path(__file__).parent / "stdlib"
+STDLIB_DIR = (
+    _PACKAGED_STDLIB_DIR
+    if _PACKAGED_STDLIB_DIR.is_dir()
+    else Path(__file__).parent.parent / "stdlib"
+)
+# core_simple.al is preferred until the runtime supports full pattern matching
+STDLIB_SOURCES = ("core_simple.al", "core.al")
+
+
+class StdlibNotFoundError(FileNotFoundError):
+    """Raised when no stdlib source can be located"""
+
+
+@dataclass(frozen=True)
+class StdlibSnapshot:
+    """Read-only view of the compiled stdlib shared by all runtimes"""
+
+    source_path: Path
+    key: str
+    enums: Tuple[IREnum, ...]
+    functions: Tuple[IRFunction, ...]
+
+    @classmethod
+    def from_module(cls, source_path: Path, key: str, module: IRModule) -> "StdlibSnapshot":
+        return cls(
+            source_path=source_path,
+            key=key,
+            enums=tuple(module.enums),
+            functions=tuple(module.functions),
+        )
+
+
+def find_stdlib_source(stdlib_dir: Path = STDLIB_DIR) -> Path:
+    """Return the stdlib source file the runtime should load."""
+    for name in STDLIB_SOURCES:
+        path = stdlib_dir / name
+        if path.exists():
+            return path
+    raise StdlibNotFoundError(f"stdlib not found in {stdlib_dir}")
+
+
+def snapshot_path_for(source_path: Path) -> Path:
+    """Return the snapshot file path for a stdlib source file."""
+    return source_path.with_name(source_path.name + SNAPSHOT_SUFFIX)
+
+
+def snapshot_key(source: str) -> str:
+    """Return the validity key for a snapshot of `source`."""
+    from dsl.ir_cache import ir_source_fingerprint
+
+    digest = hashlib.sha256(ir_source_fingerprint().encode())
+    digest.update(b"\0")
+    digest.update(source.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _read_snapshot(path: Path, key: str) -> Optional[IRModule]:
+    try:
+        with open(path, "rb") as f:
+            payload = pickle.load(f)
+    except Exception:
+        return None
+    if (
+        not isinstance(payload, dict)
+        or payload.get("format") != SNAPSHOT_FORMAT
+        or payload.get("key") != key
+        or not isinstance(payload.get("module"), IRModule)
+    ):
+        return None
+    return payload["module"]
+
+
+def _write_snapshot(path: Path, key: str, module: IRModule) -> bool:
+    payload = {"format": SNAPSHOT_FORMAT, "key": key, "module": module}
+    try:
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    except OSError:
+        return False
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(payload, f, protocol=SNAPSHOT_PICKLE_PROTOCOL)
+        os.replace(tmp_name, path)
+        return True
+    except OSError:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        return False
+
+
+def build_snapshot(source_path: Optional[Path] = None, write: bool = True) -> StdlibSnapshot:
+    """
+    Compile the stdlib into a snapshot, bypassing any existing snapshot file.
+
+    Args:
+        source_path: stdlib source (default: find_stdlib_source())
+        write: Persist the snapshot next to the source
+
+    Returns:
+        StdlibSnapshot for the freshly parsed stdlib
+    """
+    from dsl.al_parser import parse_al
+
+    source_path = source_path or find_stdlib_source()
+    source = source_path.read_text()
+    key = snapshot_key(source)
+    module = parse_al(source, use_cache=False)
+    if write:
+        snapshot_path = snapshot_path_for(source_path)
+        if not _write_snapshot(snapshot_path, key, module):
+            logger.warning(
+                "Could not write stdlib snapshot %s; each process will parse the stdlib",
+                snapshot_path,
+            )
+    return StdlibSnapshot.from_module(source_path, key, module)
+
+
+def load_snapshot(source_path: Optional[Path] = None) -> StdlibSnapshot:
+    """Load the stdlib snapshot from disk, rebuilding it if missing or stale."""
+    source_path = source_path or find_stdlib_source()
+    source = source_path.read_text()
+    key = snapshot_key(source)
+    snapshot_path = snapshot_path_for(source_path)
+    module = _read_snapshot(snapshot_path, key)
+    if module is None:
+        # The package build ships a current snapshot; getting here means a
+        # source checkout, an edited stdlib or a changed parser
+        logger.warning(
+            "stdlib snapshot %s is missing or stale; rebuilding it from source", snapshot_path
+        )
+        return build_snapshot(source_path, write=True)
+    return StdlibSnapshot.from_module(source_path, key, module)
+
+
+# ============================================================================
+# Process-wide shared snapshot
+# ============================================================================
+
+_shared_snapshot: Optional[StdlibSnapshot] = None
+_shared_lock = threading.Lock()
+
+
+def get_stdlib_snapshot() -> StdlibSnapshot:
+    """Return the process-wide stdlib snapshot, loading it on first use."""
+    global _shared_snapshot
+    snapshot = _shared_snapshot
+    if snapshot is None:
+        with _shared_lock:
+            if _shared_snapshot is None:
+                _shared_snapshot = load_snapshot()
+            snapshot = _shared_snapshot
+    return snapshot
+
+
+def reset_stdlib_snapshot() -> None:
+    """Drop the process-wide snapshot (next use reloads it)."""
+    global _shared_snapshot
+    with _shared_lock:
+        _shared_snapshot = None
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Build the stdlib snapshot ahead of time (install/build step)."""
+    argv = sys.argv[1:] if argv is None else argv
+    source_path = Path(argv[0]) if argv else find_stdlib_source()
+    snapshot = build_snapshot(source_path, write=True)
+    print(
+        f"Wrote {snapshot_path_for(source_path)} "
+        f"({len(snapshot.enums)} enums, {len(snapshot.functions)} functions)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -42,6 +42,7 @@ from dsl.ir import (
     IRReturn,
     IRType,
     LiteralType,
+    intern_type,
 )
 
 
@@ -360,34 +361,27 @@ class TypeSystem:
         # Reverse lookup in primitives
         for pw_type, mapped in self.mappings.PRIMITIVES.get(source_lang, {}).items():
             if lang_type == mapped:
-                return IRType(name=pw_type)
+                return intern_type(pw_type)
 
         # Handle collections with generics
         if source_lang == "python":
             if lang_type.startswith("List["):
                 inner = lang_type[5:-1]
-                return IRType(
-                    name="array",
-                    generic_args=[self.map_from_language(inner, source_lang)]
-                )
+                return intern_type("array", [self.map_from_language(inner, source_lang)])
             if lang_type.startswith("Dict["):
                 inner = lang_type[5:-1]
                 k, v = inner.split(",", 1)
-                return IRType(
-                    name="map",
-                    generic_args=[
-                        self.map_from_language(k.strip(), source_lang),
-                        self.map_from_language(v.strip(), source_lang)
-                    ]
-                )
+                return intern_type("map", [
+                    self.map_from_language(k.strip(), source_lang),
+                    self.map_from_language(v.strip(), source_lang)
+                ])
             if lang_type.startswith("Optional["):
                 inner = lang_type[9:-1]
                 inner_type = self.map_from_language(inner, source_lang)
-                inner_type.is_optional = True
-                return inner_type
+                return intern_type(inner_type.name, inner_type.generic_args, True, inner_type.union_types)
 
         # Custom type - return as-is
-        return IRType(name=lang_type)
+        return intern_type(lang_type)
 
     # ========================================================================
     # Type Inference
@@ -926,16 +920,14 @@ class TypeSystem:
         if type_str.endswith("?"):
             base = type_str[:-1]
             ir_type = self.normalize_type(base)
-            ir_type.is_optional = True
-            return ir_type
+            return intern_type(ir_type.name, ir_type.generic_args, True, ir_type.union_types)
 
         # Handle union (A|B|C)
         if "|" in type_str:
             parts = type_str.split("|")
             first = self.normalize_type(parts[0].strip())
             rest = [self.normalize_type(p.strip()) for p in parts[1:]]
-            first.union_types = rest
-            return first
+            return intern_type(first.name, first.generic_args, first.is_optional, rest)
 
         # Handle generics (array<T>, map<K,V>)
         if "<" in type_str and type_str.endswith(">"):
@@ -962,13 +954,10 @@ class TypeSystem:
             if current:
                 args.append("".join(current).strip())
 
-            return IRType(
-                name=base,
-                generic_args=[self.normalize_type(arg) for arg in args]
-            )
+            return intern_type(base, [self.normalize_type(arg) for arg in args])
 
         # Simple type
-        return IRType(name=type_str)
+        return intern_type(type_str)
 
     def get_required_imports(
         self, types: List[IRType], target_lang: str
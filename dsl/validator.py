@@ -17,6 +17,7 @@ from typing import Dict, List, Optional, Set
 
 from dsl.ir import (
     BinaryOperator,
+    IRArray,
     IRAssignment,
     IRBinaryOp,
     IRBreak,
@@ -41,14 +42,17 @@ from dsl.ir import (
     IRPropertyAccess,
     IRReturn,
     IRStatement,
+    IRTernary,
     IRThrow,
     IRTry,
     IRType,
     IRTypeDefinition,
     IRUnaryOp,
+    IRVisitor,
     IRWhile,
     NodeType,
     UnaryOperator,
+    dispatches,
 )
 
 
@@ -122,7 +126,7 @@ class ValidationContext:
         return self.lookup_symbol(name) is not None
 
 
-class IRValidator:
+class IRValidator(IRVisitor):
     """
     Validates IR trees for semantic correctness.
 
@@ -335,135 +339,163 @@ class IRValidator:
 
     def _validate_statement(self, stmt: IRStatement, ctx: ValidationContext) -> None:
         """Validate a statement."""
-        if isinstance(stmt, IRIf):
-            self._validate_expression(stmt.condition, ctx)
-            for s in stmt.then_body:
-                self._validate_statement(s, ctx)
-            for s in stmt.else_body:
-                self._validate_statement(s, ctx)
+        handler = self._dispatch_tables["statement"].get(stmt.__class__)
+        if handler is None:
+            handler = self.handler_for("statement", stmt.__class__)
+        handler(self, stmt, ctx)
+
+    @dispatches(IRIf, table="statement")
+    def _validate_if(self, stmt: IRIf, ctx: ValidationContext) -> None:
+        self._validate_expression(stmt.condition, ctx)
+        for s in stmt.then_body:
+            self._validate_statement(s, ctx)
+        for s in stmt.else_body:
+            self._validate_statement(s, ctx)
+
+    @dispatches(IRFor, table="statement")
+    def _validate_for(self, stmt: IRFor, ctx: ValidationContext) -> None:
+        ctx.enter_scope()
+        ctx.loop_depth += 1
+        # Define iterator variable
+        ctx.define_symbol(stmt.iterator, stmt)
+        self._validate_expression(stmt.iterable, ctx)
+        for s in stmt.body:
+            self._validate_statement(s, ctx)
+        ctx.loop_depth -= 1
+        ctx.exit_scope()
 
-        elif isinstance(stmt, IRFor):
+    @dispatches(IRWhile, table="statement")
+    def _validate_while(self, stmt: IRWhile, ctx: ValidationContext) -> None:
+        ctx.loop_depth += 1
+        self._validate_expression(stmt.condition, ctx)
+        for s in stmt.body:
+            self._validate_statement(s, ctx)
+        ctx.loop_depth -= 1
+
+    @dispatches(IRTry, table="statement")
+    def _validate_try(self, stmt: IRTry, ctx: ValidationContext) -> None:
+        # Validate try body
+        for s in stmt.try_body:
+            self._validate_statement(s, ctx)
+
+        # Validate catch blocks
+        for catch in stmt.catch_blocks:
             ctx.enter_scope()
-            ctx.loop_depth += 1
-            # Define iterator variable
-            ctx.define_symbol(stmt.iterator, stmt)
-            self._validate_expression(stmt.iterable, ctx)
-            for s in stmt.body:
+            if catch.exception_var:
+                ctx.define_symbol(catch.exception_var, catch)
+            for s in catch.body:
                 self._validate_statement(s, ctx)
-            ctx.loop_depth -= 1
             ctx.exit_scope()
 
-        elif isinstance(stmt, IRWhile):
-            ctx.loop_depth += 1
-            self._validate_expression(stmt.condition, ctx)
-            for s in stmt.body:
-                self._validate_statement(s, ctx)
-            ctx.loop_depth -= 1
-
-        elif isinstance(stmt, IRTry):
-            # Validate try body
-            for s in stmt.try_body:
-                self._validate_statement(s, ctx)
-
-            # Validate catch blocks
-            for catch in stmt.catch_blocks:
-                ctx.enter_scope()
-                if catch.exception_var:
-                    ctx.define_symbol(catch.exception_var, catch)
-                for s in catch.body:
-                    self._validate_statement(s, ctx)
-                ctx.exit_scope()
-
-            # Validate finally body
-            for s in stmt.finally_body:
-                self._validate_statement(s, ctx)
-
-        elif isinstance(stmt, IRAssignment):
+        # Validate finally body
+        for s in stmt.finally_body:
+            self._validate_statement(s, ctx)
+
+    @dispatches(IRAssignment, table="statement")
+    def _validate_assignment(self, stmt: IRAssignment, ctx: ValidationContext) -> None:
+        self._validate_expression(stmt.value, ctx)
+        # Define symbol in current scope
+        ctx.define_symbol(stmt.target, stmt)
+
+    @dispatches(IRReturn, table="statement")
+    def _validate_return(self, stmt: IRReturn, ctx: ValidationContext) -> None:
+        if ctx.current_function is None:
+            raise ValidationError("Return outside of function", stmt)
+        if stmt.value:
             self._validate_expression(stmt.value, ctx)
-            # Define symbol in current scope
-            ctx.define_symbol(stmt.target, stmt)
-
-        elif isinstance(stmt, IRReturn):
-            if ctx.current_function is None:
-                raise ValidationError("Return outside of function", stmt)
-            if stmt.value:
-                self._validate_expression(stmt.value, ctx)
 
-        elif isinstance(stmt, IRThrow):
-            self._validate_expression(stmt.exception, ctx)
+    @dispatches(IRThrow, table="statement")
+    def _validate_throw(self, stmt: IRThrow, ctx: ValidationContext) -> None:
+        self._validate_expression(stmt.exception, ctx)
 
-        elif isinstance(stmt, IRBreak):
-            if ctx.loop_depth == 0:
-                raise ValidationError("Break outside of loop", stmt)
+    @dispatches(IRBreak, table="statement")
+    def _validate_break(self, stmt: IRBreak, ctx: ValidationContext) -> None:
+        if ctx.loop_depth == 0:
+            raise ValidationError("Break outside of loop", stmt)
 
-        elif isinstance(stmt, IRContinue):
-            if ctx.loop_depth == 0:
-                raise ValidationError("Continue outside of loop", stmt)
+    @dispatches(IRContinue, table="statement")
+    def _validate_continue(self, stmt: IRContinue, ctx: ValidationContext) -> None:
+        if ctx.loop_depth == 0:
+            raise ValidationError("Continue outside of loop", stmt)
 
-        elif isinstance(stmt, IRCall):
-            # Expression statement
-            self._validate_expression(stmt, ctx)
+    @dispatches(IRCall, table="statement")
+    def _validate_expression_statement(self, stmt: IRCall, ctx: ValidationContext) -> None:
+        self._validate_expression(stmt, ctx)
 
     def _validate_expression(self, expr: IRExpression, ctx: ValidationContext) -> None:
         """Validate an expression."""
-        if isinstance(expr, IRCall):
-            self._validate_expression(expr.function, ctx)
-            for arg in expr.args:
-                self._validate_expression(arg, ctx)
-            for kwarg_val in expr.kwargs.values():
-                self._validate_expression(kwarg_val, ctx)
-
-        elif isinstance(expr, IRBinaryOp):
-            self._validate_expression(expr.left, ctx)
-            self._validate_expression(expr.right, ctx)
-
-        elif isinstance(expr, IRUnaryOp):
-            self._validate_expression(expr.operand, ctx)
-
-        elif isinstance(expr, IRIdentifier):
-            # Check if identifier is defined
-            if not ctx.is_symbol_defined(expr.name):
-                # Could be a function or module reference
-                if expr.name not in ctx.functions:
-                    self.warnings.append(f"Undefined identifier: {expr.name}")
-
-        elif isinstance(expr, IRPropertyAccess):
-            self._validate_expression(expr.object, ctx)
-
-        elif isinstance(expr, IRIndex):
-            self._validate_expression(expr.object, ctx)
-            self._validate_expression(expr.index, ctx)
-
-        elif isinstance(expr, IRLambda):
-            ctx.enter_scope()
-            for param in expr.params:
-                ctx.define_symbol(param.name, param)
-            if isinstance(expr.body, list):
-                for stmt in expr.body:
-                    self._validate_statement(stmt, ctx)
-            else:
-                self._validate_expression(expr.body, ctx)
-            ctx.exit_scope()
-
-        elif isinstance(expr, (IRLiteral,)):
-            # Literals are always valid
-            pass
-
-        # Validate container expressions
-        from dsl.ir import IRArray, IRMap, IRTernary
-
-        if isinstance(expr, IRArray):
-            for elem in expr.elements:
-                self._validate_expression(elem, ctx)
-
-        elif isinstance(expr, IRMap):
-            for value in expr.entries.values():
-                self._validate_expression(value, ctx)
+        handler = self._dispatch_tables["expression"].get(expr.__class__)
+        if handler is None:
+            handler = self.handler_for("expression", expr.__class__)
+        handler(self, expr, ctx)
+
+    @dispatches(IRCall, table="expression")
+    def _validate_call(self, expr: IRCall, ctx: ValidationContext) -> None:
+        self._validate_expression(expr.function, ctx)
+        for arg in expr.args:
+            self._validate_expression(arg, ctx)
+        for kwarg_val in expr.kwargs.values():
+            self._validate_expression(kwarg_val, ctx)
+
+    @dispatches(IRBinaryOp, table="expression")
+    def _validate_binary_op(self, expr: IRBinaryOp, ctx: ValidationContext) -> None:
+        self._validate_expression(expr.left, ctx)
+        self._validate_expression(expr.right, ctx)
+
+    @dispatches(IRUnaryOp, table="expression")
+    def _validate_unary_op(self, expr: IRUnaryOp, ctx: ValidationContext) -> None:
+        self._validate_expression(expr.operand, ctx)
+
+    @dispatches(IRIdentifier, table="expression")
+    def _validate_identifier(self, expr: IRIdentifier, ctx: ValidationContext) -> None:
+        # Check if identifier is defined
+        if not ctx.is_symbol_defined(expr.name):
+            # Could be a function or module reference
+            if expr.name not in ctx.functions:
+                self.warnings.append(f"Undefined identifier: {expr.name}")
+
+    @dispatches(IRPropertyAccess, table="expression")
+    def _validate_property_access(self, expr: IRPropertyAccess, ctx: ValidationContext) -> None:
+        self._validate_expression(expr.object, ctx)
+
+    @dispatches(IRIndex, table="expression")
+    def _validate_index(self, expr: IRIndex, ctx: ValidationContext) -> None:
+        self._validate_expression(expr.object, ctx)
+        self._validate_expression(expr.index, ctx)
+
+    @dispatches(IRLambda, table="expression")
+    def _validate_lambda(self, expr: IRLambda, ctx: ValidationContext) -> None:
+        ctx.enter_scope()
+        for param in expr.params:
+            ctx.define_symbol(param.name, param)
+        if isinstance(expr.body, list):
+            for stmt in expr.body:
+                self._validate_statement(stmt, ctx)
+        else:
+            self._validate_expression(expr.body, ctx)
+        ctx.exit_scope()
 
-        elif isinstance(expr, IRTernary):
-            self._validate_expression(expr.condition, ctx)
-            self._validate_expression(expr.true_value, ctx)
-            self._validate_expression(expr.false_value, ctx)
+    @dispatches(IRArray, table="expression")
+    def _validate_array(self, expr: IRArray, ctx: ValidationContext) -> None:
+        for elem in expr.elements:
+            self._validate_expression(elem, ctx)
+
+    @dispatches(IRMap, table="expression")
+    def _validate_map(self, expr: IRMap, ctx: ValidationContext) -> None:
+        for value in expr.entries.values():
+            self._validate_expression(value, ctx)
+
+    @dispatches(IRTernary, table="expression")
+    def _validate_ternary(self, expr: IRTernary, ctx: ValidationContext) -> None:
+        self._validate_expression(expr.condition, ctx)
+        self._validate_expression(expr.true_value, ctx)
+        self._validate_expression(expr.false_value, ctx)
+
+    @dispatches(object, table="statement")
+    @dispatches(object, table="expression")
+    def _validate_nothing(self, node: IRNode, ctx: ValidationContext) -> None:
+        # Literals and node kinds without semantic rules are always valid
+        pass
 
 
 def validate_ir(module: IRModule, strict: bool = True) -> None:
@@ -0,0 +1,42 @@
+"""
+Compile-time contract levels for the code generators.
+
+`asl build --contracts=LEVEL` selects which contract clauses a generator
+emits:
+
+- "full": preconditions, postconditions (with their `old` captures) and
+  invariants
+- "pre": preconditions only
+- "none": no contract code at all
+
+Clauses left out at build time cost nothing at run time. The runtime
+ValidationMode still switches off the clauses that were emitted.
+"""
+
+from typing import List
+
+from dsl.ir import IRContractClause, IRFunction
+
+CONTRACT_LEVELS = ("none", "pre", "full")
+
+
+def check_contract_level(level: str) -> str:
+    """Return level, or raise ValueError if it is not a contract level."""
+    if level not in CONTRACT_LEVELS:
+        raise ValueError(f"Unknown contract level {level!r} (expected one of: {', '.join(CONTRACT_LEVELS)})")
+    return level
+
+
+def emitted_requires(func: IRFunction, level: str) -> List[IRContractClause]:
+    """Preconditions of func to generate at level."""
+    return func.requires if level != "none" else []
+
+
+def emitted_ensures(func: IRFunction, level: str) -> List[IRContractClause]:
+    """Postconditions of func to generate at level."""
+    return func.ensures if level == "full" else []
+
+
+def emits_invariants(level: str) -> bool:
+    """Whether class invariants are generated at level."""
+    return level == "full"
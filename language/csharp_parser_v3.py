@@ -20,7 +20,8 @@ from dsl.ir import (
     IRAssignment, IRIf, IRFor, IRWhile, IRSwitch, IRCase, IRTry, IRCatch, IRReturn, IRThrow,
     IRBreak, IRContinue,
     IRBinaryOp, IRIdentifier, IRLiteral, IRCall, IRArray, IRMap, IRLambda,
-    LiteralType, BinaryOperator
+    LiteralType, BinaryOperator,
+    intern_type,
 )
 
 
@@ -369,20 +370,20 @@ class CSharpParserV3:
         # Handle array types
         if type_str.endswith("[]"):
             element_type = type_str[:-2]
-            return IRType(name="array", args=[self._convert_type(element_type)])
+            return intern_type(name="array", generic_args=[self._convert_type(element_type)])
 
         # Handle generic types (e.g., List<T>, Dictionary<K, V>)
         if "<" in type_str:
             base_type = type_str.split("<")[0]
             if base_type in ["List", "IList", "IEnumerable"]:
-                return IRType(name="array")
+                return intern_type(name="array")
             elif base_type in ["Dictionary", "IDictionary"]:
-                return IRType(name="map")
-            return IRType(name=self.type_mapping.get(base_type, base_type))
+                return intern_type(name="map")
+            return intern_type(name=self.type_mapping.get(base_type, base_type))
 
         # Map to universal type
         universal_type = self.type_mapping.get(type_str, type_str)
-        return IRType(name=universal_type)
+        return intern_type(name=universal_type)
 
     def _map_operator(self, op: str) -> BinaryOperator:
         """Map C# operator to IR operator."""
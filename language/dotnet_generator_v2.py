@@ -575,6 +575,9 @@ class DotNetGeneratorV2:
             if self._is_async_call(stmt):
                 return [f"{self.indent()}await {expr};"]
             return [f"{self.indent()}{expr};"]
+        elif isinstance(stmt, IRAwait):
+            # Awaited expression statement
+            return [f"{self.indent()}{self._generate_expression(stmt)};"]
         else:
             return [f"{self.indent()}// Unknown statement: {type(stmt).__name__}"]
 
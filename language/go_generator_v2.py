@@ -657,7 +657,7 @@ class GoGeneratorV2:
             return [f"{self.indent()}continue"]
         elif isinstance(stmt, IRPass):
             return [f"{self.indent()}// pass"]
-        elif isinstance(stmt, IRCall):
+        elif isinstance(stmt, (IRCall, IRAwait)):
             # Expression statement
             expr = self._generate_expression(stmt)
             return [f"{self.indent()}{expr}"]
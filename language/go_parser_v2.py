@@ -51,6 +51,7 @@ from dsl.ir import (
     BinaryOperator,
     LiteralType,
     SourceLocation,
+    intern_type,
 )
 from dsl.type_system import TypeSystem
 
@@ -237,20 +238,19 @@ class GoParserV2:
         # Handle pointers: *Type → Type? (optional)
         if go_type.startswith('*'):
             base_type = self._go_type_to_ir(go_type[1:])
-            base_type.is_optional = True
-            return base_type
+            return intern_type(base_type.name, base_type.generic_args, True, base_type.union_types)
 
         # Handle arrays/slices: []Type → array<Type>
         if go_type.startswith('[]'):
             elem_type = self._go_type_to_ir(go_type[2:])
-            return IRType(name="array", generic_args=[elem_type])
+            return intern_type(name="array", generic_args=[elem_type])
 
         # Handle maps: map[K]V → map<K, V>
         map_match = re.match(r'map\[([^]]+)\](.+)', go_type)
         if map_match:
             key_type = self._go_type_to_ir(map_match.group(1))
             val_type = self._go_type_to_ir(map_match.group(2))
-            return IRType(name="map", generic_args=[key_type, val_type])
+            return intern_type(name="map", generic_args=[key_type, val_type])
 
         # Map Go primitive types to IR types
         type_map = {
@@ -276,10 +276,10 @@ class GoParserV2:
         }
 
         if go_type in type_map:
-            return IRType(name=type_map[go_type])
+            return intern_type(name=type_map[go_type])
 
         # Custom type (User, Payment, etc.)
-        return IRType(name=go_type)
+        return intern_type(name=go_type)
 
     def _extract_functions(self, source: str) -> tuple[List[IRFunction], Dict[str, List[IRFunction]]]:
         """
@@ -499,13 +499,13 @@ class GoParserV2:
                     return self._go_type_to_ir(type_str)
 
             # All errors? Return error type
-            return IRType(name='string')
+            return intern_type(name='string')
 
         # Single return type
         if return_str != 'error':
             return self._go_type_to_ir(return_str)
 
-        return IRType(name='string')
+        return intern_type(name='string')
 
     def _extract_function_body(self, source: str, func_start: int) -> str:
         """Extract function body from source."""
@@ -44,6 +44,7 @@ from dsl.ir import (
     IRType,
     IRTypeDefinition,
     LiteralType,
+    intern_type,
 )
 from dsl.type_system import TypeSystem
 
@@ -189,12 +190,12 @@ class GoParserV3:
         # Convert return type
         results = func_data.get("results", [])
         if not results or len(results) == 0:
-            return_type = IRType(name="void")
+            return_type = intern_type(name="void")
         elif len(results) == 1:
             return_type = self._convert_go_type(results[0]["type"])
         else:
             # Multiple returns - will need special handling
-            return_type = IRType(name="tuple")
+            return_type = intern_type(name="tuple")
 
         # Convert body statements
         body = []
@@ -222,7 +223,7 @@ class GoParserV3:
         # Handle slices
         if go_type.startswith("[]"):
             element_type = go_type[2:]
-            return IRType(
+            return intern_type(
                 name="array",
                 generic_args=[self._convert_go_type(element_type)]
             )
@@ -231,7 +232,7 @@ class GoParserV3:
         if go_type.startswith("map["):
             # Extract key and value types
             # Simplified - would need proper parsing for complex types
-            return IRType(name="map")
+            return intern_type(name="map")
 
         # Map Go primitives to universal types
         type_mapping = {
@@ -245,7 +246,7 @@ class GoParserV3:
             "interface{}": "any",
         }
 
-        return IRType(name=type_mapping.get(go_type, go_type))
+        return intern_type(name=type_mapping.get(go_type, go_type))
 
     def _extract_receiver_type(self, receiver_str: str) -> str:
         """Extract clean type name from receiver (e.g., '*Calculator' -> 'Calculator')."""
@@ -70,6 +70,64 @@ from dsl.ir import (
     UnaryOperator,
 )
 from dsl.type_system import TypeSystem
+from language.contract_levels import (
+    check_contract_level,
+    emitted_ensures,
+    emitted_requires,
+    emits_invariants,
+)
+
+# Emitted once into modules with @pure / @memoize functions. Arguments are
+# keyed by their JSON form; calls with arguments JSON cannot represent
+# faithfully (functions, undefined, NaN, class instances) bypass the cache.
+MEMOIZE_HELPER = """\
+/**
+ * Wrap a pure function in a bounded LRU cache of its results.
+ * The wrapper exposes cacheInfo() (hits, misses, evictions, size, maxSize)
+ * and cacheClear().
+ */
+function __memoize(fn, maxSize) {
+    const cache = new Map();
+    const info = { hits: 0, misses: 0, evictions: 0, maxSize };
+    const exact = (k, v) => {
+        if (typeof v === 'function' || typeof v === 'symbol' || v === undefined
+            || (typeof v === 'number' && !Number.isFinite(v))
+            || (v !== null && typeof v === 'object' && !Array.isArray(v)
+                && Object.getPrototypeOf(v) !== Object.prototype && Object.getPrototypeOf(v) !== null)) {
+            throw new TypeError('unkeyable argument');
+        }
+        return v;
+    };
+    const memoized = function (...args) {
+        let key;
+        try {
+            key = JSON.stringify(args, exact);
+        } catch (e) {
+            return fn.apply(this, args);
+        }
+        if (cache.has(key)) {
+            const result = cache.get(key);
+            cache.delete(key);
+            cache.set(key, result);
+            info.hits++;
+            return result;
+        }
+        info.misses++;
+        const result = fn.apply(this, args);
+        cache.set(key, result);
+        if (cache.size > maxSize) {
+            cache.delete(cache.keys().next().value);
+            info.evictions++;
+        }
+        return result;
+    };
+    memoized.cacheInfo = () => ({ ...info, size: cache.size });
+    memoized.cacheClear = () => {
+        cache.clear();
+        info.hits = info.misses = info.evictions = 0;
+    };
+    return memoized;
+}"""
 
 
 class JavaScriptGenerator:
@@ -83,8 +141,9 @@ class JavaScriptGenerator:
     - Modern JS formatting
     """
 
-    def __init__(self):
+    def __init__(self, contracts: str = "full"):
         self.type_system = TypeSystem()
+        self.contracts = check_contract_level(contracts)  # Contract clauses to emit (see language.contract_levels)
         self.indent_level = 0
         self.indent_size = 4  # 4 spaces
         self.required_imports: Set[str] = set()
@@ -264,6 +323,12 @@ class JavaScriptGenerator:
         if module.imports:
             lines.append("")
 
+        # Result cache helper for @pure functions
+        if any(func.memoize is not None for func in module.functions):
+            lines.append(MEMOIZE_HELPER)
+            lines.append("")
+            lines.append("")
+
         # Enums
         for enum in module.enums:
             lines.append(self.generate_enum(enum))
@@ -352,7 +417,7 @@ class JavaScriptGenerator:
         """Collect all required imports from contract usage."""
         # Check if any functions have contracts
         for func in module.functions:
-            if func.requires or func.ensures:
+            if emitted_requires(func, self.contracts) or emitted_ensures(func, self.contracts):
                 # Add contract runtime import
                 self.required_imports.add("const { ContractViolationError, shouldCheckPreconditions, shouldCheckPostconditions } = require('./contracts.js');")
                 break
@@ -360,10 +425,10 @@ class JavaScriptGenerator:
         # Check classes
         for cls in module.classes:
             for method in cls.methods:
-                if method.requires or method.ensures:
+                if emitted_requires(method, self.contracts) or emitted_ensures(method, self.contracts):
                     self.required_imports.add("const { ContractViolationError, shouldCheckPreconditions, shouldCheckPostconditions } = require('./contracts.js');")
                     break
-            if cls.invariants:
+            if cls.invariants and emits_invariants(self.contracts):
                 self.required_imports.add("const { ContractViolationError, shouldCheckPreconditions, shouldCheckPostconditions } = require('./contracts.js');")
 
     def generate_import(self, imp: IRImport) -> str:
@@ -697,6 +762,10 @@ class JavaScriptGenerator:
         self.decrease_indent()
         lines.append("}")
 
+        # @pure: rebind the name so recursive calls and exports use the cache
+        if func.memoize is not None:
+            lines.append(f"{func.name} = __memoize({func.name}, {func.memoize});")
+
         # Clear variable types
         self.variable_types.clear()
 
@@ -711,10 +780,12 @@ class JavaScriptGenerator:
         precondition_lines = []
         postcondition_setup = []
         postcondition_checks = []
+        requires = emitted_requires(func, self.contracts)
+        ensures = emitted_ensures(func, self.contracts)
 
         # Preconditions
-        if func.requires:
-            for clause in func.requires:
+        if requires:
+            for clause in requires:
                 condition_expr = self.generate_expression(clause.expression)
                 expr_str = self._expression_to_string(clause.expression)
 
@@ -741,9 +812,9 @@ class JavaScriptGenerator:
                 precondition_lines.append(check)
 
         # Postconditions
-        if func.ensures:
+        if ensures:
             # Find old expressions
-            old_exprs = self._find_old_expressions(func.ensures)
+            old_exprs = self._find_old_expressions(ensures)
 
             # Capture old values
             for old_expr in old_exprs:
@@ -752,7 +823,7 @@ class JavaScriptGenerator:
                 postcondition_setup.append(f"const __old_{var_name} = {expr_code};")
 
             # Generate postcondition checks
-            for clause in func.ensures:
+            for clause in ensures:
                 condition_expr = self._replace_result_with_underscore(clause.expression)
                 expr_str = self._expression_to_string(clause.expression)
 
@@ -884,7 +955,7 @@ class JavaScriptGenerator:
             return f"{self.indent()}continue;"
         elif isinstance(stmt, IRPass):
             return f"{self.indent()}// pass"
-        elif isinstance(stmt, IRCall):
+        elif isinstance(stmt, (IRCall, IRAwait)):
             return f"{self.indent()}{self.generate_expression(stmt)};"
         elif isinstance(stmt, IRMap):
             # IRMap as statement is a parser bug workaround marker - skip it
@@ -1327,15 +1398,16 @@ class JavaScriptGenerator:
 # ============================================================================
 
 
-def generate_javascript(module: IRModule) -> str:
+def generate_javascript(module: IRModule, contracts: str = "full") -> str:
     """
     Generate JavaScript code from IR module.
 
     Args:
         module: IR module to convert
+        contracts: Contract clauses to emit: "full", "pre" or "none"
 
     Returns:
         JavaScript source code as string
     """
-    generator = JavaScriptGenerator()
+    generator = JavaScriptGenerator(contracts=contracts)
     return generator.generate(module)
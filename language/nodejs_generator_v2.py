@@ -602,7 +602,7 @@ class NodeJSGeneratorV2:
             return f"{self.indent()}continue;"
         elif isinstance(stmt, IRPass):
             return f"{self.indent()}// pass"
-        elif isinstance(stmt, IRCall):
+        elif isinstance(stmt, (IRCall, IRAwait)):
             # Expression statement (function call)
             return f"{self.indent()}{self.generate_expression(stmt)};"
         else:
@@ -52,6 +52,7 @@ from dsl.ir import (
     LiteralType,
     SourceLocation,
     UnaryOperator,
+    intern_type,
 )
 from dsl.type_system import TypeSystem
 
@@ -401,9 +402,9 @@ class NodeJSParserV2:
                 # Type inference from default value
                 if default_value and isinstance(default_value, IRLiteral):
                     type_info = self.type_system.infer_from_literal(default_value)
-                    param_type = IRType(name=type_info.pw_type)
+                    param_type = intern_type(name=type_info.pw_type)
                 else:
-                    param_type = IRType(name="any")
+                    param_type = intern_type(name="any")
 
             parameters.append(
                 IRParameter(
@@ -978,10 +979,10 @@ class NodeJSParserV2:
         # Handle Array<T> or T[]
         if type_str.startswith('Array<') and type_str.endswith('>'):
             inner = type_str[6:-1]
-            return IRType(name="array", generic_args=[self._parse_type(inner)])
+            return intern_type(name="array", generic_args=[self._parse_type(inner)])
         if type_str.endswith('[]'):
             inner = type_str[:-2]
-            return IRType(name="array", generic_args=[self._parse_type(inner)])
+            return intern_type(name="array", generic_args=[self._parse_type(inner)])
 
         # Normalize TypeScript types to PW types
         type_map = {
@@ -995,7 +996,7 @@ class NodeJSParserV2:
         }
 
         pw_type = type_map.get(type_str.lower(), type_str)
-        return IRType(name=pw_type)
+        return intern_type(name=pw_type)
 
     # ========================================================================
     # Utility Functions
@@ -66,16 +66,32 @@ from dsl.ir import (
     IRType,
     IRTypeDefinition,
     IRUnaryOp,
+    IRVisitor,
     IRWhile,
     IRWith,
     LiteralType,
     UnaryOperator,
+    dispatches,
 )
 from dsl.type_system import TypeSystem
+from language.contract_levels import (
+    check_contract_level,
+    emitted_ensures,
+    emitted_requires,
+    emits_invariants,
+)
 from language.library_mapping import LibraryMapper
 
+# Generated contract checks test the mode flags of this module
+CONTRACTS_MODULE = "_al_contracts"
+CONTRACTS_MODULE_IMPORT = f"from assertlang.runtime import contracts as {CONTRACTS_MODULE}"
+# Module-level ids of the generated module's contract clauses (see register_clauses)
+CLAUSE_TABLE = "_AL_CLAUSES"
+# Module-level validation mode handle (see module_mode)
+MODULE_MODE = "_AL_MODE"
+
 
-class PythonGeneratorV2:
+class PythonGeneratorV2(IRVisitor):
     """
     Generate idiomatic Python code from IR.
 
@@ -86,9 +102,10 @@ class PythonGeneratorV2:
     - Python-specific idioms
     """
 
-    def __init__(self):
+    def __init__(self, contracts: str = "full"):
         self.type_system = TypeSystem()
         self.library_mapper = LibraryMapper()
+        self.contracts = check_contract_level(contracts)  # Contract clauses to emit (see language.contract_levels)
         self.indent_level = 0
         self.indent_size = 4  # PEP 8 standard
         self.required_imports: Set[str] = set()
@@ -99,6 +116,8 @@ class PythonGeneratorV2:
         self.method_return_types: Dict[str, Dict[str, IRType]] = {}  # Track method return types by class
         self.current_class: Optional[str] = None  # Track current class being generated (for 'self' type inference)
         self.capturing_returns = False  # Track if we should capture return values for postconditions
+        self.type_hint_cache: Dict[IRType, str] = {}  # Rendered hints for interned types
+        self.clause_table: List[str] = []  # Contract clause entries, indexed like CLAUSE_TABLE
 
     # ========================================================================
     # Indentation Management
@@ -132,6 +151,7 @@ class PythonGeneratorV2:
             Python source code as string
         """
         self.required_imports.clear()
+        self.clause_table = []
         lines = []
 
         # BUG FIX v0.1.5: Add version header
@@ -211,6 +231,9 @@ class PythonGeneratorV2:
         if module.imports:
             lines.append("")
 
+        # Contract clause table goes here, once the clauses are known
+        clause_table_index = len(lines)
+
         # TypeVar definitions (module-level, before any classes/functions that use them)
         if type_vars:
             for type_var in sorted(type_vars):
@@ -247,6 +270,17 @@ class PythonGeneratorV2:
             lines.append("")
             lines.append("")
 
+        if self.clause_table:
+            lines[clause_table_index:clause_table_index] = [
+                "# Contract clauses: (kind, function, class, clause, expression)",
+                f"{CLAUSE_TABLE} = {CONTRACTS_MODULE}.register_clauses((",
+                *(f"{' ' * self.indent_size}{entry}," for entry in self.clause_table),
+                "))",
+                f"{MODULE_MODE} = {CONTRACTS_MODULE}.module_mode(__name__)",
+                "",
+                "",
+            ]
+
         # Clean up and return
         result = "\n".join(lines)
         # Remove excessive blank lines
@@ -310,12 +344,16 @@ class PythonGeneratorV2:
             if func.return_type:
                 all_types.append(func.return_type)
 
+            if func.memoize is not None:
+                self.required_imports.add("from assertlang.runtime.memo import memoize")
+
             # Check if function has contracts - add contract imports if needed
-            if func.requires or func.ensures:
-                if func.requires:
-                    self.required_imports.add("from assertlang.runtime.contracts import check_precondition")
-                if func.ensures:
-                    self.required_imports.add("from assertlang.runtime.contracts import check_postcondition")
+            requires = emitted_requires(func, self.contracts)
+            ensures = emitted_ensures(func, self.contracts)
+            if requires or ensures:
+                self.required_imports.add(CONTRACTS_MODULE_IMPORT)
+                self.required_imports.add("from assertlang.runtime.contracts import check_clause")
+                self.required_imports.add("from assertlang.runtime.contracts import scoped_mode")
 
         # Collect types from classes
         for cls in module.classes:
@@ -330,14 +368,15 @@ class PythonGeneratorV2:
                     all_types.append(method.return_type)
 
                 # Check if method has contracts
-                if method.requires or method.ensures:
-                    if method.requires:
-                        self.required_imports.add("from assertlang.runtime.contracts import check_precondition")
-                    if method.ensures:
-                        self.required_imports.add("from assertlang.runtime.contracts import check_postcondition")
+                requires = emitted_requires(method, self.contracts)
+                ensures = emitted_ensures(method, self.contracts)
+                if requires or ensures:
+                    self.required_imports.add(CONTRACTS_MODULE_IMPORT)
+                    self.required_imports.add("from assertlang.runtime.contracts import check_clause")
+                    self.required_imports.add("from assertlang.runtime.contracts import scoped_mode")
 
             # Check if class has invariants
-            if cls.invariants:
+            if cls.invariants and emits_invariants(self.contracts):
                 self.required_imports.add("from assertlang.runtime.contracts import check_invariant")
 
         # Collect types from type definitions
@@ -440,7 +479,7 @@ class PythonGeneratorV2:
                     for s in stmt.body:
                         check_statement(s)
 
-            elif isinstance(stmt, IRCall):
+            elif isinstance(stmt, (IRCall, IRAwait)):
                 check_expression(stmt)
 
         # Check all functions
@@ -849,6 +888,8 @@ class PythonGeneratorV2:
         decorators = func.decorators if hasattr(func, 'decorators') else func.metadata.get("decorators", [])
         for dec in decorators:
             lines.append(f"@{dec}")
+        if func.memoize is not None:
+            lines.append(f"@memoize(maxsize={func.memoize})")
 
         # Signature
         params = []
@@ -883,7 +924,7 @@ class PythonGeneratorV2:
         if preconditions or postcondition_setup or postcondition_checks:
             # Precondition checks (at function entry)
             for check in preconditions:
-                lines.append(f"{self.indent()}{check}")
+                lines.append(self._indent_lines(check, self.indent()))
 
             # Capture old values (before function body)
             for old_capture in postcondition_setup:
@@ -917,7 +958,7 @@ class PythonGeneratorV2:
 
                 # Postcondition checks
                 for check in postcondition_checks:
-                    lines.append(f"{self.indent()}{check}")
+                    lines.append(self._indent_lines(check, self.indent()))
 
                 self.decrease_indent()
 
@@ -957,7 +998,15 @@ class PythonGeneratorV2:
 
     def generate_type(self, ir_type: IRType) -> str:
         """Generate Python type hint from IR type."""
-        return self.type_system.map_to_language(ir_type, "python")
+        if not ir_type.is_interned:
+            return self.type_system.map_to_language(ir_type, "python")
+
+        # Interned types are immutable, so their rendering can be cached
+        hint = self.type_hint_cache.get(ir_type)
+        if hint is None:
+            hint = self.type_system.map_to_language(ir_type, "python")
+            self.type_hint_cache[ir_type] = hint
+        return hint
 
     # ========================================================================
     # Statement Generation
@@ -989,7 +1038,7 @@ class PythonGeneratorV2:
             return f"{self.indent()}pass"
         elif isinstance(stmt, IRWith):
             return self.generate_with(stmt)
-        elif isinstance(stmt, IRCall):
+        elif isinstance(stmt, (IRCall, IRAwait)):
             # Expression statement
             return f"{self.indent()}{self.generate_expression(stmt)}"
         elif isinstance(stmt, IRMap):
@@ -1300,94 +1349,92 @@ class PythonGeneratorV2:
 
     def generate_expression(self, expr: IRExpression) -> str:
         """Generate Python expression from IR."""
-        if isinstance(expr, IRLiteral):
-            return self.generate_literal(expr)
-        elif isinstance(expr, IRIdentifier):
-            # Special case: enum variant without data (None, True, False)
-            if expr.name in ("None", "True", "False"):
-                return f"{expr.name}_()"
-            return expr.name
-        elif isinstance(expr, IRAwait):
-            inner = self.generate_expression(expr.expression)
-            return f"await {inner}"
-        elif isinstance(expr, IRBinaryOp):
-            return self.generate_binary_op(expr)
-        elif isinstance(expr, IRUnaryOp):
-            return self.generate_unary_op(expr)
-        elif isinstance(expr, IRCall):
-            return self.generate_call(expr)
-        elif isinstance(expr, IRPropertyAccess):
-            obj = self.generate_expression(expr.object)
-            # Special case: .length property should use len() in Python
-            if expr.property == "length":
-                return f"len({obj})"
+        handler = self._dispatch_tables["expression"].get(expr.__class__)
+        if handler is None:
+            handler = self.handler_for("expression", expr.__class__)
+        return handler(self, expr)
+
+    @dispatches(object, table="expression")
+    def generate_unknown(self, expr: IRExpression) -> str:
+        """Placeholder for expression kinds without a Python mapping."""
+        return f"<unknown: {type(expr).__name__}>"
+
+    @dispatches(IRIdentifier, table="expression")
+    def generate_identifier(self, expr: IRIdentifier) -> str:
+        """Generate identifier reference."""
+        # Special case: enum variant without data (None, True, False)
+        if expr.name in ("None", "True", "False"):
+            return f"{expr.name}_()"
+        return expr.name
+
+    @dispatches(IRAwait, table="expression")
+    def generate_await(self, expr: IRAwait) -> str:
+        """Generate await expression."""
+        inner = self.generate_expression(expr.expression)
+        return f"await {inner}"
+
+    @dispatches(IRPropertyAccess, table="expression")
+    def generate_property_access(self, expr: IRPropertyAccess) -> str:
+        """Generate property access (dict key for maps, attribute for classes)."""
+        obj = self.generate_expression(expr.object)
+        # Special case: .length property should use len() in Python
+        if expr.property == "length":
+            return f"len({obj})"
+
+        # Special case: enum variant without data (Option.None, Result.Ok, etc.)
+        if expr.property in ("None", "True", "False"):
+            # Option.None → None_()
+            return f"{expr.property}_()"
+
+        # Determine if object is a map/dict (use bracket notation) or class (use dot notation)
+        is_map = self._is_map_type(expr.object)
+
+        if is_map:
+            # Generate dictionary access for maps: obj["field"]
+            return f'{obj}["{expr.property}"]'
+        else:
+            # Generate attribute access for classes: obj.field
+            return f"{obj}.{expr.property}"
 
-            # Special case: enum variant without data (Option.None, Result.Ok, etc.)
-            if expr.property in ("None", "True", "False"):
-                # Option.None → None_()
-                return f"{expr.property}_()"
+    @dispatches(IRIndex, table="expression")
+    def generate_index(self, expr: IRIndex) -> str:
+        """Generate index access (.get() for maps, [index] for arrays)."""
+        obj = self.generate_expression(expr.object)
+        index = self.generate_expression(expr.index)
 
-            # Determine if object is a map/dict (use bracket notation) or class (use dot notation)
-            is_map = self._is_map_type(expr.object)
+        # Determine if object is a map/dict (use .get()) or array (use [index])
+        is_map = False
 
-            if is_map:
-                # Generate dictionary access for maps: obj["field"]
-                return f'{obj}["{expr.property}"]'
-            else:
-                # Generate attribute access for classes: obj.field
-                return f"{obj}.{expr.property}"
-        elif isinstance(expr, IRIndex):
-            obj = self.generate_expression(expr.object)
-            index = self.generate_expression(expr.index)
-
-            # Determine if object is a map/dict (use .get()) or array (use [index])
-            is_map = False
-
-            # Check if object is an identifier with known type (e.g., function parameter)
-            if isinstance(expr.object, IRIdentifier):
-                var_name = expr.object.name
-                if var_name in self.variable_types:
-                    var_type = self.variable_types[var_name]
-                    # Check if type is "map" or "dict"
-                    if var_type.name in ("map", "dict", "Dict", "dictionary"):
-                        is_map = True
-
-            # Check if object is a property access (e.g., self.users[key])
-            elif isinstance(expr.object, IRPropertyAccess):
-                # Check if the property is a known map type
-                prop_name = expr.object.property
-                if prop_name in self.property_types:
-                    prop_type = self.property_types[prop_name]
-                    if prop_type.name in ("map", "dict", "Dict", "dictionary"):
-                        is_map = True
-
-            # If not determined by variable type, use index type as heuristic
-            if not is_map and isinstance(expr.index, IRLiteral) and expr.index.literal_type == LiteralType.STRING:
-                # String key → likely map/dict access
-                is_map = True
-
-            # Generate safe map access with .get() or regular array access
-            if is_map:
-                return f"{obj}.get({index})"
-            else:
-                return f"{obj}[{index}]"
-        elif isinstance(expr, IRArray):
-            return self.generate_array(expr)
-        elif isinstance(expr, IRMap):
-            return self.generate_dict(expr)
-        elif isinstance(expr, IRTernary):
-            return self.generate_ternary(expr)
-        elif isinstance(expr, IRLambda):
-            return self.generate_lambda(expr)
-        elif isinstance(expr, IRComprehension):
-            return self.generate_comprehension(expr)
-        elif isinstance(expr, IRPatternMatch):
-            return self.generate_pattern_match(expr)
-        elif isinstance(expr, IROldExpr):
-            return self.generate_old_expr(expr)
+        # Check if object is an identifier with known type (e.g., function parameter)
+        if isinstance(expr.object, IRIdentifier):
+            var_name = expr.object.name
+            if var_name in self.variable_types:
+                var_type = self.variable_types[var_name]
+                # Check if type is "map" or "dict"
+                if var_type.name in ("map", "dict", "Dict", "dictionary"):
+                    is_map = True
+
+        # Check if object is a property access (e.g., self.users[key])
+        elif isinstance(expr.object, IRPropertyAccess):
+            # Check if the property is a known map type
+            prop_name = expr.object.property
+            if prop_name in self.property_types:
+                prop_type = self.property_types[prop_name]
+                if prop_type.name in ("map", "dict", "Dict", "dictionary"):
+                    is_map = True
+
+        # If not determined by variable type, use index type as heuristic
+        if not is_map and isinstance(expr.index, IRLiteral) and expr.index.literal_type == LiteralType.STRING:
+            # String key → likely map/dict access
+            is_map = True
+
+        # Generate safe map access with .get() or regular array access
+        if is_map:
+            return f"{obj}.get({index})"
         else:
-            return f"<unknown: {type(expr).__name__}>"
+            return f"{obj}[{index}]"
 
+    @dispatches(IRLiteral, table="expression")
     def generate_literal(self, lit: IRLiteral) -> str:
         """Generate Python literal."""
         if lit.literal_type == LiteralType.STRING:
@@ -1575,6 +1622,7 @@ class PythonGeneratorV2:
 
         return None
 
+    @dispatches(IRBinaryOp, table="expression")
     def generate_binary_op(self, expr: IRBinaryOp) -> str:
         """Generate binary operation."""
         # Special handling for division: use // for integer division
@@ -1643,6 +1691,7 @@ class PythonGeneratorV2:
         op = op_map.get(expr.op, "+")
         return f"({left} {op} {right})"
 
+    @dispatches(IRUnaryOp, table="expression")
     def generate_unary_op(self, expr: IRUnaryOp) -> str:
         """Generate unary operation."""
         operand = self.generate_expression(expr.operand)
@@ -1658,6 +1707,7 @@ class PythonGeneratorV2:
         else:
             return operand
 
+    @dispatches(IRCall, table="expression")
     def generate_call(self, expr: IRCall) -> str:
         """Generate function call."""
         # STDLIB TRANSLATION: Translate stdlib calls to Python equivalents
@@ -1730,11 +1780,13 @@ class PythonGeneratorV2:
         all_args = args + kwargs
         return f"{func}({', '.join(all_args)})"
 
+    @dispatches(IRArray, table="expression")
     def generate_array(self, expr: IRArray) -> str:
         """Generate list literal."""
         elements = [self.generate_expression(el) for el in expr.elements]
         return f"[{', '.join(elements)}]"
 
+    @dispatches(IRMap, table="expression")
     def generate_dict(self, expr: IRMap) -> str:
         """Generate dict literal."""
         if not expr.entries:
@@ -1743,6 +1795,7 @@ class PythonGeneratorV2:
         entries = [f'"{k}": {self.generate_expression(v)}' for k, v in expr.entries.items()]
         return "{" + ", ".join(entries) + "}"
 
+    @dispatches(IRTernary, table="expression")
     def generate_ternary(self, expr: IRTernary) -> str:
         """Generate ternary expression (Python's if-else)."""
         true_val = self.generate_expression(expr.true_value)
@@ -1750,6 +1803,7 @@ class PythonGeneratorV2:
         false_val = self.generate_expression(expr.false_value)
         return f"{true_val} if {cond} else {false_val}"
 
+    @dispatches(IRComprehension, table="expression")
     def generate_comprehension(self, expr: IRComprehension) -> str:
         """
         Generate Python comprehension from IR.
@@ -1793,6 +1847,7 @@ class PythonGeneratorV2:
             target = self.generate_expression(expr.target)
             return f"[{target} for {iterator} in {iterable}{condition_str}]"
 
+    @dispatches(IRLambda, table="expression")
     def generate_lambda(self, expr: IRLambda) -> str:
         """Generate lambda expression."""
         params = ", ".join(p.name for p in expr.params)
@@ -1804,6 +1859,7 @@ class PythonGeneratorV2:
             body = self.generate_expression(expr.body)
             return f"lambda {params}: {body}"
 
+    @dispatches(IRPatternMatch, table="expression")
     def generate_pattern_match(self, expr: IRPatternMatch) -> str:
         """
         Generate pattern matching expression.
@@ -1834,6 +1890,7 @@ class PythonGeneratorV2:
         else:
             return f"isinstance({value}, {self.generate_expression(expr.pattern)})"
 
+    @dispatches(IROldExpr, table="expression")
     def generate_old_expr(self, expr: IROldExpr) -> str:
         """
         Generate 'old' expression for postconditions.
@@ -1900,76 +1957,107 @@ class PythonGeneratorV2:
         precondition_lines = []
         postcondition_setup = []
         postcondition_checks = []
-
-        # Generate precondition checks
-        if func.requires:
-            self.required_imports.add("from assertlang.runtime.contracts import check_precondition")
-
-            for clause in func.requires:
+        step = " " * self.indent_size
+        requires = emitted_requires(func, self.contracts)
+        ensures = emitted_ensures(func, self.contracts)
+
+        if requires or ensures:
+            self.required_imports.add(CONTRACTS_MODULE_IMPORT)
+            self.required_imports.add("from assertlang.runtime.contracts import check_clause")
+            self.required_imports.add("from assertlang.runtime.contracts import scoped_mode")
+            # Resolve the mode once per call: the scope's, else the module's.
+            # It then holds for the whole call, so old values are captured
+            # exactly when the checks at exit will run.
+            precondition_lines.append(f"__mode = scoped_mode({MODULE_MODE}.flags)")
+
+        # Generate precondition checks, all behind one test of the mode
+        # so nothing about a clause is evaluated while checks are off
+        if requires:
+            checks = []
+            for clause in requires:
                 condition_expr = self.generate_expression(clause.expression)
                 expr_str = self._expression_to_string(clause.expression)
 
-                # Build context dict with parameter values
-                context_items = []
-                for param in func.params:
-                    context_items.append(f'"{param.name}": {param.name}')
-
-                context_str = "{" + ", ".join(context_items) + "}" if context_items else "None"
+                # Name the parameters to report; their values are only read
+                # if the check fails (see ViolationContext)
+                context_str = self._context_names([f'"{param.name}"' for param in func.params])
 
+                clause_id = self._register_clause("requires", func.name, class_name, clause.name, expr_str)
                 check_call = (
-                    f"check_precondition(\n"
+                    f"check_clause(\n"
                     f"    {condition_expr},\n"
-                    f'    "{clause.name}",\n'
-                    f'    "{expr_str}",\n'
-                    f'    "{func.name}",\n'
+                    f"    {clause_id},\n"
+                    f"    context={context_str}\n)"
                 )
-                if class_name:
-                    check_call += f'    class_name="{class_name}",\n'
-                check_call += f"    context={context_str}\n)"
+                checks.append(self._sampled(check_call, clause_id, step))
 
-                precondition_lines.append(check_call)
+            precondition_lines.append("if __mode.preconditions:")
+            precondition_lines.extend(self._indent_lines(check, step) for check in checks)
 
         # Generate postcondition checking code
-        if func.ensures:
-            self.required_imports.add("from assertlang.runtime.contracts import check_postcondition")
-
+        if ensures:
             # Find all 'old' expressions that need capturing
-            old_exprs = self._find_old_expressions(func.ensures)
+            old_exprs = self._find_old_expressions(ensures)
 
             # Capture old values before function body
+            if old_exprs:
+                postcondition_setup.append("if __mode.postconditions:")
             for old_expr in old_exprs:
                 expr_code = self.generate_expression(old_expr)
                 var_name = expr_code.replace(".", "_").replace("[", "_").replace("]", "").replace("(", "").replace(")", "")
-                postcondition_setup.append(f"__old_{var_name} = {expr_code}")
+                postcondition_setup.append(f"{step}__old_{var_name} = {expr_code}")
 
             # Generate postcondition checks (to be inserted after function body)
-            for clause in func.ensures:
+            postcondition_checks.append("if __mode.postconditions:")
+            # __result as stored in the frame (mangled inside a class body)
+            result_local = f"_{class_name.lstrip('_')}__result" if class_name else "__result"
+            for clause in ensures:
                 # Replace 'result' identifier with '__result' in expression
                 condition_expr = self._replace_result_with_underscore(clause.expression)
                 expr_str = self._expression_to_string(clause.expression)
 
-                # Build context with result and parameters
-                context_items = ['("result", __result)']
-                for param in func.params:
-                    context_items.append(f'("{param.name}", {param.name})')
-
-                context_str = "dict([" + ", ".join(context_items) + "])"
+                # Name the result and parameters to report
+                context_str = self._context_names(
+                    [f'("result", "{result_local}")'] + [f'"{param.name}"' for param in func.params]
+                )
 
+                clause_id = self._register_clause("ensures", func.name, class_name, clause.name, expr_str)
                 check_call = (
-                    f"check_postcondition(\n"
+                    f"check_clause(\n"
                     f"    {condition_expr},\n"
-                    f'    "{clause.name}",\n'
-                    f'    "{expr_str}",\n'
-                    f'    "{func.name}",\n'
+                    f"    {clause_id},\n"
+                    f"    context={context_str}\n)"
                 )
-                if class_name:
-                    check_call += f'    class_name="{class_name}",\n'
-                check_call += f"    context={context_str}\n)"
-
-                postcondition_checks.append(check_call)
+                postcondition_checks.append(self._indent_lines(self._sampled(check_call, clause_id, step), step))
 
         return precondition_lines, postcondition_setup, postcondition_checks
 
+    def _register_clause(
+        self, kind: str, function: str, class_name: Optional[str], clause: str, expression: str
+    ) -> str:
+        """Add a clause to the module's clause table; returns its id expression."""
+        owner = f'"{class_name}"' if class_name else "None"
+        self.clause_table.append(f'("{kind}", "{function}", {owner}, "{clause}", "{expression}")')
+        return f"{CLAUSE_TABLE}[{len(self.clause_table) - 1}]"
+
+    @staticmethod
+    def _sampled(check_call: str, clause_id: str, step: str) -> str:
+        """Guard a clause check so SAMPLED mode checks it on sampled calls only."""
+        guard = f"if not __mode.sampling or {CONTRACTS_MODULE}.sample_clause({clause_id}):"
+        return guard + "\n" + PythonGeneratorV2._indent_lines(check_call, step)
+
+    @staticmethod
+    def _context_names(entries: List[str]) -> str:
+        """Constant tuple of violation context entries, or None."""
+        if not entries:
+            return "None"
+        return "(" + ", ".join(entries) + ("," if len(entries) == 1 else "") + ")"
+
+    @staticmethod
+    def _indent_lines(code: str, prefix: str) -> str:
+        """Prefix every line of a multi-line snippet."""
+        return "\n".join(prefix + line for line in code.split("\n"))
+
     def _replace_result_with_underscore(self, expr: IRExpression) -> str:
         """
         Replace 'result' identifier with '__result' in postcondition expressions.
@@ -2062,12 +2150,13 @@ class PythonGeneratorV2:
 # ============================================================================
 
 
-def generate_python(module: IRModule) -> str:
+def generate_python(module: IRModule, contracts: str = "full") -> str:
     """
     Generate Python code from IR module.
 
     Args:
         module: IR module to convert
+        contracts: Contract clauses to emit: "full", "pre" or "none"
 
     Returns:
         Python source code as string
@@ -2084,5 +2173,5 @@ def generate_python(module: IRModule) -> str:
         >>> code = generate_python(module)
         >>> print(code)
     """
-    generator = PythonGeneratorV2()
+    generator = PythonGeneratorV2(contracts=contracts)
     return generator.generate(module)
@@ -69,6 +69,7 @@ from dsl.ir import (
     LiteralType,
     SourceLocation,
     UnaryOperator,
+    intern_type,
 )
 from dsl.type_system import TypeInfo, TypeSystem
 
@@ -105,12 +106,12 @@ class PythonParserV2:
             generic_args = []
             for arg in args_str.split(","):
                 arg = arg.strip()
-                generic_args.append(IRType(name=arg))
+                generic_args.append(intern_type(name=arg))
 
-            return IRType(name=base_name, generic_args=generic_args)
+            return intern_type(name=base_name, generic_args=generic_args)
 
         # Simple type
-        return IRType(name=pw_type)
+        return intern_type(name=pw_type)
 
     def _add_statement(self, body: List[IRStatement], stmt: Union[Optional[IRStatement], List[IRStatement]]) -> None:
         """
@@ -350,7 +351,7 @@ class PythonParserV2:
                         # Check if not already in properties list
                         if not any(p.name == prop_name for p in properties):
                             # Infer type from assignment value
-                            prop_type = self._infer_expr_type_from_ir(stmt.value) if stmt.value else IRType(name='any')
+                            prop_type = self._infer_expr_type_from_ir(stmt.value) if stmt.value else intern_type(name='any')
 
                             properties.append(IRProperty(
                                 name=prop_name,
@@ -543,10 +544,10 @@ class PythonParserV2:
 
         # Mixed types - check if numeric (int + float = float)
         if all(t.name in ('int', 'float') for t in return_types):
-            return IRType(name='float')
+            return intern_type(name='float')
 
         # Mixed types - use 'any'
-        return IRType(name='any')
+        return intern_type(name='any')
 
     def _infer_expr_type_from_ir(self, expr: Any) -> IRType:
         """
@@ -563,15 +564,15 @@ class PythonParserV2:
                 LiteralType.FLOAT: 'float',
                 LiteralType.STRING: 'string',
             }
-            return IRType(name=type_mapping.get(expr.literal_type, 'any'))
+            return intern_type(name=type_mapping.get(expr.literal_type, 'any'))
 
         elif isinstance(expr, IRArray):
             # Array type
             if expr.elements:
                 # Infer element type from first element
                 elem_type = self._infer_expr_type_from_ir(expr.elements[0])
-                return IRType(name='array', generic_args=[elem_type])
-            return IRType(name='array', generic_args=[IRType(name='any')])
+                return intern_type(name='array', generic_args=[elem_type])
+            return intern_type(name='array', generic_args=[intern_type(name='any')])
 
         elif isinstance(expr, IRMap):
             # Map type
@@ -579,27 +580,27 @@ class PythonParserV2:
                 # Infer value type from first entry
                 first_value = list(expr.entries.values())[0]
                 value_type = self._infer_expr_type_from_ir(first_value)
-                return IRType(name='map', generic_args=[IRType(name='string'), value_type])
-            return IRType(name='map', generic_args=[IRType(name='string'), IRType(name='any')])
+                return intern_type(name='map', generic_args=[intern_type(name='string'), value_type])
+            return intern_type(name='map', generic_args=[intern_type(name='string'), intern_type(name='any')])
 
         elif isinstance(expr, IRIdentifier):
             # Look up identifier in context
             if expr.name in self.type_context:
-                return IRType(name=self.type_context[expr.name].pw_type)
-            return IRType(name='any')
+                return intern_type(name=self.type_context[expr.name].pw_type)
+            return intern_type(name='any')
 
         elif isinstance(expr, IRBinaryOp):
             # Infer from operation type
             if expr.op in (BinaryOperator.ADD, BinaryOperator.SUBTRACT, BinaryOperator.MULTIPLY,
                           BinaryOperator.DIVIDE, BinaryOperator.MODULO, BinaryOperator.POWER):
                 # Arithmetic operations return numeric types
-                return IRType(name='float')  # Conservative choice
+                return intern_type(name='float')  # Conservative choice
             elif expr.op in (BinaryOperator.EQUAL, BinaryOperator.NOT_EQUAL, BinaryOperator.LESS_THAN,
                             BinaryOperator.LESS_EQUAL, BinaryOperator.GREATER_THAN, BinaryOperator.GREATER_EQUAL,
                             BinaryOperator.AND, BinaryOperator.OR):
                 # Comparison and boolean operations return bool
-                return IRType(name='bool')
-            return IRType(name='any')
+                return intern_type(name='bool')
+            return intern_type(name='any')
 
         elif isinstance(expr, IRCall):
             # Try to infer from function name
@@ -614,15 +615,15 @@ class PythonParserV2:
                     'dict': 'map',
                 }
                 if func_name in type_mapping:
-                    return IRType(name=type_mapping[func_name])
-            return IRType(name='any')
+                    return intern_type(name=type_mapping[func_name])
+            return intern_type(name='any')
 
         elif isinstance(expr, IRTernary):
             # Try to infer from true value (assuming both branches have same type)
             return self._infer_expr_type_from_ir(expr.true_value)
 
         # Default: any
-        return IRType(name='any')
+        return intern_type(name='any')
 
     def _infer_expr_type(self, node: ast.expr) -> Optional[IRType]:
         """
@@ -633,29 +634,29 @@ class PythonParserV2:
         # Literal values
         if isinstance(node, ast.Constant):
             if node.value is None:
-                return IRType(name='null')
+                return intern_type(name='null')
             elif isinstance(node.value, bool):
-                return IRType(name='bool')
+                return intern_type(name='bool')
             elif isinstance(node.value, int):
-                return IRType(name='int')
+                return intern_type(name='int')
             elif isinstance(node.value, float):
-                return IRType(name='float')
+                return intern_type(name='float')
             elif isinstance(node.value, str):
-                return IRType(name='string')
+                return intern_type(name='string')
 
         # Legacy literals (Python 3.7 and earlier)
         elif isinstance(node, ast.Num):
             if isinstance(node.n, int):
-                return IRType(name='int')
+                return intern_type(name='int')
             elif isinstance(node.n, float):
-                return IRType(name='float')
+                return intern_type(name='float')
         elif isinstance(node, ast.Str):
-            return IRType(name='string')
+            return intern_type(name='string')
         elif isinstance(node, ast.NameConstant):
             if node.value is None:
-                return IRType(name='null')
+                return intern_type(name='null')
             elif isinstance(node.value, bool):
-                return IRType(name='bool')
+                return intern_type(name='bool')
 
         # Binary operations
         elif isinstance(node, ast.BinOp):
@@ -666,25 +667,25 @@ class PythonParserV2:
             if isinstance(node.op, (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Mod, ast.Pow)):
                 # If either is float, result is float
                 if left_type and left_type.name == 'float':
-                    return IRType(name='float')
+                    return intern_type(name='float')
                 if right_type and right_type.name == 'float':
-                    return IRType(name='float')
+                    return intern_type(name='float')
                 # Division always returns float
                 if isinstance(node.op, ast.Div):
-                    return IRType(name='float')
+                    return intern_type(name='float')
                 # Both int = int
                 if left_type and right_type and left_type.name == 'int' and right_type.name == 'int':
-                    return IRType(name='int')
+                    return intern_type(name='int')
                 # Default to float for numeric operations
-                return IRType(name='float')
+                return intern_type(name='float')
 
         # Comparison operations return bool
         elif isinstance(node, ast.Compare):
-            return IRType(name='bool')
+            return intern_type(name='bool')
 
         # Boolean operations return bool
         elif isinstance(node, ast.BoolOp):
-            return IRType(name='bool')
+            return intern_type(name='bool')
 
         # Lists
         elif isinstance(node, ast.List):
@@ -692,22 +693,22 @@ class PythonParserV2:
                 # Infer element type from first element
                 elem_type = self._infer_expr_type(node.elts[0])
                 if elem_type:
-                    return IRType(name='array', generic_args=[elem_type])
-            return IRType(name='array', generic_args=[IRType(name='any')])
+                    return intern_type(name='array', generic_args=[elem_type])
+            return intern_type(name='array', generic_args=[intern_type(name='any')])
 
         # Dicts
         elif isinstance(node, ast.Dict):
             if node.keys and node.values:
-                key_type = self._infer_expr_type(node.keys[0]) if node.keys[0] else IRType(name='string')
+                key_type = self._infer_expr_type(node.keys[0]) if node.keys[0] else intern_type(name='string')
                 value_type = self._infer_expr_type(node.values[0])
                 if key_type and value_type:
-                    return IRType(name='map', generic_args=[key_type, value_type])
-            return IRType(name='map', generic_args=[IRType(name='string'), IRType(name='any')])
+                    return intern_type(name='map', generic_args=[key_type, value_type])
+            return intern_type(name='map', generic_args=[intern_type(name='string'), intern_type(name='any')])
 
         # Identifiers - look up in context
         elif isinstance(node, ast.Name):
             if node.id in self.type_context:
-                return IRType(name=self.type_context[node.id].pw_type)
+                return intern_type(name=self.type_context[node.id].pw_type)
 
         # Method calls - infer from method name
         elif isinstance(node, ast.Call):
@@ -715,14 +716,14 @@ class PythonParserV2:
                 # String methods return string
                 if node.func.attr in ('upper', 'lower', 'strip', 'lstrip', 'rstrip', 'replace',
                                        'split', 'join', 'format', 'capitalize', 'title', 'swapcase'):
-                    return IRType(name='string')
+                    return intern_type(name='string')
                 # Some string methods return bool
                 elif node.func.attr in ('startswith', 'endswith', 'isdigit', 'isalpha', 'isalnum'):
-                    return IRType(name='bool')
+                    return intern_type(name='bool')
                 # List methods that return list
                 elif node.func.attr in ('append', 'extend', 'sort', 'reverse'):
                     # These modify in place, return None typically
-                    return IRType(name='null')
+                    return intern_type(name='null')
 
         # Ternary expression
         elif isinstance(node, ast.IfExp):
@@ -732,7 +733,7 @@ class PythonParserV2:
             if true_type and false_type and true_type.name == false_type.name:
                 return true_type
             # Mixed - use any
-            return IRType(name='any')
+            return intern_type(name='any')
 
         # Default: unknown
         return None
@@ -752,7 +753,7 @@ class PythonParserV2:
             if isinstance(node, ast.For):
                 if isinstance(node.iter, ast.Name) and node.iter.id == param_name:
                     # It's iterable - likely array
-                    return IRType(name='array', generic_args=[IRType(name='any')])
+                    return intern_type(name='array', generic_args=[intern_type(name='any')])
 
         # Check for arithmetic usage
         for node in ast.walk(func_node):
@@ -765,8 +766,8 @@ class PythonParserV2:
                         # Used in arithmetic - likely numeric
                         # Default to int (can be float if we see division)
                         if isinstance(node.op, ast.Div):
-                            return IRType(name='float')
-                        return IRType(name='int')
+                            return intern_type(name='float')
+                        return intern_type(name='int')
 
         # Check for string operations BEFORE general property access
         # (param.upper(), param.split(), etc.)
@@ -785,14 +786,14 @@ class PythonParserV2:
                                               'split', 'join', 'replace', 'startswith', 'endswith',
                                               'format', 'capitalize', 'title', 'swapcase',
                                               'isdigit', 'isalpha', 'isalnum'):
-                            return IRType(name='string')
+                            return intern_type(name='string')
                     # Also check the immediate attribute access
                     elif isinstance(node.func.value, ast.Name) and node.func.value.id == param_name:
                         if node.func.attr in ('upper', 'lower', 'strip', 'lstrip', 'rstrip',
                                               'split', 'join', 'replace', 'startswith', 'endswith',
                                               'format', 'capitalize', 'title', 'swapcase',
                                               'isdigit', 'isalpha', 'isalnum'):
-                            return IRType(name='string')
+                            return intern_type(name='string')
 
         # Check for property access (param.field) - after string methods
         # This is less specific, so check it last
@@ -801,10 +802,10 @@ class PythonParserV2:
                 if isinstance(node.value, ast.Name) and node.value.id == param_name:
                     # Has properties - it's a custom type
                     # For now, keep as 'any' but with better confidence
-                    return IRType(name='any')
+                    return intern_type(name='any')
 
         # Default: keep as any
-        return IRType(name='any')
+        return intern_type(name='any')
 
     # ========================================================================
     # Statement Conversion
@@ -1123,7 +1124,7 @@ class PythonParserV2:
                 target=", ".join(target_names),
                 value=self._convert_expression(node.value),
                 is_declaration=True,
-                var_type=IRType(name="any")
+                var_type=intern_type(name="any")
             )]
 
         # Create individual assignments
@@ -1413,7 +1414,7 @@ class PythonParserV2:
         """Convert lambda to IR."""
         params = []
         for arg in node.args.args:
-            param_type = IRType(name="any")
+            param_type = intern_type(name="any")
             if arg.annotation:
                 param_type = self._convert_type_annotation(arg.annotation)
 
@@ -1624,8 +1625,9 @@ class PythonParserV2:
                 # Handle Optional[T] -> T?
                 if base_type == 'Optional':
                     inner_type = self._convert_type_annotation(annotation.slice)
-                    inner_type.is_optional = True
-                    return inner_type
+                    return intern_type(
+                        inner_type.name, inner_type.generic_args, True, inner_type.union_types
+                    )
 
                 # Handle Union[A, B, C]
                 elif base_type == 'Union':
@@ -1633,29 +1635,30 @@ class PythonParserV2:
                     if isinstance(annotation.slice, ast.Tuple):
                         types = [self._convert_type_annotation(t) for t in annotation.slice.elts]
                         first = types[0]
-                        first.union_types = types[1:]
-                        return first
+                        return intern_type(
+                            first.name, first.generic_args, first.is_optional, types[1:]
+                        )
                     else:
                         return self._convert_type_annotation(annotation.slice)
 
                 # Handle List[T]
                 elif base_type in ('List', 'list'):
                     inner_type = self._convert_type_annotation(annotation.slice)
-                    return IRType(name="array", generic_args=[inner_type])
+                    return intern_type(name="array", generic_args=[inner_type])
 
                 # Handle Dict[K, V]
                 elif base_type in ('Dict', 'dict'):
                     if isinstance(annotation.slice, ast.Tuple):
                         key_type = self._convert_type_annotation(annotation.slice.elts[0])
                         value_type = self._convert_type_annotation(annotation.slice.elts[1])
-                        return IRType(name="map", generic_args=[key_type, value_type])
+                        return intern_type(name="map", generic_args=[key_type, value_type])
 
         elif isinstance(annotation, ast.Constant):
             # String annotation (forward reference)
-            return IRType(name=str(annotation.value))
+            return intern_type(name=str(annotation.value))
 
         # Default to any
-        return IRType(name="any")
+        return intern_type(name="any")
 
     def _normalize_python_type(self, type_name: str) -> IRType:
         """Normalize Python type name to IR type."""
@@ -1671,7 +1674,7 @@ class PythonParserV2:
         }
 
         normalized = type_mapping.get(type_name, type_name)
-        return IRType(name=normalized)
+        return intern_type(name=normalized)
 
     # ========================================================================
     # Utility Methods
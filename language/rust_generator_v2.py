@@ -691,7 +691,7 @@ class RustGeneratorV2:
             return f"{base_indent}continue;"
         elif isinstance(stmt, IRPass):
             return f"{base_indent}// pass"
-        elif isinstance(stmt, IRCall):
+        elif isinstance(stmt, (IRCall, IRAwait)):
             # Expression statement
             call_expr = self._generate_expression(stmt)
             return f"{base_indent}{call_expr};"
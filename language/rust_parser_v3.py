@@ -42,6 +42,7 @@ from dsl.ir import (
     IRType,
     IRWhile,
     LiteralType,
+    intern_type,
 )
 from dsl.type_system import TypeSystem
 
@@ -158,7 +159,7 @@ class RustParserV3:
         # Convert return type
         return_type_str = func_data.get("return_type", "()")
         if return_type_str == "()":
-            return_type = IRType(name="void")
+            return_type = intern_type(name="void")
         else:
             return_type = self._convert_rust_type(return_type_str)
 
@@ -419,15 +420,15 @@ class RustParserV3:
         # Handle Vec<T>
         if rust_type.startswith("Vec <"):
             # Extract inner type (simplified - doesn't handle nested generics)
-            return IRType(name="array")
+            return intern_type(name="array")
 
         # Handle Option<T>
         if rust_type.startswith("Option <"):
             # Optional type - map to base type (simplified)
-            return IRType(name="any")
+            return intern_type(name="any")
 
         # Map to universal type
-        return IRType(name=type_mapping.get(rust_type, rust_type))
+        return intern_type(name=type_mapping.get(rust_type, rust_type))
 
 
 # Convenience functions
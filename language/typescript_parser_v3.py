@@ -20,7 +20,8 @@ from dsl.ir import (
     IRAssignment, IRIf, IRFor, IRWhile, IRSwitch, IRCase, IRTry, IRCatch, IRReturn, IRThrow,
     IRBreak, IRContinue,
     IRBinaryOp, IRIdentifier, IRLiteral, IRCall, IRArray, IRMap, IRLambda,
-    LiteralType, BinaryOperator
+    LiteralType, BinaryOperator,
+    intern_type,
 )
 
 
@@ -383,7 +384,7 @@ class TypeScriptParserV3:
 
             # IRArrowFunction doesn't exist, use IRLambda
             return IRLambda(
-                params=[IRParameter(name=p, param_type=IRType(name="any")) for p in params],
+                params=[IRParameter(name=p, param_type=intern_type(name="any")) for p in params],
                 body=ir_body
             )
 
@@ -395,16 +396,16 @@ class TypeScriptParserV3:
         # Handle array types
         if type_str.endswith("[]"):
             element_type = type_str[:-2]
-            return IRType(name="array", args=[self._convert_type(element_type)])
+            return intern_type(name="array", generic_args=[self._convert_type(element_type)])
 
         # Handle generic types (e.g., Array<T>, Map<K, V>)
         if "<" in type_str:
             base_type = type_str.split("<")[0]
-            return IRType(name=self.type_mapping.get(base_type, base_type))
+            return intern_type(name=self.type_mapping.get(base_type, base_type))
 
         # Map to universal type
         universal_type = self.type_mapping.get(type_str, type_str)
-        return IRType(name=universal_type)
+        return intern_type(name=universal_type)
 
     def _map_operator(self, op: str) -> BinaryOperator:
         """Map TypeScript operator to IR operator."""
@@ -2,7 +2,41 @@
 AssertLang setup configuration.
 """
 
+import os
+import sys
+from pathlib import Path
+
 from setuptools import find_packages, setup
+from setuptools.command.build_py import build_py
+
+ROOT = Path(__file__).parent
+
+
+class build_py_with_stdlib(build_py):
+    """build_py that also ships the PW stdlib with a prebuilt snapshot.
+
+    The stdlib sources are copied to dsl/stdlib and compiled there, so
+    installed runtimes load the snapshot instead of parsing the stdlib
+    (see dsl/stdlib_snapshot.py).
+    """
+
+    def run(self):
+        super().run()
+        if self.dry_run:
+            return
+
+        sys.path.insert(0, str(ROOT))
+        from dsl.stdlib_snapshot import build_snapshot, find_stdlib_source, snapshot_path_for
+
+        target = Path(self.build_lib) / "dsl" / "stdlib"
+        self.mkpath(str(target))
+        for source in sorted((ROOT / "stdlib").glob("*.al")):
+            self.copy_file(str(source), str(target / source.name))
+        snapshot = build_snapshot(find_stdlib_source(target), write=True)
+        # Written through mkstemp, which creates the file private to the builder
+        os.chmod(snapshot_path_for(snapshot.source_path), 0o644)
+        self.announce(f"built stdlib snapshot for {snapshot.source_path.name}", level=2)
+
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
@@ -97,6 +131,11 @@ setup(
             "temporalio>=1.5.0",
         ],
 
+        # Vectorized batch execution in the PW runtime (optional)
+        "batch": [
+            "numpy>=1.22.0",
+        ],
+
         # Development dependencies
         "dev": [
             "pytest>=7.4.0",
@@ -138,6 +177,7 @@ setup(
             "asl=assertlang.cli:main",
         ],
     },
+    cmdclass={"build_py": build_py_with_stdlib},
     include_package_data=True,
     package_data={
         "assertlang": ["py.typed"],
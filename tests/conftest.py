@@ -0,0 +1,31 @@
+"""
+Shared pytest fixtures.
+"""
+
+import sys
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_ir_cache(tmp_path_factory):
+    """
+    Keep the on-disk IR cache out of the developer's ~/.cache.
+
+    parse_al caches by default; every test (and every CLI it runs in a
+    subprocess) writes to a per-session directory instead. Tests of the
+    cache itself install their own IRCache.
+    """
+    directory = tmp_path_factory.mktemp("ir-cache")
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv("ASSERTLANG_IR_CACHE_DIR", str(directory))
+        _reset_ir_cache()
+        yield directory
+    _reset_ir_cache()
+
+
+def _reset_ir_cache():
+    # A process-wide cache created earlier keeps the directory it was made with
+    ir_cache = sys.modules.get("dsl.ir_cache")
+    if ir_cache is not None:
+        ir_cache.set_ir_cache(None)
@@ -0,0 +1,176 @@
+"""
+Tests for async AL execution: `await` parsing, synchronous fallback in every
+engine and tier, tasks and concurrent awaits under execute_function_async,
+and Python coroutine functions registered as globals.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dsl.al_parser import parse_al
+from dsl.al_runtime import PWRuntime, PWRuntimeError
+from dsl.ir import IRAwait, IRBinaryOp
+
+SOURCE = """
+async function double(n: int) -> int {
+    let v = await io(n);
+    return v * 2;
+}
+
+async function independent() -> int {
+    let a = await double(1);
+    let b = await double(2);
+    let c = await io(3);
+    return a + b + c;
+}
+
+async function dependent() -> int {
+    let a = await io(1);
+    let b = await io(a + 1);
+    return b;
+}
+
+async function tasks() -> int {
+    let first = double(1);
+    let second = double(2);
+    return await first + await second;
+}
+
+async function loop(n: int) -> int {
+    let total = 0;
+    let i = 0;
+    while (i < n) {
+        total = total + await double(i);
+        i = i + 1;
+    }
+    return total;
+}
+
+async function statements() -> int {
+    await io(1);
+    await io(2);
+    return 0;
+}
+
+function helper() -> int {
+    return double(5);
+}
+"""
+
+ENGINES = [("tree", None), ("closure", None), ("tree", 1), ("closure", 1)]
+
+
+class IO:
+    """Python coroutine function logging when each call starts and ends"""
+
+    def __init__(self, fail=None):
+        self.log = []
+        self.fail = fail
+
+    async def __call__(self, n):
+        self.log.append(("start", n))
+        await asyncio.sleep(0.001 if n == self.fail else 0.02)
+        if n == self.fail:
+            raise ValueError(f"io({n}) failed")
+        self.log.append(("end", n))
+        return n
+
+
+def make_runtime(engine, tier_threshold, io):
+    runtime = PWRuntime(engine=engine, tier_threshold=tier_threshold)
+    runtime.execute_module(parse_al(SOURCE, use_cache=False))
+    runtime.globals["io"] = io
+    return runtime
+
+
+def run(runtime, name, args=(), **kwargs):
+    return asyncio.run(runtime.execute_function_async(runtime.globals[name], list(args), **kwargs))
+
+
+def test_await_is_a_unary_operator():
+    module = parse_al("async function f() -> int {\n    return await g() + 1;\n}\n", use_cache=False)
+    value = module.functions[0].body[0].value
+    assert isinstance(value, IRBinaryOp) and isinstance(value.left, IRAwait)
+
+
+@pytest.mark.parametrize("engine, tier_threshold", ENGINES)
+def test_synchronous_execution_unchanged(engine, tier_threshold):
+    runtime = make_runtime(engine, tier_threshold, lambda n: n)
+    for _ in range(3):
+        assert runtime.execute_function(runtime.globals["independent"], []) == 9
+        assert runtime.execute_function(runtime.globals["tasks"], []) == 6
+        assert runtime.execute_function(runtime.globals["statements"], []) == 0
+    if tier_threshold:
+        assert runtime.tier_stats()["independent"]["tier"] == "python"
+
+    # Coroutines cannot be awaited synchronously
+    runtime.globals["io"] = IO()
+    with pytest.raises(PWRuntimeError, match="execute_function_async"):
+        runtime.execute_function(runtime.globals["double"], [1])
+
+
+@pytest.mark.parametrize("engine, tier_threshold", ENGINES)
+def test_independent_awaits_run_concurrently(engine, tier_threshold):
+    io = IO()
+    runtime = make_runtime(engine, tier_threshold, io)
+    assert run(runtime, "independent") == 9
+    # All three calls are in flight before the first completes
+    assert sorted(io.log[:3]) == [("start", 1), ("start", 2), ("start", 3)]
+
+    io.log.clear()
+    assert run(runtime, "independent", concurrent_awaits=False) == 9
+    assert io.log == [("start", 1), ("end", 1), ("start", 2), ("end", 2), ("start", 3), ("end", 3)]
+
+
+def test_dependent_awaits_and_statements_stay_sequential():
+    io = IO()
+    runtime = make_runtime("tree", None, io)
+    assert run(runtime, "dependent") == 2
+    assert io.log == [("start", 1), ("end", 1), ("start", 2), ("end", 2)]
+
+    io.log.clear()
+    assert run(runtime, "statements") == 0
+    assert io.log == [("start", 1), ("end", 1), ("start", 2), ("end", 2)]
+
+
+@pytest.mark.parametrize("engine, tier_threshold", ENGINES)
+def test_calls_start_tasks(engine, tier_threshold):
+    io = IO()
+    runtime = make_runtime(engine, tier_threshold, io)
+    assert run(runtime, "tasks") == 6
+    assert io.log[:2] == [("start", 1), ("start", 2)]
+    # A synchronous function returning a task resolves to its value
+    assert run(runtime, "helper") == 10
+    assert run(runtime, "loop", [4]) == 12
+    assert runtime.tier_stats()["double"]["calls"] == 7
+    assert runtime.call_stack == []
+
+
+def test_failure_cancels_pending_calls():
+    io = IO(fail=2)
+    runtime = make_runtime("closure", None, io)
+
+    async def main():
+        with pytest.raises(ValueError, match="io\\(2\\) failed"):
+            await runtime.execute_function_async(runtime.globals["independent"], [])
+        await asyncio.sleep(0.05)
+
+    asyncio.run(main())
+    assert ("end", 1) not in io.log and ("end", 3) not in io.log
+
+
+def test_python_coroutine_function_called_directly():
+    runtime = make_runtime("tree", None, IO())
+    assert asyncio.run(runtime.execute_function_async(runtime.globals["io"], [4])) == 4
+
+    async def gather():
+        return await asyncio.gather(*[
+            runtime.execute_function_async(runtime.globals["double"], [n]) for n in range(5)
+        ])
+
+    assert asyncio.run(gather()) == [0, 2, 4, 6, 8]
@@ -0,0 +1,175 @@
+"""
+Tests for batch execution of AL functions over argument columns.
+
+Every batch is checked against calling the function once per row.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dsl import al_batch
+from dsl.al_parser import parse_al
+from dsl.al_runtime import PWRuntime, PWRuntimeError
+
+np = pytest.importorskip("numpy")
+
+SOURCE = """
+function tokens_to_add(elapsed: int, rate: int, current: int, max_tokens: int) -> int {
+    @requires valid_elapsed: elapsed >= 0
+    @requires valid_current: current >= 0 && current <= max_tokens
+    @ensures valid_result: result >= 0
+
+    let add = elapsed * rate;
+    if (current + add > max_tokens) {
+        add = max_tokens - current;
+    }
+    return add;
+}
+
+function score(x: float, y: int, flag: bool) -> float {
+    let base = x * 2.5 - y // 3 + y % 4;
+    if (flag and not (x > 50.0)) {
+        return -base if y & 1 == 1 else base / 2;
+    } else {
+        if (y >= limit) {
+            return base + 1;
+        }
+    }
+    return x - (y ^ 5);
+}
+
+function ratio(a: int, b: int) -> float {
+    return a / b;
+}
+
+function safe_ratio(a: int, b: int) -> float {
+    if (b == 0) {
+        return 0.0;
+    }
+    return a / b;
+}
+
+function label(n: int) -> string {
+    if (n > 0) {
+        return "positive";
+    }
+    return "other";
+}
+
+function invariant_if(a: int) -> int {
+    let t = 0;
+    if (t > 1) {
+        return t;
+    }
+    return a | 3;
+}
+
+function invariant_ternary(a: int) -> int {
+    let t = 2;
+    return (a // (-1 if 1.5 else true)) if t < 5 else a;
+}
+
+function count_up(n: int) -> int {
+    let total = 0;
+    for (let i = 0; i < n; i = i + 1) {
+        total = total + i;
+    }
+    return total;
+}
+"""
+
+
+@pytest.fixture(scope="module")
+def module():
+    return parse_al(SOURCE, use_cache=False)
+
+
+@pytest.fixture
+def runtime(module):
+    runtime = PWRuntime()
+    runtime.execute_module(module)
+    runtime.globals["limit"] = 20
+    return runtime
+
+
+def per_row(runtime, name, columns):
+    rows = zip(*(c.tolist() if hasattr(c, "tolist") else c for c in columns))
+    return [runtime.execute_function(runtime.globals[name], list(row)) for row in rows]
+
+
+def run_batch(runtime, name, columns, **kwargs):
+    result = runtime.execute_function_batch(runtime.globals[name], columns, **kwargs)
+    assert result.values.tolist() == per_row(runtime, name, columns)
+    return result
+
+
+def test_vectorized_matches_scalar(runtime):
+    rng = np.random.default_rng(7)
+    columns = [rng.integers(0, 20, 2000) for _ in range(4)]
+    result = run_batch(runtime, "tokens_to_add", columns)
+    assert result.vectorized and result.reason is None
+
+    columns = [rng.uniform(0, 100, 2000), rng.integers(-30, 30, 2000), rng.integers(0, 2, 2000).astype(bool)]
+    assert run_batch(runtime, "score", columns).vectorized
+
+
+def test_lists_and_named_columns(runtime):
+    columns = {"elapsed": [1, 2, 3], "rate": [5, 5, 5], "current": [0, 4, 9], "max_tokens": [10, 10, 10]}
+    result = runtime.execute_function_batch(runtime.globals["tokens_to_add"], columns)
+    assert result.vectorized
+    assert result.values.tolist() == [5, 6, 1]
+
+    with pytest.raises(ValueError, match="different lengths"):
+        runtime.execute_function_batch(runtime.globals["ratio"], [[1, 2], [1]])
+    with pytest.raises(ValueError, match="No parameter named c"):
+        runtime.execute_function_batch(runtime.globals["ratio"], {"a": [1], "c": [1]})
+
+
+def test_contract_masks(runtime):
+    columns = [[1, -1, 2, 0], [3, 3, 3, 3], [0, 0, 12, 5], [10, 10, 10, 4]]
+    result = runtime.execute_function_batch(runtime.globals["tokens_to_add"], columns, contracts=True)
+    assert result.requires["valid_elapsed"].tolist() == [True, False, True, True]
+    assert result.requires["valid_current"].tolist() == [True, True, False, False]
+    assert result.ensures["valid_result"].tolist() == [v >= 0 for v in result.values.tolist()]
+
+
+def test_falls_back_per_row(runtime):
+    result = run_batch(runtime, "label", [[3, -1, 0]])
+    assert not result.vectorized and "str" in result.reason
+    assert result.values.tolist() == ["positive", "other", "other"]
+
+    result = run_batch(runtime, "count_up", [np.arange(5)])
+    assert not result.vectorized and "IRForCStyle" in result.reason
+
+    # Values outside the exact int64/float64 range run row by row
+    result = run_batch(runtime, "ratio", [[2**60, 3], [3, 2]])
+    assert not result.vectorized and "2**53" in result.reason
+
+
+def test_row_invariant_conditions(runtime):
+    # Conditions that are the same in every row are NumPy scalars or 0-d
+    # arrays, not bool arrays
+    result = run_batch(runtime, "invariant_if", [[1, 2, 4]])
+    assert result.vectorized and result.values.tolist() == [3, 3, 7]
+
+    result = run_batch(runtime, "invariant_ternary", [[1, 2, 3]])
+    assert result.vectorized and result.values.tolist() == [-1, -2, -3]
+
+
+def test_division_by_zero(runtime):
+    # A zero divisor in a dead row is harmless; in a live row the scalar error surfaces
+    result = run_batch(runtime, "safe_ratio", [[1, 2], [0, 4]])
+    assert result.vectorized and result.values.tolist() == [0.0, 0.5]
+    with pytest.raises(PWRuntimeError, match="Division by zero"):
+        runtime.execute_function_batch(runtime.globals["ratio"], [[1, 2], [1, 0]])
+
+
+def test_without_numpy(runtime, monkeypatch):
+    monkeypatch.setattr(al_batch, "NUMPY_AVAILABLE", False)
+    result = runtime.execute_function_batch(runtime.globals["ratio"], [[1, 3], [2, 4]], contracts=True)
+    assert result.values == [0.5, 0.75]
+    assert not result.vectorized and "NumPy" in result.reason
@@ -0,0 +1,355 @@
+"""
+Differential tests for the PWRuntime execution engines and tiers.
+
+Every program runs under the closure-compiling engine and, with
+tier_threshold=1, lowered to Python bytecode from the first call; results,
+side effects on globals and errors must be identical to the tree-walking
+interpreter.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dsl.al_parser import parse_al
+from dsl.al_runtime import EnumVariantInstance, PWRuntime, PWRuntimeError
+from dsl.ir import (
+    IRAssignment,
+    IRBinaryOp,
+    IRFunction,
+    IRIdentifier,
+    IRLiteral,
+    IRParameter,
+    IRReturn,
+    LiteralType,
+    intern_type,
+)
+
+PROGRAM = """
+enum Shape:
+    - Circle(float)
+    - Square(float)
+    - Empty
+
+function fib(n: int) -> int {
+    if (n < 2) {
+        return n;
+    }
+    return fib(n - 1) + fib(n - 2);
+}
+
+function bump(by: int) -> int {
+    counter = counter + by;
+    return counter;
+}
+
+function collatz(n: int) -> int {
+    let steps = 0;
+    while (n != 1) {
+        if (n % 2 == 0) {
+            n = n // 2;
+        } else {
+            n = 3 * n + 1;
+        }
+        steps = steps + 1;
+    }
+    return steps;
+}
+
+function first_over(values: array<int>, limit: int) -> int {
+    for (v in values) {
+        if (v > limit) {
+            return v;
+        }
+    }
+    return -1;
+}
+
+function loop_controls(n: int) -> array<int> {
+    let kept = [];
+    let total = 0;
+    for (let i = 0; i < n; i = i + 1) {
+        if (i % 3 == 0) {
+            continue;
+        }
+        if (i > 10) {
+            break;
+        }
+        total = total + i;
+    }
+    let j = 0;
+    while (true) {
+        j = j + 1;
+        if (j >= 4) {
+            break;
+        }
+    }
+    for (x in [1, 2, 3, 4, 5, 6]) {
+        if (x == 2) {
+            continue;
+        }
+        if (x == 5) {
+            break;
+        }
+        kept = kept + [x * 10];
+    }
+    return [total, j, x] + kept;
+}
+
+function histogram(words: array<string>) -> map<string, int> {
+    let counts = {"short": 0, "long": 0};
+    for (w in words) {
+        if (w in ["a", "an", "the"]) {
+            counts["short"] = counts["short"] + 1;
+        } else {
+            counts["long"] = counts["long"] + 1;
+        }
+    }
+    return counts;
+}
+
+function implicit_tail(flag: bool) -> int {
+    let base = 5;
+    if (flag) {
+        bump(base);
+        let doubled = base * 2;
+    } else {
+        let halved = base / 2;
+    }
+}
+
+function implicit_none(flag: bool) -> int {
+    if (flag) {
+        let x = 1;
+    }
+}
+
+function make_adder(k: int) -> any {
+    return fn(x) -> x + k;
+}
+
+function apply_twice(k: int, v: int) -> int {
+    let add = make_adder(k);
+    return add(add(v));
+}
+
+function pick(x: int) -> string {
+    return "big" if x > 10 else "small";
+}
+
+function logic(a: int, b: int) -> array<bool> {
+    return [a > 0 and b > 0, a > 0 or b > 0, not (a > b), a == b, a != b];
+}
+
+function bits(a: int, b: int) -> array<int> {
+    return [a & b, a | b, a ^ b, a << 2, a >> 1, -a, a ** 2, a % b];
+}
+
+function area(s: any) -> float {
+    if (s == Shape.Circle(1.0)) {
+        return 3.0;
+    }
+    return 0.0;
+}
+
+function make_shapes() -> array<any> {
+    return [Shape.Circle(2.0), Square(3.0), Shape.Empty(), Some(1), None()];
+}
+
+function divide(a: int, b: int) -> float {
+    return a / b;
+}
+
+function missing_var() -> int {
+    return nowhere + 1;
+}
+
+function defaults(a: int, b: int = 10) -> int {
+    return a + b;
+}
+
+function shadow(k: int) -> array<int> {
+    let x = 7;
+    let f = fn(x) -> x + k;
+    let g = fn(y) -> limit + y;
+    return [f(1), f(), g(2)];
+}
+
+function nested(a: int) -> array<int> {
+    let b = a * 2;
+    let outer = fn(x) -> fn(y) -> a + b + x + y;
+    let inner = outer(10);
+    b = 100;
+    let last = 0;
+    for (v in [1, 2, 3]) {
+        last = v;
+    }
+    return [inner(1), last, v];
+}
+
+function loop_lambdas(n: int) -> array<int> {
+    let seen = 0;
+    let before = fn() -> seen;
+    let during = 0;
+    let made = fn() -> 0;
+    for (v in [1, 2, n]) {
+        seen = seen + v;
+        during = during + before();
+        made = fn() -> seen + v;
+    }
+    seen = 100;
+    return [made(), before(), during, seen];
+}
+
+function unwrap_sum(opts: array<any>) -> int {
+    let total = 0;
+    for (o in opts) {
+        if (o is Some(v)) {
+            total = total + v;
+        } else {
+            if (o is Shape.Square(_) or o is Err(e)) {
+                total = total - 1;
+            }
+        }
+    }
+    return total;
+}
+
+function classify(o: any) -> array<any> {
+    let is_ok = fn(x) -> x is Ok(val);
+    if (o is Circle(r)) {
+        return ["circle", r, is_ok(o)];
+    }
+    return [o is None, is_ok(o)];
+}
+
+function maybe_local(flag: bool) -> int {
+    if (flag) {
+        let limit = 1;
+    }
+    return limit;
+}
+"""
+
+CALLS = [
+    ("fib", [15]),
+    ("bump", [3]),
+    ("bump", [4]),
+    ("collatz", [27]),
+    ("first_over", [[1, 5, 9, 12, 3], 8]),
+    ("first_over", [[1, 2], 8]),
+    ("loop_controls", [20]),
+    ("histogram", [["the", "cat", "a", "dog", "an", "elephant"]]),
+    ("implicit_tail", [True]),
+    ("implicit_tail", [False]),
+    ("implicit_none", [True]),
+    ("implicit_none", [False]),
+    ("apply_twice", [3, 4]),
+    ("pick", [11]),
+    ("pick", [2]),
+    ("logic", [3, 0]),
+    ("logic", [2, 2]),
+    ("bits", [12, 5]),
+    ("area", [EnumVariantInstance("Circle", [1.0])]),
+    ("area", [EnumVariantInstance("Square", [1.0])]),
+    ("make_shapes", []),
+    ("defaults", [1]),
+    ("defaults", [1, 2]),
+    ("shadow", [5]),
+    ("nested", [3]),
+    ("loop_lambdas", [3]),
+    ("unwrap_sum", [[
+        EnumVariantInstance("Some", [4]),
+        EnumVariantInstance("None", []),
+        EnumVariantInstance("Square", [1.0]),
+        EnumVariantInstance("Err", ["x"]),
+        EnumVariantInstance("Some", [5]),
+    ]]),
+    ("classify", [EnumVariantInstance("Circle", [2.0])]),
+    ("classify", [EnumVariantInstance("None", [])]),
+    ("maybe_local", [True]),
+    ("maybe_local", [False]),
+]
+
+ERRORS = [
+    ("divide", [1, 0]),
+    ("missing_var", []),
+    ("defaults", []),
+]
+
+
+def make_runtime(engine, tier_threshold=None):
+    runtime = PWRuntime(engine=engine, tier_threshold=tier_threshold)
+    runtime.execute_module(parse_al(PROGRAM, use_cache=False))
+    runtime.globals["counter"] = 0
+    runtime.globals["limit"] = 100
+    return runtime
+
+
+def run_call(runtime, name, args):
+    try:
+        return "ok", runtime.execute_function(runtime.globals[name], list(args))
+    except PWRuntimeError as e:
+        return "error", str(e)
+
+
+@pytest.fixture(params=[("closure", None), ("tree", 1), ("closure", 1)], ids=lambda p: f"{p[0]}-tier{p[1]}")
+def runtimes(request):
+    return make_runtime("tree"), make_runtime(*request.param)
+
+
+def test_results_match_tree_walker(runtimes):
+    tree, candidate = runtimes
+    for name, args in CALLS:
+        expected = run_call(tree, name, args)
+        assert expected[0] == "ok", (name, expected)
+        assert run_call(candidate, name, args) == expected, name
+
+    # Side effects on module globals are identical too
+    assert candidate.globals["counter"] == tree.globals["counter"] == 12
+
+
+def test_errors_match_tree_walker(runtimes):
+    tree, candidate = runtimes
+    for name, args in ERRORS:
+        expected = run_call(tree, name, args)
+        assert expected[0] == "error", (name, expected)
+        assert run_call(candidate, name, args) == expected, name
+        assert candidate.call_stack == tree.call_stack == []
+
+
+def test_functions_compile_once():
+    runtime = make_runtime("closure")
+    fib = runtime.globals["fib"]
+    assert runtime.execute_function(fib, [10]) == 55
+
+    compiled = runtime.function_tier(fib).entry
+    assert runtime.execute_function(fib, [12]) == 144
+    assert runtime.function_tier(fib).entry is compiled
+
+    # Compiled code is per runtime: it closes over that runtime's globals
+    other = make_runtime("closure")
+    assert other.function_tier(other.globals["fib"]).entry is not compiled
+
+
+def test_unsupported_nodes_fail_at_run_time():
+    func = IRFunction(
+        name="f",
+        params=[IRParameter(name="x", param_type=intern_type("int"))],
+        body=[
+            IRAssignment(target="y", value=IRLiteral(value=1, literal_type=LiteralType.INTEGER), is_declaration=True),
+            IRReturn(value=IRBinaryOp(op="??", left=IRIdentifier(name="x"), right=IRIdentifier(name="y"))),
+        ],
+    )
+    for engine in PWRuntime.ENGINES:
+        runtime = PWRuntime(engine=engine)
+        with pytest.raises(PWRuntimeError, match="Unsupported binary operator"):
+            runtime.execute_function(func, [1])
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError, match="Unknown engine"):
+        PWRuntime(engine="jit")
@@ -0,0 +1,127 @@
+"""
+Tests for tiered compilation of hot AL functions to Python bytecode.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dsl.al_lowering import LoweringError, PythonLowering, lower_function
+from dsl.al_parser import parse_al
+from dsl.al_runtime import DEFAULT_TIER_THRESHOLD, PWRuntime
+
+SOURCE = """
+function rate(amount: float, tier: string) -> float {
+    let rate = 0.05;
+    if (tier == "gold") {
+        rate = 0.1;
+    }
+    return amount * rate;
+}
+
+function total(amounts: array<float>, tier: string) -> float {
+    let sum = 0.0;
+    for (a in amounts) {
+        sum = sum + rate(a, tier);
+    }
+    return sum;
+}
+
+function greet(name: string, greeting: string = "hello") -> string {
+    return greeting + " " + name;
+}
+
+function skip_odd(n: int) -> int {
+    let kept = 0;
+    for (let i = 0; i < n; i = i + 1) {
+        if (i % 2 == 1) {
+            continue;
+        }
+        kept = kept + 1;
+    }
+    return kept;
+}
+"""
+
+
+@pytest.fixture(scope="module")
+def module():
+    return parse_al(SOURCE, use_cache=False)
+
+
+def make_runtime(module, **kwargs):
+    runtime = PWRuntime(**kwargs)
+    runtime.execute_module(module)
+    return runtime
+
+
+def test_promotes_at_threshold(module):
+    runtime = make_runtime(module, tier_threshold=5)
+    rate = runtime.globals["rate"]
+
+    for _ in range(4):
+        assert runtime.execute_function(rate, [100.0, "gold"]) == 10.0
+    assert runtime.tier_stats()["rate"] == {"tier": "tree", "calls": 4, "reason": None}
+
+    assert runtime.execute_function(rate, [100.0, "silver"]) == 5.0
+    assert runtime.execute_function(rate, [100.0, "gold"]) == 10.0
+    assert runtime.tier_stats()["rate"] == {"tier": "python", "calls": 6, "reason": None}
+
+
+def test_calls_from_lowered_code_are_counted(module):
+    runtime = make_runtime(module, engine="closure", tier_threshold=3)
+    total = runtime.globals["total"]
+    for _ in range(3):
+        assert runtime.execute_function(total, [[10.0, 20.0], "gold"]) == pytest.approx(3.0)
+
+    stats = runtime.tier_stats()
+    assert stats["total"]["tier"] == "python"
+    assert stats["rate"] == {"tier": "python", "calls": 6, "reason": None}
+    assert runtime.call_stack == []
+
+
+def test_disabled(module):
+    runtime = make_runtime(module, tier_threshold=None)
+    for _ in range(DEFAULT_TIER_THRESHOLD + 1):
+        runtime.execute_function(runtime.globals["rate"], [1.0, "gold"])
+    assert runtime.tier_stats()["rate"]["tier"] == "tree"
+
+    with pytest.raises(ValueError, match="tier_threshold"):
+        PWRuntime(tier_threshold=0)
+
+
+def test_omitted_arguments_use_previous_tier(module):
+    runtime = make_runtime(module, tier_threshold=1)
+    greet = runtime.globals["greet"]
+    assert runtime.execute_function(greet, ["ada", "hi"]) == "hi ada"
+    assert runtime.execute_function(greet, ["ada"]) == "hello ada"
+    assert runtime.tier_stats()["greet"]["tier"] == "python"
+
+
+def test_refused_functions_stay_in_their_tier(module):
+    runtime = make_runtime(module, engine="closure", tier_threshold=1)
+    assert runtime.execute_function(runtime.globals["skip_odd"], [10]) == 5
+    assert runtime.execute_function(runtime.globals["skip_odd"], [7]) == 4
+    assert runtime.tier_stats()["skip_odd"] == {
+        "tier": "closure",
+        "calls": 2,
+        "reason": "continue in a C-style for loop",
+    }
+
+    with pytest.raises(LoweringError, match="C-style"):
+        PythonLowering(module.functions[3]).compile()
+
+
+def test_code_object_shared_across_runtimes(module):
+    rate = module.functions[0]
+    lowered = lower_function(rate)
+    assert lower_function(rate) is lowered
+    assert "def _lowered(l_amount, l_tier)" in lowered.source
+
+    first = make_runtime(module, tier_threshold=1)
+    second = make_runtime(module, tier_threshold=1)
+    assert first.execute_function(rate, [10.0, "gold"]) == second.execute_function(rate, [10.0, "gold"])
+    assert lower_function(rate) is lowered
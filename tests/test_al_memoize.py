@@ -0,0 +1,168 @@
+"""
+Tests for @pure / @memoize: parsing and purity checks, the PWRuntime result
+cache in every engine and tier, and the caches emitted by the Python and
+JavaScript generators.
+"""
+
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dsl.al_parser import DEFAULT_MEMO_SIZE, ALParseError, parse_al
+from dsl.al_runtime import EnumVariantInstance, MemoCache, PWRuntime, memo_key
+from language.javascript_generator import generate_javascript
+
+SOURCE = """
+function fib(n: int) -> int {
+    @pure
+    if (n < 2) {
+        return n;
+    }
+    return fib(n - 1) + fib(n - 2);
+}
+
+function total(xs: array<int>) -> int {
+    @memoize(max=2)
+    let sum = 0;
+    for (x in xs) {
+        sum = sum + x;
+    }
+    return sum;
+}
+
+function plain(n: int) -> int {
+    return n;
+}
+"""
+
+
+@pytest.fixture(scope="module")
+def module():
+    return parse_al(SOURCE, use_cache=False)
+
+
+def test_annotations_carried_in_ir(module):
+    fib, total, plain = module.functions
+    assert fib.memoize == DEFAULT_MEMO_SIZE
+    assert total.memoize == 2
+    assert plain.memoize is None
+
+
+@pytest.mark.parametrize(
+    "body, reason",
+    [
+        ("print(x);", "calls print()"),
+        ("let r = http.get(\"/\");", "calls http.get()"),
+        ("xs[0] = 1;", "mutates parameter 'xs'"),
+        ("xs.append(1);", "mutates parameter 'xs' via append()"),
+        ("counter = counter + 1;", "assigns to 'counter' without declaring it"),
+    ],
+)
+def test_impure_functions_rejected(body, reason):
+    source = f"""
+function f(x: int, xs: array<int>) -> int {{
+    @pure
+    {body}
+    return x;
+}}
+"""
+    with pytest.raises(ALParseError, match=reason.replace("(", r"\(").replace(")", r"\)")):
+        parse_al(source, use_cache=False)
+
+
+def test_invalid_annotations_rejected():
+    with pytest.raises(ALParseError, match="positive integer"):
+        parse_al("function f(x: int) -> int {\n    @memoize(max=0)\n    return x;\n}\n", use_cache=False)
+    with pytest.raises(ALParseError, match="declares @effects"):
+        parse_al("function f(x: int) -> int {\n    @pure\n    @effects [db.write]\n    return x;\n}\n", use_cache=False)
+    with pytest.raises(ALParseError, match="module-level functions"):
+        parse_al("class C {\n    function f(x: int) -> int {\n        @pure\n        return x;\n    }\n}\n", use_cache=False)
+
+
+@pytest.mark.parametrize("engine, tier_threshold", [("tree", None), ("closure", None), ("tree", 1), ("closure", 5)])
+def test_runtime_caches_results(module, engine, tier_threshold):
+    runtime = PWRuntime(engine=engine, tier_threshold=tier_threshold)
+    runtime.execute_module(module)
+
+    assert runtime.execute_function(runtime.globals["fib"], [60]) == 1548008755920
+    for xs in ([1, 2], [3], [1, 2], [4], [5], [3]):
+        assert runtime.execute_function(runtime.globals["total"], [xs]) == sum(xs)
+    runtime.execute_function(runtime.globals["plain"], [1])
+
+    stats = runtime.memo_stats()
+    assert stats["fib"] == {"hits": 58, "misses": 61, "evictions": 0, "size": 61, "max_size": DEFAULT_MEMO_SIZE}
+    assert stats["total"] == {"hits": 1, "misses": 5, "evictions": 3, "size": 2, "max_size": 2}
+    assert "plain" not in stats
+    # Hits do not run the function
+    assert runtime.tier_stats()["fib"]["calls"] == 61
+    assert runtime.call_stack == []
+
+
+def test_memo_keys():
+    assert memo_key(1) != memo_key(1.0) != memo_key(True)
+    assert memo_key([1, {"a": [2]}]) == memo_key([1, {"a": [2]}])
+    assert memo_key(EnumVariantInstance("Some", [1])) != memo_key(EnumVariantInstance("Ok", [1]))
+    with pytest.raises(TypeError):
+        memo_key(lambda x: x)
+
+    # Unkeyable arguments bypass the cache
+    cache = MemoCache(4)
+    entry = cache.wrap(lambda args: args[0])
+    assert entry([len]) is len
+    assert cache.stats() == {"hits": 0, "misses": 0, "evictions": 0, "size": 0, "max_size": 4}
+
+
+def test_python_memoize_helper():
+    from assertlang.runtime.memo import MemoInfo, memoize
+
+    calls = []
+
+    @memoize(maxsize=2)
+    def double(xs):
+        calls.append(xs)
+        return [x * 2 for x in xs]
+
+    assert double([1]) == [2]
+    assert double([1]) == [2]
+    double([2])
+    double([3])
+    assert double.cache_info() == MemoInfo(hits=1, misses=3, evictions=1, size=2, maxsize=2)
+    assert len(calls) == 3
+
+    double.cache_clear()
+    assert double.cache_info() == MemoInfo(0, 0, 0, 0, 2)
+
+
+def test_python_generator_emits_cache(module):
+    from language.python_generator_v2 import generate_python
+
+    code = generate_python(module)
+    assert "from assertlang.runtime.memo import memoize" in code
+    assert f"@memoize(maxsize={DEFAULT_MEMO_SIZE})\ndef fib(" in code
+    assert "@memoize(maxsize=2)\ndef total(" in code
+    assert code.count("@memoize(") == 2
+
+
+def test_javascript_generator_emits_cache(module, tmp_path):
+    code = generate_javascript(module)
+    assert code.count("function __memoize(") == 1
+    assert "fib = __memoize(fib, 128);" in code
+    assert "total = __memoize(total, 2);" in code
+    assert "plain = __memoize" not in code
+
+    if shutil.which("node") is None:
+        pytest.skip("node is not installed")
+    script = tmp_path / "memo.js"
+    script.write_text(code + """
+console.log(fib(40));
+for (const xs of [[1, 2], [3], [1, 2], [4], [5], [3]]) total(xs);
+console.log(JSON.stringify(total.cacheInfo()));
+""")
+    out = subprocess.run(["node", str(script)], capture_output=True, text=True, check=True).stdout.split("\n")
+    assert out[0] == "102334155"
+    assert out[1] == '{"hits":1,"misses":5,"evictions":3,"maxSize":2,"size":2}'
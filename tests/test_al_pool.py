@@ -0,0 +1,164 @@
+"""
+Tests for RuntimePool: jobs by source and by IR cache key, program reuse in
+workers, errors, timeouts, worker recycling and statistics.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dsl import ir_cache
+from dsl.al_parser import parse_al
+from dsl.al_pool import Job, PoolError, PoolTimeoutError, RuntimePool
+from dsl.al_runtime import EnumVariantInstance
+from dsl.ir_cache import IRCache
+
+SOURCE = """
+function add(x: int, y: int) -> int {
+    return x + y;
+}
+
+function spin(n: int) -> int {
+    let i = 0;
+    while (i < n) {
+        i = i + 1;
+    }
+    return i;
+}
+
+function wrap(x: int) -> Option<int> {
+    return option_some(x);
+}
+"""
+
+
+@pytest.fixture
+def cache(tmp_path):
+    instance = IRCache(tmp_path / "ir")
+    ir_cache.set_ir_cache(instance)
+    ir_cache.set_ir_cache_enabled(True)
+    yield instance
+    ir_cache.set_ir_cache(None)
+    ir_cache.set_ir_cache_enabled(None)
+
+
+@pytest.fixture
+def pool(cache):
+    with RuntimePool(workers=2, timeout=10) as pool:
+        yield pool
+
+
+def test_run_by_source_and_key(pool, cache):
+    assert pool.run("add", [2, 3], source=SOURCE) == 5
+
+    parse_al(SOURCE)
+    assert pool.run("add", [4, 5], key=cache.key(SOURCE)) == 9
+    # Stdlib values pickle back to the caller
+    assert pool.run("wrap", [7], source=SOURCE) == EnumVariantInstance("Some", [7])
+
+
+def test_worker_keeps_loaded_programs(cache):
+    ir_cache.set_ir_cache_enabled(False)
+    with RuntimePool(workers=1) as pool:
+        assert pool.run("add", [1, 2], source=SOURCE) == 3
+        # Nothing was written to disk; the worker still has the program
+        assert pool.run("add", [3, 4], key=cache.key(SOURCE)) == 7
+
+
+def test_map_runs_on_all_workers(pool):
+    results = pool.map(Job("add", [i, i], source=SOURCE) for i in range(20))
+    assert [r.value for r in results] == [2 * i for i in range(20)]
+    assert all(r.ok for r in results)
+    assert len({r.worker for r in results}) == 2
+
+
+def test_errors(pool):
+    with pytest.raises(PoolError, match="PWRuntimeError: Undefined variable: nope"):
+        pool.run("add", [1, 2], source="function add(x: int, y: int) -> int {\n    return nope;\n}\n")
+    with pytest.raises(PoolError, match="ALParseError"):
+        pool.run("f", [], source="function f( {")
+    with pytest.raises(PoolError, match="no function 'missing'"):
+        pool.run("missing", [], source=SOURCE)
+    with pytest.raises(PoolError, match="No cached IR"):
+        pool.run("add", [1, 2], key="0" * 64)
+    with pytest.raises(PoolError, match="exactly one of source or key"):
+        pool.run("add", [1, 2])
+    # The workers survive failed jobs
+    assert pool.run("add", [1, 2], source=SOURCE) == 3
+    assert pool.stats()["errors"] == 5
+    assert pool.stats()["restarted"] == 0
+
+
+def test_unpicklable_args_keep_worker(cache):
+    with RuntimePool(workers=1, timeout=10) as pool:
+        with pytest.raises(PoolError, match="Job cannot be sent"):
+            pool.run("add", [lambda: 1, 2], source=SOURCE)
+        assert pool.run("add", [3, 4], source=SOURCE) == 7
+
+        results = pool.map([Job("add", [1, 1], source=SOURCE), Job("add", [lambda: 1, 2], source=SOURCE)])
+        assert results[0].value == 2 and "cannot be sent" in results[1].error
+        assert pool.stats()["restarted"] == 0
+
+
+def test_map_interrupted_replaces_running_workers(pool, monkeypatch):
+    record = pool._record
+
+    def fail_once(result):
+        monkeypatch.setattr(pool, "_record", record)
+        raise KeyboardInterrupt
+
+    # The first result aborts map() while the other job is still running
+    monkeypatch.setattr(pool, "_record", fail_once)
+    with pytest.raises(KeyboardInterrupt):
+        pool.map([Job("add", [1, 1], source=SOURCE), Job("spin", [10**6], source=SOURCE)])
+
+    assert pool._idle.qsize() == 2
+    assert pool.stats()["restarted"] >= 1
+    results = pool.map(Job("add", [i, 1], source=SOURCE) for i in range(4))
+    assert [r.value for r in results] == [1, 2, 3, 4]
+
+
+def test_timeout_replaces_worker(pool):
+    with pytest.raises(PoolTimeoutError, match="timed out"):
+        pool.run("spin", [10**9], source=SOURCE, timeout=0.2)
+
+    results = pool.map([Job("spin", [10**9], source=SOURCE, timeout=0.2), Job("add", [1, 1], source=SOURCE)])
+    assert results[0].timed_out and not results[1].timed_out
+    assert results[1].value == 2
+
+    stats = pool.stats()
+    assert stats["timeouts"] == 2 and stats["restarted"] == 2
+    assert pool.run("spin", [10], source=SOURCE) == 10
+
+
+def test_workers_recycled(cache):
+    with RuntimePool(workers=1, max_jobs_per_worker=3) as pool:
+        results = pool.map(Job("add", [i, 0], source=SOURCE) for i in range(7))
+        assert [r.value for r in results] == list(range(7))
+        pids = [r.worker for r in results]
+        assert len(set(pids[0:3])) == len(set(pids[3:6])) == 1
+        assert len(set(pids)) == 3
+        assert pool.stats()["recycled"] == 2
+
+
+def test_stats(pool):
+    pool.map(Job("add", [i, 1], source=SOURCE) for i in range(10))
+    stats = pool.stats()
+    assert stats["jobs"] == 10 and stats["workers"] == 2
+    assert stats["jobs_per_second"] > 0
+    latency = stats["latency_ms"]
+    assert 0 < latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["max"]
+
+
+def test_closed_pool_and_arguments(cache):
+    pool = RuntimePool(workers=1)
+    pool.close()
+    with pytest.raises(PoolError, match="closed"):
+        pool.run("add", [1, 2], source=SOURCE)
+    with pytest.raises(ValueError):
+        RuntimePool(workers=0)
+    with pytest.raises(ValueError):
+        RuntimePool(workers=1, max_jobs_per_worker=0)
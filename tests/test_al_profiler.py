@@ -0,0 +1,126 @@
+"""
+Tests for the AL profiler: timings with a fake clock, line counts from
+parser source locations, flamegraph/JSON output and PWRuntime integration.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dsl.al_parser import parse_al
+from dsl.al_profiler import MODULE_FRAME, Profiler
+from dsl.al_runtime import PWRuntime, PWRuntimeError
+
+SOURCE = """
+function fib(n: int) -> int {
+    if (n < 2) {
+        return n;
+    }
+    return fib(n - 1) + fib(n - 2);
+}
+
+function main() -> int {
+    let total = 0;
+    for (i in [1, 2, 3]) {
+        total = total + fib(5);
+    }
+    return total;
+}
+"""
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+def test_inclusive_and_exclusive_time():
+    clock = FakeClock()
+    profiler = Profiler(clock=clock)
+
+    profiler.enter("main")
+    clock.now += 1000
+    profiler.enter("fib")
+    clock.now += 5000
+    profiler.enter("fib")
+    clock.now += 2000
+    profiler.exit()
+    profiler.exit()
+    clock.now += 3000
+    profiler.exit()
+
+    main, fib = profiler.functions["main"], profiler.functions["fib"]
+    assert (main.calls, main.inclusive_ns, main.exclusive_ns) == (1, 11000, 4000)
+    # The recursive activation counts once towards inclusive time
+    assert (fib.calls, fib.inclusive_ns, fib.exclusive_ns) == (2, 7000, 7000)
+    assert profiler.total_ns == 11000
+    assert profiler.collapsed() == "main 4\nmain;fib 5\nmain;fib;fib 2\n"
+
+
+@pytest.mark.parametrize("engine", PWRuntime.ENGINES)
+def test_runtime_reports_calls_and_lines(engine):
+    module = parse_al(SOURCE, use_cache=False)
+    profiler = Profiler()
+    runtime = PWRuntime(engine=engine, tier_threshold=1, profiler=profiler)
+    runtime.execute_module(module)
+    assert runtime.execute_function(runtime.globals["main"], []) == 15
+
+    summary = profiler.summary()
+    calls = {entry["name"]: entry["calls"] for entry in summary["functions"]}
+    assert calls == {"main": 1, "fib": 45}
+    lines = {(entry["function"], entry["line"]): entry["count"] for entry in summary["lines"]}
+    assert lines == {
+        ("fib", 3): 45,
+        ("fib", 4): 24,
+        ("fib", 6): 21,
+        ("main", 10): 1,
+        ("main", 11): 1,
+        ("main", 12): 3,
+        ("main", 14): 1,
+    }
+    # Profiled runtimes stay in their engine
+    assert runtime.tier_stats()["fib"]["tier"] == engine
+    assert runtime.call_stack == []
+
+
+def test_exceptions_unwind_profiler():
+    module = parse_al("function boom(n: int) -> float {\n    return n / 0;\n}\n", use_cache=False)
+    profiler = Profiler()
+    runtime = PWRuntime(profiler=profiler)
+    runtime.execute_module(module)
+    with pytest.raises(PWRuntimeError, match="Division by zero"):
+        runtime.execute_function(runtime.globals["boom"], [1])
+    assert profiler.functions["boom"].calls == 1
+    assert profiler._stack == []
+
+
+def test_module_statements_and_output(tmp_path):
+    module = parse_al(SOURCE, use_cache=False)
+    profiler = Profiler()
+    runtime = PWRuntime(profiler=profiler)
+    runtime.execute_module(module)
+    runtime.execute_statement(module.functions[1].body[0], {})
+    assert profiler.lines[(MODULE_FRAME, 10)] == 1
+
+    runtime.execute_function(runtime.globals["main"], [])
+    folded, summary = profiler.write(tmp_path / "app")
+    assert folded.name == "app.folded" and summary.name == "app.profile.json"
+    for line in folded.read_text().splitlines():
+        stack, micros = line.rsplit(" ", 1)
+        assert stack.startswith("main") and int(micros) > 0
+    data = json.loads(summary.read_text())
+    assert data["functions"][0]["exclusive_ms"] >= data["functions"][1]["exclusive_ms"]
+    assert {entry["name"] for entry in data["functions"]} == {"main", "fib"}
+
+
+def test_disabled_by_default():
+    runtime = PWRuntime()
+    assert runtime.profiler is None
+    assert "execute_statement" not in vars(runtime)
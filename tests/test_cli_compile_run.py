@@ -106,6 +106,47 @@ def test_compile_default_output():
         Path(temp_pw).unlink()
 
 
+def test_compile_to_binary():
+    """Test compiling PW to binary IR."""
+    print(f"\n{'='*60}")
+    print("Testing: asl compile --format binary")
+    print(f"{'='*60}")
+
+    from dsl.ir_binary import load
+
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.al', delete=False) as f:
+        f.write("""
+function multiply(a: int, b: int) -> int {
+    return a * b;
+}
+""")
+        temp_pw = f.name
+
+    try:
+        returncode, stdout, stderr = run_cli_command([
+            "compile", temp_pw, "--format", "binary"
+        ])
+
+        assert returncode == 0, f"Compile failed with code {returncode}\n{stderr}"
+
+        # Default output should be <input>.alir
+        binary_path = Path(temp_pw).with_suffix('.alir')
+        assert binary_path.exists(), f"Binary IR file not created: {binary_path}"
+
+        module = load(binary_path, lazy=False)
+        assert [func.name for func in module.functions] == ["multiply"]
+
+        print(f"  ✅ Generated {binary_path.stat().st_size} bytes of binary IR")
+        print("✅ Compile to binary IR works")
+
+        # Cleanup
+        binary_path.unlink()
+        return True
+
+    finally:
+        Path(temp_pw).unlink()
+
+
 def test_run_executes():
     """Test run command executes PW code."""
     print(f"\n{'='*60}")
@@ -174,6 +215,45 @@ def test_run_verbose():
         Path(temp_pw).unlink()
 
 
+def test_run_profile():
+    """Test run with the profiler writes flamegraph and summary files."""
+    print(f"\n{'='*60}")
+    print("Testing: assertlang run --profile")
+    print(f"{'='*60}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pw_path = Path(tmp) / "fib.al"
+        pw_path.write_text("""
+function fib(n: int) -> int {
+    if (n < 2) {
+        return n;
+    }
+    return fib(n - 1) + fib(n - 2);
+}
+
+function main() -> int {
+    return fib(10);
+}
+""")
+
+        returncode, stdout, stderr = run_cli_command([
+            "run", str(pw_path), "--profile"
+        ])
+
+        assert returncode == 0, f"Run failed with code {returncode}\n{stderr}"
+        assert "fib" in stdout
+
+        folded = Path(tmp) / "fib.folded"
+        summary = json.loads((Path(tmp) / "fib.profile.json").read_text())
+        assert folded.read_text().startswith("main")
+        calls = {entry["name"]: entry["calls"] for entry in summary["functions"]}
+        assert calls == {"main": 1, "fib": 177}
+
+        print("  ✅ Profile files written")
+        print("✅ Run profile mode works")
+        return True
+
+
 def run_all_tests():
     """Run all CLI compile/run tests."""
     print("\n" + "="*60)
@@ -183,8 +263,10 @@ def run_all_tests():
     tests = [
         ("Compile to JSON", test_compile_to_json),
         ("Compile default output", test_compile_default_output),
+        ("Compile to binary IR", test_compile_to_binary),
         ("Run executes code", test_run_executes),
         ("Run verbose", test_run_verbose),
+        ("Run profile", test_run_profile),
     ]
 
     results = []
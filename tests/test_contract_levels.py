@@ -0,0 +1,72 @@
+"""
+Tests for compile-time contract levels (`asl build --contracts`): which
+contract code the Python and JavaScript generators emit at each level.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dsl.al_parser import parse_al
+from language.javascript_generator import generate_javascript
+from language.python_generator_v2 import PythonGeneratorV2, generate_python
+
+SOURCE = """
+function withdraw(balance: int, amount: int) -> int {
+    @requires positive: amount > 0
+    @ensures reduced: result == old balance - amount
+    return balance - amount;
+}
+
+function deposit(balance: int, amount: int) -> int {
+    @ensures grew: result > balance
+    return balance + amount;
+}
+"""
+
+
+@pytest.fixture(scope="module")
+def module():
+    return parse_al(SOURCE, use_cache=False)
+
+
+def test_python_levels(module):
+    full = generate_python(module)
+    pre = generate_python(module, contracts="pre")
+    none = generate_python(module, contracts="none")
+    for code in (full, pre, none):
+        compile(code, "<generated>", "exec")
+
+    assert '("requires", "withdraw", None, "positive", "amount > 0")' in full
+    assert '("ensures", "deposit", None, "grew", "result > balance")' in full
+    assert "__old_balance" in full
+
+    assert '"requires"' in pre and "check_clause(" in pre
+    assert '"ensures"' not in pre and "__mode.postconditions" not in pre
+    assert "__old_" not in pre and "__result" not in pre
+
+    assert "contracts" not in none
+    assert "__old_" not in none and "__result" not in none
+    assert "return (balance - amount)" in none
+
+
+def test_javascript_levels(module):
+    full = generate_javascript(module)
+    pre = generate_javascript(module, contracts="pre")
+    none = generate_javascript(module, contracts="none")
+
+    assert "shouldCheckPreconditions()" in full and "shouldCheckPostconditions()" in full
+    assert "const __old_balance" in full
+
+    assert "shouldCheckPreconditions()" in pre
+    assert "shouldCheckPostconditions()" not in pre and "__old_" not in pre
+
+    assert "contracts.js" not in none and "ContractViolationError" not in none
+
+
+def test_unknown_level():
+    with pytest.raises(ValueError, match="Unknown contract level 'some'"):
+        PythonGeneratorV2(contracts="some")
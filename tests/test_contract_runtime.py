@@ -8,15 +8,37 @@ Tests runtime enforcement of:
 - Validation modes
 """
 
+import asyncio
+import json
+import shutil
+import subprocess
+import threading
+from pathlib import Path
+
 import pytest
 from dsl.al_parser import Lexer, Parser
 from language.python_generator_v2 import generate_python
+from assertlang.runtime import contracts
 from assertlang.runtime.contracts import (
     ContractViolationError,
     ValidationMode,
+    check_clause,
+    check_postcondition,
+    check_precondition,
+    configure_sampling,
+    get_coverage,
+    get_validation_mode,
+    get_sampling_stats,
+    register_clauses,
+    reset_coverage,
+    reset_sampling,
+    set_module_validation_mode,
     set_validation_mode,
+    validation_mode,
 )
 
+CONTRACTS_JS = Path(__file__).parent.parent / "assertlang" / "runtime" / "contracts.js"
+
 
 def parse_and_generate(code: str) -> str:
     """Helper to parse PW code and generate Python."""
@@ -230,6 +252,401 @@ function bad_function(x: int) -> int {
             # Restore full mode
             set_validation_mode(ValidationMode.FULL)
 
+    def test_disabled_checks_evaluate_nothing(self):
+        """Disabled clauses, their context and old values are never evaluated."""
+        code = '''
+function size(items: list) -> int {
+    @requires not_empty: len(items) > 0
+    @ensures same_size: result == old (len(items))
+    return 0
+}
+'''
+        python_code = parse_and_generate(code)
+        assert "if __mode.preconditions:" in python_code
+        assert "if __mode.postconditions:" in python_code
+
+        namespace = {}
+        exec(python_code, namespace)
+        size = namespace["size"]
+
+        # len(None) raises if any clause is evaluated
+        set_validation_mode(ValidationMode.DISABLED)
+        try:
+            assert size(None) == 0
+        finally:
+            set_validation_mode(ValidationMode.FULL)
+
+        # The mode is read on every call, not when the module is loaded
+        with pytest.raises(TypeError):
+            size(None)
+
+        set_validation_mode(ValidationMode.PRECONDITIONS_ONLY)
+        try:
+            # Postconditions (and their old values) stay off
+            assert size([1, 2]) == 0
+        finally:
+            set_validation_mode(ValidationMode.FULL)
+
+        with pytest.raises(ContractViolationError):
+            size([1, 2])
+
+
+class TestSampledMode:
+    """SAMPLED mode checks each clause on a warm-up, then 1-in-N calls."""
+
+    CODE = '''
+function withdraw(balance: int, amount: int) -> int {
+    @requires enough: amount <= balance
+    @ensures reduced: result < balance
+    return balance - amount
+}
+'''
+
+    @pytest.fixture
+    def withdraw(self):
+        namespace = {}
+        exec(parse_and_generate(self.CODE), namespace)
+        reset_sampling()
+        set_validation_mode(ValidationMode.SAMPLED)
+        yield namespace["withdraw"]
+        set_validation_mode(ValidationMode.FULL)
+        configure_sampling()
+        reset_sampling()
+
+    def test_warmup_then_one_in_n(self, withdraw):
+        configure_sampling(preconditions=3, postconditions=5, warmup=2)
+        for _ in range(11):
+            withdraw(10, 1)
+
+        stats = get_sampling_stats()
+        # Calls 1-2 (warm-up), then every 3rd (5, 8, 11) or 5th (7)
+        assert stats["withdraw.requires.enough"] == {"checked": 5, "skipped": 6, "interval": 3}
+        assert stats["withdraw.ensures.reduced"] == {"checked": 3, "skipped": 8, "interval": 5}
+
+    def test_violations_caught_on_sampled_calls(self, withdraw):
+        configure_sampling(preconditions=4, warmup=1)
+        assert withdraw(10, 1) == 9
+
+        outcomes = []
+        for _ in range(8):
+            try:
+                outcomes.append(withdraw(1, 5))
+            except ContractViolationError:
+                outcomes.append("violation")
+        # Skipped calls run unchecked; every 4th call is checked
+        assert outcomes == [-4, -4, -4, "violation"] * 2
+
+    def test_adaptive_backoff(self, withdraw):
+        configure_sampling(preconditions=2, warmup=0, backoff_after=3, max_interval=8)
+        for _ in range(100):
+            withdraw(10, 1)
+        assert get_sampling_stats()["withdraw.requires.enough"]["interval"] == 8
+
+        # A violation restores the base rate
+        with pytest.raises(ContractViolationError):
+            for _ in range(8):
+                withdraw(1, 5)
+        assert get_sampling_stats()["withdraw.requires.enough"]["interval"] == 2
+
+    def test_counts_approximate_across_threads(self, withdraw):
+        # The counters are shared without a lock: concurrent calls may lose
+        # updates, but the stats never exceed the calls made and still show
+        # the warm-up and sampled checks
+        configure_sampling(preconditions=10, warmup=5)
+
+        def worker():
+            for _ in range(2000):
+                withdraw(10, 1)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = get_sampling_stats()["withdraw.requires.enough"]
+        assert stats["skipped"] >= 0 and stats["checked"] >= 5
+        assert stats["checked"] + stats["skipped"] <= 8000
+        assert 5 + (stats["checked"] + stats["skipped"] - 5) // 20 <= stats["checked"] <= 5 + 8000 // 5
+
+    def test_configuration_errors(self):
+        with pytest.raises(ValueError):
+            configure_sampling(preconditions=0)
+        with pytest.raises(ValueError):
+            configure_sampling(warmup=-1)
+
+
+class TestViolationContext:
+    """Context values are only gathered when a check fails."""
+
+    def test_generated_checks_report_context(self):
+        """Generated code names its locals; values are read on violation."""
+        code = '''
+function withdraw(balance: int, amount: int) -> int {
+    @requires enough: amount <= balance
+    @ensures reduced: result < balance
+    return balance - amount
+}
+'''
+        python_code = parse_and_generate(code)
+        assert 'context=("balance", "amount")' in python_code
+        assert 'context=(("result", "__result"), "balance", "amount")' in python_code
+
+        with pytest.raises(ContractViolationError) as exc_info:
+            execute_generated(python_code, "withdraw", 1, 3)
+        assert exc_info.value.context == {"balance": 1, "amount": 3}
+
+        with pytest.raises(ContractViolationError) as exc_info:
+            execute_generated(python_code, "withdraw", 5, -1)
+        assert exc_info.value.context == {"result": 6, "balance": 5, "amount": -1}
+
+    def test_lazy_context_forms(self):
+        """Callables are called, and locals read, only on violation."""
+        calls = []
+
+        def context():
+            calls.append(1)
+            return {"x": 1}
+
+        check_precondition(True, "ok", "x > 0", "f", context=context)
+        assert calls == []
+        with pytest.raises(ContractViolationError) as exc_info:
+            check_postcondition(False, "bad", "x < 0", "f", context=context)
+        assert exc_info.value.context == {"x": 1} and calls == [1]
+
+        x, value = 2, 3
+        with pytest.raises(ContractViolationError) as exc_info:
+            check_precondition(False, "bad", "x < 0", "f", context=("x", ("result", "value"), "missing"))
+        assert exc_info.value.context == {"x": 2, "result": 3}
+
+        with pytest.raises(ContractViolationError) as exc_info:
+            check_precondition(False, "bad", "x < 0", "f", context={"x": x})
+        assert exc_info.value.context == {"x": 2}
+
+    def test_javascript_runtime_matches(self, tmp_path):
+        """contracts.js materializes function contexts the same way."""
+        if shutil.which("node") is None:
+            pytest.skip("node is not installed")
+        script = tmp_path / "context.js"
+        script.write_text(f"""
+const c = require({json.dumps(str(CONTRACTS_JS))});
+let calls = 0;
+const context = () => {{ calls++; return {{ x: 1 }}; }};
+c.checkPrecondition(true, 'ok', 'x > 0', 'f', context);
+const seen = [calls];
+for (const ctx of [context, {{ x: 2 }}, null]) {{
+    try {{ c.checkPostcondition(false, 'bad', 'x < 0', 'f', ctx); }}
+    catch (e) {{ seen.push(e.context); }}
+}}
+seen.push(calls);
+console.log(JSON.stringify(seen));
+""")
+        out = subprocess.run(["node", str(script)], capture_output=True, text=True, check=True).stdout
+        assert json.loads(out) == [0, {"x": 1}, {"x": 2}, {}, 1]
+
+
+class TestClauseRegistry:
+    """Checks pass clause ids; coverage is counted in per-thread arrays."""
+
+    CODE = '''
+function scale(x: int, factor: int) -> int {
+    @requires positive_factor: factor > 0
+    @ensures scaled: result == x * factor
+    return x * factor
+}
+'''
+
+    def setup_method(self):
+        reset_coverage()
+
+    def test_generated_module_table(self):
+        python_code = parse_and_generate(self.CODE)
+        assert '("requires", "scale", None, "positive_factor", "factor > 0")' in python_code
+        assert '"positive_factor"' not in python_code.split("def scale")[1]
+
+        # Loading the module again reuses the ids, so coverage adds up
+        first, second = {}, {}
+        exec(python_code, first)
+        exec(python_code, second)
+        assert first["_AL_CLAUSES"] == second["_AL_CLAUSES"]
+        first["scale"](2, 3)
+        second["scale"](2, 3)
+        assert get_coverage() == {"scale.requires.positive_factor": 2, "scale.ensures.scaled": 2}
+
+        with pytest.raises(ContractViolationError, match="Precondition 'positive_factor' violated"):
+            first["scale"](2, 0)
+
+    def test_coverage_counts_across_threads(self):
+        (clause_id,) = register_clauses([("invariant", None, "Pool", "bounded", "size <= limit")])
+
+        def worker():
+            for _ in range(1000):
+                check_clause(True, clause_id)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert get_coverage() == {"Pool.invariant.bounded": 8000}
+
+        reset_coverage()
+        check_clause(True, clause_id)
+        assert get_coverage() == {"Pool.invariant.bounded": 1}
+
+    def test_finished_threads_release_shards(self):
+        (clause_id,) = register_clauses([("invariant", None, "Pool", "drained", "size >= 0")])
+        shards = len(contracts._COVERAGE_SHARDS)
+
+        def worker():
+            check_clause(True, clause_id)
+
+        for _ in range(50):
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+        # Each shard was folded into the totals when its thread finished
+        assert len(contracts._COVERAGE_SHARDS) == shards
+        assert get_coverage() == {"Pool.invariant.drained": 50}
+
+        reset_coverage()
+        assert get_coverage() == {}
+
+    def test_named_checks_share_ids(self):
+        (clause_id,) = register_clauses([("requires", "area", "Rect", "wide", "w > 0")])
+        check_clause(True, clause_id)
+        check_precondition(True, "wide", "w > 0", "area", class_name="Rect")
+        assert get_coverage() == {"Rect.area.requires.wide": 2}
+
+        # A precomputed id is used as given; the names are only for errors
+        check_precondition(True, "other", "w > 0", "area", clause_id=clause_id)
+        assert get_coverage() == {"Rect.area.requires.wide": 3}
+        with pytest.raises(ContractViolationError, match="Precondition 'wide' violated"):
+            check_precondition(False, "wide", "w > 0", "area", class_name="Rect", clause_id=clause_id)
+
+    def test_unknown_kind(self):
+        with pytest.raises(ValueError, match="Unknown clause kind"):
+            register_clauses([("assumes", "f", None, "c", "x")])
+
+
+class TestScopedModes:
+    """validation_mode() scopes and per-module overrides."""
+
+    CODE = '''
+function positive(x: int) -> int {
+    @requires is_positive: x > 0
+    return x
+}
+'''
+
+    @pytest.fixture
+    def positive(self):
+        namespace = {"__name__": "scoped_test_module"}
+        exec(parse_and_generate(self.CODE), namespace)
+        yield namespace["positive"]
+        set_module_validation_mode("scoped_test_module", None)
+        set_validation_mode(ValidationMode.FULL)
+
+    def test_context_manager(self, positive):
+        with validation_mode(ValidationMode.DISABLED):
+            assert positive(-1) == -1
+            assert get_validation_mode() == ValidationMode.DISABLED
+            with validation_mode(ValidationMode.FULL):
+                with pytest.raises(ContractViolationError):
+                    positive(-1)
+            assert positive(-1) == -1
+        with pytest.raises(ContractViolationError):
+            positive(-1)
+
+        # A scope also overrides the process-wide mode
+        set_validation_mode(ValidationMode.DISABLED)
+        with validation_mode(ValidationMode.PRECONDITIONS_ONLY):
+            with pytest.raises(ContractViolationError):
+                positive(-1)
+
+    def test_decorator(self, positive):
+        @validation_mode(ValidationMode.DISABLED)
+        def batch(values):
+            return [positive(value) for value in values]
+
+        @validation_mode("disabled")
+        async def batch_async(values):
+            await asyncio.sleep(0)
+            return [positive(value) for value in values]
+
+        assert batch([-1, 2]) == [-1, 2]
+        assert asyncio.run(batch_async([-1, 2])) == [-1, 2]
+        with pytest.raises(ContractViolationError):
+            positive(-1)
+
+    def test_threads_and_tasks_are_isolated(self, positive):
+        def outcome():
+            try:
+                positive(-1)
+                return "unchecked"
+            except ContractViolationError:
+                return "checked"
+
+        async def request(mode):
+            with validation_mode(mode):
+                await asyncio.sleep(0)  # Interleave with the other tasks
+                return outcome()
+
+        async def serve():
+            modes = [ValidationMode.FULL, ValidationMode.DISABLED] * 3
+            return await asyncio.gather(*(request(mode) for mode in modes))
+
+        assert asyncio.run(serve()) == ["checked", "unchecked"] * 3
+
+        results = {}
+        barrier = threading.Barrier(2)
+
+        def worker(mode):
+            with validation_mode(mode):
+                barrier.wait()
+                results[mode] = outcome()
+
+        threads = [threading.Thread(target=worker, args=(mode,))
+                   for mode in (ValidationMode.FULL, ValidationMode.DISABLED)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == {ValidationMode.FULL: "checked", ValidationMode.DISABLED: "unchecked"}
+
+    def test_shared_instance_across_tasks(self, positive):
+        """One module-level scope object can be entered by concurrent tasks."""
+        unchecked = validation_mode(ValidationMode.DISABLED)
+
+        async def request(delay):
+            with unchecked:
+                await asyncio.sleep(delay)
+                inside = positive(-1)
+                with unchecked:  # Reentrant in the same task too
+                    await asyncio.sleep(0)
+            return inside, get_validation_mode()
+
+        async def serve():
+            # The first task leaves its block while the second is still inside
+            return await asyncio.gather(request(0.01), request(0.02))
+
+        assert asyncio.run(serve()) == [(-1, ValidationMode.FULL)] * 2
+
+    def test_module_override(self, positive):
+        set_module_validation_mode("scoped_test_module", ValidationMode.DISABLED)
+        assert positive(-1) == -1
+
+        # The override outlasts process-wide changes; scopes still win
+        set_validation_mode(ValidationMode.FULL)
+        assert positive(-1) == -1
+        with validation_mode(ValidationMode.FULL):
+            with pytest.raises(ContractViolationError):
+                positive(-1)
+
+        set_module_validation_mode("scoped_test_module", None)
+        with pytest.raises(ContractViolationError):
+            positive(-1)
+
 
 class TestContractErrorMessages:
     """Test that contract errors provide helpful messages."""
@@ -42,11 +42,14 @@ from dsl.ir import (
     IRType,
     IRTypeDefinition,
     IRUnaryOp,
+    IRVisitor,
     IRWhile,
     LiteralType,
     NodeType,
     SourceLocation,
     UnaryOperator,
+    dispatches,
+    intern_type,
 )
 from dsl.validator import IRValidator, ValidationError, validate_ir
 
@@ -98,6 +101,50 @@ def test_ir_type_basic():
     assert str(map_str_int) == "map<string, int>"
 
 
+def test_ir_type_interning():
+    """Test structurally identical interned types share one instance."""
+    a = intern_type("map", [IRType(name="string"), intern_type("array", [IRType(name="int")])])
+    b = intern_type("map", [intern_type("string"), intern_type("array", [intern_type("int")])])
+
+    assert a is b
+    assert a.is_interned
+    assert a.generic_args[1] is intern_type("array", [intern_type("int")])
+    assert intern_type("int") is not intern_type("int", is_optional=True)
+    assert str(a) == "map<string, array<int>>"
+
+    # Interned and plain instances still compare and hash structurally
+    plain = IRType(name="map", generic_args=[IRType(name="string"), IRType(name="array", generic_args=[IRType(name="int")])])
+    assert not plain.is_interned
+    assert plain == a and a == plain
+    assert hash(plain) == hash(a)
+    assert plain.interned() is a
+    assert {a: "x"}[plain] == "x"
+
+
+def test_ir_type_interned_immutable():
+    """Test interned types cannot be mutated in place."""
+    import copy
+    import pickle
+
+    t = intern_type("array", [intern_type("string")])
+    with pytest.raises(AttributeError):
+        t.is_optional = True
+    with pytest.raises(TypeError):
+        t.generic_args.append(intern_type("int"))
+    with pytest.raises(AttributeError):
+        t.metadata["note"] = "shared"
+
+    assert copy.deepcopy(t) is t
+    assert pickle.loads(pickle.dumps(t)) is t
+
+
+def test_ir_type_union_str():
+    """Test union types render without recursing into themselves."""
+    t = IRType(name="int", union_types=[IRType(name="string"), IRType(name="null")])
+    assert str(t) == "int|string|null"
+    assert str(intern_type("int", union_types=[intern_type("string")], is_optional=True)) == "int|string?"
+
+
 def test_ir_literal():
     """Test IRLiteral creation."""
     # String literal
@@ -204,6 +251,56 @@ def test_ir_function_with_metadata():
     assert "test.py" in str(func.location)
 
 
+def test_ir_node_slots():
+    """Test IR nodes carry no per-instance __dict__."""
+    nodes = [
+        IRFunction(name="f"),
+        IRLiteral(value=1, literal_type=LiteralType.INTEGER),
+        IRBinaryOp(op=BinaryOperator.ADD, left=IRIdentifier(name="a"), right=IRIdentifier(name="b")),
+        IRModule(name="m"),
+    ]
+    for node in nodes:
+        assert not hasattr(node, "__dict__")
+        with pytest.raises(AttributeError):
+            node.not_a_field = 1
+
+
+def test_ir_metadata_lazy():
+    """Test metadata dict is only allocated on first write."""
+    func = IRFunction(name="test")
+    assert func._metadata is None
+    assert func.location is None
+    assert func.comment is None
+    assert func.metadata == {}
+    assert func.metadata.get("decorators", []) == []
+    assert func._metadata is None
+
+    metadata = func.metadata
+    metadata["rust_ownership"] = {"x": "borrowed"}
+    metadata["doc"] = "Docs"
+    assert func.metadata is metadata
+    assert func.metadata == {"rust_ownership": {"x": "borrowed"}, "doc": "Docs"}
+
+    other = IRIdentifier(name="x")
+    other.metadata.setdefault("tags", []).append("hot")
+    other.metadata.update(kind="local")
+    assert other.metadata == {"tags": ["hot"], "kind": "local"}
+
+
+def test_ir_metadata_copy_and_pickle():
+    """Test lazily allocated metadata survives copy and pickle."""
+    import copy
+    import pickle
+
+    func = IRFunction(name="test")
+    func.location = SourceLocation(file="test.py", line=10)
+
+    for clone in (copy.deepcopy(func), pickle.loads(pickle.dumps(func))):
+        assert clone == func
+        assert clone.location.line == 10
+        assert type(clone.metadata) is dict
+
+
 def test_ir_property():
     """Test IRProperty creation."""
     prop = IRProperty(
@@ -567,6 +664,66 @@ def test_ir_module_complex():
     assert len(module.functions) == 1
 
 
+# ============================================================================
+# Test Visitor Dispatch
+# ============================================================================
+
+
+class _NamePrinter(IRVisitor):
+    @dispatches(IRLiteral)
+    def visit_literal(self, node):
+        return repr(node.value)
+
+    @dispatches(IRIdentifier)
+    def visit_identifier(self, node):
+        return node.name
+
+    @dispatches(IRBinaryOp)
+    def visit_binary_op(self, node):
+        return f"({self.visit(node.left)} {node.op.value} {self.visit(node.right)})"
+
+    @dispatches(IRReturn, IRThrow, table="statement")
+    def visit_exit(self, node, prefix=""):
+        return prefix + type(node).__name__
+
+
+def test_visitor_dispatch():
+    """Test IRVisitor routes nodes through per-class dispatch tables."""
+    expr = IRBinaryOp(
+        op=BinaryOperator.ADD,
+        left=IRIdentifier(name="x"),
+        right=IRLiteral(value=1, literal_type=LiteralType.INTEGER),
+    )
+    printer = _NamePrinter()
+    assert printer.visit(expr) == "(x + 1)"
+    assert printer.dispatch("statement", IRReturn(), "> ") == "> IRReturn"
+    assert printer.dispatch("statement", IRThrow(exception=expr)) == "IRThrow"
+
+    with pytest.raises(TypeError, match="no 'visit' handler for IRMap"):
+        printer.visit(IRMap())
+    with pytest.raises(TypeError, match="no 'statement' handler for IRLiteral"):
+        printer.dispatch("statement", IRLiteral(value=1, literal_type=LiteralType.INTEGER))
+
+
+def test_visitor_override_and_fallback():
+    """Test subclasses override handlers by name and resolve fallbacks once."""
+
+    class Upper(_NamePrinter):
+        def visit_identifier(self, node):
+            return node.name.upper()
+
+        @dispatches(object)
+        def visit_other(self, node):
+            return "?"
+
+    assert Upper().visit(IRIdentifier(name="x")) == "X"
+    assert Upper().visit(IRMap()) == "?"
+    assert Upper.dispatch_table()[IRMap] is Upper.visit_other
+    # Subclass tables never leak into the parent
+    assert _NamePrinter().visit(IRIdentifier(name="x")) == "x"
+    assert _NamePrinter.dispatch_table()[IRIdentifier] is _NamePrinter.visit_identifier
+
+
 # ============================================================================
 # Test IR Validation
 # ============================================================================
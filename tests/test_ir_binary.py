@@ -0,0 +1,150 @@
+"""
+Tests for the binary IR serialization format.
+"""
+
+import copy
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dsl import ir_binary
+from dsl.al_parser import parse_al
+from dsl.ir import IRFunction, IRLiteral, IRModule, LiteralType, SourceLocation, intern_type
+from dsl.ir_binary import IRBinaryError, IRBinaryReader, dump, dumps, load, loads
+
+REAL_WORLD_DIR = Path(__file__).parent.parent / "examples" / "real_world"
+
+SOURCE = """
+enum Status:
+    - Active
+    - Failed(string)
+
+function add(x: int, y: int) -> int {
+    return x + y;
+}
+
+function classify(values: array<float>, limit: float) -> map<string, int> {
+    let counts = {"small": 0, "large": 0};
+    for (v in values) {
+        if (v > limit * -1.5) {
+            counts["large"] = counts["large"] + 1;
+        } else {
+            counts["small"] = counts["small"] + 1;
+        }
+    }
+    return counts;
+}
+"""
+
+
+@pytest.fixture(scope="module")
+def module():
+    return parse_al(SOURCE, use_cache=False)
+
+
+def test_roundtrip(module):
+    assert loads(dumps(module)) == module
+
+
+def test_roundtrip_real_world():
+    for path in sorted(REAL_WORLD_DIR.glob("*/*.al")):
+        original = parse_al(path.read_text(), use_cache=False)
+        assert loads(dumps(original)) == original, path
+
+
+def test_scalars_metadata_and_locations():
+    func = IRFunction(
+        name="f",
+        body=[
+            IRLiteral(value=value, literal_type=LiteralType.INTEGER)
+            for value in (0, -1, 2**62, -(2**63), 2**80, -(2**80), 1.5, "µ", None, True)
+        ],
+    )
+    func.location = SourceLocation(file="f.al", line=3, column=7)
+    func.metadata["tags"] = ("hot", ["nested", {"k": 1}])
+    original = IRModule(name="m", functions=[func])
+
+    restored = loads(dumps(original))
+    assert restored == original
+    restored_func = restored.functions[0]
+    assert restored_func.location.line == 3
+    assert restored_func.metadata["tags"] == ("hot", ["nested", {"k": 1}])
+    assert [lit.value for lit in restored_func.body][4:6] == [2**80, -(2**80)]
+
+
+def test_types_stay_interned(module):
+    restored = loads(dumps(module))
+    classify = restored.functions[1]
+    assert classify.return_type is intern_type("map", [intern_type("string"), intern_type("int")])
+    assert classify.params[0].param_type is module.functions[1].params[0].param_type
+
+
+def test_much_smaller_than_json(module):
+    import json
+    from translators.ir_converter import ir_to_mcp
+
+    assert len(dumps(module)) * 5 < len(json.dumps(ir_to_mcp(module), indent=2, default=str))
+
+
+def test_lazy_bodies(module):
+    reader = IRBinaryReader(dumps(module))
+    lazy = reader.module(lazy=True)
+    bodies = [func.body for func in lazy.functions]
+    assert not any(body.is_loaded for body in bodies)
+
+    # Signatures are available without touching the bodies
+    assert [f.name for f in lazy.functions] == ["add", "classify"]
+    assert not bodies[1].is_loaded
+
+    assert len(bodies[1]) == 3
+    assert bodies[1].is_loaded
+    assert not bodies[0].is_loaded
+    assert lazy == module
+
+
+def test_lazy_bodies_copy_and_pickle(module):
+    lazy = loads(dumps(module), lazy=True)
+    for clone in (copy.deepcopy(lazy), pickle.loads(pickle.dumps(lazy))):
+        assert clone == module
+        assert type(clone.functions[0].body) is list
+
+
+def test_load_from_file_with_mmap(module, tmp_path):
+    path = tmp_path / "module.alir"
+    size = dump(module, path)
+    assert path.stat().st_size == size
+
+    reader = IRBinaryReader.open(path)
+    assert reader._mmap is not None
+    lazy = reader.module(lazy=True)
+    assert lazy.functions[0].body == module.functions[0].body
+
+    reader.close()
+    with pytest.raises(IRBinaryError, match="closed"):
+        len(lazy.functions[1].body)
+
+    assert load(path, lazy=False) == module
+    assert load(path, use_mmap=False) == module
+
+
+def test_rejects_bad_input(module):
+    data = dumps(module)
+    with pytest.raises(IRBinaryError, match="magic"):
+        loads(b"JSON" + data[4:])
+    with pytest.raises(IRBinaryError, match="version"):
+        loads(data[:4] + bytes([ir_binary.FORMAT_VERSION + 1]) + data[5:])
+    with pytest.raises(IRBinaryError):
+        loads(data[:8])
+    with pytest.raises(IRBinaryError):
+        loads(data[: len(data) // 2])
+
+
+def test_rejects_non_ir_classes():
+    with pytest.raises(IRBinaryError, match="Refusing"):
+        ir_binary._resolve("os", "system")
+    with pytest.raises(IRBinaryError, match="Cannot serialize"):
+        dumps(IRModule(name="m", functions=[IRFunction(name="f", doc=object())]))
@@ -0,0 +1,165 @@
+"""
+Tests for the on-disk IR cache used by parse_al.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dsl import ir_cache
+from dsl.al_parser import ALParseError, parse_al
+from dsl.ir_cache import IRCache
+
+SOURCE = """
+function add(x: int, y: int) -> int {
+    return x + y;
+}
+
+function clamp(v: int, lo: int, hi: int) -> int {
+    if (v < lo) {
+        return lo;
+    }
+    if (v > hi) {
+        return hi;
+    }
+    return v;
+}
+"""
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Install an isolated process-wide cache for the duration of a test."""
+    instance = IRCache(tmp_path / "ir")
+    ir_cache.set_ir_cache(instance)
+    ir_cache.set_ir_cache_enabled(True)
+    yield instance
+    ir_cache.set_ir_cache(None)
+    ir_cache.set_ir_cache_enabled(None)
+
+
+def _shape(module):
+    return [
+        (f.name, [p.name for p in f.params], len(f.body))
+        for f in module.functions
+    ]
+
+
+def test_miss_then_hit(cache):
+    cold = parse_al(SOURCE)
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hits"] == 0
+
+    warm = parse_al(SOURCE)
+    assert cache.stats()["hits"] == 1
+    assert warm is not cold
+    assert _shape(warm) == _shape(cold)
+
+
+def test_warm_hit_skips_parser(cache, monkeypatch):
+    parse_al(SOURCE)
+
+    import dsl.al_parser as al_parser
+
+    def boom(*args, **kwargs):
+        raise AssertionError("parser should not run on a cache hit")
+
+    monkeypatch.setattr(al_parser, "tokenize", boom)
+    module = parse_al(SOURCE)
+    assert [f.name for f in module.functions] == ["add", "clamp"]
+
+
+def test_hits_return_independent_copies(cache):
+    parse_al(SOURCE)
+    first = parse_al(SOURCE)
+    first.functions.clear()
+    second = parse_al(SOURCE)
+    assert len(second.functions) == 2
+
+
+def test_key_depends_on_source_and_parser_version(cache, monkeypatch):
+    key = cache.key(SOURCE)
+    assert cache.key(SOURCE + " ") != key
+
+    monkeypatch.setattr(ir_cache, "_parser_fingerprint", "other-parser")
+    assert cache.key(SOURCE) != key
+
+
+def test_opt_out(cache):
+    parse_al(SOURCE, use_cache=False)
+    assert (cache.hits, cache.misses) == (0, 0)
+    assert cache.size_bytes() == 0
+
+    ir_cache.set_ir_cache_enabled(False)
+    parse_al(SOURCE)
+    assert cache.size_bytes() == 0
+
+
+def test_env_opt_out(cache, monkeypatch):
+    ir_cache.set_ir_cache_enabled(None)
+    monkeypatch.setenv("ASSERTLANG_IR_CACHE", "0")
+    assert not ir_cache.ir_cache_enabled()
+    parse_al(SOURCE)
+    assert cache.size_bytes() == 0
+
+
+def test_reference_lexer_bypasses_cache(cache):
+    parse_al(SOURCE, lexer="reference")
+    assert cache.size_bytes() == 0
+
+
+def test_parse_errors_are_not_cached(cache):
+    with pytest.raises(ALParseError):
+        parse_al("function broken( {")
+    assert cache.size_bytes() == 0
+
+
+def test_corrupt_entry_is_treated_as_miss(cache):
+    parse_al(SOURCE)
+    entry = cache._path(cache.key(SOURCE))
+    entry.write_bytes(b"not a cache entry")
+
+    module = parse_al(SOURCE)
+    assert [f.name for f in module.functions] == ["add", "clamp"]
+    assert cache.stats()["hits"] == 0
+
+
+def test_lru_eviction(tmp_path):
+    sources = [f"function f{i}(x: int) -> int {{ return x + {i}; }}" for i in range(4)]
+    probe = IRCache(tmp_path / "probe")
+    probe.put(sources[0], parse_al(sources[0], use_cache=False))
+    entry_size = probe.size_bytes()
+
+    cache = IRCache(tmp_path / "ir", max_bytes=entry_size * 2 + entry_size // 2)
+    for i, source in enumerate(sources[:2]):
+        cache.put(source, parse_al(source, use_cache=False))
+        os.utime(cache._path(cache.key(source)), (1000 + i, 1000 + i))
+
+    # Touch the older entry so the other one becomes least recently used
+    assert cache.get(sources[0]) is not None
+
+    cache.put(sources[2], parse_al(sources[2], use_cache=False))
+    assert cache.evictions == 1
+    assert cache.get(sources[1]) is None
+    assert cache.get(sources[0]) is not None
+    assert cache.get(sources[2]) is not None
+    assert cache.size_bytes() <= cache.max_bytes
+
+
+def test_clear(cache):
+    parse_al(SOURCE)
+    assert cache.clear() == 1
+    assert cache.size_bytes() == 0
+
+
+def test_default_dir_honours_env(monkeypatch, tmp_path):
+    monkeypatch.delenv("ASSERTLANG_IR_CACHE_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert ir_cache.default_cache_dir() == tmp_path / "assertlang" / "ir"
+
+    monkeypatch.setenv("ASSERTLANG_IR_CACHE_DIR", str(tmp_path / "custom"))
+    assert ir_cache.default_cache_dir() == tmp_path / "custom"
@@ -0,0 +1,124 @@
+"""
+Test operator precedence and associativity in the PW expression parser.
+
+Expressions are rendered as s-expressions so the expected tree shape is
+readable at a glance.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dsl.al_parser import ALParseError, Parser, tokenize
+from dsl.ir import (
+    IRBinaryOp,
+    IRCall,
+    IRIdentifier,
+    IRLiteral,
+    IRPatternMatch,
+    IRPropertyAccess,
+    IRTernary,
+    IRUnaryOp,
+)
+
+
+def sexpr(node) -> str:
+    if isinstance(node, IRBinaryOp):
+        return f"({node.op.value} {sexpr(node.left)} {sexpr(node.right)})"
+    if isinstance(node, IRUnaryOp):
+        return f"({node.op.value} {sexpr(node.operand)})"
+    if isinstance(node, IRTernary):
+        return f"(?: {sexpr(node.condition)} {sexpr(node.true_value)} {sexpr(node.false_value)})"
+    if isinstance(node, IRPatternMatch):
+        return f"(is {sexpr(node.value)} {sexpr(node.pattern)})"
+    if isinstance(node, IRCall):
+        args = " ".join(sexpr(a) for a in node.args)
+        return f"(call {sexpr(node.function)}{' ' + args if args else ''})"
+    if isinstance(node, IRPropertyAccess):
+        return f"{sexpr(node.object)}.{node.property}"
+    if isinstance(node, IRIdentifier):
+        return node.name
+    if isinstance(node, IRLiteral):
+        return repr(node.value)
+    raise AssertionError(f"unexpected node {type(node).__name__}")
+
+
+def parse_expr(source: str):
+    parser = Parser(tokenize(source + "\n"))
+    return parser.parse_expression(), parser
+
+
+@pytest.mark.parametrize("source, expected", [
+    # Arithmetic precedence and left associativity
+    ("a + b * c", "(+ a (* b c))"),
+    ("a - b - c", "(- (- a b) c)"),
+    ("a * b / c % d", "(% (/ (* a b) c) d)"),
+    ("a ** b ** c", "(** (** a b) c)"),
+    ("a // b + c", "(+ (// a b) c)"),
+    # Shifts and bitwise levels
+    ("a << 1 + b", "(<< a (+ 1 b))"),
+    ("a | b ^ c & d", "(| a (^ b (& c d)))"),
+    ("a & b == c", "(== (& a b) c)"),
+    # Comparisons chain left-to-right
+    ("a < b < c", "(< (< a b) c)"),
+    ("x in xs == true", "(== (in x xs) True)"),
+    # Logical operators, both spellings
+    ("a or b and c", "(or a (and b c))"),
+    ("a || b && c", "(or a (and b c))"),
+    ("a and b or c and d", "(or (and a b) (and c d))"),
+    # Prefix operators
+    ("-a * b", "(* (- a) b)"),
+    ("- - a", "(- (- a))"),
+    ("!a && b", "(and (not a) b)"),
+    ("~a + +b", "(+ (~ a) (+ b))"),
+    ("not a == b and c", "(and (not (== a b)) c)"),
+    ("a or not b", "(or a (not b))"),
+    # Postfix binds tighter than prefix
+    ("-obj.f(x)", "(- (call obj.f x))"),
+    # Pattern matching ends the comparison level
+    ("opt is Some(v) and v > 0", "(and (is opt (call Some v)) (> v 0))"),
+    ("a + b is None", "(is (+ a b) None)"),
+    # Ternary operands are full logical expressions
+    ("a + 1 if x > 0 and y else b or c", "(?: (and (> x 0) y) (+ a 1) (or b c))"),
+    # Grouping
+    ("(a + b) * c", "(* (+ a b) c)"),
+])
+def test_precedence_and_associativity(source, expected):
+    expr, _ = parse_expr(source)
+    assert sexpr(expr) == expected
+
+
+def test_pattern_match_is_not_continued_by_higher_operators():
+    """`x is P` may only be followed by and/or; other operators are left unconsumed."""
+    expr, parser = parse_expr("x is None == y")
+    assert sexpr(expr) == "(is x None)"
+    assert parser.current().value == "=="
+
+
+def test_not_is_only_valid_in_logical_position():
+    with pytest.raises(ALParseError):
+        parse_expr("a == not b")
+
+
+def test_deeply_nested_expression():
+    depth = 120
+    source = "(" * depth + "a" + " + 1)" * depth
+    expr, _ = parse_expr(source)
+    for _ in range(depth):
+        assert expr.op.value == "+"
+        expr = expr.left
+    assert sexpr(expr) == "a"
+
+
+def test_long_flat_expression():
+    source = " + ".join(f"x{i}" for i in range(500))
+    expr, _ = parse_expr(source)
+    assert sexpr(expr.right) == "x499"
+    count = 0
+    while isinstance(expr, IRBinaryOp):
+        count += 1
+        expr = expr.left
+    assert count == 499
@@ -17,6 +17,8 @@ from dsl.ir import (
     IRAssignment,
     IRBinaryOp,
     IRCall,
+    IREnum,
+    IREnumVariant,
     IRFor,
     IRForCStyle,
     IRFunction,
@@ -25,12 +27,22 @@ from dsl.ir import (
     IRLiteral,
     IRModule,
     IRParameter,
+    IRPatternMatch,
+    IRPropertyAccess,
     IRReturn,
     IRType,
     IRWhile,
     LiteralType,
 )
-from dsl.al_runtime import EnumVariantInstance, PWRuntime, PWRuntimeError
+from dsl.al_runtime import (
+    EnumVariantInstance,
+    PatternMatcher,
+    PWRuntime,
+    PWRuntimeError,
+    compile_pattern,
+    get_property,
+    variant_table,
+)
 
 
 def test_runtime_literal_evaluation():
@@ -413,6 +425,56 @@ def test_runtime_enum_variant():
     assert none_value.values == []
 
 
+def test_runtime_enum_variant_table():
+    """Variant constructors are looked up in a per-enum table and shared"""
+    enum = IREnum(name="Shape", variants=[IREnumVariant(name="Circle"), IREnumVariant(name="Square")])
+    table = variant_table(enum)
+    assert variant_table(enum) is table
+    assert get_property(enum, "Square") is table["Square"]
+    assert table["Circle"](1.5) == EnumVariantInstance("Circle", [1.5])
+
+    runtime = PWRuntime()
+    runtime.execute_module(IRModule(name="shapes", enums=[enum]))
+    assert runtime.globals["Circle"] is table["Circle"]
+
+    with pytest.raises(PWRuntimeError, match="Enum Shape has no variant Triangle"):
+        get_property(enum, "Triangle")
+
+    # Instances are slotted
+    assert not hasattr(EnumVariantInstance("None", []), "__dict__")
+
+
+def test_runtime_pattern_matcher():
+    """Pattern strings are compiled once"""
+    assert compile_pattern("Some(val)") is compile_pattern("Some(val)")
+
+    some = EnumVariantInstance("Some", [42])
+    assert PatternMatcher.match(some, "Some(val)").bindings == {"val": 42}
+    assert PatternMatcher.match(some, "Some(_)").matched
+    assert not PatternMatcher.match(some, "None").matched
+    assert not PatternMatcher.match(42, "Some(val)").matched
+    assert not PatternMatcher.match(EnumVariantInstance("Some", []), "Some(val)").matched
+    assert PatternMatcher.match(EnumVariantInstance("Pair", [1, 2]), "Pair(p)").bindings == {"p": (1, 2)}
+
+
+def test_runtime_pattern_match_expression():
+    """`is` binds captures in the current scope when it matches"""
+    runtime = PWRuntime()
+    pattern = IRCall(
+        function=IRPropertyAccess(object=IRIdentifier(name="Pair"), property="Both"),
+        args=[IRIdentifier(name="a"), IRIdentifier(name="_")],
+    )
+    expr = IRPatternMatch(value=IRIdentifier(name="v"), pattern=pattern)
+
+    scope = {"v": EnumVariantInstance("Both", [1, 2])}
+    assert runtime.evaluate_expression(expr, scope) is True
+    assert scope["a"] == 1 and "_" not in scope
+
+    scope = {"v": EnumVariantInstance("Both", [1])}
+    assert runtime.evaluate_expression(expr, scope) is False
+    assert "a" not in scope
+
+
 def test_runtime_division_by_zero():
     """Test division by zero error"""
     runtime = PWRuntime()
@@ -0,0 +1,78 @@
+"""
+Tests for call frames in dsl.runtime.PWRuntime: per-call locals, globals,
+recursion and frame cleanup on errors.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dsl.al_parser import parse_al
+from dsl.ir import IRLiteral
+from dsl.runtime import PWRuntime
+
+SOURCE = """
+function fib(n: int) -> int {
+    if (n < 2) {
+        return n;
+    }
+    return fib(n - 1) + fib(n - 2);
+}
+
+function caller() -> int {
+    let secret = 1;
+    let result = callee();
+    return secret + result;
+}
+
+function callee() -> int {
+    let secret = 100;
+    return secret + scale;
+}
+
+function leaky() -> int {
+    let secret = 1;
+    return peek();
+}
+
+function peek() -> int {
+    return secret;
+}
+"""
+
+
+@pytest.fixture
+def runtime():
+    runtime = PWRuntime()
+    for func in parse_al(SOURCE, use_cache=False).functions:
+        runtime.context.functions[func.name] = func
+    runtime.context.globals["scale"] = 10
+    return runtime
+
+
+def call(runtime, name, *args):
+    return runtime.execute_function(runtime.context.functions[name], [IRLiteral(value=a, literal_type=None) for a in args])
+
+
+def test_recursion(runtime):
+    assert [call(runtime, "fib", n) for n in range(10)] == [0, 1, 1, 2, 3, 5, 8, 13, 21, 34]
+    assert runtime.context.frames == []
+    assert runtime.context.variables is runtime.context.globals
+
+
+def test_calls_get_their_own_locals(runtime):
+    # callee's secret does not overwrite caller's; both read the global scale
+    assert call(runtime, "caller") == 111
+    assert runtime.context.globals == {"scale": 10}
+
+
+def test_callee_cannot_see_caller_locals(runtime):
+    with pytest.raises(NameError, match="Variable not defined: secret"):
+        call(runtime, "leaky")
+    # The frames of the failed calls were popped
+    assert runtime.context.frames == []
+    assert runtime.context.variables is runtime.context.globals
+    assert call(runtime, "caller") == 111
@@ -0,0 +1,111 @@
+"""
+Tests for the dsl.runtime operation registry: built-in operations, plugin
+registration, per-call-site resolution and the lazily loaded CharCNN model.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dsl import operations
+from dsl.operations import OPERATIONS, register_operation, resolve_operation
+from dsl.runtime import PWRuntime
+
+SOURCE = """
+function main() -> int {
+    let i = 0;
+    while (i < 3) {
+        print(str.upper("ok"), math.max(i, 1), text.shout("hi"));
+        i = i + 1;
+    }
+    return 0;
+}
+"""
+
+
+@pytest.fixture
+def shout():
+    register_operation("text.shout", lambda value: value.upper() + "!")
+    yield
+    del OPERATIONS["text.shout"]
+
+
+def test_builtin_operations():
+    runtime = PWRuntime()
+    assert runtime.execute_operation("str.split", ["a,b", ","]) == ["a", "b"]
+    assert runtime.execute_operation("str.contains", ["assert", "ss"]) is True
+    assert runtime.execute_operation("math.pow", [2, 3]) == 8.0
+    assert runtime.execute_operation("math.min", [3, 1, 2]) == 1
+    assert runtime.execute_operation("json.stringify_pretty", [{"a": 1}]) == '{\n  "a": 1\n}'
+
+    items = [3, 1]
+    assert runtime.execute_operation("array.push", [items, 2]) is None
+    runtime.execute_operation("array.sort", [items])
+    assert items == [1, 2, 3]
+
+
+def test_file_operations(tmp_path):
+    runtime = PWRuntime()
+    path = str(tmp_path / "out.txt")
+    runtime.execute_operation("file.write", [path, "data"])
+    assert runtime.execute_operation("file.read", [path]) == "data"
+    runtime.execute_operation("file.delete", [path])
+    assert runtime.execute_operation("file.exists", [path]) is False
+
+
+def test_unknown_operation():
+    with pytest.raises(NotImplementedError, match="Operation not implemented: str.shout"):
+        PWRuntime().execute_operation("str.shout", ["x"])
+    with pytest.raises(ValueError, match="namespace.method"):
+        register_operation("shout")
+
+
+def test_plugin_operation_and_call_site_resolution(shout, capsys, monkeypatch):
+    runtime = PWRuntime()
+    runtime.execute(SOURCE)
+    assert capsys.readouterr().out == "OK 1 HI!\nOK 1 HI!\nOK 2 HI!\n"
+    # Three call sites, each resolved once
+    assert len(runtime._call_sites) == 3
+
+    calls = []
+    monkeypatch.setattr("dsl.runtime.resolve_operation", lambda op: calls.append(op) or resolve_operation(op))
+    runtime.execute_function(runtime.context.functions["main"], [])
+    assert calls == []
+
+
+def test_entry_point_plugins_loaded_on_miss(monkeypatch):
+    class EntryPoint:
+        name = "demo"
+
+        def load(self):
+            return lambda register: register("demo.answer", lambda: 42)
+
+    class EntryPoints:
+        def select(self, group):
+            assert group == "assertlang.operations"
+            return [EntryPoint()]
+
+    monkeypatch.setattr("importlib.metadata.entry_points", lambda: EntryPoints())
+    monkeypatch.setattr(operations, "_plugins_loaded", False)
+    try:
+        assert resolve_operation("demo.answer")() == 42
+    finally:
+        OPERATIONS.pop("demo.answer", None)
+
+
+def test_charcnn_loaded_lazily(capsys, monkeypatch):
+    monkeypatch.setitem(sys.modules, "ml.inference", None)
+    runtime = PWRuntime()
+    assert capsys.readouterr().out == ""
+
+    assert runtime.operation_lookup is None
+    assert "CharCNN not available" in capsys.readouterr().out
+    # The failed load is not retried
+    assert runtime.operation_lookup is None
+    assert capsys.readouterr().out == ""
+
+    assert PWRuntime(use_charcnn=False).operation_lookup is None
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,122 @@
+"""
+Tests for the frozen stdlib snapshot shared by PWRuntime instances.
+"""
+
+import logging
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dsl import ir_cache
+from dsl.al_runtime import EnumVariantInstance, PWRuntime
+from dsl.stdlib_snapshot import (
+    StdlibNotFoundError,
+    build_snapshot,
+    find_stdlib_source,
+    get_stdlib_snapshot,
+    load_snapshot,
+    snapshot_key,
+    snapshot_path_for,
+)
+
+
+@pytest.fixture
+def stdlib_copy(tmp_path):
+    """A private copy of the stdlib source so snapshot files land in tmp_path."""
+    source = find_stdlib_source()
+    target = tmp_path / source.name
+    target.write_text(source.read_text())
+    return target
+
+
+def test_build_writes_snapshot(stdlib_copy):
+    snapshot = build_snapshot(stdlib_copy)
+    assert snapshot_path_for(stdlib_copy).exists()
+    assert {e.name for e in snapshot.enums} >= {"Option", "Result"}
+    assert any(f.name == "option_some" for f in snapshot.functions)
+
+
+def test_load_uses_snapshot_without_parsing(stdlib_copy, monkeypatch, caplog):
+    build_snapshot(stdlib_copy)
+
+    import dsl.al_parser as al_parser
+
+    def boom(*args, **kwargs):
+        raise AssertionError("stdlib should not be re-parsed")
+
+    monkeypatch.setattr(al_parser, "parse_al", boom)
+    snapshot = load_snapshot(stdlib_copy)
+    assert {e.name for e in snapshot.enums} >= {"Option", "Result"}
+    assert not caplog.records
+
+
+def test_stale_snapshot_is_rebuilt(stdlib_copy, caplog):
+    first = build_snapshot(stdlib_copy)
+    stdlib_copy.write_text(
+        stdlib_copy.read_text() + "\nfunction extra_helper() -> int {\n    return 1\n}\n"
+    )
+
+    with caplog.at_level(logging.WARNING, logger="dsl.stdlib_snapshot"):
+        second = load_snapshot(stdlib_copy)
+    assert "missing or stale; rebuilding it from source" in caplog.text
+    assert second.key != first.key
+    assert any(f.name == "extra_helper" for f in second.functions)
+
+    with open(snapshot_path_for(stdlib_copy), "rb") as f:
+        assert pickle.load(f)["key"] == second.key
+
+
+def test_key_ignores_python_version(monkeypatch):
+    # Wheels ship the snapshot for every interpreter; the IR cache stays per version
+    key, fingerprint = snapshot_key("source"), ir_cache.parser_fingerprint()
+    monkeypatch.setattr(ir_cache, "_parser_fingerprint", None)
+    monkeypatch.setattr(ir_cache, "_source_fingerprint", None)
+    monkeypatch.setattr(sys, "version_info", (3, 99, 0))
+    assert snapshot_key("source") == key
+    assert ir_cache.parser_fingerprint() != fingerprint
+
+
+def test_corrupt_snapshot_is_rebuilt(stdlib_copy):
+    snapshot_path_for(stdlib_copy).write_bytes(b"garbage")
+    snapshot = load_snapshot(stdlib_copy)
+    assert {e.name for e in snapshot.enums} >= {"Option", "Result"}
+
+
+def test_missing_stdlib(tmp_path):
+    with pytest.raises(StdlibNotFoundError):
+        find_stdlib_source(tmp_path)
+
+
+def test_snapshot_is_shared_across_runtimes():
+    first = PWRuntime()
+    first.load_stdlib()
+    second = PWRuntime()
+    second.load_stdlib()
+
+    assert get_stdlib_snapshot() is get_stdlib_snapshot()
+    assert first.globals["Option"] is second.globals["Option"]
+    assert first.globals["option_some"] is second.globals["option_some"]
+    assert first.globals["Some"] is second.globals["Some"]
+
+
+def test_runtime_globals_are_isolated():
+    first = PWRuntime()
+    first.load_stdlib()
+    first.globals["Some"] = "shadowed"
+    first.globals["tenant_value"] = 1
+
+    second = PWRuntime()
+    second.load_stdlib()
+    assert isinstance(second.globals["Some"](1), EnumVariantInstance)
+    assert "tenant_value" not in second.globals
+
+
+def test_snapshot_is_frozen():
+    snapshot = get_stdlib_snapshot()
+    with pytest.raises(AttributeError):
+        snapshot.functions = ()
+    assert isinstance(snapshot.functions, tuple)
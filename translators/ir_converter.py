@@ -8,7 +8,7 @@ This allows IR nodes to be sent as MCP tool parameters and returned as MCP tool
 
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 # Add parent directories to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -18,42 +18,32 @@ from dsl.ir import (
     IRStatement, IRExpression, IRAssignment, IRReturn, IRThrow, IRIf, IRFor, IRForCStyle, IRWhile,
     IRTry, IRCatch, IRBreak, IRContinue, IRCall, IRBinaryOp, IRUnaryOp, IRLiteral, IRIdentifier,
     IRPropertyAccess, IRIndex, IRLambda, IRArray, IRMap, IRTernary,
-    IRType, IRImport, IRTypeDefinition, IREnum, IREnumVariant,
-    BinaryOperator, UnaryOperator, LiteralType,
+    IRType, IRImport, IRTypeDefinition, IREnum, IREnumVariant, intern_type,
+    BinaryOperator, UnaryOperator, LiteralType, IRVisitor, dispatches,
 )
 
 
-def ir_to_mcp(node: Any) -> Dict[str, Any]:
-    """
-    Convert IR node to MCP tree (JSON-serializable dict).
-
-    Args:
-        node: Any IR node (IRModule, IRFunction, IRExpression, etc.)
-
-    Returns:
-        Dict representing the node as MCP tool call
-    """
-    if node is None:
-        return None
+class _MCPEncoder(IRVisitor):
+    """Encode IR nodes as MCP trees, one handler per node class."""
 
-    # Module
-    if isinstance(node, IRModule):
+    @dispatches(IRModule)
+    def visit_module(self, node: IRModule) -> Dict[str, Any]:
         return {
             "tool": "pw_module",
             "params": {
                 "name": node.name,
                 "version": node.version,
-                "imports": [ir_to_mcp(imp) for imp in node.imports],
-                "functions": [ir_to_mcp(func) for func in node.functions],
-                "classes": [ir_to_mcp(cls) for cls in node.classes],
-                "types": [ir_to_mcp(t) for t in node.types],
-                "enums": [ir_to_mcp(e) for e in node.enums],
-                "module_vars": [ir_to_mcp(v) for v in node.module_vars],
+                "imports": [self.visit(imp) for imp in node.imports],
+                "functions": [self.visit(func) for func in node.functions],
+                "classes": [self.visit(cls) for cls in node.classes],
+                "types": [self.visit(t) for t in node.types],
+                "enums": [self.visit(e) for e in node.enums],
+                "module_vars": [self.visit(v) for v in node.module_vars],
             }
         }
 
-    # Import
-    elif isinstance(node, IRImport):
+    @dispatches(IRImport)
+    def visit_import(self, node: IRImport) -> Dict[str, Any]:
         return {
             "tool": "pw_import",
             "params": {
@@ -63,15 +53,15 @@ def ir_to_mcp(node: Any) -> Dict[str, Any]:
             }
         }
 
-    # Function
-    elif isinstance(node, IRFunction):
+    @dispatches(IRFunction)
+    def visit_function(self, node: IRFunction) -> Dict[str, Any]:
         return {
             "tool": "pw_function",
             "params": {
                 "name": node.name,
-                "params": [ir_to_mcp(p) for p in node.params],
-                "return_type": ir_to_mcp(node.return_type) if node.return_type else None,
-                "body": [ir_to_mcp(stmt) for stmt in node.body],
+                "params": [self.visit(p) for p in node.params],
+                "return_type": self.visit(node.return_type) if node.return_type else None,
+                "body": [self.visit(stmt) for stmt in node.body],
                 "is_async": node.is_async,
                 "is_static": node.is_static if hasattr(node, 'is_static') else False,
                 "is_private": node.is_private if hasattr(node, 'is_private') else False,
@@ -80,173 +70,188 @@ def ir_to_mcp(node: Any) -> Dict[str, Any]:
             }
         }
 
-    # Parameter
-    elif isinstance(node, IRParameter):
+    @dispatches(IRParameter)
+    def visit_parameter(self, node: IRParameter) -> Dict[str, Any]:
         return {
             "tool": "pw_parameter",
             "params": {
                 "name": node.name,
-                "param_type": ir_to_mcp(node.param_type) if node.param_type else None,
-                "default_value": ir_to_mcp(node.default_value) if node.default_value else None,
+                "param_type": self.visit(node.param_type) if node.param_type else None,
+                "default_value": self.visit(node.default_value) if node.default_value else None,
                 "is_variadic": node.is_variadic,
             }
         }
 
-    # Class
-    elif isinstance(node, IRClass):
+    @dispatches(IRClass)
+    def visit_class(self, node: IRClass) -> Dict[str, Any]:
         return {
             "tool": "pw_class",
             "params": {
                 "name": node.name,
                 "base_classes": node.base_classes or [],
-                "properties": [ir_to_mcp(p) for p in node.properties],
-                "methods": [ir_to_mcp(m) for m in node.methods],
-                "constructor": ir_to_mcp(node.constructor) if node.constructor else None,
+                "properties": [self.visit(p) for p in node.properties],
+                "methods": [self.visit(m) for m in node.methods],
+                "constructor": self.visit(node.constructor) if node.constructor else None,
             }
         }
 
-    # Property
-    elif isinstance(node, IRProperty):
+    @dispatches(IRProperty)
+    def visit_property(self, node: IRProperty) -> Dict[str, Any]:
         return {
             "tool": "pw_property",
             "params": {
                 "name": node.name,
-                "prop_type": ir_to_mcp(node.prop_type),
-                "default_value": ir_to_mcp(node.default_value) if node.default_value else None,
+                "prop_type": self.visit(node.prop_type),
+                "default_value": self.visit(node.default_value) if node.default_value else None,
             }
         }
 
     # Statements
-    elif isinstance(node, IRAssignment):
+    @dispatches(IRAssignment)
+    def visit_assignment(self, node: IRAssignment) -> Dict[str, Any]:
         return {
             "tool": "pw_assignment",
             "params": {
-                "target": node.target if isinstance(node.target, str) else ir_to_mcp(node.target),
-                "value": ir_to_mcp(node.value),
-                "var_type": ir_to_mcp(node.var_type) if node.var_type else None,
+                "target": node.target if isinstance(node.target, str) else self.visit(node.target),
+                "value": self.visit(node.value),
+                "var_type": self.visit(node.var_type) if node.var_type else None,
                 "is_declaration": node.is_declaration,
             }
         }
 
-    elif isinstance(node, IRReturn):
+    @dispatches(IRReturn)
+    def visit_return(self, node: IRReturn) -> Dict[str, Any]:
         return {
             "tool": "pw_return",
             "params": {
-                "value": ir_to_mcp(node.value) if node.value else None,
+                "value": self.visit(node.value) if node.value else None,
             }
         }
 
-    elif isinstance(node, IRThrow):
+    @dispatches(IRThrow)
+    def visit_throw(self, node: IRThrow) -> Dict[str, Any]:
         return {
             "tool": "pw_throw",
             "params": {
-                "exception": ir_to_mcp(node.exception),
+                "exception": self.visit(node.exception),
             }
         }
 
-    elif isinstance(node, IRBreak):
+    @dispatches(IRBreak)
+    def visit_break(self, node: IRBreak) -> Dict[str, Any]:
         return {
             "tool": "pw_break",
             "params": {}
         }
 
-    elif isinstance(node, IRContinue):
+    @dispatches(IRContinue)
+    def visit_continue(self, node: IRContinue) -> Dict[str, Any]:
         return {
             "tool": "pw_continue",
             "params": {}
         }
 
-    elif isinstance(node, IRIf):
+    @dispatches(IRIf)
+    def visit_if(self, node: IRIf) -> Dict[str, Any]:
         return {
             "tool": "pw_if",
             "params": {
-                "condition": ir_to_mcp(node.condition),
-                "then_body": [ir_to_mcp(stmt) for stmt in node.then_body],
-                "else_body": [ir_to_mcp(stmt) for stmt in node.else_body] if node.else_body else None,
+                "condition": self.visit(node.condition),
+                "then_body": [self.visit(stmt) for stmt in node.then_body],
+                "else_body": [self.visit(stmt) for stmt in node.else_body] if node.else_body else None,
             }
         }
 
-    elif isinstance(node, IRForCStyle):
+    @dispatches(IRForCStyle)
+    def visit_for_c_style(self, node: IRForCStyle) -> Dict[str, Any]:
         return {
             "tool": "pw_for_c_style",
             "params": {
-                "init": ir_to_mcp(node.init),
-                "condition": ir_to_mcp(node.condition),
-                "increment": ir_to_mcp(node.increment),
-                "body": [ir_to_mcp(stmt) for stmt in node.body],
+                "init": self.visit(node.init),
+                "condition": self.visit(node.condition),
+                "increment": self.visit(node.increment),
+                "body": [self.visit(stmt) for stmt in node.body],
             }
         }
 
-    elif isinstance(node, IRFor):
+    @dispatches(IRFor)
+    def visit_for(self, node: IRFor) -> Dict[str, Any]:
         return {
             "tool": "pw_for",
             "params": {
                 "iterator": node.iterator,
-                "iterable": ir_to_mcp(node.iterable),
-                "body": [ir_to_mcp(stmt) for stmt in node.body],
+                "iterable": self.visit(node.iterable),
+                "body": [self.visit(stmt) for stmt in node.body],
             }
         }
 
-    elif isinstance(node, IRWhile):
+    @dispatches(IRWhile)
+    def visit_while(self, node: IRWhile) -> Dict[str, Any]:
         return {
             "tool": "pw_while",
             "params": {
-                "condition": ir_to_mcp(node.condition),
-                "body": [ir_to_mcp(stmt) for stmt in node.body],
+                "condition": self.visit(node.condition),
+                "body": [self.visit(stmt) for stmt in node.body],
             }
         }
 
-    elif isinstance(node, IRTry):
+    @dispatches(IRTry)
+    def visit_try(self, node: IRTry) -> Dict[str, Any]:
         return {
             "tool": "pw_try",
             "params": {
-                "body": [ir_to_mcp(stmt) for stmt in node.try_body],
-                "catch_clauses": [ir_to_mcp(c) for c in node.catch_blocks],
-                "finally_body": [ir_to_mcp(stmt) for stmt in node.finally_body] if node.finally_body else None,
+                "body": [self.visit(stmt) for stmt in node.try_body],
+                "catch_clauses": [self.visit(c) for c in node.catch_blocks],
+                "finally_body": [self.visit(stmt) for stmt in node.finally_body] if node.finally_body else None,
             }
         }
 
-    elif isinstance(node, IRCatch):
+    @dispatches(IRCatch)
+    def visit_catch(self, node: IRCatch) -> Dict[str, Any]:
         return {
             "tool": "pw_catch",
             "params": {
                 "exception_type": node.exception_type,
                 "variable": node.exception_var,
-                "body": [ir_to_mcp(stmt) for stmt in node.body],
+                "body": [self.visit(stmt) for stmt in node.body],
             }
         }
 
     # Expressions
-    elif isinstance(node, IRCall):
+    @dispatches(IRCall)
+    def visit_call(self, node: IRCall) -> Dict[str, Any]:
         return {
             "tool": "pw_call",
             "params": {
-                "function": ir_to_mcp(node.function),
-                "args": [ir_to_mcp(arg) for arg in node.args],
-                "kwargs": {k: ir_to_mcp(v) for k, v in node.kwargs.items()} if node.kwargs else {},
+                "function": self.visit(node.function),
+                "args": [self.visit(arg) for arg in node.args],
+                "kwargs": {k: self.visit(v) for k, v in node.kwargs.items()} if node.kwargs else {},
             }
         }
 
-    elif isinstance(node, IRBinaryOp):
+    @dispatches(IRBinaryOp)
+    def visit_binary_op(self, node: IRBinaryOp) -> Dict[str, Any]:
         return {
             "tool": "pw_binary_op",
             "params": {
                 "op": node.op.value if hasattr(node.op, 'value') else node.op,
-                "left": ir_to_mcp(node.left),
-                "right": ir_to_mcp(node.right),
+                "left": self.visit(node.left),
+                "right": self.visit(node.right),
             }
         }
 
-    elif isinstance(node, IRUnaryOp):
+    @dispatches(IRUnaryOp)
+    def visit_unary_op(self, node: IRUnaryOp) -> Dict[str, Any]:
         return {
             "tool": "pw_unary_op",
             "params": {
                 "op": node.op.value if hasattr(node.op, 'value') else node.op,
-                "operand": ir_to_mcp(node.operand),
+                "operand": self.visit(node.operand),
             }
         }
 
-    elif isinstance(node, IRLiteral):
+    @dispatches(IRLiteral)
+    def visit_literal(self, node: IRLiteral) -> Dict[str, Any]:
         return {
             "tool": "pw_literal",
             "params": {
@@ -255,7 +260,8 @@ def ir_to_mcp(node: Any) -> Dict[str, Any]:
             }
         }
 
-    elif isinstance(node, IRIdentifier):
+    @dispatches(IRIdentifier)
+    def visit_identifier(self, node: IRIdentifier) -> Dict[str, Any]:
         return {
             "tool": "pw_identifier",
             "params": {
@@ -263,93 +269,103 @@ def ir_to_mcp(node: Any) -> Dict[str, Any]:
             }
         }
 
-    elif isinstance(node, IRPropertyAccess):
+    @dispatches(IRPropertyAccess)
+    def visit_property_access(self, node: IRPropertyAccess) -> Dict[str, Any]:
         return {
             "tool": "pw_property_access",
             "params": {
-                "object": ir_to_mcp(node.object),
+                "object": self.visit(node.object),
                 "property": node.property,
             }
         }
 
-    elif isinstance(node, IRIndex):
+    @dispatches(IRIndex)
+    def visit_index(self, node: IRIndex) -> Dict[str, Any]:
         return {
             "tool": "pw_index",
             "params": {
-                "object": ir_to_mcp(node.object),
-                "index": ir_to_mcp(node.index),
+                "object": self.visit(node.object),
+                "index": self.visit(node.index),
             }
         }
 
-    elif isinstance(node, IRLambda):
+    @dispatches(IRLambda)
+    def visit_lambda(self, node: IRLambda) -> Dict[str, Any]:
         return {
             "tool": "pw_lambda",
             "params": {
-                "params": [ir_to_mcp(p) for p in node.params],
-                "body": ir_to_mcp(node.body) if not isinstance(node.body, list) else [ir_to_mcp(s) for s in node.body],
-                "return_type": ir_to_mcp(node.return_type) if node.return_type else None,
+                "params": [self.visit(p) for p in node.params],
+                "body": self.visit(node.body) if not isinstance(node.body, list) else [self.visit(s) for s in node.body],
+                "return_type": self.visit(node.return_type) if node.return_type else None,
             }
         }
 
-    elif isinstance(node, IRArray):
+    @dispatches(IRArray)
+    def visit_array(self, node: IRArray) -> Dict[str, Any]:
         return {
             "tool": "pw_array",
             "params": {
-                "elements": [ir_to_mcp(elem) for elem in node.elements],
-                "element_type": ir_to_mcp(node.element_type) if hasattr(node, 'element_type') and node.element_type else None,
+                "elements": [self.visit(elem) for elem in node.elements],
+                "element_type": self.visit(node.element_type) if hasattr(node, 'element_type') and node.element_type else None,
             }
         }
 
-    elif isinstance(node, IRMap):
+    @dispatches(IRMap)
+    def visit_map(self, node: IRMap) -> Dict[str, Any]:
         return {
             "tool": "pw_map",
             "params": {
-                "entries": {str(k): ir_to_mcp(v) for k, v in node.entries.items()},
-                "key_type": ir_to_mcp(node.key_type) if hasattr(node, 'key_type') and node.key_type else None,
-                "value_type": ir_to_mcp(node.value_type) if hasattr(node, 'value_type') and node.value_type else None,
+                "entries": {str(k): self.visit(v) for k, v in node.entries.items()},
+                "key_type": self.visit(node.key_type) if hasattr(node, 'key_type') and node.key_type else None,
+                "value_type": self.visit(node.value_type) if hasattr(node, 'value_type') and node.value_type else None,
             }
         }
 
-    elif isinstance(node, IRTernary):
+    @dispatches(IRTernary)
+    def visit_ternary(self, node: IRTernary) -> Dict[str, Any]:
         return {
             "tool": "pw_ternary",
             "params": {
-                "condition": ir_to_mcp(node.condition),
-                "true_value": ir_to_mcp(node.true_value),
-                "false_value": ir_to_mcp(node.false_value),
+                "condition": self.visit(node.condition),
+                "true_value": self.visit(node.true_value),
+                "false_value": self.visit(node.false_value),
             }
         }
 
     # Types
-    elif isinstance(node, IRType):
+    @dispatches(IRType)
+    def visit_type(self, node: IRType) -> Dict[str, Any]:
         return {
             "tool": "pw_type",
             "params": {
                 "name": node.name,
-                "generic_args": [ir_to_mcp(arg) for arg in node.generic_args] if node.generic_args else [],
+                "generic_args": [self.visit(arg) for arg in node.generic_args] if node.generic_args else [],
                 "is_optional": node.is_optional,
             }
         }
 
-    elif isinstance(node, IRTypeDefinition):
+    @dispatches(IRTypeDefinition)
+    def visit_type_definition(self, node: IRTypeDefinition) -> Dict[str, Any]:
         return {
             "tool": "pw_type_definition",
             "params": {
                 "name": node.name,
-                "fields": [{"name": f.name, "type": ir_to_mcp(f.field_type)} for f in node.fields],
+                "fields": [{"name": f.name, "type": self.visit(f.field_type)} for f in node.fields],
             }
         }
 
-    elif isinstance(node, IREnum):
+    @dispatches(IREnum)
+    def visit_enum(self, node: IREnum) -> Dict[str, Any]:
         return {
             "tool": "pw_enum",
             "params": {
                 "name": node.name,
-                "variants": [ir_to_mcp(v) for v in node.variants],
+                "variants": [self.visit(v) for v in node.variants],
             }
         }
 
-    elif isinstance(node, IREnumVariant):
+    @dispatches(IREnumVariant)
+    def visit_enum_variant(self, node: IREnumVariant) -> Dict[str, Any]:
         return {
             "tool": "pw_enum_variant",
             "params": {
@@ -358,10 +374,45 @@ def ir_to_mcp(node: Any) -> Dict[str, Any]:
             }
         }
 
-    else:
+    @dispatches(object)
+    def visit_unknown(self, node: Any) -> Dict[str, Any]:
         # Fallback for unknown types
         return {"tool": "unknown", "params": {"type": str(type(node)), "value": str(node)}}
 
+    def visit(self, node: Any) -> Optional[Dict[str, Any]]:
+        if node is None:
+            return None
+        return self.dispatch("visit", node)
+
+
+_ENCODER = _MCPEncoder()
+
+
+def ir_to_mcp(node: Any) -> Dict[str, Any]:
+    """
+    Convert IR node to MCP tree (JSON-serializable dict).
+
+    Args:
+        node: Any IR node (IRModule, IRFunction, IRExpression, etc.)
+
+    Returns:
+        Dict representing the node as MCP tool call
+    """
+    return _ENCODER.visit(node)
+
+
+_MCP_DECODERS: Dict[str, Callable[[Dict[str, Any]], Any]] = {}
+
+
+def _decoder(tool: str) -> Callable:
+    """Register the decorated function as the mcp_to_ir decoder for a tool name."""
+
+    def decorator(func: Callable) -> Callable:
+        _MCP_DECODERS[tool] = func
+        return func
+
+    return decorator
+
 
 def mcp_to_ir(mcp_tree: Dict[str, Any]) -> Any:
     """
@@ -376,207 +427,256 @@ def mcp_to_ir(mcp_tree: Dict[str, Any]) -> Any:
     if not mcp_tree or not isinstance(mcp_tree, dict):
         return None
 
-    tool = mcp_tree.get("tool")
-    params = mcp_tree.get("params", {})
-
-    # Module
-    if tool == "pw_module":
-        return IRModule(
-            name=params["name"],
-            version=params.get("version", "1.0.0"),
-            imports=[mcp_to_ir(imp) for imp in params.get("imports", [])],
-            functions=[mcp_to_ir(func) for func in params.get("functions", [])],
-            classes=[mcp_to_ir(cls) for cls in params.get("classes", [])],
-            types=[mcp_to_ir(t) for t in params.get("types", [])],
-            enums=[mcp_to_ir(e) for e in params.get("enums", [])],
-            module_vars=[mcp_to_ir(v) for v in params.get("module_vars", [])],
-        )
-
-    # Import
-    elif tool == "pw_import":
-        return IRImport(
-            module=params["module"],
-            alias=params.get("alias"),
-            items=params.get("items"),
-        )
-
-    # Function
-    elif tool == "pw_function":
-        return IRFunction(
-            name=params["name"],
-            params=[mcp_to_ir(p) for p in params.get("params", [])],
-            return_type=mcp_to_ir(params["return_type"]) if params.get("return_type") else None,
-            body=[mcp_to_ir(stmt) for stmt in params.get("body", [])],
-            is_async=params.get("is_async", False),
-            is_static=params.get("is_static", False),
-            is_private=params.get("is_private", False),
-            throws=params.get("throws", []),
-            doc=params.get("doc"),
-        )
-
-    # Parameter
-    elif tool == "pw_parameter":
-        return IRParameter(
-            name=params["name"],
-            param_type=mcp_to_ir(params["param_type"]) if params.get("param_type") else None,
-            default_value=mcp_to_ir(params["default_value"]) if params.get("default_value") else None,
-            is_variadic=params.get("is_variadic", False),
-        )
-
-    # Class
-    elif tool == "pw_class":
-        return IRClass(
-            name=params["name"],
-            base_classes=params.get("base_classes", []),
-            properties=[mcp_to_ir(prop) for prop in params.get("properties", [])],
-            methods=[mcp_to_ir(method) for method in params.get("methods", [])],
-            constructor=mcp_to_ir(params["constructor"]) if params.get("constructor") else None,
-        )
-
-    # Property
-    elif tool == "pw_property":
-        return IRProperty(
-            name=params["name"],
-            prop_type=mcp_to_ir(params["prop_type"]) if params.get("prop_type") else None,
-            default_value=mcp_to_ir(params["default_value"]) if params.get("default_value") else None,
-        )
+    decoder = _MCP_DECODERS.get(mcp_tree.get("tool"))
+    if decoder is None:
+        return None
+    return decoder(mcp_tree.get("params", {}))
+
+
+@_decoder("pw_module")
+def _decode_module(params: Dict[str, Any]) -> Any:
+    return IRModule(
+        name=params["name"],
+        version=params.get("version", "1.0.0"),
+        imports=[mcp_to_ir(imp) for imp in params.get("imports", [])],
+        functions=[mcp_to_ir(func) for func in params.get("functions", [])],
+        classes=[mcp_to_ir(cls) for cls in params.get("classes", [])],
+        types=[mcp_to_ir(t) for t in params.get("types", [])],
+        enums=[mcp_to_ir(e) for e in params.get("enums", [])],
+        module_vars=[mcp_to_ir(v) for v in params.get("module_vars", [])],
+    )
 
-    # Statements
-    elif tool == "pw_assignment":
-        return IRAssignment(
-            target=params["target"] if isinstance(params["target"], str) else mcp_to_ir(params["target"]),
-            value=mcp_to_ir(params["value"]),
-            var_type=mcp_to_ir(params["var_type"]) if params.get("var_type") else None,
-            is_declaration=params.get("is_declaration", True),
-        )
-
-    elif tool == "pw_return":
-        return IRReturn(
-            value=mcp_to_ir(params["value"]) if params.get("value") else None,
-        )
-
-    elif tool == "pw_if":
-        return IRIf(
-            condition=mcp_to_ir(params["condition"]),
-            then_body=[mcp_to_ir(stmt) for stmt in params.get("then_body", [])],
-            else_body=[mcp_to_ir(stmt) for stmt in params.get("else_body", [])] if params.get("else_body") else None,
-        )
-
-    elif tool == "pw_for_c_style":
-        return IRForCStyle(
-            init=mcp_to_ir(params["init"]),
-            condition=mcp_to_ir(params["condition"]),
-            increment=mcp_to_ir(params["increment"]),
-            body=[mcp_to_ir(stmt) for stmt in params.get("body", [])],
-        )
-
-    elif tool == "pw_for":
-        return IRFor(
-            iterator=params["iterator"],
-            iterable=mcp_to_ir(params["iterable"]),
-            body=[mcp_to_ir(stmt) for stmt in params.get("body", [])],
-        )
-
-    elif tool == "pw_while":
-        return IRWhile(
-            condition=mcp_to_ir(params["condition"]),
-            body=[mcp_to_ir(stmt) for stmt in params.get("body", [])],
-        )
-
-    elif tool == "pw_try":
-        return IRTry(
-            try_body=[mcp_to_ir(stmt) for stmt in params.get("body", [])],
-            catch_blocks=[mcp_to_ir(c) for c in params.get("catch_clauses", [])],
-            finally_body=[mcp_to_ir(stmt) for stmt in params.get("finally_body", [])] if params.get("finally_body") else [],
-        )
-
-    elif tool == "pw_catch":
-        return IRCatch(
-            exception_type=params.get("exception_type"),
-            exception_var=params.get("variable"),
-            body=[mcp_to_ir(stmt) for stmt in params.get("body", [])],
-        )
-
-    elif tool == "pw_throw":
-        return IRThrow(
-            exception=mcp_to_ir(params["exception"]),
-        )
-
-    elif tool == "pw_break":
-        return IRBreak()
-
-    elif tool == "pw_continue":
-        return IRContinue()
 
-    # Expressions
-    elif tool == "pw_call":
-        return IRCall(
-            function=mcp_to_ir(params["function"]),
-            args=[mcp_to_ir(arg) for arg in params.get("args", [])],
-            kwargs={k: mcp_to_ir(v) for k, v in params.get("kwargs", {}).items()},
-        )
-
-    elif tool == "pw_binary_op":
-        return IRBinaryOp(
-            op=BinaryOperator(params["op"]),
-            left=mcp_to_ir(params["left"]),
-            right=mcp_to_ir(params["right"]),
-        )
-
-    elif tool == "pw_unary_op":
-        return IRUnaryOp(
-            op=UnaryOperator(params["op"]),
-            operand=mcp_to_ir(params["operand"]),
-        )
-
-    elif tool == "pw_literal":
-        # Handle literal_type - if it's uppercase, convert to lowercase for enum
-        lit_type = params["literal_type"]
-        if isinstance(lit_type, str):
-            lit_type = lit_type.lower()
-        return IRLiteral(
-            value=params["value"],
-            literal_type=LiteralType(lit_type),
-        )
-
-    elif tool == "pw_identifier":
-        return IRIdentifier(name=params["name"])
-
-    elif tool == "pw_property_access":
-        return IRPropertyAccess(
-            object=mcp_to_ir(params["object"]),
-            property=params["property"],
-        )
-
-    elif tool == "pw_index":
-        return IRIndex(
-            object=mcp_to_ir(params["object"]),
-            index=mcp_to_ir(params["index"]),
-        )
-
-    elif tool == "pw_array":
-        return IRArray(elements=[mcp_to_ir(elem) for elem in params.get("elements", [])])
-
-    elif tool == "pw_map":
-        return IRMap(entries={k: mcp_to_ir(v) for k, v in params.get("entries", {}).items()})
-
-    elif tool == "pw_ternary":
-        return IRTernary(
-            condition=mcp_to_ir(params["condition"]),
-            true_value=mcp_to_ir(params["true_value"]),
-            false_value=mcp_to_ir(params["false_value"]),
-        )
+@_decoder("pw_import")
+def _decode_import(params: Dict[str, Any]) -> Any:
+    return IRImport(
+        module=params["module"],
+        alias=params.get("alias"),
+        items=params.get("items"),
+    )
 
-    # Types
-    elif tool == "pw_type":
-        return IRType(
-            name=params["name"],
-            generic_args=[mcp_to_ir(arg) for arg in params.get("generic_args", [])],
-            is_optional=params.get("is_optional", False),
-        )
-
-    else:
-        return None
+
+@_decoder("pw_function")
+def _decode_function(params: Dict[str, Any]) -> Any:
+    return IRFunction(
+        name=params["name"],
+        params=[mcp_to_ir(p) for p in params.get("params", [])],
+        return_type=mcp_to_ir(params["return_type"]) if params.get("return_type") else None,
+        body=[mcp_to_ir(stmt) for stmt in params.get("body", [])],
+        is_async=params.get("is_async", False),
+        is_static=params.get("is_static", False),
+        is_private=params.get("is_private", False),
+        throws=params.get("throws", []),
+        doc=params.get("doc"),
+    )
+
+
+@_decoder("pw_parameter")
+def _decode_parameter(params: Dict[str, Any]) -> Any:
+    return IRParameter(
+        name=params["name"],
+        param_type=mcp_to_ir(params["param_type"]) if params.get("param_type") else None,
+        default_value=mcp_to_ir(params["default_value"]) if params.get("default_value") else None,
+        is_variadic=params.get("is_variadic", False),
+    )
+
+
+@_decoder("pw_class")
+def _decode_class(params: Dict[str, Any]) -> Any:
+    return IRClass(
+        name=params["name"],
+        base_classes=params.get("base_classes", []),
+        properties=[mcp_to_ir(prop) for prop in params.get("properties", [])],
+        methods=[mcp_to_ir(method) for method in params.get("methods", [])],
+        constructor=mcp_to_ir(params["constructor"]) if params.get("constructor") else None,
+    )
+
+
+@_decoder("pw_property")
+def _decode_property(params: Dict[str, Any]) -> Any:
+    return IRProperty(
+        name=params["name"],
+        prop_type=mcp_to_ir(params["prop_type"]) if params.get("prop_type") else None,
+        default_value=mcp_to_ir(params["default_value"]) if params.get("default_value") else None,
+    )
+
+
+# Statements
+@_decoder("pw_assignment")
+def _decode_assignment(params: Dict[str, Any]) -> Any:
+    return IRAssignment(
+        target=params["target"] if isinstance(params["target"], str) else mcp_to_ir(params["target"]),
+        value=mcp_to_ir(params["value"]),
+        var_type=mcp_to_ir(params["var_type"]) if params.get("var_type") else None,
+        is_declaration=params.get("is_declaration", True),
+    )
+
+
+@_decoder("pw_return")
+def _decode_return(params: Dict[str, Any]) -> Any:
+    return IRReturn(
+        value=mcp_to_ir(params["value"]) if params.get("value") else None,
+    )
+
+
+@_decoder("pw_if")
+def _decode_if(params: Dict[str, Any]) -> Any:
+    return IRIf(
+        condition=mcp_to_ir(params["condition"]),
+        then_body=[mcp_to_ir(stmt) for stmt in params.get("then_body", [])],
+        else_body=[mcp_to_ir(stmt) for stmt in params.get("else_body", [])] if params.get("else_body") else None,
+    )
+
+
+@_decoder("pw_for_c_style")
+def _decode_for_c_style(params: Dict[str, Any]) -> Any:
+    return IRForCStyle(
+        init=mcp_to_ir(params["init"]),
+        condition=mcp_to_ir(params["condition"]),
+        increment=mcp_to_ir(params["increment"]),
+        body=[mcp_to_ir(stmt) for stmt in params.get("body", [])],
+    )
+
+
+@_decoder("pw_for")
+def _decode_for(params: Dict[str, Any]) -> Any:
+    return IRFor(
+        iterator=params["iterator"],
+        iterable=mcp_to_ir(params["iterable"]),
+        body=[mcp_to_ir(stmt) for stmt in params.get("body", [])],
+    )
+
+
+@_decoder("pw_while")
+def _decode_while(params: Dict[str, Any]) -> Any:
+    return IRWhile(
+        condition=mcp_to_ir(params["condition"]),
+        body=[mcp_to_ir(stmt) for stmt in params.get("body", [])],
+    )
+
+
+@_decoder("pw_try")
+def _decode_try(params: Dict[str, Any]) -> Any:
+    return IRTry(
+        try_body=[mcp_to_ir(stmt) for stmt in params.get("body", [])],
+        catch_blocks=[mcp_to_ir(c) for c in params.get("catch_clauses", [])],
+        finally_body=[mcp_to_ir(stmt) for stmt in params.get("finally_body", [])] if params.get("finally_body") else [],
+    )
+
+
+@_decoder("pw_catch")
+def _decode_catch(params: Dict[str, Any]) -> Any:
+    return IRCatch(
+        exception_type=params.get("exception_type"),
+        exception_var=params.get("variable"),
+        body=[mcp_to_ir(stmt) for stmt in params.get("body", [])],
+    )
+
+
+@_decoder("pw_throw")
+def _decode_throw(params: Dict[str, Any]) -> Any:
+    return IRThrow(
+        exception=mcp_to_ir(params["exception"]),
+    )
+
+
+@_decoder("pw_break")
+def _decode_break(params: Dict[str, Any]) -> Any:
+    return IRBreak()
+
+
+@_decoder("pw_continue")
+def _decode_continue(params: Dict[str, Any]) -> Any:
+    return IRContinue()
+
+
+# Expressions
+@_decoder("pw_call")
+def _decode_call(params: Dict[str, Any]) -> Any:
+    return IRCall(
+        function=mcp_to_ir(params["function"]),
+        args=[mcp_to_ir(arg) for arg in params.get("args", [])],
+        kwargs={k: mcp_to_ir(v) for k, v in params.get("kwargs", {}).items()},
+    )
+
+
+@_decoder("pw_binary_op")
+def _decode_binary_op(params: Dict[str, Any]) -> Any:
+    return IRBinaryOp(
+        op=BinaryOperator(params["op"]),
+        left=mcp_to_ir(params["left"]),
+        right=mcp_to_ir(params["right"]),
+    )
+
+
+@_decoder("pw_unary_op")
+def _decode_unary_op(params: Dict[str, Any]) -> Any:
+    return IRUnaryOp(
+        op=UnaryOperator(params["op"]),
+        operand=mcp_to_ir(params["operand"]),
+    )
+
+
+@_decoder("pw_literal")
+def _decode_literal(params: Dict[str, Any]) -> Any:
+    # Handle literal_type - if it's uppercase, convert to lowercase for enum
+    lit_type = params["literal_type"]
+    if isinstance(lit_type, str):
+        lit_type = lit_type.lower()
+    return IRLiteral(
+        value=params["value"],
+        literal_type=LiteralType(lit_type),
+    )
+
+
+@_decoder("pw_identifier")
+def _decode_identifier(params: Dict[str, Any]) -> Any:
+    return IRIdentifier(name=params["name"])
+
+
+@_decoder("pw_property_access")
+def _decode_property_access(params: Dict[str, Any]) -> Any:
+    return IRPropertyAccess(
+        object=mcp_to_ir(params["object"]),
+        property=params["property"],
+    )
+
+
+@_decoder("pw_index")
+def _decode_index(params: Dict[str, Any]) -> Any:
+    return IRIndex(
+        object=mcp_to_ir(params["object"]),
+        index=mcp_to_ir(params["index"]),
+    )
+
+
+@_decoder("pw_array")
+def _decode_array(params: Dict[str, Any]) -> Any:
+    return IRArray(elements=[mcp_to_ir(elem) for elem in params.get("elements", [])])
+
+
+@_decoder("pw_map")
+def _decode_map(params: Dict[str, Any]) -> Any:
+    return IRMap(entries={k: mcp_to_ir(v) for k, v in params.get("entries", {}).items()})
+
+
+@_decoder("pw_ternary")
+def _decode_ternary(params: Dict[str, Any]) -> Any:
+    return IRTernary(
+        condition=mcp_to_ir(params["condition"]),
+        true_value=mcp_to_ir(params["true_value"]),
+        false_value=mcp_to_ir(params["false_value"]),
+    )
+
+
+# Types
+@_decoder("pw_type")
+def _decode_type(params: Dict[str, Any]) -> Any:
+    return intern_type(
+        params["name"],
+        [mcp_to_ir(arg) for arg in params.get("generic_args", [])],
+        params.get("is_optional", False),
+    )
 
 
 # Test if run directly